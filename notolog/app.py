@@ -31,29 +31,37 @@ For detailed instructions and project information, please see the repository's R
 import argparse
 import logging
 import asyncio
+import time
 import sys
 import os
 
-from PySide6.QtCore import QLoggingCategory
+from PySide6.QtCore import QLoggingCategory, QCoreApplication, QTimer
 from PySide6.QtWidgets import QStyleFactory
 
 from notolog.app_config import AppConfig
 from notolog.font_loader import FontLoader
+from notolog.enums.themes import Themes
+from notolog.helpers.import_helper import ImportProfiler
 
 # Force Qt API (for qasync).
 # It's necessary to set the QT_API environment variable before importing qasync
 # because the library uses this environment variable to determine which Qt binding to use.
 os.environ["QT_API"] = "PySide6"
 
-from notolog.notolog_editor import NotologEditor  # noqa
-
 from qasync import QEventLoop, QApplication  # noqa
 
 # Force Qt style override
 os.environ["QT_STYLE_OVERRIDE"] = "Fusion"
 
+# Operations of the crypt command, the same as the BatchCrypt ones; the batch encryption is imported upon it is run
+CRYPT_OPERATIONS = ('encrypt', 'decrypt', 'rekey')
+
 
 def main():
+    # Time to the window shown
+    started_at = time.perf_counter()
+    import_profiler = None
+
     # Check if any command line arguments are present
     if len(sys.argv) > 1:
         class NotologArgumentParser(argparse.ArgumentParser):
@@ -79,15 +87,62 @@ def main():
                             version=f'{AppConfig().get_app_name()} {AppConfig().get_app_version()}',
                             help='show the version information and exit')
 
+        # Add a startup report argument
+        parser.add_argument('--import-time', action='store_true',
+                            help='start the app and report the import time of the modules once the window is shown')
+
+        # Commands to run without starting the app
+        subparsers = parser.add_subparsers(dest='command', metavar='command')
+
+        crypt_parser = subparsers.add_parser(
+            'crypt', help='encrypt, decrypt or change the password of the notes',
+            description='Encrypt, decrypt or change the password (rekey) of the notes in a batch. The passwords are '
+                        'taken from the NOTOLOG_PASSWORD and NOTOLOG_NEW_PASSWORD environment variables, or prompted.')
+        crypt_parser.add_argument('operation', choices=CRYPT_OPERATIONS, help='operation to run')
+        crypt_parser.add_argument('paths', nargs='+', metavar='path', help='notes or directories with the notes')
+        crypt_parser.add_argument('-r', '--recursive', action='store_true', help='process the sub-directories too')
+        crypt_parser.add_argument('--iterations', type=int, help='key derivation iterations of the notes encrypted')
+        crypt_parser.add_argument('--hint', help='password hint to set')
+        crypt_parser.add_argument('--overwrite', action='store_true',
+                                  help='overwrite the existing notes encrypted or decrypted')
+        crypt_parser.add_argument('-j', '--jobs', type=int, help='number of the worker processes')
+
+        export_parser = subparsers.add_parser(
+            'export', help='export the notes to html',
+            description='Render the notes in a directory to html the way the view mode does. Only the notes changed '
+                        'since the last export into the same output directory are rendered again.')
+        export_parser.add_argument('source', help='directory with the notes')
+        export_parser.add_argument('-o', '--output', required=True, help='directory to write the html files to')
+        export_parser.add_argument('--theme', choices=[str(theme) for theme in Themes],
+                                   help='theme of the styles, the one of the app settings by default')
+        export_parser.add_argument('--emojis', action=argparse.BooleanOptionalAction,
+                                   help='convert emojis, like :cat:, the app setting by default')
+        export_parser.add_argument('--no-recursive', dest='recursive', action='store_false',
+                                   help='skip the sub-directories')
+        export_parser.add_argument('--force', action='store_true', help='render all the notes, even the unchanged ones')
+        export_parser.add_argument('-j', '--jobs', type=int, help='number of the worker processes')
+
         # Parse the arguments
         # parser.parse_args()
         args = parser.parse_args()
 
-        # Check if the --init=package option was provided
-        if args.version:
-            pass
+        if args.command in ('crypt', 'export'):
+            # The settings (e.g. the default iterations or the theme) are the ones of the app
+            QCoreApplication.setOrganizationName(AppConfig().get_settings_org_name())
+            QCoreApplication.setOrganizationDomain(AppConfig().get_settings_org_domain())
+            QCoreApplication.setApplicationName(AppConfig().get_settings_app_name())
+            if args.command == 'crypt':
+                from notolog.encrypt import batch_crypt
+                sys.exit(batch_crypt.run_cli(args))
+            from notolog import html_export
+            sys.exit(html_export.run_cli(args))
+
+        if not args.import_time:
+            sys.exit(0)
 
-        sys.exit(0)
+        # The modules imported from now on are measured
+        import_profiler = ImportProfiler()
+        import_profiler.install()
 
     """
     Possible params:
@@ -147,10 +202,17 @@ def main():
     app_close_event = asyncio.Event()
     app.aboutToQuit.connect(app_close_event.set)
 
+    # Imported here, the command line commands do not need the editor
+    from notolog.notolog_editor import NotologEditor
+
     # Start up the editor
     editor = NotologEditor(screen=screen)
     editor.show()
 
+    if import_profiler is not None:
+        # Reported once the window is painted
+        QTimer.singleShot(0, lambda: report_startup(import_profiler, started_at))
+
     with loop:
         """
         Contains run_forever() which is contain app.exec(),
@@ -159,6 +221,12 @@ def main():
         loop.run_until_complete(app_close_event.wait())
 
 
+def report_startup(import_profiler: ImportProfiler, started_at: float) -> None:
+    import_profiler.uninstall()
+    print(import_profiler.report(), file=sys.stderr)
+    print(f'Window shown in {(time.perf_counter() - started_at) * 1e3:.1f} ms', file=sys.stderr)
+
+
 if __name__ == '__main__':
     # Debug:
     # async def main(): ...
@@ -4,6 +4,8 @@ An open-source Markdown editor built with Python.
 
 File Details:
 - Purpose: Async syntax highlighter to support background operation and avoid UI blocks.
+- Functionality: Coalesces the re-highlighting requests of a burst of edits into a single run, delayed according to
+  the measured cost of the previous runs, and counts the requests and runs for diagnostics.
 
 Repository: https://github.com/notolog/notolog-editor
 Website: https://notolog.app
@@ -16,93 +18,121 @@ License: MIT License
 For detailed instructions and project information, please see the repository's README.md.
 """
 
-from PySide6.QtCore import QTimer
-
-from qasync import asyncSlot
 import asyncio
 
+import time
 import logging
 
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Dict
+
+if TYPE_CHECKING:
+    from typing import Union  # noqa: F401
 
 
 class AsyncHighlighter:
+    """
+    Debouncing scheduler of the re-highlighting. The changed blocks themselves are tracked and merged by the
+    highlighter's incremental engine, which also carries the cross-block state changes over, so a run re-highlights
+    what the coalesced edits have changed and nothing escalates to the whole document re-highlighting.
+    """
+
+    # Bounds of the delay after the latest request, in seconds
+    MIN_DELAY = 0.05  # type: float
+    MAX_DELAY = 0.3  # type: float
+    # The run is not postponed further than that since the first request coalesced, in seconds
+    MAX_WAIT = 0.5  # type: float
+    # The delay is the measured cost of a run multiplied by the factor, the more expensive, the less often
+    COST_FACTOR = 2.0  # type: float
+    # Weight of the latest run within the average cost
+    COST_SMOOTHING = 0.3  # type: float
 
     def __init__(self, callback: Callable[..., Any]):
-
+        """
+        Args:
+            callback (Callable[..., Any]): Re-highlighting, receives whether the whole document is requested
+        """
         self.callback = callback
 
         self.logger = logging.getLogger('async_highlighter')
 
-        self.rehighlight_tasks = []
+        # Scheduled run and the loop time of the first request it coalesces
+        self.handle = None  # type: Union[asyncio.TimerHandle, None]
+        self.first_request_time = 0.0  # type: float
+        # Whether any of the coalesced requests is for the whole document
+        self.full_rehighlight = False
 
-        self.loop = asyncio.get_event_loop()
+        # Average cost of a run, in seconds
+        self.cost = 0.0  # type: float
 
-    @asyncSlot()
-    async def rehighlight_in_queue(self, full_rehighlight: bool = False) -> Any:
-        """
-        Re-highlight code asynchronously here.
-        More info about asyncio tasks: https://docs.python.org/3/library/asyncio-task.html
-        """
+        self.counters = {'scheduled': 0, 'coalesced': 0, 'executed': 0, 'ms_spent': 0.0}  # type: Dict[str, Any]
 
-        # Check async loop is running
-        if not asyncio.get_event_loop().is_running():
-            self.logger.debug('Skipping the task because the async loop is not running.')
-            return
+    def rehighlight_in_queue(self, full_rehighlight: bool = False) -> bool:
+        """
+        Schedule re-highlighting, or postpone the run already scheduled to coalesce the request with.
 
-        self.logger.debug('Re-highlight %d tasks in queue' % len(self.rehighlight_tasks))
+        Args:
+            full_rehighlight (bool, optional): Request the whole document re-highlighting
 
-        postpone = False if len(self.rehighlight_tasks) == 0 else True
-        self.logger.debug('Re-highlight is to postpone "%r"' % postpone)
+        Returns:
+            bool: False if the event loop is not running and the request is skipped
+        """
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or not loop.is_running():
+            self.logger.debug('Skipping the task because the async loop is not running.')
+            return False
 
-        task = None
-        # To keep only a few tasks in queue
-        if len(self.rehighlight_tasks) < 3:
-            task = asyncio.ensure_future(self.rehighlight_async(full_rehighlight, postpone))
-            # task = asyncio.create_task(self.rehighlight_async(full_rehighlight, postpone))
-            # Add task to the local pool first
-            self.rehighlight_tasks.append(task)
-            # Callback method to set up further actions
-            task.add_done_callback(lambda _task: self.rehighlight_task_callback(_task))
+        self.counters['scheduled'] += 1
+        self.full_rehighlight = self.full_rehighlight or full_rehighlight
 
-        try:
-            done, pending = await asyncio.wait(
-                self.rehighlight_tasks,
-                return_when=asyncio.ALL_COMPLETED,  # There is no pending tasks check
-            )
-            self.logger.debug(f'Re-highlight tasks progress. Done {len(done)}, pending {len(pending)}')
-        except asyncio.CancelledError:
-            # All tasks will be cancelled later upon close event
-            pass
+        now = loop.time()
+        if self.handle is not None:
+            self.counters['coalesced'] += 1
+            self.handle.cancel()
+        else:
+            self.first_request_time = now
 
-        return task
+        # Wait for the edits to pause, but not longer than the max wait since the first request coalesced
+        delay = min(self.get_delay(), max(0.0, self.first_request_time + self.MAX_WAIT - now))
+        self.handle = loop.call_later(delay, self.run)
 
-    def rehighlight_task_callback(self, task) -> None:
-        self.logger.debug('%s from total %d completed with callback'
-                          % (task.get_name(), len(self.rehighlight_tasks)))
+        return True
 
-        self.rehighlight_tasks.remove(task)
+    def get_delay(self) -> float:
+        return min(self.MAX_DELAY, max(self.MIN_DELAY, self.cost * self.COST_FACTOR))
 
-        if len(self.rehighlight_tasks) == 0:
-            QTimer.singleShot(500, lambda: self.callback(True))
+    def run(self) -> None:
+        full_rehighlight = self.full_rehighlight
+        self.handle = None
+        self.full_rehighlight = False
 
-    async def rehighlight_async(self, full_rehighlight: bool = False, postpone: bool = False) -> None:
-        """
-        Run this method not too often to avoid overwhelming the system.
-        """
+        start_time = time.perf_counter()
         try:
-            # Postpone before re-highlighting set
-            if postpone:
-                self.logger.debug('Re-highlighting the text > postpone')
-                # Keep this method particular amount of time to avoid overwhelming
-                await asyncio.sleep(0.15, self.loop)
-            # Re-highlight
             self.callback(full_rehighlight)
-            self.logger.debug('Async re-highlighting queue task processed')
-            # Postpone after re-highlighting to keep the queue busy
-            self.logger.debug('Re-highlighting the text > wait to return')
-            # Keep this method particular amount of time to avoid overwhelming
-            await asyncio.sleep(0.3, self.loop)
-        except asyncio.CancelledError:
-            # All tasks will be cancelled later upon close event
-            pass
+        finally:
+            elapsed = time.perf_counter() - start_time
+            self.cost = (elapsed if self.counters['executed'] == 0
+                         else self.cost + (elapsed - self.cost) * self.COST_SMOOTHING)
+            self.counters['executed'] += 1
+            self.counters['ms_spent'] += elapsed * 1000
+
+        self.logger.debug(f'Re-highlighted in {elapsed * 1000:.1f} ms, next delay {self.get_delay() * 1000:.0f} ms, '
+                          f'counters {self.counters}')
+
+    def cancel(self) -> None:
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        self.full_rehighlight = False
+
+    def is_pending(self) -> bool:
+        return self.handle is not None
+
+    def get_counters(self) -> Dict[str, Any]:
+        """
+        Counters for diagnostics: the requests 'scheduled', the ones 'coalesced' with a pending run, the runs
+        'executed' and the time spent on them, 'ms_spent'.
+        """
+        return dict(self.counters)
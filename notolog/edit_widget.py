@@ -20,10 +20,12 @@ from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QTextCursor, QTextBlock, QFont
 from PySide6.QtWidgets import QPlainTextEdit
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Any, Callable, Union
 
 from .app_config import AppConfig
+from .search_index import SearchIndex
 
+import hashlib
 import logging
 
 if TYPE_CHECKING:
@@ -36,6 +38,9 @@ class EditWidget(QPlainTextEdit):
 
     content_set = Signal()
 
+    # Text longer than that is set chunk by chunk, in characters
+    CHUNK_SIZE = 1024 * 1024  # type: int
+
     def __init__(self, parent=None):
         """
         Args:
@@ -50,8 +55,13 @@ class EditWidget(QPlainTextEdit):
 
         self.logger = logging.getLogger('edit_widget')
 
-        # Initialize storage for positions and indexes of searched text occurrences.
-        self._searched_text_positions = []
+        # Index of the searched text occurrences, it follows the document edits
+        self.search_index = SearchIndex()
+
+        # Document revision and hash of the content saved, to check whether there is anything to save without
+        # keeping a copy of the content
+        self.saved_revision = -1  # type: int
+        self.saved_hash = None  # type: Union[str, None]
 
         # Disable line wrapping
         # self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
@@ -70,6 +80,71 @@ class EditWidget(QPlainTextEdit):
         # Emit document set signal to notify listeners
         self.content_set.emit()
 
+    def set_plain_text_chunked(self, text: str, progress_callback: Callable[[int], Any] = None) -> None:
+        """
+        Set the plain text the same way setPlainText() does it, but chunk by chunk if the text is large, to report
+        the progress and to avoid the extra copies of the whole text made at once.
+
+        Args:
+            text (str): The text to set
+            progress_callback (Callable[[int], Any], optional): Receives the percentage of the text set
+        """
+        if len(text) <= self.CHUNK_SIZE:
+            self.setPlainText(text)
+            return
+
+        document = self.document()
+        # The index is built again upon the next search rather than updated with each chunk
+        self.search_index.clear()
+
+        # Clear the document and its undo stack; the widget signals are emitted once the whole text is set
+        self.blockSignals(True)
+        document.setUndoRedoEnabled(False)
+        try:
+            super().setPlainText('')
+            cursor = QTextCursor(document)
+            text_length = len(text)
+            for start in range(0, text_length, self.CHUNK_SIZE):
+                cursor.insertText(text[start:start + self.CHUNK_SIZE])
+                if callable(progress_callback):
+                    progress_callback(min(start + self.CHUNK_SIZE, text_length) * 100 // text_length)
+        finally:
+            document.setUndoRedoEnabled(True)
+            document.setModified(False)
+            self.blockSignals(False)
+
+        # The cursor is at the start, as upon setPlainText()
+        self.moveCursor(QTextCursor.MoveOperation.Start)
+        self.textChanged.emit()
+        self.blockCountChanged.emit(document.blockCount())
+        # Emit document set signal to notify listeners
+        self.content_set.emit()
+
+    @staticmethod
+    def get_content_hash(text: str) -> str:
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+    def set_saved(self, content_hash: str, revision: int = None) -> None:
+        """
+        Remember the content is saved (or loaded) as of the document revision given, the current one by default.
+
+        Args:
+            content_hash (str): Hash of the content saved, see get_content_hash()
+            revision (int, optional): Document revision the content is taken at
+        """
+        self.saved_revision = self.document().revision() if revision is None else revision
+        self.saved_hash = content_hash
+
+    def is_changed(self) -> bool:
+        """
+        Check the document is edited since the content is saved. Any edit increases the document revision, even
+        the undo one, so the document may still have the content saved; check it with is_saved_hash() then.
+        """
+        return self.document().revision() != self.saved_revision
+
+    def is_saved_hash(self, content_hash: str) -> bool:
+        return content_hash == self.saved_hash
+
     def find_block_by_number(self, block_number: int) -> Union[QTextBlock, None]:
         """
         Notice: Very resource greedy method, avoid it, refactor or change the logic.
@@ -214,6 +289,7 @@ class EditWidget(QPlainTextEdit):
     def searched_text_count(self, searched_text, find_flags) -> int:
         """
         Counts the number of occurrences of a given text within the document.
+        The occurrences are indexed, so the repeated searches on the same document are not scanning it again.
 
         Args:
             searched_text (str): The text string to search for within the document.
@@ -223,29 +299,7 @@ class EditWidget(QPlainTextEdit):
         Returns:
             int: The number of times the searched text appears in the document.
         """
-        count = 0
-        # Reset stored text positions from previous searches to prepare for a new search.
-        self._searched_text_positions = []
-        # Create a temporary cursor for the search
-        # This way, the actual cursor position that the user sees will not be affected.
-        temp_cursor = self.textCursor()
-
-        # Move the temporary cursor to the start of the document
-        temp_cursor.movePosition(temp_cursor.MoveOperation.Start)
-
-        # Find and count occurrences
-        while temp_cursor := self.document().find(searched_text, temp_cursor, find_flags):
-            count += 1
-            pos = temp_cursor.position()
-            if pos not in self._searched_text_positions:
-                self._searched_text_positions.append(pos)
-
-        # Reset the stored positions if no occurrence index is found.
-        if count == 0:
-            self._searched_text_positions = []
-
-        # No need to reset the visual cursor since the original cursor was not moved
-        return count
+        return self.search_index.search(self.document(), searched_text, find_flags)
 
     def searched_text_index(self, position) -> int:
         """
@@ -257,11 +311,7 @@ class EditWidget(QPlainTextEdit):
         Returns:
             int: The index of the occurrence at a given cursor position within the document.
         """
-
-        if position in self._searched_text_positions:
-            return self._searched_text_positions.index(position) + 1
-        else:
-            return 0
+        return self.search_index.index(position)
 
     def contextMenuEvent(self, event):
         # Create the standard context menu
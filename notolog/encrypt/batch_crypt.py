@@ -0,0 +1,382 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Batch encryption, decryption and password change of the notes.
+- Functionality: Collects the notes within the directories given, derives the keys once per salt and processes the
+  notes on a process pool with progress and cancellation. Each note is written atomically. Used by the file tree
+  context menu and by the `notolog crypt` command.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from PySide6.QtCore import QObject, Signal
+
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from threading import Event
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Union
+
+import os
+import sys
+import getpass
+import logging
+import multiprocessing
+
+from cryptography.fernet import InvalidToken
+
+from .enc_helper import EncHelper
+from .enc_password import EncPassword
+from ..file_header import FileHeader
+from ..helpers import file_helper
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Tuple  # noqa: F401
+
+
+class BatchCrypt:
+    """
+    Encrypts, decrypts or changes the password of the notes in a batch.
+
+    The notes encrypted are saved next to the plain ones with the '.enc' extension, the decrypted ones without it,
+    the same as the single file actions do. The notes with the password changed are re-encrypted in place, in the
+    chunked format, with a new salt and the iterations given.
+    """
+
+    ENCRYPT = 'encrypt'  # type: str
+    DECRYPT = 'decrypt'  # type: str
+    REKEY = 'rekey'  # type: str
+
+    OPERATIONS = (ENCRYPT, DECRYPT, REKEY)  # type: Tuple[str, ...]
+
+    # Extensions of the plain notes to encrypt
+    EXTENSIONS = ('md', 'txt', 'htm', 'html')  # type: Tuple[str, ...]
+    ENC_EXTENSION = 'enc'  # type: str
+
+    def __init__(self, operation: str, password: str = None, new_password: str = None, hint: str = None,
+                 iterations: int = None, overwrite: bool = False, processes: int = None):
+        """
+        Args:
+            operation (str): One of ENCRYPT, DECRYPT or REKEY
+            password (str, optional): Password of the encrypted notes, to decrypt or to change it
+            new_password (str, optional): Password to encrypt the notes with, to encrypt or to change the password
+            hint (str, optional): Password hint to set, the hint of the note is kept if not set
+            iterations (int, optional): Key derivation iterations of the notes encrypted, the default ones if not set
+            overwrite (bool, optional): Overwrite the existing notes encrypted or decrypted
+            processes (int, optional): Number of the worker processes, the number of the CPUs by default;
+                the notes are processed within the current process if it is 1 or less
+        """
+        if operation not in self.OPERATIONS:
+            raise ValueError(f'Unknown operation "{operation}"')
+
+        self.logger = logging.getLogger('batch_crypt')
+
+        self.operation = operation
+        self.password = password
+        self.new_password = new_password
+        self.hint = hint
+        self.iterations = iterations
+        self.overwrite = overwrite
+        self.processes = processes if processes is not None else (os.cpu_count() or 1)
+
+    def collect(self, paths: Iterable[str], recursive: bool = False) -> 'List[Tuple[str, str]]':
+        """
+        Collect the notes to process within the paths given, either the notes or the directories.
+
+        Returns:
+            List[Tuple[str, str]]: Paths of the notes to process and of the notes to write
+        """
+        files = []  # type: List[Tuple[str, str]]
+        for path in paths:
+            path = os.path.abspath(path)
+            if os.path.isdir(path):
+                for dir_path, dir_names, file_names in os.walk(path):
+                    if recursive:
+                        # Hidden directories are skipped, e.g. the ones of the VCS
+                        dir_names[:] = sorted(name for name in dir_names if not name.startswith('.'))
+                    else:
+                        dir_names[:] = []
+                    for file_name in sorted(file_names):
+                        self.collect_file(os.path.join(dir_path, file_name), files)
+            elif os.path.isfile(path):
+                self.collect_file(path, files)
+            else:
+                self.logger.warning(f'Path not found "{path}"')
+        return files
+
+    def collect_file(self, file_path: str, files: 'List[Tuple[str, str]]') -> None:
+        extension = os.path.splitext(file_path)[1][1:].lower()
+        if extension not in self.EXTENSIONS + (self.ENC_EXTENSION,):
+            return
+        is_encrypted = FileHeader().probe(file_path).is_file_encrypted()
+        if self.operation == self.ENCRYPT:
+            if is_encrypted or extension == self.ENC_EXTENSION:
+                return
+            target_path = f'{file_path}.{self.ENC_EXTENSION}'
+        elif self.operation == self.DECRYPT:
+            # The note decrypted is named after the encrypted one
+            if not is_encrypted or extension != self.ENC_EXTENSION:
+                return
+            target_path = file_path[:-len(self.ENC_EXTENSION) - 1]
+        else:
+            if not is_encrypted:
+                return
+            target_path = file_path
+        files.append((file_path, target_path))
+
+    def run(self, files: 'List[Tuple[str, str]]', progress_callback: Callable[[int, int], Any] = None,
+            cancel_event: Event = None) -> 'Dict[str, Any]':
+        """
+        Process the notes collected, see collect().
+
+        Args:
+            files (List[Tuple[str, str]]): Paths of the notes to process and of the notes to write
+            progress_callback (Callable[[int, int], Any], optional): Receives the number of the notes processed and
+                the total number of them, it is called on the thread the batch runs on
+            cancel_event (Event, optional): Stops the batch once set, the notes being written are finished
+
+        Returns:
+            Dict[str, Any]: The notes 'processed', 'failed' (with the errors) and 'skipped' (as the notes to write
+                exist), and whether the batch is 'cancelled'
+        """
+        result = {'processed': [], 'failed': [], 'skipped': [], 'cancelled': False}
+        cancel_event = cancel_event or Event()
+
+        jobs = []
+        for file_path, target_path in files:
+            if target_path != file_path and os.path.exists(target_path) and not self.overwrite:
+                result['skipped'].append(file_path)
+            else:
+                jobs.append({'operation': self.operation, 'file_path': file_path, 'target_path': target_path})
+        total = len(jobs)
+        if callable(progress_callback):
+            progress_callback(0, total)
+        if not jobs:
+            return result
+
+        # Keys are derived once per salt and iterations, not per note
+        keys = self.derive_keys(jobs, cancel_event)
+        if keys is None:
+            result['cancelled'] = True
+            return result
+
+        if self.processes > 1:
+            # Spawned processes do not inherit the threads of the app
+            executor = ProcessPoolExecutor(max_workers=min(self.processes, total),
+                                           mp_context=multiprocessing.get_context('spawn'))
+            futures = [executor.submit(process_file, job) for job in jobs]
+            completed = as_completed(futures)
+        else:
+            executor = None
+            futures = []
+            completed = (process_file(job) for job in jobs)
+
+        try:
+            for done, job_result in enumerate(completed, start=1):
+                file_path, error = job_result.result() if executor is not None else job_result
+                if error is None:
+                    result['processed'].append(file_path)
+                else:
+                    self.logger.warning(f'Cannot {self.operation} "{file_path}": {error}')
+                    result['failed'].append((file_path, error))
+                if callable(progress_callback):
+                    progress_callback(done, total)
+                if cancel_event.is_set():
+                    result['cancelled'] = True
+                    break
+        finally:
+            if executor is not None:
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=True)
+
+        return result
+
+    def derive_keys(self, jobs: 'List[Dict[str, Any]]', cancel_event: Event) -> 'Union[Dict[Tuple[str, int], bytes], None]':
+        """
+        Derive the keys of the jobs and set them to the jobs.
+
+        Returns:
+            Union[Dict[Tuple[str, int], bytes], None]: The keys by the salt and iterations, None if cancelled
+        """
+        # Passwords by the salt and iterations
+        params = {}  # type: Dict[Tuple[str, int], str]
+        if self.operation in (self.DECRYPT, self.REKEY):
+            for job in jobs:
+                file_header = FileHeader().probe(job['file_path'])
+                job['salt'] = file_header.get_enc_param('slt')
+                job['iterations'] = int(file_header.get_enc_param('itr') or EncHelper.DEFAULT_ITERATIONS)
+                job['password'] = self.password
+                params[(job['salt'], job['iterations'])] = self.password
+        if self.operation in (self.ENCRYPT, self.REKEY):
+            # A single salt for the notes of the batch, as they share the password anyway. The notes share the key then,
+            # each one is bound to its own stream id (see FileHeader.pack_encrypted()), so their segments do not mix
+            new_salt = EncHelper.generate_salt()
+            new_iterations = self.iterations or EncHelper.get_default_iterations()
+            for job in jobs:
+                job.update({'new_salt': new_salt, 'new_iterations': new_iterations, 'new_password': self.new_password,
+                            'hint': self.hint})
+            params[(new_salt, new_iterations)] = self.new_password
+
+        keys = {}
+        # PBKDF2 releases the GIL, the threads derive the keys in parallel
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix='batch_crypt') as executor:
+            futures = {}
+            for (salt, iterations), password in params.items():
+                futures[executor.submit(EncHelper.derive_key, (password or '').encode(), salt.encode(),
+                                        iterations)] = (salt, iterations)
+            for future in as_completed(futures):
+                keys[futures[future]] = future.result()
+                if cancel_event.is_set():
+                    for pending in futures:
+                        pending.cancel()
+                    return None
+
+        for job in jobs:
+            if 'salt' in job:
+                job['key'] = keys[(job['salt'], job['iterations'])]
+            if 'new_salt' in job:
+                job['new_key'] = keys[(job['new_salt'], job['new_iterations'])]
+
+        return keys
+
+
+def get_enc_helper(password: str, salt: str, iterations: int, key: bytes) -> EncHelper:
+    enc_password = EncPassword()
+    enc_password.password = password
+    return EncHelper(enc_password=enc_password, salt=salt, iterations=iterations, key=key)
+
+
+def process_file(job: 'Dict[str, Any]') -> 'Tuple[str, Union[str, None]]':
+    """
+    Process a single note of the batch, it is run on the worker process.
+
+    Returns:
+        Tuple[str, Union[str, None]]: Path of the note and the error, if any
+    """
+    file_path = job['file_path']
+    try:
+        if job['operation'] in (BatchCrypt.DECRYPT, BatchCrypt.REKEY):
+            file_header = FileHeader().probe(file_path)
+            content = file_header.load_encrypted(
+                file_path, get_enc_helper(job['password'], job['salt'], job['iterations'], job['key']))
+            if content is None:
+                raise InvalidToken
+        else:
+            file_header, content = FileHeader().load_file(file_path)
+            if content is None:
+                content = ''
+
+        if job['operation'] == BatchCrypt.DECRYPT:
+            data = FileHeader().get_new().pack(content)
+        else:
+            if not file_header.is_valid():
+                file_header = FileHeader().get_new()
+            enc = file_header.get_param('enc') if file_header.is_file_encrypted() else {'hint': ''}
+            enc.update({'slt': job['new_salt'], 'itr': job['new_iterations'], 'ver': EncHelper.FORMAT_CHUNKED})
+            if job['hint'] is not None:
+                enc['hint'] = job['hint']
+            file_header.set_param('enc', enc)
+            file_header.refresh()
+            data = file_header.pack_encrypted(
+                content, get_enc_helper(job['new_password'], job['new_salt'], job['new_iterations'], job['new_key']))
+            if data is None:
+                return file_path, 'Cannot encrypt with an empty password'
+
+        if not file_helper.save_file_atomic(job['target_path'], data):
+            return file_path, 'Cannot write the file'
+    except InvalidToken:
+        return file_path, 'Wrong password or damaged file'
+    except (OSError, ValueError) as e:
+        return file_path, str(e)
+
+    return file_path, None
+
+
+class BatchCryptRunner(QObject):  # QObject to allow signal emitting
+    """
+    Runs the batch on a worker thread, e.g. for the window to stay responsive.
+    """
+
+    # Signal to emit upon a note is processed, with the number of the notes processed and the total number of them
+    progress_changed = Signal(int, int)
+    # Signal to emit upon the batch is finished, with its result
+    finished = Signal(object)
+
+    def __init__(self, batch_crypt: BatchCrypt, parent=None):
+        super().__init__(parent)
+
+        self.batch_crypt = batch_crypt
+        self.cancel_event = Event()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='batch_crypt_runner')
+
+    def start(self, files: 'List[Tuple[str, str]]') -> None:
+        # The signals emitted on the worker thread are delivered on the UI thread
+        future = self.executor.submit(self.batch_crypt.run, files, progress_callback=self.progress_changed.emit,
+                                      cancel_event=self.cancel_event)
+        future.add_done_callback(lambda _future: self.finished.emit(self.get_result(_future)))
+        self.executor.shutdown(wait=False)
+
+    def get_result(self, future) -> 'Dict[str, Any]':
+        try:
+            return future.result()
+        except Exception as e:
+            self.batch_crypt.logger.warning(f'Batch failed: {e}')
+            return {'processed': [], 'failed': [], 'skipped': [], 'cancelled': True}
+
+    def cancel(self) -> None:
+        self.cancel_event.set()
+
+
+def run_cli(args: Any) -> int:
+    """
+    Run the batch from the command line, see the `crypt` command of the app.
+    The passwords are taken from the NOTOLOG_PASSWORD and NOTOLOG_NEW_PASSWORD environment variables, or prompted.
+
+    Returns:
+        int: Exit code, 1 if any note failed, 130 if interrupted
+    """
+    password = new_password = None
+    if args.operation in (BatchCrypt.DECRYPT, BatchCrypt.REKEY):
+        password = os.environ.get('NOTOLOG_PASSWORD') or getpass.getpass('Password: ')
+    if args.operation in (BatchCrypt.ENCRYPT, BatchCrypt.REKEY):
+        new_password = os.environ.get('NOTOLOG_NEW_PASSWORD')
+        if not new_password:
+            new_password = getpass.getpass('New password: ')
+            if new_password != getpass.getpass('Repeat new password: '):
+                print('Passwords do not match', file=sys.stderr)
+                return 2
+        if not new_password:
+            print('Password is empty', file=sys.stderr)
+            return 2
+
+    batch_crypt = BatchCrypt(args.operation, password=password, new_password=new_password, hint=args.hint,
+                             iterations=args.iterations, overwrite=args.overwrite, processes=args.jobs)
+    files = batch_crypt.collect(args.paths, recursive=args.recursive)
+
+    def progress(done: int, total: int) -> None:
+        print(f'\r{done}/{total}', end='', file=sys.stderr, flush=True)
+
+    try:
+        result = batch_crypt.run(files, progress_callback=progress)
+    except KeyboardInterrupt:
+        print('\nInterrupted', file=sys.stderr)
+        return 130
+
+    print('', file=sys.stderr)
+    for file_path, error in result['failed']:
+        print(f'Failed: {file_path}: {error}', file=sys.stderr)
+    for file_path in result['skipped']:
+        print(f'Skipped, the target exists: {file_path}', file=sys.stderr)
+    print(f"Processed: {len(result['processed'])}, failed: {len(result['failed'])}, "
+          f"skipped: {len(result['skipped'])}")
+
+    return 1 if result['failed'] else 0
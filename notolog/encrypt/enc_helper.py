@@ -4,7 +4,10 @@ An open-source Markdown editor built with Python.
 
 File Details:
 - Purpose: Encryption helper class.
-- Functionality: Encrypts/decrypts file data with a symmetric encryption algorithm.
+- Functionality: Encrypts/decrypts file data with a symmetric encryption algorithm. Notes are encrypted either
+  as a single Fernet token (format 1) or as a sequence of AES-GCM segments, one per line (format 2), which are
+  encrypted and decrypted one by one, so the note is never held in memory as a whole ciphertext. The segments are
+  encrypted with a subkey of their own, derived from the password key with HKDF-SHA256.
 
 Repository: https://github.com/notolog/notolog-editor
 Website: https://notolog.app
@@ -19,7 +22,10 @@ For detailed instructions and project information, please see the repository's R
 
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.exceptions import InvalidTag
 
 from .enc_password import EncPassword
 
@@ -28,8 +34,10 @@ from . import Settings
 import logging
 import secrets
 import base64
+import codecs
+import struct
 
-from typing import Union
+from typing import Iterable, Iterator, Union
 
 
 class EncHelper:
@@ -39,7 +47,28 @@ class EncHelper:
     """
     DEFAULT_ITERATIONS = 768000
 
-    def __init__(self, enc_password: EncPassword = None, salt: str = None, iterations: int = None):
+    # Encrypted content formats, the format is stored within the file header's encryption params
+    FORMAT_FERNET = 1  # type: int
+    FORMAT_CHUNKED = 2  # type: int
+
+    # Size of the content chunk encrypted into a segment, in characters
+    CHUNK_SIZE = 64 * 1024  # type: int
+    # Segment nonce size, in bytes
+    NONCE_SIZE = 12  # type: int
+    # Segment associated data prefix, the stream id, the segment index and the last segment flag are appended to it
+    SEGMENT_AAD = b'notolog.app:2'  # type: bytes
+    # Info the segments subkey is derived with, so the Fernet and AES-GCM keys are not the same
+    SEGMENT_KEY_INFO = b'notolog.app:2'  # type: bytes
+
+    def __init__(self, enc_password: EncPassword = None, salt: str = None, iterations: int = None, key: bytes = None):
+        """
+        Args:
+            enc_password (EncPassword, optional): Encryption password
+            salt (str, optional): File specific salt, random if not set
+            iterations (int, optional): Number of the key derivation iterations, the default one if not set
+            key (bytes, optional): Key derived from the password with the salt and iterations given already,
+                e.g. in background (see KeyDerivation)
+        """
         super().__init__()
 
         self.logger = logging.getLogger('enc_helper')
@@ -69,11 +98,14 @@ class EncHelper:
             self.logger.warning('No iterations provided! Default value fallback')
             self.iterations = self.__class__.get_default_iterations()
 
-        # Derive key from password
-        key = self.generate_key_from_password()
+        # Derive key from password, unless it is derived already
+        if key is None:
+            key = self.generate_key_from_password()
         encoded_key = base64.urlsafe_b64encode(key)
         # Fernet uses only the first 128 bits (16 bytes) of the decoded key for AES encryption.
         self.cipher_suite = Fernet(encoded_key)
+        # The chunked format uses a 256 bits subkey, the key itself is not used by the two ciphers at once
+        self.aead = AESGCM(self.derive_segment_key(key))
 
         self.key = None
 
@@ -84,16 +116,38 @@ class EncHelper:
         Password-Based Key Derivation Function 2 (PBKDF2) implementation.
         The param length=32 is the length of the derived key.
         """
+        self.key = self.derive_key(self.password, self.salt, self.iterations)
+
+        return self.key
+
+    @staticmethod
+    def derive_key(password: bytes, salt: bytes, iterations: int) -> bytes:
+        """
+        Password-Based Key Derivation Function 2 (PBKDF2) implementation.
+        The derivation releases the GIL, so the keys can be derived on several threads in parallel.
+        """
         kdf = PBKDF2HMAC(
             algorithm=hashes.SHA256(),
-            iterations=self.iterations,
-            salt=self.salt,
+            iterations=iterations,
+            salt=salt,
             length=32  # 32 bytes = 256 bits
         )
 
-        self.key = kdf.derive(self.password)
+        return kdf.derive(password)
 
-        return self.key
+    @classmethod
+    def derive_segment_key(cls, key: bytes) -> bytes:
+        """
+        Derive the subkey of the chunked format segments from the password key, HKDF with SHA-256.
+        """
+        hkdf = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,  # 32 bytes = 256 bits
+            salt=None,
+            info=cls.SEGMENT_KEY_INFO
+        )
+
+        return hkdf.derive(key)
 
     @staticmethod
     def generate_key() -> bytes:
@@ -120,6 +174,98 @@ class EncHelper:
             return None
         return self.cipher_suite.decrypt(encrypted_data)
 
+    def encrypt_text(self, text: str, chunk_size: int = None, stream_id: str = '') -> Union[Iterator[str], None]:
+        """
+        Encrypt the text into the chunked format segments, see encrypt_chunks().
+        The text is encoded chunk by chunk, so no full copy of it is made.
+        """
+        if not self.is_password_valid():
+            return None
+        chunk_size = chunk_size or self.CHUNK_SIZE
+        chunks = (text[pos:pos + chunk_size].encode("utf-8") for pos in range(0, len(text), chunk_size))
+        return (segment.decode("ascii") for segment in self.encrypt_chunks(chunks, stream_id=stream_id))
+
+    def decrypt_text(self, segments: Iterable[Union[str, bytes]], stream_id: str = '') -> Union[str, None]:
+        """
+        Decrypt the chunked format segments into the text, see decrypt_chunks().
+
+        Raises:
+            InvalidToken: If a segment cannot be authenticated, e.g. the password is wrong or the data is altered
+        """
+        if not self.is_password_valid():
+            return None
+        # A character may be split across the chunks
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        text = [decoder.decode(chunk) for chunk in self.decrypt_chunks(segments, stream_id=stream_id)]
+        text.append(decoder.decode(b'', final=True))
+        return ''.join(text)
+
+    def encrypt_chunks(self, chunks: Iterable[bytes], stream_id: str = '') -> Iterator[bytes]:
+        """
+        Encrypt the data chunks into the segments, one by one.
+        Each segment is the base64 encoded last segment flag, nonce and the AES-GCM encrypted chunk. The stream id,
+        the segment index and the flag are authenticated with it, so the segments cannot be reordered, dropped,
+        truncated or mixed with the segments of another stream, e.g. of a previous save or another note with the same
+        key. At least one segment is produced, even for no data.
+
+        Args:
+            chunks (Iterable[bytes]): Data chunks
+            stream_id (str, optional): Random id of the stream, see generate_stream_id()
+        """
+        index = 0
+        chunk = None
+        for next_chunk in chunks:
+            if chunk is not None:
+                yield self.encrypt_segment(chunk, index, False, stream_id)
+                index += 1
+            chunk = next_chunk
+        yield self.encrypt_segment(chunk if chunk is not None else b'', index, True, stream_id)
+
+    def decrypt_chunks(self, segments: Iterable[Union[str, bytes]], stream_id: str = '') -> Iterator[bytes]:
+        """
+        Decrypt the segments into the data chunks, one by one. Empty segments (e.g. blank lines) are skipped.
+
+        Raises:
+            InvalidToken: If a segment cannot be authenticated or the last segment is missing
+        """
+        index = 0
+        is_last = False
+        for segment in segments:
+            if not segment:
+                continue
+            if is_last:
+                # There is nothing after the last segment
+                raise InvalidToken
+            chunk, is_last = self.decrypt_segment(segment, index, stream_id)
+            index += 1
+            yield chunk
+        if not is_last:
+            # Truncated
+            raise InvalidToken
+
+    def encrypt_segment(self, chunk: bytes, index: int, is_last: bool, stream_id: str = '') -> bytes:
+        flag = b'\x01' if is_last else b'\x00'
+        nonce = secrets.token_bytes(self.NONCE_SIZE)
+        return base64.urlsafe_b64encode(
+            flag + nonce + self.aead.encrypt(nonce, chunk, self.get_segment_aad(index, flag, stream_id)))
+
+    def decrypt_segment(self, segment: Union[str, bytes], index: int, stream_id: str = '') -> tuple[bytes, bool]:
+        try:
+            data = base64.urlsafe_b64decode(segment)
+        except ValueError:
+            raise InvalidToken
+        flag, nonce, encrypted_chunk = data[:1], data[1:self.NONCE_SIZE + 1], data[self.NONCE_SIZE + 1:]
+        try:
+            chunk = self.aead.decrypt(nonce, encrypted_chunk, self.get_segment_aad(index, flag, stream_id))
+        except (InvalidTag, ValueError):
+            raise InvalidToken
+        return chunk, flag == b'\x01'
+
+    def get_segment_aad(self, index: int, flag: bytes, stream_id: str = '') -> bytes:
+        # The last segment flag is stored as is, it is authenticated along with the stream id and the segment index
+        stream_id_b = stream_id.encode('utf-8')
+        return self.SEGMENT_AAD + struct.pack('>H', len(stream_id_b)) + stream_id_b + struct.pack('>Q', index) + flag
+
     def is_password_valid(self) -> bool:
         """
         Check either the password is valid or not
@@ -133,6 +279,13 @@ class EncHelper:
         """
         return secrets.token_urlsafe(length)
 
+    @staticmethod
+    def generate_stream_id(length: int = 16) -> str:
+        """
+        Generate new stream id, it is stored within the file header and is new on each save
+        """
+        return secrets.token_urlsafe(length)
+
     @staticmethod
     def get_default_iterations() -> int:
         # Allow update default value and store it in settings
@@ -0,0 +1,226 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Background derivation of the encryption keys.
+- Functionality: Derives the keys from the password on the worker threads, so the window stays responsive while
+  the encrypted notes are opened. The keys of several notes are derived in parallel. The keys derived are kept in
+  memory by the password fingerprint, salt and iterations, and wiped once they are not used for a while.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Iterable, Tuple
+
+import os
+import hmac
+import hashlib
+import logging
+import secrets
+
+from .enc_helper import EncHelper
+
+if TYPE_CHECKING:
+    from typing import Dict  # noqa: F401
+
+
+class KeyDerivation(QObject):  # QObject to allow signal emitting
+
+    # Signal to emit upon a derivation is started (True) or there is no derivation in progress anymore (False)
+    busy_changed = Signal(bool)
+    # Signal to emit on the UI thread upon a key is derived
+    key_derived = Signal()
+    # Signal to emit upon the keys are wiped, e.g. to drop the objects keeping the keys as well
+    keys_wiped = Signal()
+    # Internal signal to pass the derivation end over from the worker thread
+    _finished = Signal()
+    # Internal signal to pass the password and the params found by a prefetch scan over from the worker thread
+    _scanned = Signal(bytes, object)
+
+    # Max number of the keys to keep
+    MAX_SIZE = 64  # type: int
+    # Time to keep the keys since they are used last, in milliseconds
+    IDLE_TIMEOUT = 15 * 60 * 1000  # type: int
+    # Max number of the keys to prefetch at once, and the workers to prefetch them, not to compete with the keys needed
+    MAX_PREFETCH = 8  # type: int
+    PREFETCH_WORKERS = 1  # type: int
+
+    def __init__(self, max_size: int = None, idle_timeout: int = None, max_workers: int = None, parent=None):
+        """
+        Args:
+            max_size (int, optional): Max number of the keys to keep
+            idle_timeout (int, optional): Time to keep the keys since they are used last, in milliseconds
+            max_workers (int, optional): Number of the keys to derive in parallel, the number of the CPUs by default
+            parent (optional): Parent object
+        """
+        super().__init__(parent)
+
+        self.logger = logging.getLogger('key_derivation')
+
+        self.max_size = max_size if max_size is not None else self.MAX_SIZE
+
+        # PBKDF2 releases the GIL, the threads derive the keys in parallel
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 1,
+                                           thread_name_prefix='key_derivation')
+        # The keys that may be needed next are derived apart, so the keys needed now do not wait for them
+        self.prefetch_executor = ThreadPoolExecutor(max_workers=self.PREFETCH_WORKERS,
+                                                    thread_name_prefix='key_prefetch')
+
+        # Derived keys and the derivations in progress by the password fingerprint, salt and iterations
+        self.keys = OrderedDict()  # type: OrderedDict[Tuple[bytes, bytes, int], bytes]
+        self.futures = {}  # type: Dict[Tuple[bytes, bytes, int], Future]
+        # Derivations in progress that are prefetched
+        self.prefetched = set()  # type: set[Tuple[bytes, bytes, int]]
+        # Keys are stored by the workers
+        self.lock = Lock()
+
+        # Secret to get the password fingerprints, so the passwords cannot be guessed by them
+        self.secret = secrets.token_bytes(32)
+
+        # Wipe the keys once they are not used for a while
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.setInterval(idle_timeout if idle_timeout is not None else self.IDLE_TIMEOUT)
+        self.idle_timer.timeout.connect(self.clear)
+
+        self._finished.connect(self.derivation_finished)
+        self._scanned.connect(self.prefetch)
+
+    def get_params(self, password: bytes, salt: bytes, iterations: int) -> Tuple[bytes, bytes, int]:
+        fingerprint = hmac.new(self.secret, password, hashlib.sha256).digest()
+        return fingerprint, salt, iterations
+
+    def derive(self, password: bytes, salt: bytes, iterations: int, prefetch: bool = False) -> Future:
+        """
+        Derive the key in background, unless it is derived or being derived already.
+
+        Args:
+            password (bytes): Password
+            salt (bytes): Salt
+            iterations (int): Number of the iterations
+            prefetch (bool, optional): The key may be needed later, it is derived by the prefetch worker
+
+        Returns:
+            Future: Resolves with the key derived
+        """
+        params = self.get_params(password, salt, iterations)
+        self.idle_timer.start()
+
+        with self.lock:
+            key = self.keys.get(params)
+            if key is not None:
+                self.keys.move_to_end(params)
+                future = Future()
+                future.set_result(key)
+                return future
+            future = self.futures.get(params)
+
+        # The key needed now is not left queued behind the prefetched ones; cancelled outside the lock, as the done
+        # callbacks are called right away
+        if future is not None and (prefetch or params not in self.prefetched or not future.cancel()):
+            return future
+
+        with self.lock:
+            # The lock is held, so the future is stored before the worker is done with it
+            executor = self.prefetch_executor if prefetch else self.executor
+            future = executor.submit(self.run, params, password, salt, iterations)
+            self.futures[params] = future
+            if prefetch:
+                self.prefetched.add(params)
+            else:
+                self.prefetched.discard(params)
+            is_first = len(self.futures) == 1
+
+        self.logger.debug(f'Key derivation started [{iterations} iterations]')
+        if is_first:
+            self.busy_changed.emit(True)
+
+        # Done callbacks are called on the worker thread, the signal passes the end over to the UI thread
+        future.add_done_callback(lambda _future: self._finished.emit())
+
+        return future
+
+    def prefetch(self, password: bytes, params: Iterable[Tuple[bytes, int]]) -> None:
+        """
+        Derive the keys for the salts and iterations given in background, e.g. for the notes to be opened next.
+        Up to the max prefetch number of the keys are derived, one by one.
+        """
+        for index, (salt, iterations) in enumerate(params):
+            if index >= self.MAX_PREFETCH:
+                break
+            self.derive(password, salt, iterations, prefetch=True)
+
+    def prefetch_scan(self, password: bytes, scan: Callable[[], Iterable[Tuple[bytes, int]]]) -> Future:
+        """
+        Look for the salts and iterations of the keys to prefetch on the prefetch worker, e.g. by reading the headers
+        of the notes nearby, and prefetch the keys found then. The scan is queued ahead of the keys it finds.
+
+        Returns:
+            Future: Resolves with the params found
+        """
+        future = self.prefetch_executor.submit(scan)
+        # Done callbacks are called on the worker thread, the signal passes the params over to the UI thread
+        future.add_done_callback(lambda _future: self.scan_finished(password, _future))
+        return future
+
+    def scan_finished(self, password: bytes, future: Future) -> None:
+        if future.cancelled():
+            return
+        try:
+            params = list(future.result())
+        except Exception as e:
+            self.logger.warning(f'Key prefetch scan failed: {e}')
+            return
+        self._scanned.emit(password, params)
+
+    def run(self, params: Tuple[bytes, bytes, int], password: bytes, salt: bytes, iterations: int) -> bytes:
+        try:
+            key = EncHelper.derive_key(password, salt, iterations)
+            with self.lock:
+                self.keys[params] = key
+                self.keys.move_to_end(params)
+                while len(self.keys) > self.max_size:
+                    self.keys.popitem(last=False)
+            return key
+        finally:
+            with self.lock:
+                self.futures.pop(params, None)
+                self.prefetched.discard(params)
+
+    def derivation_finished(self) -> None:
+        if not self.is_busy():
+            self.busy_changed.emit(False)
+        self.key_derived.emit()
+
+    def is_busy(self) -> bool:
+        with self.lock:
+            return bool(self.futures)
+
+    def clear(self) -> None:
+        """
+        Wipe the keys derived.
+        """
+        with self.lock:
+            self.keys.clear()
+        self.logger.debug('Derived keys are wiped')
+        self.keys_wiped.emit()
+
+    def shutdown(self) -> None:
+        self.idle_timer.stop()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        self.clear()
@@ -20,18 +20,66 @@ For detailed instructions and project information, please see the repository's R
 import datetime
 import logging
 import json
+import copy
 import re
 import os
 
-from typing import Any, Union, Iterable
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Union, Iterable, Iterator, Tuple
 from json import JSONDecodeError
 
 from .helpers import file_helper
+from .helpers.regex_helper import RegexRegistry
 from .encrypt.enc_helper import EncHelper
 
 from .exceptions.file_header_empty_exception import FileHeaderEmptyException
 
 
+class FileHeaderCache:
+    """
+    Parsed headers of the files by the file path. A header is actual as long as the file modification time and size
+    are the same, so the files are not read again to get their headers, e.g. to check the encryption.
+    """
+
+    # Max number of the files to keep the headers of
+    MAX_SIZE = 4096  # type: int
+
+    def __init__(self, max_size: int = None):
+        self.max_size = max_size if max_size is not None else self.MAX_SIZE
+        # Path -> ((mtime, size), header)
+        self.items = OrderedDict()  # type: OrderedDict[str, Tuple[Tuple[int, int], Any]]
+        # The cache is shared with the workers, e.g. the workspace index
+        self.lock = Lock()
+
+    @staticmethod
+    def get_key(stat: os.stat_result) -> Tuple[int, int]:
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, file_path: str, stat: os.stat_result) -> Tuple[bool, Any]:
+        """
+        Returns:
+            Tuple[bool, Any]: Whether the header is found, and the header json (None if the file has no header)
+        """
+        with self.lock:
+            item = self.items.get(file_path)
+            if item is None or item[0] != self.get_key(stat):
+                return False, None
+            self.items.move_to_end(file_path)
+            return True, copy.deepcopy(item[1])
+
+    def put(self, file_path: str, stat: os.stat_result, header: Any) -> None:
+        with self.lock:
+            self.items[file_path] = (self.get_key(stat), copy.deepcopy(header))
+            self.items.move_to_end(file_path)
+            while len(self.items) > self.max_size:
+                self.items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.items.clear()
+
+
 class FileHeader:
     """
     File header stores the data about the file and its contents.
@@ -42,6 +90,15 @@ class FileHeader:
     """
 
     HEADER_TPL = '<!-- %s -->'
+    # Header within the header line, compiled once rather than formatted and searched per file
+    HEADER_RE = RegexRegistry.compile(HEADER_TPL % '(.*?)', re.IGNORECASE)
+    # Line boundaries splitlines() splits the text by
+    LINE_BREAK_RE = RegexRegistry.compile('[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+    # Size of the chunks the header line is read by from the file
+    READ_CHUNK_SIZE = 4096  # type: int
+
+    # Headers of the files probed or loaded, shared by the instances
+    cache = FileHeaderCache()
 
     def __init__(self):
         super(FileHeader, self).__init__()
@@ -67,7 +124,8 @@ class FileHeader:
         return header
 
     def generate_enc(self) -> json:
-        return {'enc': {'slt': EncHelper.generate_salt(), 'itr': EncHelper.get_default_iterations(), 'hint': ''}}
+        return {'enc': {'slt': EncHelper.generate_salt(), 'itr': EncHelper.get_default_iterations(), 'hint': '',
+                        'ver': EncHelper.FORMAT_CHUNKED}}
 
     def set_encrypted(self):
         self.header['notolog.app'].update(self.generate_enc())
@@ -133,6 +191,15 @@ class FileHeader:
             return enc[param]
         return None
 
+    def get_enc_version(self) -> int:
+        """
+        Get the encrypted content format, the files encrypted before the format is set are the Fernet ones.
+        """
+        try:
+            return int(self.get_enc_param('ver') or EncHelper.FORMAT_FERNET)
+        except (TypeError, ValueError):
+            return EncHelper.FORMAT_FERNET
+
     def set_enc_param(self, param: str, value: str) -> None:
         """
         Set encryption params to the header.
@@ -170,40 +237,225 @@ class FileHeader:
             # Return header without content
             return header_line
 
-    def load_file(self, file_path: str) -> tuple[Any, str]:
-        file_data = file_helper.read_file(file_path)
-        return self.load(file_data)
+    def pack_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Pack the header and the content lines given one by one, e.g. the encrypted content segments, to be written
+        without joining them all first.
+        """
+        header_line = repr(self)
+        if header_line:
+            yield header_line
+        is_first = True
+        for line in lines:
+            yield line if is_first and not header_line else '\n' + line
+            is_first = False
+
+    def pack_encrypted(self, content: str, encrypt_helper: EncHelper) -> Union[str, Iterator[str], None]:
+        """
+        Encrypt the content in the format set within the header and pack it with the header.
+        The chunked format content is encrypted segment by segment as it is being written.
+
+        Returns:
+            Union[str, Iterator[str], None]: The file data or its lines, None if the content cannot be encrypted
+        """
+        if self.get_enc_version() == EncHelper.FORMAT_CHUNKED:
+            # New stream on each save, so the segments cannot be replayed from another save or another note
+            stream_id = EncHelper.generate_stream_id()
+            segments = encrypt_helper.encrypt_text(content, stream_id=stream_id)
+            if segments is None:
+                return None
+            self.set_enc_param('sid', stream_id)
+            return self.pack_lines(segments)
+        encrypted_content_b = encrypt_helper.encrypt_data(content.encode("utf-8"))
+        return self.pack(encrypted_content_b.decode("utf-8")) if encrypted_content_b else None
+
+    def load_encrypted(self, file_path: str, encrypt_helper: EncHelper) -> Union[str, None]:
+        """
+        Read and decrypt the content of the file in the format set within the header.
+        The chunked format content is read and decrypted segment by segment.
+
+        Raises:
+            InvalidToken: If the content cannot be decrypted, e.g. the password is wrong
+        """
+        if self.get_enc_version() == EncHelper.FORMAT_CHUNKED:
+            try:
+                return encrypt_helper.decrypt_text(self.read_body_lines(file_path),
+                                                   stream_id=str(self.get_enc_param('sid') or ''))
+            except (OSError, UnicodeDecodeError) as e:
+                self.logger.warning(f'Error reading encrypted file "{file_path}": {e}')
+                return None
+        _file_header, encrypted_content = FileHeader().load_file(file_path)
+        decrypted_content_b = encrypt_helper.decrypt_data((encrypted_content or '').encode("utf-8"))
+        return decrypted_content_b.decode("utf-8") if decrypted_content_b is not None else None
+
+    def read_body_lines(self, file_path: str) -> Iterator[str]:
+        """
+        Read the body of the file with a header line by line, e.g. the encrypted content segments.
+        """
+        with open(file_path, encoding='utf-8') as f:
+            # Header line
+            f.readline()
+            for line in f:
+                yield line.rstrip('\n')
+
+    def load_file(self, file_path: str) -> tuple[Any, Union[str, None]]:
+        """
+        Load the header and the body of the file, the same as load() does it with the file content.
+        The header is parsed from the first line only and the rest of the file is read as the body at once, without
+        splitting it into lines and joining them back, so the content is kept in memory as a single copy.
+        """
+        if not file_helper.can_access_file(file_path, 'r'):
+            return self, None
 
-    def load(self, file_data: str) -> tuple[Any, Union[str, None]]:
         try:
-            file_header_line = file_data.splitlines()[0]
-        except (IndexError, AttributeError):
+            with open(file_path, 'rb') as f:
+                header_line = self.read_first_line(f)
+                is_valid = self.parse(self.decode(header_line))
+                stat = os.fstat(f.fileno())
+                self.cache.put(file_path, stat, self.header)
+                if is_valid:
+                    if stat.st_size <= f.tell():
+                        return self, None
+                    # The line break ending the file is not a part of the body, it is left unread
+                    return self, self.read_body(f, stat.st_size, strip_line_break=True)
+                # No header, the whole file is the body
+                f.seek(0)
+                return self, self.read_body(f, stat.st_size)
+        except (OSError, IOError) as e:
+            self.logger.warning(f'Error reading file "{file_path}": {e}')
+            return self, None
+
+    @classmethod
+    def read_first_line(cls, f) -> bytes:
+        """
+        Read the first line of the file opened in binary mode, ended with either '\\n', '\\r' or '\\r\\n' as the text
+        mode reading does it. The file is read by chunks up to the line break and the position is set right after it.
+
+        Returns:
+            bytes: The line without its line break
+        """
+        start = f.tell()
+        data = b''
+        while True:
+            chunk = f.read(cls.READ_CHUNK_SIZE)
+            if not chunk:
+                # No line break, the whole file is a single line
+                return data
+            # Look for the line break within the new chunk only
+            offset = len(data)
+            data += chunk
+            ends = [index for index in (data.find(b'\n', offset), data.find(b'\r', offset)) if index >= 0]
+            if not ends:
+                continue
+            end = min(ends)
+            line_end = end + 1
+            if data[end:line_end] == b'\r':
+                if line_end == len(data):
+                    # The line break may continue in the next chunk
+                    data += f.read(1)
+                if data[line_end:line_end + 1] == b'\n':
+                    line_end += 1
+            f.seek(start + line_end)
+            return data[:end]
+
+    @classmethod
+    def read_body(cls, f, file_size: int, strip_line_break: bool = False) -> str:
+        """
+        Read the rest of the file from the current position. The line break ending the file is excluded before
+        decoding when asked to, so the body is not copied once more to strip it.
+        """
+        offset = f.tell()
+        size = file_size - offset
+        if strip_line_break and size > 0:
+            f.seek(max(file_size - 2, offset))
+            tail = f.read(2)
+            size -= 2 if tail == b'\r\n' else 1 if tail[-1:] in (b'\n', b'\r') else 0
+            f.seek(offset)
+        return cls.decode(f.read(size))
+
+    @staticmethod
+    def decode(data: bytes) -> str:
+        """
+        Decode the file data the same way the text mode reading does it, with the universal newlines.
+        """
+        text = data.decode('utf-8')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+
+    def load(self, file_data: str) -> tuple[Any, Union[str, None]]:
+        if not isinstance(file_data, str) or not file_data:
             self.logger.debug('File header is not found')
             return self, file_data
 
+        # The first line, the same as splitlines() gives it, without splitting the whole content
+        line_break = self.LINE_BREAK_RE.search(file_data)
+        file_header_line = file_data[:line_break.start()] if line_break else file_data
+
+        if self.parse(file_header_line):
+            # Splitting file_data into lines
+            lines = file_data.splitlines()
+            if len(lines) >= 2:
+                file_body = "\n".join(lines[1:])
+            else:
+                file_body = None
+            return self, file_body
+
+        return self, file_data
+
+    def parse(self, file_header_line: str) -> bool:
+        """
+        Parse the header from the header line of the file.
+
+        Returns:
+            bool: True if the header is found and valid
+        """
         self.header = None
         try:
-            search = re.search(self.HEADER_TPL % '(.*?)', file_header_line, re.IGNORECASE)
+            search = self.HEADER_RE.search(file_header_line)
             file_header_json = search.group(1) if search else None
             self.header = json.loads(file_header_json)
             # Run migrations here if needed
             self.validate_enc()
         except (TypeError, JSONDecodeError):
             self.logger.debug('File header is empty')
-            return self, file_data
+            return False
 
         if self.is_valid():
-            # Splitting file_data into lines
-            lines = file_data.splitlines()
-            if len(lines) >= 2:
-                file_body = "\n".join(lines[1:])
-            else:
-                file_body = None
-            return self, file_body
+            return True
 
         self.logger.debug('File header is empty')  # Suppose to be a valid situation if not set yet or not created
 
-        return self, file_data
+        return False
+
+    def probe(self, file_path: str) -> Any:
+        """
+        Get the header of the file reading its first line only, see read(). The header is taken from the cache
+        unless the file is changed since it is probed or loaded.
+        """
+        self.header = None
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return self
+
+        found, header = self.cache.get(file_path, stat)
+        if found:
+            self.header = header
+            return self
+
+        try:
+            file_header_line = self.read(file_path)
+        except (OSError, ValueError) as e:
+            # Not a text file, e.g. the decoding failed
+            self.logger.debug(f'File header cannot be read "{file_path}": {e}')
+            file_header_line = None
+        if file_header_line is not None:
+            self.parse(file_header_line)
+
+        self.cache.put(file_path, stat, self.header)
+
+        return self
 
     def read(self, file_path: str) -> Union[str, None]:
         if os.path.isfile(file_path):
@@ -20,9 +20,11 @@ from PySide6.QtCore import QDir
 
 import os
 import sys
+import shutil
 import logging
+import tempfile
 
-from typing import Union
+from typing import IO, Iterable, Union
 
 
 def res_path(rel_path):
@@ -123,13 +125,21 @@ def read_file(file_path: str, as_bytearray: bool = False) -> Union[str, bytearra
         return None
 
 
-def save_file(file_path: str, data: Union[str, bytearray], as_bytearray: bool = False) -> bool:
+def write_data(file: IO, data: Union[str, bytearray, Iterable]) -> None:
+    if isinstance(data, (str, bytes, bytearray)):
+        file.write(data)
+    else:
+        # The parts are produced on the fly, e.g. the encrypted segments
+        file.writelines(data)
+
+
+def save_file(file_path: str, data: Union[str, bytearray, Iterable], as_bytearray: bool = False) -> bool:
     """
     Save content to the specified file.
 
     Args:
         file_path (str): The path to the file where content will be saved.
-        data (Union[str, bytearray]): The content to save.
+        data (Union[str, bytearray, Iterable]): The content to save, or its parts to write one by one.
         as_bytearray (bool): If True, saves the content as a bytearray;
                              otherwise saves it as a string. Defaults to False.
 
@@ -143,7 +153,7 @@ def save_file(file_path: str, data: Union[str, bytearray], as_bytearray: bool =
     mode = 'wb' if as_bytearray else 'w'
     try:
         with open(file_path, mode, encoding=None if as_bytearray else 'utf-8') as file:
-            file.write(data)
+            write_data(file, data)
             return True
     except (OSError, IOError) as e:
         logger = logging.getLogger("file_helper")
@@ -151,6 +161,63 @@ def save_file(file_path: str, data: Union[str, bytearray], as_bytearray: bool =
         return False
 
 
+def save_file_atomic(file_path: str, data: Union[str, bytearray, Iterable], as_bytearray: bool = False) -> bool:
+    """
+    Save content to the specified file atomically: the content is written to a temporary file next to it, flushed
+    to the disk and renamed over the file, so the file is never left partially written.
+    A new file or a file within a read-only directory is saved the usual way, as there is nothing to lose.
+    A symlinked file is saved to its target, the link itself is kept.
+
+    Args:
+        file_path (str): The path to the file where content will be saved.
+        data (Union[str, bytearray, Iterable]): The content to save, or its parts to write one by one.
+        as_bytearray (bool): If True, saves the content as a bytearray;
+                             otherwise saves it as a string. Defaults to False.
+
+    Returns:
+        bool: True if the content was successfully saved, False otherwise.
+    """
+    # The target of the link is replaced, not the link itself
+    file_path = os.path.realpath(file_path)
+    dir_path = os.path.dirname(file_path) or '.'
+    if not os.path.isfile(file_path) or not os.access(dir_path, os.W_OK):
+        return save_file(file_path, data, as_bytearray=as_bytearray)
+
+    if not can_access_file(file_path, 'w'):
+        return False
+
+    mode = 'wb' if as_bytearray else 'w'
+    temp_path = None
+    try:
+        # Hidden temporary file within the same directory, to be renamed on the same file system
+        fd, temp_path = tempfile.mkstemp(prefix='.%s.' % os.path.basename(file_path), suffix='.tmp', dir=dir_path)
+        with open(fd, mode, encoding=None if as_bytearray else 'utf-8') as file:
+            write_data(file, data)
+            file.flush()
+            os.fsync(file.fileno())
+        # Keep the permissions of the file replaced
+        shutil.copymode(file_path, temp_path)
+        os.replace(temp_path, file_path)
+        return True
+    except (OSError, IOError) as e:
+        logger = logging.getLogger("file_helper")
+        logger.warning(f"Error saving file {file_path}: {e}")
+        remove_temp_file(temp_path)
+        return False
+    except Exception:
+        # The content parts failed to be produced, the file is kept as is
+        remove_temp_file(temp_path)
+        raise
+
+
+def remove_temp_file(temp_path: Union[str, None]) -> None:
+    if temp_path is not None and os.path.exists(temp_path):
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
 def is_file_openable(file_path: str) -> bool:
     """
     Check if a file is openable.
@@ -0,0 +1,171 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Import helper classes.
+- Functionality: Lazy imports of the heavy modules, imported upon their first use rather than at startup, and the
+  import time profiler to see what the startup time is spent on.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from importlib.abc import MetaPathFinder
+from typing import TYPE_CHECKING, Any
+
+import sys
+import time
+import logging
+import importlib
+import threading
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Tuple, Union  # noqa: F401
+
+
+class LazyImport:
+    """
+    Stand-in for a module or a module attribute (e.g. a dialog class), the module is imported upon the first use of
+    the stand-in: calling it or getting its attribute.
+
+    Example:
+        SettingsDialog = LazyImport('.ui.settings_dialog', 'SettingsDialog', package=__package__)
+        settings = SettingsDialog(self)  # Imported here
+    """
+
+    def __init__(self, module_name: str, attr_name: str = None, package: str = None):
+        """
+        Args:
+            module_name (str): Module name, relative to the package if starts with a dot
+            attr_name (str, optional): Name of the module attribute to stand in for, the module itself if not set
+            package (str, optional): Package of the relative module name
+        """
+        # Set directly, as any other attribute is taken from the target
+        self.__dict__.update({'_module_name': module_name, '_attr_name': attr_name, '_package': package,
+                              '_target': None})
+
+    def load(self) -> Any:
+        """
+        Import the module if not imported yet.
+
+        Returns:
+            Any: The module or its attribute
+        """
+        target = self.__dict__['_target']
+        if target is None:
+            module = importlib.import_module(self._module_name, self._package)
+            target = getattr(module, self._attr_name) if self._attr_name else module
+            self.__dict__['_target'] = target
+            logging.getLogger('import_helper').debug(
+                f'Lazy import of "{self._module_name}"{f" {self._attr_name}" if self._attr_name else ""} loaded')
+        return target
+
+    def is_loaded(self) -> bool:
+        return self.__dict__['_target'] is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.load(), name)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.load()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<LazyImport '{self._module_name}'{f' {self._attr_name}' if self._attr_name else ''}>"
+
+
+class ImportProfiler(MetaPathFinder):
+    """
+    Measures the time each module takes to import, the same way `python -X importtime` does: the self time of the
+    module code and the cumulative time with the modules it imports.
+    """
+
+    def __init__(self):
+        # Self and cumulative time of the modules imported, in seconds
+        self.records = {}  # type: Dict[str, Tuple[float, float]]
+        # Time of the nested imports being run, per thread
+        self.local = threading.local()
+        self.installed_at = None  # type: Union[float, None]
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+            self.installed_at = time.perf_counter()
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        # Find the module with the rest of the finders, then wrap its loader to measure the module execution
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = TimedLoader(spec.loader, self)
+        return spec
+
+    def exec_module(self, loader: Any, module: Any) -> None:
+        stack = self.local.__dict__.setdefault('stack', [])  # type: List[float]
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            loader.exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            self.records[module.__name__] = (elapsed - nested, elapsed)
+            # The original loader is set back, e.g. for the resource readers
+            module.__loader__ = loader
+            if getattr(module, '__spec__', None) is not None:
+                module.__spec__.loader = loader
+
+    def get_total(self) -> float:
+        """
+        Total import time of the top level modules, in seconds.
+        """
+        return sum(self_time for self_time, _cumulative in self.records.values())
+
+    def report(self, limit: int = 30) -> str:
+        """
+        Breakdown of the slowest imports by the cumulative time, in microseconds as `-X importtime` shows it.
+        """
+        lines = ['import time: self [us] | cumulative | imported package']
+        records = sorted(self.records.items(), key=lambda item: item[1][1], reverse=True)
+        for name, (self_time, cumulative) in records[:limit]:
+            lines.append(f'import time: {int(self_time * 1e6):>9} | {int(cumulative * 1e6):>10} | {name}')
+        lines.append(f'Imported modules: {len(self.records)}, total import time: {self.get_total() * 1e3:.1f} ms')
+        return '\n'.join(lines)
+
+
+class TimedLoader:
+    """
+    Loader wrapper measuring the module execution, see ImportProfiler.
+    """
+
+    def __init__(self, loader: Any, profiler: ImportProfiler):
+        self.loader = loader
+        self.profiler = profiler
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec) if hasattr(self.loader, 'create_module') else None
+
+    def exec_module(self, module) -> None:
+        self.profiler.exec_module(self.loader, module)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.loader, name)
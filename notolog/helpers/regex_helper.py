@@ -0,0 +1,235 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Registry of the compiled regular expressions.
+- Functionality: Compiles each pattern once and shares it across the app, e.g. among the highlighters of the
+  various documents, and combines the independent replacements into a single alternation to replace them within a
+  single pass over the content.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from typing import TYPE_CHECKING, Dict
+
+import re
+import threading
+
+if TYPE_CHECKING:
+    from typing import List, Pattern, Match, Tuple, Union  # noqa: F401
+
+
+class RegexRegistry:
+    """
+    Compiled patterns by the pattern and flags. Unlike the module level functions of `re`, the callers keep the
+    compiled pattern rather than look it up within the `re` cache (limited in size) upon each call.
+    """
+
+    patterns = {}  # type: Dict[Tuple[str, int], Pattern]
+    replacers = {}  # type: Dict[Tuple[Tuple[str, str], ...], Replacer]
+
+    lock = threading.Lock()
+
+    @classmethod
+    def compile(cls, pattern: str, flags: int = 0) -> 'Pattern':
+        key = (pattern, flags)
+        compiled = cls.patterns.get(key)
+        if compiled is None:
+            compiled = re.compile(pattern, flags)
+            with cls.lock:
+                cls.patterns[key] = compiled
+        return compiled
+
+    @classmethod
+    def get_replacer(cls, replacements: Dict[str, str], flags: int = 0) -> 'Replacer':
+        """
+        Replacer of the replacements given, see Replacer.
+        """
+        key = (tuple(replacements.items()), flags)
+        replacer = cls.replacers.get(key)
+        if replacer is None:
+            replacer = Replacer(replacements, flags)
+            with cls.lock:
+                cls.replacers[key] = replacer
+        return replacer
+
+
+class Replacer:
+    """
+    Performs the replacements, in the `re.sub()` format, within a single pass over the content: the patterns are
+    combined into an alternation. The result is the same as the replacements applied one by one as long as they are
+    independent, i.e. the patterns do not overlap and a replacement does not produce any text the following patterns
+    would match.
+
+    Each alternative ends with an empty marker group to tell which one has matched. Wrapping the alternatives into
+    groups instead would hide their first characters, so the alternation would be tried at each position of the
+    content rather than at the candidate characters only.
+
+    The groups of an alternative are shifted by the groups of the preceding ones, so the group references of its
+    pattern, i.e. the backreferences and the conditionals, are renumbered, and the named groups are turned into the
+    numbered ones, as the same name may be used by the various patterns.
+    """
+
+    # Group references of a replacement template, and the escaped backslash to skip
+    GROUP_REF_RE = re.compile(r'\\(\d+|g<\w+>|\\)')
+    # Group references of a pattern: named group, named backreference and conditional
+    PATTERN_REF_RE = re.compile(r'\(\?P<(\w+)>|\(\?P=(\w+)\)|\(\?\((\w+)\)')
+
+    def __init__(self, replacements: Dict[str, str], flags: int = 0):
+        """
+        Args:
+            replacements (Dict[str, str]): Replacement templates by the patterns, in the order to apply them
+            flags (int, optional): Flags of the patterns
+        """
+        parts = []  # type: List[str]
+        # Parsed replacement templates by the marker group index of the alternative
+        self.templates = {}  # type: Dict[int, List[Union[str, int]]]
+        offset = 0
+        for pattern, replacement in replacements.items():
+            # The groups of the pattern follow the ones of the preceding alternatives
+            compiled = re.compile(pattern, flags)
+            parts.append(f'(?:{self.shift_pattern(pattern, offset, compiled.groupindex)})()')
+            self.templates[offset + compiled.groups + 1] = self.parse_template(replacement, offset,
+                                                                               compiled.groupindex)
+            offset += compiled.groups + 1
+        self.pattern = re.compile('|'.join(parts), flags)  # type: Pattern
+
+    @classmethod
+    def shift_pattern(cls, pattern: str, shift: int, group_index: 'Dict[str, int]' = None) -> str:
+        """
+        Renumber the group references of the pattern, the sets (e.g. `[\\1]`) and the escapes are kept as they are.
+
+        Args:
+            pattern (str): Pattern of the alternative
+            shift (int): Number of the groups the pattern's groups are shifted by within the alternation
+            group_index (Dict[str, int], optional): Group numbers by the names, see Pattern.groupindex
+
+        Raises:
+            ValueError: Unknown group name, e.g. the pattern is a verbose one with the comments
+        """
+        group_index = group_index or {}
+        result = []  # type: List[str]
+        pos = 0
+        while pos < len(pattern):
+            char = pattern[pos]
+            if char == '[':
+                end = cls.get_set_end(pattern, pos)
+                result.append(pattern[pos:end])
+                pos = end
+                continue
+            if char == '\\':
+                number, end = cls.get_backreference(pattern, pos)
+                # Grouped, so no digit following it is taken as the part of the number; other escapes are kept
+                result.append(f'(?:\\{number + shift})' if number is not None else pattern[pos:end])
+                pos = end
+                continue
+            match = cls.PATTERN_REF_RE.match(pattern, pos)
+            if match is None:
+                result.append(char)
+                pos += 1
+                continue
+            group_name, ref_name, condition = match.groups()
+            if group_name is not None:
+                result.append('(')
+            else:
+                name = ref_name if ref_name is not None else condition
+                if not name.isdigit() and name not in group_index:
+                    raise ValueError(f'Unknown group name "{name}" in the pattern "{pattern}"')
+                index = int(name if name.isdigit() else group_index[name]) + shift
+                result.append(f'(?({index})' if condition is not None else f'(?:\\{index})')
+            pos = match.end()
+        return ''.join(result)
+
+    @staticmethod
+    def get_backreference(pattern: str, pos: int) -> 'Tuple[Union[int, None], int]':
+        """
+        Parse the escape at the position given the way `re` does: up to 2 digits not starting with 0 are the group
+        number, unless there are 3 octal digits.
+
+        Returns:
+            Tuple[Union[int, None], int]: Group number, None if it is another escape, and the position after it
+        """
+        digits = pattern[pos + 1:pos + 4]
+        if not digits[:1].isdigit() or digits[0] == '0' or (len(digits) == 3 and all(d in '01234567' for d in digits)):
+            # The octal escapes are taken as a whole, the other ones are up to 2 characters long, e.g. \x within \x41
+            return None, pos + (4 if digits[:1].isdigit() and digits[0] != '0' else 2)
+        number = digits[:2] if digits[1:2].isdigit() else digits[:1]
+        return int(number), pos + 1 + len(number)
+
+    @staticmethod
+    def get_set_end(pattern: str, pos: int) -> int:
+        # Position after the set starting at the position given, a closing bracket right after the opening one is
+        # a literal
+        end = pos + 1
+        if pattern.startswith('^', end):
+            end += 1
+        if pattern.startswith(']', end):
+            end += 1
+        while end < len(pattern) and pattern[end] != ']':
+            end += 2 if pattern[end] == '\\' else 1
+        return end + 1
+
+    @classmethod
+    def parse_template(cls, template: str, shift: int = 0, group_index: 'Dict[str, int]' = None) \
+            -> 'List[Union[str, int]]':
+        """
+        Parse the replacement template once rather than upon each match, as Match.expand() does.
+
+        Args:
+            template (str): Replacement template, in the `re.sub()` format
+            shift (int, optional): Number of the groups the pattern's groups are shifted by within the alternation
+            group_index (Dict[str, int], optional): Group numbers of the pattern by the names
+
+        Returns:
+            List[Union[str, int]]: Literal parts of the template and the group indexes
+
+        Raises:
+            ValueError: Unknown group name
+        """
+        parts = []  # type: List[Union[str, int]]
+        literal = ''
+        pos = 0
+        for match in cls.GROUP_REF_RE.finditer(template):
+            literal += template[pos:match.start()]
+            pos = match.end()
+            ref = match.group(1)
+            if ref == '\\':
+                literal += match.group(0)
+                continue
+            if literal:
+                parts.append(cls.unescape(literal))
+                literal = ''
+            ref = ref[2:-1] if ref.startswith('g<') else ref
+            if not ref.isdigit():
+                if group_index is None or ref not in group_index:
+                    raise ValueError(f'Unknown group name "{ref}" in the template "{template}"')
+                ref = group_index[ref]
+            index = int(ref)
+            # The whole match is the alternative's match
+            parts.append(index + shift if index > 0 else 0)
+        literal += template[pos:]
+        if literal:
+            parts.append(cls.unescape(literal))
+        return parts
+
+    @staticmethod
+    def unescape(literal: str) -> str:
+        # Escapes of the literal part of the template, e.g. \n, the same as re.sub() processes them
+        return re.sub('', literal, '') if '\\' in literal else literal
+
+    def sub(self, content: str) -> str:
+        return self.pattern.sub(self.expand, content)
+
+    def expand(self, match: 'Match') -> str:
+        # The marker group closes last, so it is the last group matched
+        parts = self.templates[match.lastindex]
+        return ''.join(part if type(part) is str else (match.group(part) or '') for part in parts)
@@ -35,7 +35,11 @@ class ThemeHelper:
     This class is intended to help with theme assets (colors, icons, etc.)
     """
 
-    def __init__(self):
+    def __init__(self, theme: str = None):
+        """
+        Args:
+            theme (str, optional): Theme name, the one of the app settings by default
+        """
         super().__init__()
 
         self.logger = logging.getLogger('theme_helper')
@@ -44,7 +48,7 @@ class ThemeHelper:
 
         self.settings = Settings()
 
-        theme_name = self.settings.app_theme
+        theme_name = theme or self.settings.app_theme
         # Check the theme is still in the themes list with fallback to the default one
         if theme_name not in [_theme.name.lower() for _theme in Themes]:  # Or: list(Themes.__members__.keys()):
             theme_name = str(Themes.default())
@@ -0,0 +1,241 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Incremental block-level re-highlighting engine.
+- Functionality: Tracks dirty block ranges from the document changes and re-highlights only them and the blocks
+  their state change reaches, e.g. a newly opened code fence. The dirty blocks can be processed within a time budget
+  and the given ones, e.g. the visible ones, ahead of the rest.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from typing import TYPE_CHECKING
+
+from . import TextBlockData
+
+import time
+import bisect
+import logging
+
+if TYPE_CHECKING:
+    from typing import List  # noqa: F401
+    from PySide6.QtGui import QTextBlock  # noqa: F401
+    from .main_highlighter import MainHighlighter  # noqa: F401
+
+
+class IncrementalEngine:
+    """
+    Re-highlights the changed blocks only, so the cost scales with the size of the edit, not the document.
+    The walk over the blocks stops as soon as a block ends with the same state it had before.
+    """
+
+    # Number of the dirty blocks to step back at most from the blocks processed ahead, to start with a paragraph
+    LOOKBEHIND = 100  # type: int
+
+    def __init__(self, highlighter: 'MainHighlighter'):
+        self.highlighter = highlighter
+        self.document = highlighter.document()
+
+        self.logger = logging.getLogger('incremental_engine')
+
+        # Sorted and merged list of [first, last] block numbers to re-highlight
+        self.dirty_ranges = []  # type: List[List[int]]
+
+        self.block_count = self.document.blockCount()
+
+        # Re-highlighting changes formats only, such changes do not emit the signal
+        self.document.contentsChange.connect(self.on_contents_change)
+
+    def on_contents_change(self, position: int, chars_removed: int, chars_added: int) -> None:
+        """
+        Mark the blocks touched by the change as dirty.
+        More info about the signal: https://doc.qt.io/qt-6/qtextdocument.html#contentsChange
+        """
+        block_count = self.document.blockCount()
+        delta = block_count - self.block_count
+        self.block_count = block_count
+
+        first = self.document.findBlock(position).blockNumber()
+        if first < 0:
+            # Position is out of the document, e.g. the whole content was removed
+            first = 0
+        last_block = self.document.findBlock(position + chars_added)
+        last = last_block.blockNumber() if last_block.isValid() else block_count - 1
+        # Inserted blocks are dirty too, even if the reported range does not cover them
+        last = max(last, first + delta)
+        if delta < 0:
+            # The block below the merged ones follows another block now, its cached state is not comparable
+            last += 1
+        last = min(last, block_count - 1)
+
+        # Shift the ranges located below the change by the number of inserted or removed blocks
+        if delta:
+            for dirty_range in self.dirty_ranges:
+                if dirty_range[0] > first:
+                    dirty_range[0] = max(first, dirty_range[0] + delta)
+                if dirty_range[1] > first:
+                    dirty_range[1] = max(first, dirty_range[1] + delta)
+
+        self.logger.debug(f'Contents change at {position} (-{chars_removed}, +{chars_added}), '
+                          f'blocks {first}..{last}, delta {delta}')
+
+        self.mark_dirty(first, last)
+
+    def mark_dirty(self, first: int, last: int) -> None:
+        """
+        Add the range of block numbers to re-highlight, merging it with the overlapping or adjacent ones.
+        """
+        ranges = sorted(self.dirty_ranges + [[first, max(first, last)]])
+        merged = []  # type: List[List[int]]
+        for dirty_range in ranges:
+            if merged and dirty_range[0] <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], dirty_range[1])
+            else:
+                merged.append(list(dirty_range))
+        self.dirty_ranges = merged
+
+    def mark_clean(self, first: int, last: int) -> None:
+        """
+        Remove the range of block numbers from the ones to re-highlight.
+        """
+        cleaned = []  # type: List[List[int]]
+        for dirty_first, dirty_last in self.dirty_ranges:
+            if dirty_first < first:
+                cleaned.append([dirty_first, min(dirty_last, first - 1)])
+            if dirty_last > last:
+                cleaned.append([max(dirty_first, last + 1), dirty_last])
+        self.dirty_ranges = cleaned
+
+    def is_block_dirty(self, number: int) -> bool:
+        index = bisect.bisect_right(self.dirty_ranges, [number, float('inf')]) - 1
+        return index >= 0 and self.dirty_ranges[index][1] >= number
+
+    def mark_all_dirty(self) -> None:
+        self.dirty_ranges = [[0, max(0, self.document.blockCount() - 1)]]
+
+    def clear(self) -> None:
+        self.dirty_ranges = []
+
+    def is_dirty(self) -> bool:
+        return len(self.dirty_ranges) > 0
+
+    @staticmethod
+    def get_seeded_block(block: 'QTextBlock') -> 'QTextBlock':
+        """
+        Step back to the block whose previous block has a known end state to start with.
+        """
+        while block.isValid() and block.previous().isValid():
+            prev_user_data = block.previous().userData()
+            if isinstance(prev_user_data, TextBlockData) and prev_user_data.state is not None:
+                break
+            block = block.previous()
+        return block
+
+    def process(self, budget: float = None) -> int:
+        """
+        Re-highlight the dirty ranges and the blocks the state change propagates to.
+
+        Args:
+            budget (float, optional): Time to spend, in seconds; the blocks left are kept dirty to process later
+
+        Returns:
+            int: The number of blocks re-highlighted
+        """
+        processed = 0
+        # The last block number processed, the ranges below it are already up-to-date
+        processed_till = -1
+
+        deadline = time.perf_counter() + budget if budget is not None else None
+
+        ranges, self.dirty_ranges = self.dirty_ranges, []
+        for index, (first, last) in enumerate(ranges):
+            if last <= processed_till:
+                continue
+            block = self.get_seeded_block(self.document.findBlockByNumber(max(first, processed_till + 1)))
+            while block.isValid():
+                self.highlighter.rehighlight_incremental(block)
+                last_block = self.highlighter.last_block
+                if (last_block is None or not last_block.isValid()
+                        or last_block.blockNumber() < block.blockNumber()):
+                    break
+                processed += last_block.blockNumber() - block.blockNumber() + 1
+                processed_till = last_block.blockNumber()
+                # Beyond the dirty range and the block ends with the same state as before
+                if processed_till >= last and not self.highlighter.state_changed:
+                    break
+                block = last_block.next()
+                if deadline is not None and block.isValid() and time.perf_counter() >= deadline:
+                    # Out of time, the next block is re-highlighted regardless of its state to continue with
+                    for rest_first, rest_last in [[processed_till + 1, max(last, processed_till + 1)]] + ranges[index + 1:]:
+                        if rest_last > processed_till:
+                            self.mark_dirty(max(rest_first, processed_till + 1), rest_last)
+                    self.logger.debug(f'Re-highlighted {processed} block(s) within the budget, '
+                                      f'{len(self.dirty_ranges)} range(s) left')
+                    return processed
+
+        self.logger.debug(f'Re-highlighted {processed} block(s) of {self.document.blockCount()}')
+
+        return processed
+
+    def process_ahead(self, first: int, last: int) -> int:
+        """
+        Re-highlight the dirty blocks of the range, e.g. the visible ones, ahead of the dirty blocks above them.
+        The state those blocks end with is unknown yet, so the range is highlighted starting with the state of the
+        nearest block processed, or from scratch after an empty line. Once the blocks above are processed the state
+        change propagates to the range as usual, so the result is the same as processed in order.
+
+        Args:
+            first (int): The first block number of the range
+            last (int): The last block number of the range
+
+        Returns:
+            int: The number of blocks re-highlighted
+        """
+        block = self.document.findBlockByNumber(first)
+        while block.isValid() and block.blockNumber() <= last and not self.is_block_dirty(block.blockNumber()):
+            block = block.next()
+        if not block.isValid() or block.blockNumber() > last:
+            return 0
+
+        # Start with the paragraph the block belongs to, as the state of its lines (e.g. a list) is restored then
+        for _i in range(self.LOOKBEHIND):
+            prev_block = block.previous()
+            if (not prev_block.isValid() or not self.is_block_dirty(prev_block.blockNumber())
+                    or not prev_block.text().strip()):
+                break
+            block = prev_block
+
+        processed = 0
+        state_changed = True
+        while block.isValid() and block.blockNumber() <= last:
+            if not state_changed and not self.is_block_dirty(block.blockNumber()):
+                # Up-to-date and follows the same state as before
+                block = block.next()
+                continue
+            self.highlighter.rehighlight_incremental(block)
+            last_block = self.highlighter.last_block
+            if (last_block is None or not last_block.isValid()
+                    or last_block.blockNumber() < block.blockNumber()):
+                break
+            processed += last_block.blockNumber() - block.blockNumber() + 1
+            state_changed = self.highlighter.state_changed
+            self.mark_clean(block.blockNumber(), last_block.blockNumber())
+            block = last_block.next()
+
+        if state_changed and block.isValid():
+            # The state change propagates further once the processing reaches the block
+            self.mark_dirty(block.blockNumber(), block.blockNumber())
+
+        self.logger.debug(f'Re-highlighted {processed} block(s) ahead of the range {first}..{last}')
+
+        return processed
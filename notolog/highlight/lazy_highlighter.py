@@ -0,0 +1,178 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Viewport-first highlighting of the large documents in EDIT mode.
+- Functionality: Highlights the visible blocks right away and the rest of the document within the time slices run
+  from the event loop, yielding to the input events in between. Scrolling brings the newly visible blocks ahead of
+  the rest; the cross-block state, e.g. of the code fences, is brought in order by the incremental engine.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from typing import TYPE_CHECKING, Union
+
+import asyncio
+import logging
+
+if TYPE_CHECKING:
+    from typing import Tuple  # noqa: F401
+    from PySide6.QtWidgets import QPlainTextEdit  # noqa: F401
+    from .main_highlighter import MainHighlighter  # noqa: F401
+
+
+class LazyHighlighter:
+    """
+    Drives the highlighter's incremental engine, see IncrementalEngine, viewport first and slice by slice.
+    """
+
+    # Content longer than that is highlighted lazily, in characters
+    MIN_LENGTH = 256 * 1024  # type: int
+    # Time to spend on highlighting per slice, in seconds
+    SLICE_TIME = 0.02  # type: float
+
+    def __init__(self, highlighter: 'MainHighlighter', editor: 'QPlainTextEdit'):
+        """
+        Args:
+            highlighter (MainHighlighter): Highlighter of the editor's document, with the incremental engine
+            editor (QPlainTextEdit): Editor to get the visible blocks of
+        """
+        self.highlighter = highlighter
+        self.editor = editor
+
+        self.logger = logging.getLogger('lazy_highlighter')
+
+        # Task processing the slices within the event loop
+        self.task = None  # type: Union[asyncio.Future, None]
+        # Whether the visible blocks are to check before the next slice
+        self.viewport_changed = False
+
+        self.editor.verticalScrollBar().valueChanged.connect(self.on_scroll)
+
+    def defer(self) -> None:
+        """
+        Skip the highlighting upon the document changes, e.g. while a large content is loading.
+        """
+        self.cancel()
+        self.highlighter.deferred = True
+
+    def resume(self) -> None:
+        """
+        Highlight the whole document lazily, the visible blocks first.
+        """
+        self.highlighter.deferred = False
+        if self.highlighter.engine is None:
+            self.highlighter.rehighlight()
+            return
+        self.highlighter.engine.mark_all_dirty()
+        self.process()
+
+    def process(self) -> None:
+        """
+        Highlight the visible dirty blocks and a slice of the rest, the remaining slices are scheduled.
+        """
+        engine = self.highlighter.engine
+        if engine is None or self.highlighter.deferred:
+            return
+
+        self.viewport_changed = True
+
+        if not self.is_loop_running():
+            self.logger.debug('Highlighting the whole document because the async loop is not running.')
+            self.process_slice(budget=None)
+            return
+
+        if self.process_slice():
+            self.schedule()
+
+    def process_slice(self, budget: Union[float, None] = SLICE_TIME) -> bool:
+        """
+        Highlight the visible dirty blocks if the viewport has changed, then the dirty blocks in order within the budget.
+
+        Args:
+            budget (Union[float, None], optional): Time to spend, in seconds, None to process all the dirty blocks
+
+        Returns:
+            bool: Whether there are dirty blocks left
+        """
+        engine = self.highlighter.engine
+
+        # Prevent QTextEdit's on_text_changed() method invocation by blocking signals
+        was_blocked = self.editor.blockSignals(True)
+        try:
+            if self.viewport_changed:
+                self.viewport_changed = False
+                engine.process_ahead(*self.get_visible_range())
+            engine.process(budget=budget)
+        finally:
+            self.editor.blockSignals(was_blocked)
+
+        return engine.is_dirty()
+
+    def schedule(self) -> None:
+        if self.task is None or self.task.done():
+            self.task = asyncio.ensure_future(self.run())
+
+    async def run(self) -> None:
+        try:
+            while self.highlighter.engine.is_dirty() and not self.highlighter.deferred:
+                # Let the loop process the pending events, e.g. the input ones, before the next slice
+                await asyncio.sleep(0)
+                self.process_slice()
+            self.logger.debug('Lazy highlighting is complete')
+        except asyncio.CancelledError:
+            pass
+
+    def cancel(self) -> None:
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+        self.task = None
+
+    def stop(self) -> None:
+        """
+        Cancel the slices left and stop following the editor, e.g. once the highlighter is replaced.
+        """
+        self.cancel()
+        try:
+            self.editor.verticalScrollBar().valueChanged.disconnect(self.on_scroll)
+        except (RuntimeError, TypeError):
+            pass
+
+    def on_scroll(self, _value: int) -> None:
+        engine = self.highlighter.engine
+        if engine is None or self.highlighter.deferred or not engine.is_dirty():
+            return
+        # The newly visible blocks go ahead of the rest within the next slice
+        self.viewport_changed = True
+        if self.is_loop_running():
+            self.schedule()
+
+    def get_visible_range(self) -> 'Tuple[int, int]':
+        """
+        The first and the last visible block numbers, the same way the line numbers area gets them.
+        """
+        block = self.editor.firstVisibleBlock()
+        first = last = block.blockNumber()
+        offset = self.editor.contentOffset()
+        bottom = self.editor.viewport().rect().bottom()
+        while block.isValid() and self.editor.blockBoundingGeometry(block).translated(offset).top() <= bottom:
+            last = block.blockNumber()
+            block = block.next()
+        return max(first, 0), max(last, 0)
+
+    @staticmethod
+    def is_loop_running() -> bool:
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            return False
+        return loop.is_running()
@@ -24,7 +24,10 @@ from PySide6.QtGui import QColor, QBrush, QFont
 from typing import TYPE_CHECKING
 
 from . import AppConfig
+from . import TextBlockData
 from . import ThemeHelper
+from .incremental_engine import IncrementalEngine
+from .rule_tokenizer import RuleTokenizer
 
 from ..font_loader import FontLoader
 
@@ -32,7 +35,6 @@ import logging
 
 if TYPE_CHECKING:
     from typing import Union  # noqa: F401
-    from . import TextBlockData  # noqa: F401
     from PySide6.QtGui import QTextBlock, QTextBlockUserData  # noqa: F401
 
 
@@ -56,6 +58,9 @@ class MainHighlighter(QSyntaxHighlighter):
     """
     re_rules = []
 
+    # Whether to re-highlight the changed blocks only, see IncrementalEngine
+    incremental = False
+
     def __init__(self, document: QTextDocument = None):
         super().__init__(document)
 
@@ -68,6 +73,16 @@ class MainHighlighter(QSyntaxHighlighter):
         self.rules = [(self.get_regex(pattern), nth, tag, group, duple, fmt, reckon)
                       for (pattern, nth, tag, group, duple, fmt, reckon) in self.re_rules]
 
+        # Matches all the rules against a block at once, in the same order as the rules; shared by the rule set
+        self.tokenizer = RuleTokenizer.get_shared(self.re_rules)
+
+        # Open-close token map and the token sets checked within each block, built once rather than per block
+        self.open_close_token_map = self.get_open_close_token_map()
+        self.oct_groups = frozenset(token_data['group'] for token_data in self.open_close_token_map)
+        self.open_tokens = frozenset(token_data['open'] for token_data in self.open_close_token_map)
+        self.close_tokens = frozenset(token_data['close'] for token_data in self.open_close_token_map)
+        self.nl_closing_tokens = self.get_nl_closing_tokens()
+
         # Collect found tokens
         self.tokens = {}
         # Tokens which belong the same line
@@ -93,6 +108,20 @@ class MainHighlighter(QSyntaxHighlighter):
 
         self.override_colors()
 
+        # Seed each block with the state the previous block ended with (incremental re-highlighting)
+        self.seed_state = False
+        # The last highlighted block and whether its end state has changed
+        self.last_block = None  # type: Union[QTextBlock, None]
+        self.state_changed = False
+
+        # Skip the highlighting Qt does upon the document changes, e.g. while a large content is loading to highlight
+        # it later (see LazyHighlighter)
+        self.deferred = False
+
+        self.engine = None  # type: Union[IncrementalEngine, None]
+        if self.incremental and self.document() is not None:
+            self.engine = IncrementalEngine(self)
+
     def __init_subclass__(cls):
         # Check the required methods are implemented
         if not hasattr(cls, 'highlightBlock'):
@@ -249,6 +278,74 @@ class MainHighlighter(QSyntaxHighlighter):
 
         self.rehighlight_block = True
 
+        if self.engine is not None:
+            # The whole document is up-to-date
+            self.engine.clear()
+
+    def rehighlight_incremental(self, block: 'QTextBlock') -> None:
+        """
+        Re-highlight the block seeded with the state of the previous block, the same way the whole document
+        re-highlighting does. Qt may continue to the next blocks if the block state has changed.
+        """
+        rehighlight_block = self.rehighlight_block
+
+        self.rehighlight_block = False
+        self.seed_state = True
+        self.last_block = None
+
+        try:
+            super().rehighlightBlock(block)
+        finally:
+            self.seed_state = False
+            self.rehighlight_block = rehighlight_block
+
+    def get_block_state(self) -> dict:
+        """
+        Snapshot of the cross-block state the current block ends with.
+        Only the tags of the two last lines are kept, as the rules look behind no further.
+        """
+        line_number = self.currentBlock().blockNumber()
+        return {
+            'tokens': {tag: dict(token) for tag, token in self.tokens.items()},
+            'lines': tuple(frozenset(self.line_tokens.get(line_number - i, {})) for i in (1, 0)),
+            'block_state': self.currentBlockState(),
+        }
+
+    @staticmethod
+    def get_state_signature(state: dict) -> tuple:
+        """
+        Comparable part of the block state. Token counters are skipped as they grow with each match,
+        and the code token state derives from the counter anyway.
+        """
+        return (tuple(sorted((tag, token.get('o')) for tag, token in state['tokens'].items())),
+                state['lines'], state['block_state'])
+
+    def save_block_state(self, user_data: 'TextBlockData') -> None:
+        """
+        Store the state the current block ends with to seed the next block and to detect whether it has changed.
+        """
+        state = self.get_block_state()
+        self.state_changed = (user_data.state is None
+                              or self.get_state_signature(user_data.state) != self.get_state_signature(state))
+        user_data.state = state
+        self.last_block = self.currentBlock()
+
+    def restore_block_state(self) -> None:
+        """
+        Restore the state the previous block ended with.
+        """
+        line_number = self.currentBlock().blockNumber()
+        prev_user_data = self.currentBlock().previous().userData()
+
+        self.tokens = {}
+        if isinstance(prev_user_data, TextBlockData) and prev_user_data.state is not None:
+            self.tokens = {tag: dict(token) for tag, token in prev_user_data.state['tokens'].items()}
+            for i, tags in zip((2, 1), prev_user_data.state['lines']):
+                self.line_tokens[line_number - i] = {tag: [] for tag in tags}
+
+        # Line tokens are collected from scratch
+        self.line_tokens[line_number] = {}
+
     def get_open_close_token_map(self):
         return []
 
@@ -263,7 +360,7 @@ class MainHighlighter(QSyntaxHighlighter):
         pass
 
     def get_opened_group_token(self, group):
-        for token_data in self.get_open_close_token_map():
+        for token_data in self.open_close_token_map:
             if (group == token_data['group']
                     and token_data['open'] in self.tokens
                     and self.tokens[token_data['open']]['o'] is True):
@@ -27,13 +27,14 @@ from PySide6.QtCore import Qt
 
 from .main_highlighter import MainHighlighter
 from . import TextBlockData
+from ..helpers.regex_helper import RegexRegistry
 
 from typing import TYPE_CHECKING
 
 import re
 
 if TYPE_CHECKING:
-    from typing import Union  # noqa: F401
+    from typing import Pattern, Union  # noqa: F401
     from PySide6.QtGui import QTextBlockUserData  # noqa: F401
 
 
@@ -117,6 +118,9 @@ class MdHighlighter(MainHighlighter):
     # Keep it consistent with ini-file name, say 'md.ini', item prefix 'md_color_h1_text'
     theme_ini_prefix = 'md'
 
+    # Re-highlight the changed blocks only
+    incremental = True
+
     """
     Elements order is matter.
     Say, i* first, b** second, bi*** third one-by-one to override prev token.
@@ -265,12 +269,12 @@ class MdHighlighter(MainHighlighter):
         # lambda s: s.is_in_code() and not s.is_in_code_comment()),
     ]
 
-    def get_regex(self, pattern: re) -> re:
+    def get_regex(self, pattern: str) -> 'Pattern':
         """
-        Get either QRegularExpression or raw Python regex
+        Get either QRegularExpression or Python regex, compiled once for all the highlighters
         re = QRegularExpression(pattern)
         """
-        return pattern
+        return RegexRegistry.compile(pattern)
 
     def get_open_close_token_map(self):
         return [
@@ -310,6 +314,10 @@ class MdHighlighter(MainHighlighter):
         * https://doc.qt.io/qt-6/qsyntaxhighlighter.html#highlightBlock
         """
 
+        if self.deferred:
+            # The block is left dirty to highlight later
+            return
+
         # Get the current block and associated user data
         self.current_block = self.currentBlock()
         self.user_data = self.current_block.userData()  # type: Union[TextBlockData, QTextBlockUserData]
@@ -321,6 +329,10 @@ class MdHighlighter(MainHighlighter):
         # Line number as it appears in the editor
         self.line_number_log = self.line_number + 1
 
+        if self.seed_state:
+            # Continue with the state the previous block ended with
+            self.restore_block_state()
+
         if self.user_data is None or not isinstance(self.user_data, TextBlockData):
             self.logger.debug('{%r} !!! Block data is not set at [%d*], is in code %d, prev state %d'
                               % (self.rehighlight_block, self.line_number_log,
@@ -343,12 +355,15 @@ class MdHighlighter(MainHighlighter):
         self.clear_formatted()
 
         # Groups of tokens for correction (they have similar approach in rules)
-        oct_groups = [r.get('group') for r in self.get_open_close_token_map()]
-        open_tokens = [r.get('open') for r in self.get_open_close_token_map()]
-        close_tokens = [r.get('close') for r in self.get_open_close_token_map()]
+        oct_groups = self.oct_groups
+        open_tokens = self.open_tokens
+        close_tokens = self.close_tokens
+
+        # Matches of every rule within the line, in the rules order
+        rule_matches = self.tokenizer.tokenize(text_str)
 
-        pattern, nth, tag, group, duple, cf_data, reckon = (None,) * 7
-        for pattern, nth, tag, group, duple, cf_data, reckon in self.rules:
+        index, pattern, nth, tag, group, duple, cf_data, reckon = (None,) * 8
+        for index, (pattern, nth, tag, group, duple, cf_data, reckon) in enumerate(self.rules):
             """
             Process code block tokens.
             """
@@ -368,7 +383,7 @@ class MdHighlighter(MainHighlighter):
                 self.tokens['code']['o'] = (self.user_data.get_param('code', 'within')
                                             and not self.user_data.get_param('code', 'closed'))
 
-        matches = re.finditer(pattern, text_str)
+        matches = iter(rule_matches[index])
         match = next(matches, None)
 
         if match:
@@ -470,7 +485,7 @@ class MdHighlighter(MainHighlighter):
                 self.setCurrentBlockState(0)
                 self.logger.debug('{%r} ... No "%s" [%d*]' % (self.rehighlight_block, tag, self.line_number_log))
 
-        for pattern, nth, tag, group, duple, cf_data, reckon in self.rules:
+        for index, (pattern, nth, tag, group, duple, cf_data, reckon) in enumerate(self.rules):
             """
             Process block tokens closing with a new line.
             * rn
@@ -483,7 +498,7 @@ class MdHighlighter(MainHighlighter):
             Causing a "jumping" syntax, so better to leave the blocks within the code block
             but re-write their style accordingly.
             """
-            if tag not in self.get_nl_closing_tokens():
+            if tag not in self.nl_closing_tokens:
                 continue
 
             if tag not in self.tokens:
@@ -497,7 +512,7 @@ class MdHighlighter(MainHighlighter):
                     """
                     self.tokens[tag]['o'] = self.user_data.get_param(tag, 'within')
 
-            matches = re.finditer(pattern, text_str)
+            matches = iter(rule_matches[index])
             match = next(matches, None)
 
             if match:
@@ -595,7 +610,7 @@ class MdHighlighter(MainHighlighter):
             self.logger.error(f'Cannot setup block data "{self.user_data}", error occurred: {e}')
 
         format_map = {}  # To apply formatting after the whole line processed
-        for pattern, nth, tag, group, duple, cf_data, reckon in self.rules:
+        for index, (pattern, nth, tag, group, duple, cf_data, reckon) in enumerate(self.rules):
 
             if self.is_in_code() and group not in {'code', 'comment', 'coop', 'rn'}:
                 """
@@ -621,10 +636,11 @@ class MdHighlighter(MainHighlighter):
             """
             Regular Python regular expression operations instead of QRegularExpression, QRegularExpressionMatchIterator
             and QRegularExpressionMatch as sometimes it doesn't work properly.
+            The matches are collected by the tokenizer, see RuleTokenizer.
             * https://docs.python.org/3/library/re.html
             * https://doc.qt.io/qt-6/qregularexpression.html
             """
-            matches = re.finditer(pattern, text_str)
+            matches = rule_matches[index]
 
             for match in matches:
                 # Get regex result position into the text string
@@ -635,7 +651,7 @@ class MdHighlighter(MainHighlighter):
                 # Collect line tokens only when any of them matched
                 if tag not in self.line_tokens[self.line_number]:
                     self.line_tokens[self.line_number][tag] = []
-                if tag != 'code' or tag not in self.get_nl_closing_tokens():
+                if tag != 'code' or tag not in self.nl_closing_tokens:
                     # The line tokens data will be reset after re-highlighting, no need to check for duplicates
                     line_token_data = {'start': start, 'end': end, 'length': length}
                     if line_token_data not in self.line_tokens[self.line_number][tag]:
@@ -670,7 +686,7 @@ class MdHighlighter(MainHighlighter):
                         if tag in open_tokens:
                             self.tokens[tag]['o'] = True
                         elif tag in close_tokens:
-                            for _r in self.get_open_close_token_map():
+                            for _r in self.open_close_token_map:
                                 if _r['group'] == group and _r['close'] == tag and _r['open'] in self.tokens:
                                     self.tokens[_r['open']]['o'] = False
 
@@ -837,7 +853,7 @@ class MdHighlighter(MainHighlighter):
         #    self.setFormat(0, len(text_str), self.cf(**self.theme['comment']))
         #    self.set_formatted('comment')
 
-        for token_data in self.get_open_close_token_map():
+        for token_data in self.open_close_token_map:
             """
             Process the lines located between the tags
             """
@@ -851,6 +867,10 @@ class MdHighlighter(MainHighlighter):
                 self.setFormat(0, len(text_str), self.cf(**self.theme[token_data['theme']]))
                 self.set_formatted(token_data['group'])
 
+        if not self.rehighlight_block:
+            # Only the sequential processing keeps the state consistent across the blocks
+            self.save_block_state(self.user_data)
+
     def check_and_set_in_code_state(self):
         if self.is_in_code(True):
             self.logger.debug('In code context')
@@ -0,0 +1,179 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Compiled tokenizer for the highlighter rule sets.
+- Functionality: Scans a text block once to pick the rules that may match it, then collects the matches of those rules
+  only. The output is the same as running every rule one-by-one.
+
+Story:
+Merging the rules into a single alternation changes the result, as overlapping rules hide each other, and wrapping
+each rule into a lookahead is way slower with Python's re, as the literal prefix optimizations are lost. The rules are
+filtered by the characters they require instead, e.g. an italic rule cannot match a line without an asterisk.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from typing import TYPE_CHECKING, List, FrozenSet, Union
+
+import re
+
+try:
+    # Python 3.11+
+    from re import _parser as sre_parse  # type: ignore
+    from re import _constants as sre_constants  # type: ignore
+except ImportError:
+    import sre_parse  # type: ignore
+    import sre_constants  # type: ignore
+
+import logging
+
+from ..helpers.regex_helper import RegexRegistry
+
+if TYPE_CHECKING:
+    from typing import Dict, Match, Pattern, Tuple  # noqa: F401
+
+# Character classes wider than this filter almost nothing out, e.g. [a-zA-Z0-9]
+MAX_CLASS_SIZE = 16
+# Limit of the cached candidate combinations
+MAX_CACHE_SIZE = 1024
+
+
+class RuleTokenizer:
+    """
+    Tokenizer over the highlighter rules, see MainHighlighter.re_rules for the rule format.
+    """
+
+    # Tokenizers shared by the highlighters of the same rule set, by the rule set id
+    shared = {}  # type: Dict[int, Tuple[list, RuleTokenizer]]
+
+    def __init__(self, rules: list):
+        self.logger = logging.getLogger('rule_tokenizer')
+
+        self.rules = rules
+        self.patterns = [RegexRegistry.compile(rule[0]) for rule in rules]  # type: List[Pattern]
+        # Sets of characters, a text block has to contain at least one character of each set to match the rule
+        self.requirements = [self.get_pattern_requirements(rule[0]) for rule in rules]
+        # All the characters the rules depend on
+        self.chars = frozenset().union(*[req for requirements in self.requirements for req in requirements])
+        # Candidate rules by the set of characters found, there are few combinations in practice
+        self.candidates_cache = {}
+
+    @classmethod
+    def get_shared(cls, rules: list) -> 'RuleTokenizer':
+        """
+        Tokenizer of the rule set, built once per rule set (e.g. the class rules of a highlighter) rather than per
+        highlighter, as the patterns parsing is not cheap.
+        """
+        shared = cls.shared.get(id(rules))
+        # The rule set itself is kept, so its id is not reused while the tokenizer is shared
+        if shared is None or shared[0] is not rules:
+            shared = (rules, cls(rules))
+            cls.shared[id(rules)] = shared
+        return shared[1]
+
+    def get_pattern_requirements(self, pattern: str) -> List[FrozenSet[str]]:
+        try:
+            parsed = sre_parse.parse(pattern)
+            if parsed.state.flags & (re.IGNORECASE | re.VERBOSE):
+                return []
+            return self.get_requirements(parsed)
+        except Exception as e:
+            # No shortcut then, the rule is always checked
+            self.logger.warning(f'Cannot parse the pattern "{pattern}": {e}')
+            return []
+
+    @classmethod
+    def get_requirements(cls, items) -> List[FrozenSet[str]]:  # noqa: C901
+        """
+        Collect the characters each match of the parsed pattern must contain.
+        Only certain parts are taken into account: literals, character classes, groups, repeats with at least one
+        occurrence, positive assertions and branches.
+        """
+        requirements = []  # type: List[FrozenSet[str]]
+        for op, av in items:
+            if op is sre_constants.LITERAL:
+                requirements.append(frozenset(chr(av)))
+            elif op is sre_constants.IN:
+                chars = cls.get_class_chars(av)
+                if chars:
+                    requirements.append(chars)
+            elif op is sre_constants.SUBPATTERN:
+                # Scoped inline flags, e.g. (?i:abc), the literals of the case-insensitive group are not required as is
+                if len(av) == 4 and av[1] & (re.IGNORECASE | re.VERBOSE):
+                    continue
+                requirements += cls.get_requirements(av[-1])
+            elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT,
+                        getattr(sre_constants, 'POSSESSIVE_REPEAT', None)):
+                if av[0] >= 1:
+                    requirements += cls.get_requirements(av[2])
+            elif op is sre_constants.BRANCH:
+                # Each branch has to contain any of its own characters
+                branch_chars = set()
+                for branch in av[1]:
+                    branch_requirements = cls.get_requirements(branch)
+                    if not branch_requirements:
+                        branch_chars = set()
+                        break
+                    branch_chars |= min(branch_requirements, key=len)
+                if branch_chars:
+                    requirements.append(frozenset(branch_chars))
+            elif op is sre_constants.ASSERT:
+                # Positive lookahead or lookbehind
+                requirements += cls.get_requirements(av[1])
+            elif op is getattr(sre_constants, 'ATOMIC_GROUP', None):
+                requirements += cls.get_requirements(av)
+        return requirements
+
+    @staticmethod
+    def get_class_chars(items) -> Union[FrozenSet[str], None]:
+        chars = set()
+        for op, av in items:
+            if op is sre_constants.LITERAL:
+                chars.add(chr(av))
+            elif op is sre_constants.RANGE and av[1] - av[0] < MAX_CLASS_SIZE:
+                chars.update(chr(code) for code in range(av[0], av[1] + 1))
+            else:
+                # Negated classes, categories like \s, or too wide ranges
+                return None
+        return frozenset(chars) if len(chars) <= MAX_CLASS_SIZE else None
+
+    def get_candidates(self, text: str) -> List[bool]:
+        """
+        Scan the text once to find the rules that may match it.
+        """
+        chars = self.chars.intersection(text)
+        candidates = self.candidates_cache.get(chars)
+        if candidates is None:
+            candidates = [all(not chars.isdisjoint(req) for req in requirements)
+                          for requirements in self.requirements]
+            if len(self.candidates_cache) >= MAX_CACHE_SIZE:
+                self.candidates_cache.clear()
+            self.candidates_cache[chars] = candidates
+        return candidates
+
+    def tokenize(self, text: str) -> List[List['Match']]:
+        """
+        Match the rules against the text block.
+
+        Returns:
+            List[List[Match]]: Matches of each rule in the rules order, the same as re.finditer() returns
+        """
+        return [list(pattern.finditer(text)) if candidate else []
+                for pattern, candidate in zip(self.patterns, self.get_candidates(text))]
+
+    def get_tokens(self, text: str) -> list:
+        """
+        Flat list of (tag, start, end) of the rule matches, the positions are taken from the rule's nth group.
+        """
+        return [(rule[2], match.start(rule[1]), match.end(rule[1]))
+                for rule, matches in zip(self.rules, self.tokenize(text)) for match in matches]
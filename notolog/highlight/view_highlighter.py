@@ -23,13 +23,12 @@ from PySide6.QtGui import QTextBlock
 
 from .main_highlighter import MainHighlighter
 from . import TextBlockData
+from ..helpers.regex_helper import RegexRegistry
 
 from typing import TYPE_CHECKING
 
-import re
-
 if TYPE_CHECKING:
-    from typing import Match  # noqa: F401
+    from typing import Match, Pattern  # noqa: F401
 
 
 class ViewHighlighter(MainHighlighter):
@@ -68,11 +67,11 @@ class ViewHighlighter(MainHighlighter):
         (r'(​)', 0, 'inv_sep', 'inv_sep', False, theme['inv_sep'], None),
     ]
 
-    def get_regex(self, pattern: re) -> re:
+    def get_regex(self, pattern: str) -> 'Pattern':
         """
-        Get either QRegularExpression or raw Python regex
+        Get either QRegularExpression or Python regex, compiled once for all the highlighters
         """
-        return pattern
+        return RegexRegistry.compile(pattern)
 
     def get_open_close_token_map(self):
         return [
@@ -110,18 +109,22 @@ class ViewHighlighter(MainHighlighter):
             self.line_tokens[line_number] = {}
 
         # Groups of tokens for correction (they have similar approach in rules)
-        # oct_groups = [r.get('group') for r in self.get_open_close_token_map()]
-        open_tokens = [r.get('open') for r in self.get_open_close_token_map()]
-        close_tokens = [r.get('close') for r in self.get_open_close_token_map()]
+        # oct_groups = self.oct_groups
+        open_tokens = self.open_tokens
+        close_tokens = self.close_tokens
+
+        # Matches of every rule within the line, in the rules order
+        rule_matches = self.tokenizer.tokenize(text_str)
 
-        for pattern, nth, tag, group, duple, cf_data, reckon in self.rules:
+        for index, (pattern, nth, tag, group, duple, cf_data, reckon) in enumerate(self.rules):
             """
             Regular Python regular expression operations instead of QRegularExpression, QRegularExpressionMatchIterator
             and QRegularExpressionMatch as sometimes it doesn't work properly.
+            The matches are collected by the tokenizer, see RuleTokenizer.
             * https://docs.python.org/3/library/re.html
             * https://doc.qt.io/qt-6/qregularexpression.html
             """
-            matches = re.finditer(pattern, text_str)
+            matches = rule_matches[index]
 
             for match in matches:  # type: Match[str]
                 # Get regex result position into the text string
@@ -132,7 +135,7 @@ class ViewHighlighter(MainHighlighter):
                 # Collect line tokens only when any of them matched
                 if tag not in self.line_tokens[line_number]:
                     self.line_tokens[line_number][tag] = []
-                if tag != 'code' or tag not in self.get_nl_closing_tokens():
+                if tag != 'code' or tag not in self.nl_closing_tokens:
                     # The line tokens data will be reset after re-highlighting, no need to check for duplicates
                     self.line_tokens[line_number][tag].append(
                         {'start': start, 'end': end, 'length': length})  # 'in_code':...
@@ -148,7 +151,7 @@ class ViewHighlighter(MainHighlighter):
                     if tag in open_tokens:
                         self.tokens[tag]['o'] = True
                     elif tag in close_tokens:
-                        for _r in self.get_open_close_token_map():
+                        for _r in self.open_close_token_map:
                             if _r['group'] == group and _r['close'] == tag and _r['open'] in self.tokens:
                                 self.tokens[_r['open']]['o'] = False
 
@@ -182,7 +185,7 @@ class ViewHighlighter(MainHighlighter):
                 # Save block's data
                 self.set_block_data(current_block, user_data)
 
-        for token_data in self.get_open_close_token_map():
+        for token_data in self.open_close_token_map:
             """
             Process the lines located between the tags those are do not have regex matches
             """
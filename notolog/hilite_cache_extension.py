@@ -0,0 +1,197 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: CodeHilite extension with a cache of the highlighted code blocks.
+- Functionality: Keeps the html of each highlighted code block by the hash of the block and the highlighting config,
+  so the unchanged blocks are not lexed by Pygments again, across the renders and the notes.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from markdown import Markdown
+from markdown.extensions.codehilite import CodeHilite, CodeHiliteExtension, HiliteTreeprocessor
+from markdown.extensions.fenced_code import FencedBlockPreprocessor
+
+from collections import OrderedDict
+from threading import Lock
+from typing import List, Union
+
+import hashlib
+import logging
+
+
+class HiliteCache:
+    """
+    LRU cache of the highlighted code blocks html, shared by all the Markdown objects.
+    """
+
+    MAX_ITEMS = 1024  # type: int
+    MAX_SIZE = 16 * 1024 * 1024  # type: int
+
+    items = OrderedDict()  # type: OrderedDict[str, str]
+    size = 0  # type: int
+    # Markdown objects may work on the different threads, e.g. the render worker
+    lock = Lock()
+
+    hits = 0  # type: int
+    misses = 0  # type: int
+
+    @staticmethod
+    def get_key(*params) -> str:
+        key_hash = hashlib.sha256()
+        for param in params:
+            key_hash.update(repr(param).encode('utf-8', errors='surrogatepass'))
+            key_hash.update(b'\0')
+        return key_hash.hexdigest()
+
+    @classmethod
+    def get(cls, key: str) -> Union[str, None]:
+        with cls.lock:
+            html = cls.items.get(key)
+            if html is None:
+                cls.misses += 1
+            else:
+                cls.items.move_to_end(key)
+                cls.hits += 1
+            return html
+
+    @classmethod
+    def put(cls, key: str, html: str) -> None:
+        with cls.lock:
+            if len(html) > cls.MAX_SIZE:
+                return
+            if key in cls.items:
+                cls.size -= len(cls.items.pop(key))
+            cls.items[key] = html
+            cls.size += len(html)
+            while len(cls.items) > cls.MAX_ITEMS or cls.size > cls.MAX_SIZE:
+                _key, _html = cls.items.popitem(last=False)
+                cls.size -= len(_html)
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls.lock:
+            cls.items.clear()
+            cls.size = 0
+            cls.hits = 0
+            cls.misses = 0
+
+
+class HiliteCacheExtension(CodeHiliteExtension):
+    """
+    Drop-in replacement of the CodeHiliteExtension, Fenced Code extension recognizes it as the CodeHilite one.
+    Register it after the Fenced Code extension (or 'extra') to cache the fenced blocks as well.
+    """
+
+    logger = logging.getLogger('hilite_cache_extension')
+
+    def extendMarkdown(self, md: Markdown) -> None:
+        self.logger.debug('%s extension engaged' % self.__class__.__qualname__)
+
+        config = self.getConfigs()
+
+        # Indented code blocks
+        hiliter = HiliteCacheTreeprocessor(md)
+        hiliter.config = config
+        md.treeprocessors.register(hiliter, 'hilite', 30)
+
+        # Fenced code blocks, replacing the processor with the same name
+        if 'fenced_code_block' in md.preprocessors:
+            fenced_processor = md.preprocessors['fenced_code_block']
+            if isinstance(fenced_processor, FencedBlockPreprocessor):
+                md.preprocessors.register(
+                    FencedBlockCachePreprocessor(md, fenced_processor.config, config), 'fenced_code_block', 25)
+
+        md.registerExtension(self)
+
+
+class HiliteCacheTreeprocessor(HiliteTreeprocessor):
+    """
+    Highlights indented code blocks the same way as HiliteTreeprocessor does, using the cache.
+    """
+
+    logger = logging.getLogger('hilite_cache_extension')
+
+    def run(self, root) -> None:
+        for block in root.iter('pre'):
+            if len(block) == 1 and block[0].tag == 'code':
+                local_config = self.config.copy()
+                text = block[0].text
+                if text is None:
+                    continue
+                code_text = self.code_unescape(text)
+                key = HiliteCache.get_key('indented', sorted(local_config.items()), self.md.tab_length, code_text)
+                html = HiliteCache.get(key)
+                if html is None:
+                    code = CodeHilite(
+                        code_text,
+                        tab_length=self.md.tab_length,
+                        style=local_config.pop('pygments_style', 'default'),
+                        **local_config
+                    )
+                    html = code.hilite()
+                    HiliteCache.put(key, html)
+                placeholder = self.md.htmlStash.store(html)
+                # Clear code block in `etree` instance
+                block.clear()
+                # Change to `p` element which will later be removed when inserting raw html
+                block.tag = 'p'
+                block.text = placeholder
+
+        self.logger.debug(f'Code blocks cache: {HiliteCache.hits} hit(s), {HiliteCache.misses} miss(es)')
+
+
+class FencedBlockCachePreprocessor(FencedBlockPreprocessor):
+    """
+    Passes each fenced block to the original processor one by one, caching the html it produces.
+    """
+
+    logger = logging.getLogger('hilite_cache_extension')
+
+    def __init__(self, md: Markdown, config: dict, hilite_config: dict):
+        super().__init__(md, config)
+        # The key covers anything the block html depends on apart from the block itself
+        self.config_key = (sorted(config.items()), sorted(hilite_config.items()), md.tab_length)
+
+    def run(self, lines: List[str]) -> List[str]:
+        text = "\n".join(lines)
+        index = 0
+        while True:
+            match = self.FENCED_BLOCK_RE.search(text, index)
+            if not match:
+                break
+            block_text = match.group(0)
+            key = HiliteCache.get_key('fenced', self.config_key, block_text)
+            html = HiliteCache.get(key)
+            if html is None:
+                stash_size = len(self.md.htmlStash.rawHtmlBlocks)
+                block_lines = super().run(block_text.split("\n"))
+                stashed = self.md.htmlStash.rawHtmlBlocks[stash_size:]
+                if len(stashed) != 1 or not isinstance(stashed[0], str):
+                    # Not a single code block, keep the processed text as is without caching
+                    processed_text = "\n".join(block_lines)
+                    text = f'{text[:match.start()]}{processed_text}{text[match.end():]}'
+                    index = match.start() + len(processed_text)
+                    continue
+                html = stashed[0]
+                placeholder = self.md.htmlStash.get_placeholder(stash_size)
+                HiliteCache.put(key, html)
+            else:
+                placeholder = self.md.htmlStash.store(html)
+            text = f'{text[:match.start()]}\n{placeholder}\n{text[match.end():]}'
+            # Continue from after the replaced text in the next iteration
+            index = match.start() + 1 + len(placeholder)
+
+        self.logger.debug(f'Code blocks cache: {HiliteCache.hits} hit(s), {HiliteCache.misses} miss(es)')
+
+        return text.split("\n")
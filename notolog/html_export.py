@@ -0,0 +1,377 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Headless export of the notes to html.
+- Functionality: Renders the notes within a directory to html files with the same Markdown extensions, details
+  blocks processing and theme styles the VIEW mode uses. The notes are rendered on a pool of worker processes,
+  each with its own Markdown object. The export is incremental: a manifest within the output directory keeps the
+  modification time, size and hash of each note exported, so only the notes changed since are rendered again.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Callable, Union
+
+import os
+import sys
+import html
+import json
+import hashlib
+import logging
+import multiprocessing
+
+import emoji
+import markdown
+import pygments
+
+from .app_config import AppConfig
+from .file_header import FileHeader
+from .helpers import file_helper
+from .helpers.theme_helper import ThemeHelper
+from .render_pipeline import RenderPipeline
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future  # noqa: F401
+    from typing import Dict, List, Tuple  # noqa: F401
+
+
+class HtmlExport:
+    """
+    Exports the notes within the source directory to the html files within the output directory, keeping the
+    sub-directories structure. Encrypted notes are not exported.
+    """
+
+    # Extensions of the notes to export
+    EXTENSIONS = ('md',)  # type: Tuple[str, ...]
+
+    # Manifest of the notes exported, within the output directory
+    MANIFEST_NAME = '.notolog-export.json'  # type: str
+    MANIFEST_VERSION = 1  # type: int
+
+    HTML_TPL = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<title>%s</title>
+<style type="text/css">
+%s
+</style>
+</head>
+<body>
+%s
+</body>
+</html>
+"""
+
+    def __init__(self, source_dir: str, output_dir: str, theme: str = None, process_emojis: bool = None,
+                 recursive: bool = True, force: bool = False, processes: int = None):
+        """
+        Args:
+            source_dir (str): Directory with the notes
+            output_dir (str): Directory to write the html files to
+            theme (str, optional): Theme of the styles, the one of the app settings by default
+            process_emojis (bool, optional): Convert emojis, like :cat: to 🐱, the app setting by default
+            recursive (bool, optional): Export the notes within the sub-directories too
+            force (bool, optional): Render all the notes, even the unchanged ones
+            processes (int, optional): Number of the worker processes, the number of the CPUs by default;
+                the notes are rendered within the current process if it is 1 or less
+        """
+        self.logger = logging.getLogger('html_export')
+
+        self.source_dir = os.path.abspath(source_dir)
+        self.output_dir = os.path.abspath(output_dir)
+        self.recursive = recursive
+        self.force = force
+        self.processes = processes if processes is not None else (os.cpu_count() or 1)
+
+        theme_helper = ThemeHelper(theme=theme)
+        self.css = theme_helper.get_css('styles') or ''
+        self.process_emojis = (process_emojis if process_emojis is not None
+                               else bool(theme_helper.settings.viewer_process_emojis))
+
+        # Anything the html depends on besides the note itself, the notes are rendered again once it is changed
+        self.config_hash = get_hash(repr((self.MANIFEST_VERSION, RenderPipeline.MD_EXTENSIONS, self.process_emojis,
+                                          AppConfig().get_app_version(), markdown.__version__, pygments.__version__,
+                                          emoji.__version__)).encode('utf-8') + self.css.encode('utf-8'))
+
+    def collect(self) -> 'List[str]':
+        """
+        Collect the notes to export.
+
+        Returns:
+            List[str]: Paths of the notes relative to the source directory
+        """
+        files = []  # type: List[str]
+        for dir_path, dir_names, file_names in os.walk(self.source_dir):
+            if self.recursive:
+                # Hidden directories are skipped, e.g. the ones of the VCS, as well as the output directory
+                dir_names[:] = sorted(name for name in dir_names if not name.startswith('.')
+                                      and os.path.join(dir_path, name) != self.output_dir)
+            else:
+                dir_names[:] = []
+            for file_name in sorted(file_names):
+                extension = os.path.splitext(file_name)[1][1:].lower()
+                if extension in self.EXTENSIONS:
+                    files.append(os.path.relpath(os.path.join(dir_path, file_name), self.source_dir))
+        return files
+
+    def get_output_path(self, rel_path: str) -> str:
+        return os.path.join(self.output_dir, os.path.splitext(rel_path)[0] + '.html')
+
+    def get_manifest_path(self) -> str:
+        return os.path.join(self.output_dir, self.MANIFEST_NAME)
+
+    def load_manifest(self) -> 'Dict[str, Any]':
+        try:
+            with open(self.get_manifest_path(), encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or manifest.get('config') != self.config_hash:
+            # Exported with the other config or damaged, all the notes are rendered again
+            return {}
+        return manifest.get('files', {})
+
+    def save_manifest(self, files: 'Dict[str, Any]') -> None:
+        data = json.dumps({'config': self.config_hash, 'files': files}, indent=1, sort_keys=True)
+        if not file_helper.save_file_atomic(self.get_manifest_path(), data):
+            self.logger.warning(f'Cannot write the export manifest "{self.get_manifest_path()}"')
+
+    def run(self, progress_callback: Callable[[int, int], Any] = None) -> 'Dict[str, Any]':
+        """
+        Export the notes changed since the last export and remove the html of the notes removed since.
+        The manifest is saved even if the export is interrupted, the notes not exported keep their previous entries.
+
+        Args:
+            progress_callback (Callable[[int, int], Any], optional): Receives the number of the notes rendered and
+                the total number of the notes to render
+
+        Returns:
+            Dict[str, Any]: The notes 'rendered', 'unchanged', 'skipped' (encrypted ones), 'removed' and 'failed'
+                (with the errors)
+        """
+        result = {'rendered': [], 'unchanged': [], 'skipped': [], 'removed': [], 'failed': []}
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        manifest = {} if self.force else self.load_manifest()
+        files = {}  # type: Dict[str, Any]
+        # The notes the html of which is gone
+        dropped = set()  # type: set[str]
+        try:
+            jobs = self.scan(manifest, files, result)
+            self.render(jobs, files, result, progress_callback)
+            dropped = self.remove_outputs(manifest, files, result)
+        finally:
+            # E.g. the failed notes, the ones out of the scope of the export or the ones left upon an interruption
+            files.update({rel_path: entry for rel_path, entry in manifest.items()
+                          if rel_path not in files and rel_path not in dropped})
+            self.save_manifest(files)
+
+        return result
+
+    def scan(self, manifest: 'Dict[str, Any]', files: 'Dict[str, Any]', result: 'Dict[str, Any]') \
+            -> 'List[Dict[str, Any]]':
+        """
+        Collect the notes and sort out the ones to render, the unchanged ones are set to the files as they are.
+
+        Returns:
+            List[Dict[str, Any]]: Jobs of the notes to render
+        """
+        jobs = []  # type: List[Dict[str, Any]]
+        for rel_path in self.collect():
+            file_path = os.path.join(self.source_dir, rel_path)
+            try:
+                stat = os.stat(file_path)
+            except OSError as e:
+                result['failed'].append((rel_path, str(e)))
+                continue
+            entry = manifest.get(rel_path)
+            output_exists = os.path.isfile(self.get_output_path(rel_path))
+            if (entry is not None and output_exists
+                    and entry.get('mtime') == stat.st_mtime_ns and entry.get('size') == stat.st_size):
+                # Unchanged since the last export, not even read
+                files[rel_path] = entry
+                result['unchanged'].append(rel_path)
+                continue
+            if FileHeader().probe(file_path).is_file_encrypted():
+                result['skipped'].append(rel_path)
+                continue
+            jobs.append({'rel_path': rel_path, 'file_path': file_path, 'output_path': self.get_output_path(rel_path),
+                         'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'css': self.css,
+                         'process_emojis': self.process_emojis,
+                         # Touched but unchanged notes are not rendered again, compared by the hash
+                         'hash': entry.get('hash') if entry is not None and output_exists else None})
+        return jobs
+
+    def render(self, jobs: 'List[Dict[str, Any]]', files: 'Dict[str, Any]', result: 'Dict[str, Any]',
+               progress_callback: Callable[[int, int], Any] = None) -> None:
+        """
+        Render the notes of the jobs, on the worker processes if there are any. A note failed does not stop the others.
+        """
+        total = len(jobs)
+        if callable(progress_callback):
+            progress_callback(0, total)
+
+        if self.processes > 1 and total > 1:
+            # Spawned processes do not inherit the threads of the app
+            executor = ProcessPoolExecutor(max_workers=min(self.processes, total),
+                                           mp_context=multiprocessing.get_context('spawn'))
+            futures = {executor.submit(export_file, job): job['rel_path'] for job in jobs}
+            completed = (get_result(future, futures[future]) for future in as_completed(futures))
+        else:
+            executor = None
+            completed = (export_file(job) for job in jobs)
+
+        try:
+            for done, (rel_path, entry, rendered, error) in enumerate(completed, start=1):
+                if error is not None:
+                    self.logger.warning(f'Cannot export "{rel_path}": {error}')
+                    result['failed'].append((rel_path, error))
+                else:
+                    files[rel_path] = entry
+                    result['rendered' if rendered else 'unchanged'].append(rel_path)
+                if callable(progress_callback):
+                    progress_callback(done, total)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+
+    def remove_outputs(self, manifest: 'Dict[str, Any]', files: 'Dict[str, Any]', result: 'Dict[str, Any]') \
+            -> 'set[str]':
+        """
+        Remove the html of the notes removed or encrypted since the last export. The notes out of the scope of the
+        export, e.g. the ones within the sub-directories of a non-recursive export, are kept as they are.
+
+        Returns:
+            set[str]: The notes the html of which is gone
+        """
+        dropped = set()  # type: set[str]
+        failed = {rel_path for rel_path, _error in result['failed']}
+        for rel_path in sorted(set(manifest) - set(files) - failed):
+            if not self.recursive and os.path.dirname(rel_path):
+                continue
+            try:
+                os.remove(self.get_output_path(rel_path))
+                result['removed'].append(rel_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.warning(f'Cannot remove "{self.get_output_path(rel_path)}": {e}')
+                continue
+            dropped.add(rel_path)
+        return dropped
+
+
+# Markdown object of the worker process, created once and reset before each note
+md = None  # type: Union[markdown.Markdown, None]
+
+
+def get_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def get_result(future: 'Future', rel_path: str) -> 'Tuple[str, Union[Dict[str, Any], None], bool, Union[str, None]]':
+    """
+    Result of the note exported on the worker process, the same as export_file() returns, e.g. if the process is gone.
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        return rel_path, None, False, str(e) or type(e).__name__
+
+
+def render_html(content: str, process_emojis: bool) -> str:
+    """
+    Convert the note content to html, the same stages the VIEW mode renders it with.
+    """
+    global md
+    if md is None:
+        md = RenderPipeline.create_md(RenderPipeline.MD_EXTENSIONS)
+    else:
+        # Resets extensions as well, without this the footnotes tend to be kept across the various notes
+        md.reset()
+
+    content = RenderPipeline.pre_md_process(content)
+    if process_emojis:
+        content = RenderPipeline.convert_emojis(content)
+    content = md.convert(content)
+    # The details blocks are left as they are, as the browsers expand them natively
+    return RenderPipeline.post_md_process(content)
+
+
+def export_file(job: 'Dict[str, Any]') -> 'Tuple[str, Union[Dict[str, Any], None], bool, Union[str, None]]':
+    """
+    Export a single note, it is run on the worker process.
+
+    Returns:
+        Tuple: Relative path of the note, its manifest entry, whether it is rendered and the error, if any
+    """
+    rel_path = job['rel_path']
+    try:
+        with open(job['file_path'], 'rb') as f:
+            data = f.read()
+        entry = {'mtime': job['mtime'], 'size': job['size'], 'hash': get_hash(data)}
+        if entry['hash'] == job['hash']:
+            return rel_path, entry, False, None
+
+        content = data.decode('utf-8')
+        # The header is parsed from the first line only, the same as upon loading the note
+        file_header = FileHeader()
+        header_line, _separator, body = content.partition('\n')
+        if file_header.parse(header_line.rstrip('\r')):
+            content = body
+        title = file_header.get_param('title') or os.path.splitext(os.path.basename(rel_path))[0]
+        html_content = HtmlExport.HTML_TPL % (html.escape(title), job['css'],
+                                              render_html(content, job['process_emojis']))
+
+        os.makedirs(os.path.dirname(job['output_path']), exist_ok=True)
+        if not file_helper.save_file_atomic(job['output_path'], html_content):
+            return rel_path, None, False, 'Cannot write the file'
+    except Exception as e:
+        # Any note failed, e.g. by an extension, is recorded and does not stop the others
+        return rel_path, None, False, str(e) or type(e).__name__
+
+    return rel_path, entry, True, None
+
+
+def run_cli(args: Any) -> int:
+    """
+    Run the export from the command line, see the `export` command of the app.
+
+    Returns:
+        int: Exit code, 1 if any note failed, 130 if interrupted
+    """
+    if not os.path.isdir(args.source):
+        print(f'Directory not found: {args.source}', file=sys.stderr)
+        return 2
+
+    html_export = HtmlExport(args.source, args.output, theme=args.theme, process_emojis=args.emojis,
+                             recursive=args.recursive, force=args.force, processes=args.jobs)
+
+    def progress(done: int, total: int) -> None:
+        print(f'\r{done}/{total}', end='', file=sys.stderr, flush=True)
+
+    try:
+        result = html_export.run(progress_callback=progress)
+    except KeyboardInterrupt:
+        print('\nInterrupted', file=sys.stderr)
+        return 130
+
+    print('', file=sys.stderr)
+    for rel_path, error in result['failed']:
+        print(f'Failed: {rel_path}: {error}', file=sys.stderr)
+    print(f"Rendered: {len(result['rendered'])}, unchanged: {len(result['unchanged'])}, "
+          f"skipped: {len(result['skipped'])}, removed: {len(result['removed'])}, failed: {len(result['failed'])}")
+
+    return 1 if result['failed'] else 0
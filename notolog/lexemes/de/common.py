@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "Vollständig löschen",
     "menu_action_restore": "Wiederherstellen",
     "menu_action_create_new_dir": "Neues Verzeichnis erstellen",
+    "menu_action_search_notes": "In Notizen suchen",
+    "menu_action_encrypt_notes": "Notizen im Ordner verschlüsseln",
+    "menu_action_decrypt_notes": "Notizen im Ordner entschlüsseln",
+    "menu_action_rekey_notes": "Passwort der Notizen im Ordner ändern",
 
     "dialog_file_rename_title": "Datei umbenennen",
     "dialog_file_rename_field_label": "Neuen Dateinamen eingeben",
@@ -46,6 +50,18 @@ lexemes = {
     "dialog_create_new_dir_error": "Verzeichnis kann nicht erstellt werden. Stellen Sie sicher, "
                                    "dass das Zielverzeichnis {base_dir} beschreibbar ist",
 
+    "dialog_workspace_search_title": "In Notizen suchen",
+    "dialog_workspace_search_input_placeholder_text": "Zu suchende Wörter",
+    "dialog_workspace_search_results_count": "Gefundene Notizen: {count}",
+    "dialog_workspace_search_indexing": "Notizen werden indiziert...",
+    "dialog_workspace_search_not_available": "Wählen Sie den Standardordner für Notizen, um darin zu suchen",
+    "dialog_batch_crypt_title": "Notizen im Ordner",
+    "dialog_batch_crypt_text": "Zu verarbeitende Notizen im Ordner und seinen Unterordnern: {count}. Fortfahren?",
+    "dialog_batch_crypt_no_notes": "Keine zu verarbeitenden Notizen im Ordner",
+    "dialog_batch_crypt_progress": "Notizen werden verarbeitet...",
+    "dialog_batch_crypt_cancel": "Abbrechen",
+    "dialog_batch_crypt_result": "Verarbeitete Notizen: {processed}, fehlgeschlagen: {failed}, übersprungen: {skipped}",
+
     "dialog_message_box_title": "Nachricht",
     "dialog_message_box_button_ok": "Schließen",
 
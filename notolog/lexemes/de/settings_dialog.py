@@ -39,6 +39,11 @@ lexemes = {
     "editor_config_label": "Editor-Konfiguration",
     "editor_config_show_line_numbers_checkbox": "Zeilennummern anzeigen",
     "editor_config_show_line_numbers_checkbox_accessible_description": "Zeilennummern im Editor anzeigen",
+    "editor_config_enc_chunked_migration_checkbox":
+        "Verschlüsselte Notizen beim Speichern in das segmentierte Format umwandeln",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "Verschlüsselt ältere verschlüsselte Notizen beim Speichern im segmentierten Format neu. "
+        "Solche Notizen können von früheren Versionen nicht geöffnet werden.",
 
     "viewer_config_label": "Viewer-Konfiguration",
     "viewer_config_process_emojis_checkbox": "Text-Emojis in Grafiken umwandeln",
@@ -51,6 +56,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "Externe Bilder automatisch auf Festplatte speichern",
     "viewer_config_save_resources_checkbox_accessible_description":
         "Speichert automatisch Kopien von externen Bildern auf der Festplatte für den Offline-Zugriff.",
+    "viewer_config_render_cache_disk_checkbox": "Gerenderte Notizen auf der Festplatte behalten",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "Speichert die gerenderte Ansicht der Notizen auf der Festplatte, um unveränderte Notizen schneller zu öffnen.",
+    "viewer_config_render_cache_clear_button": "Render-Cache leeren",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "Zwischengespeicherte gerenderte Notizen aus Speicher und Festplatte entfernen",
 
     "ai_config_inference_module_label": "Inferenzmodul",
     "ai_config_inference_module_names_combo_label": "Aktives Inferenzmodul",
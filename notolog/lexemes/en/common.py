@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "Delete completely",
     "menu_action_restore": "Restore",
     "menu_action_create_new_dir": "Create a new directory",
+    "menu_action_search_notes": "Search in notes",
+    "menu_action_encrypt_notes": "Encrypt notes in folder",
+    "menu_action_decrypt_notes": "Decrypt notes in folder",
+    "menu_action_rekey_notes": "Change password of notes in folder",
 
     "dialog_file_rename_title": "Rename file",
     "dialog_file_rename_field_label": "Enter new file name",
@@ -44,6 +48,18 @@ lexemes = {
     "dialog_create_new_dir_error_existed": "Directory already exists",
     "dialog_create_new_dir_error": "Cannot create directory. Ensure the destination directory {base_dir} is writable",
 
+    "dialog_workspace_search_title": "Search in notes",
+    "dialog_workspace_search_input_placeholder_text": "Words to search",
+    "dialog_workspace_search_results_count": "Notes found: {count}",
+    "dialog_workspace_search_indexing": "Indexing notes...",
+    "dialog_workspace_search_not_available": "Select the default folder for notes to search in",
+    "dialog_batch_crypt_title": "Notes in folder",
+    "dialog_batch_crypt_text": "Notes to process in the folder and its sub-folders: {count}. Continue?",
+    "dialog_batch_crypt_no_notes": "No notes to process in the folder",
+    "dialog_batch_crypt_progress": "Processing notes...",
+    "dialog_batch_crypt_cancel": "Cancel",
+    "dialog_batch_crypt_result": "Notes processed: {processed}, failed: {failed}, skipped: {skipped}",
+
     "dialog_message_box_title": "Message",
     "dialog_message_box_button_ok": "Close",
 
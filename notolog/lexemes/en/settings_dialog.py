@@ -38,6 +38,10 @@ lexemes = {
     "editor_config_label": "Editor Configuration",
     "editor_config_show_line_numbers_checkbox": "Show Line Numbers",
     "editor_config_show_line_numbers_checkbox_accessible_description": "Display line numbers in the editor",
+    "editor_config_enc_chunked_migration_checkbox": "Upgrade encrypted notes to the chunked format on save",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "Re-encrypts older encrypted notes in the chunked format when they are saved. "
+        "Such notes cannot be opened by earlier versions.",
 
     "viewer_config_label": "Viewer Configuration",
     "viewer_config_process_emojis_checkbox": "Convert Text Emojis to Graphics",
@@ -50,6 +54,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "Auto-save external images to disk",
     "viewer_config_save_resources_checkbox_accessible_description":
         "Automatically saves copies of external images to disk for offline access.",
+    "viewer_config_render_cache_disk_checkbox": "Keep rendered notes on disk",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "Caches the rendered view of notes on disk to open unchanged notes faster.",
+    "viewer_config_render_cache_clear_button": "Clear render cache",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "Remove the cached rendered notes from memory and disk",
 
     "ai_config_inference_module_label": "Inference Module",
     "ai_config_inference_module_names_combo_label": "Active Inference Module",
@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "Eliminar completamente",
     "menu_action_restore": "Restaurar",
     "menu_action_create_new_dir": "Crear un nuevo directorio",
+    "menu_action_search_notes": "Buscar en las notas",
+    "menu_action_encrypt_notes": "Cifrar las notas de la carpeta",
+    "menu_action_decrypt_notes": "Descifrar las notas de la carpeta",
+    "menu_action_rekey_notes": "Cambiar la contraseña de las notas de la carpeta",
 
     "dialog_file_rename_title": "Renombrar archivo",
     "dialog_file_rename_field_label": "Ingrese el nuevo nombre del archivo",
@@ -46,6 +50,18 @@ lexemes = {
     "dialog_create_new_dir_error": "No se puede crear el directorio. Asegúrese de que el directorio de destino "
                                    "{base_dir} sea escribible",
 
+    "dialog_workspace_search_title": "Buscar en las notas",
+    "dialog_workspace_search_input_placeholder_text": "Palabras a buscar",
+    "dialog_workspace_search_results_count": "Notas encontradas: {count}",
+    "dialog_workspace_search_indexing": "Indexando notas...",
+    "dialog_workspace_search_not_available": "Seleccione la carpeta predeterminada de notas para buscar en ella",
+    "dialog_batch_crypt_title": "Notas de la carpeta",
+    "dialog_batch_crypt_text": "Notas a procesar en la carpeta y sus subcarpetas: {count}. ¿Continuar?",
+    "dialog_batch_crypt_no_notes": "No hay notas para procesar en la carpeta",
+    "dialog_batch_crypt_progress": "Procesando las notas...",
+    "dialog_batch_crypt_cancel": "Cancelar",
+    "dialog_batch_crypt_result": "Notas procesadas: {processed}, fallidas: {failed}, omitidas: {skipped}",
+
     "dialog_message_box_title": "Mensaje",
     "dialog_message_box_button_ok": "Cerrar",
 
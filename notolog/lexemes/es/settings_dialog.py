@@ -39,6 +39,10 @@ lexemes = {
     "editor_config_label": "Configuración del editor",
     "editor_config_show_line_numbers_checkbox": "Mostrar números de línea",
     "editor_config_show_line_numbers_checkbox_accessible_description": "Mostrar números de línea en el editor",
+    "editor_config_enc_chunked_migration_checkbox": "Actualizar las notas cifradas al formato por fragmentos al guardar",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "Vuelve a cifrar las notas cifradas antiguas en el formato por fragmentos al guardarlas. "
+        "Las versiones anteriores no pueden abrir dichas notas.",
 
     "viewer_config_label": "Configuración del visor",
     "viewer_config_process_emojis_checkbox": "Convertir emojis de texto en gráficos",
@@ -52,6 +56,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "Guardar automáticamente imágenes externas en el disco",
     "viewer_config_save_resources_checkbox_accessible_description":
         "Guarda automáticamente copias de imágenes externas en el disco para acceso sin conexión.",
+    "viewer_config_render_cache_disk_checkbox": "Conservar notas renderizadas en el disco",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "Guarda en caché la vista renderizada de las notas en el disco para abrir más rápido las notas sin cambios.",
+    "viewer_config_render_cache_clear_button": "Borrar caché de renderizado",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "Eliminar las notas renderizadas en caché de la memoria y del disco",
 
     "ai_config_inference_module_label": "Módulo de inferencia",
     "ai_config_inference_module_names_combo_label": "Módulo de inferencia activo",
@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "Poista kokonaan",
     "menu_action_restore": "Palauta",
     "menu_action_create_new_dir": "Luo uusi hakemisto",
+    "menu_action_search_notes": "Hae muistiinpanoista",
+    "menu_action_encrypt_notes": "Salaa kansion muistiinpanot",
+    "menu_action_decrypt_notes": "Pura kansion muistiinpanojen salaus",
+    "menu_action_rekey_notes": "Vaihda kansion muistiinpanojen salasana",
 
     "dialog_file_rename_title": "Nimeä tiedosto uudelleen",
     "dialog_file_rename_field_label": "Anna uusi tiedostonimi",
@@ -46,6 +50,18 @@ lexemes = {
     "dialog_create_new_dir_error": "Hakemistoa ei voi luoda. Varmista, että kohdehakemisto "
                                    "{base_dir} on kirjoitettavissa",
 
+    "dialog_workspace_search_title": "Hae muistiinpanoista",
+    "dialog_workspace_search_input_placeholder_text": "Haettavat sanat",
+    "dialog_workspace_search_results_count": "Löydetyt muistiinpanot: {count}",
+    "dialog_workspace_search_indexing": "Muistiinpanoja indeksoidaan...",
+    "dialog_workspace_search_not_available": "Valitse muistiinpanojen oletuskansio hakua varten",
+    "dialog_batch_crypt_title": "Kansion muistiinpanot",
+    "dialog_batch_crypt_text": "Käsiteltäviä muistiinpanoja kansiossa ja sen alikansioissa: {count}. Jatketaanko?",
+    "dialog_batch_crypt_no_notes": "Kansiossa ei ole käsiteltäviä muistiinpanoja",
+    "dialog_batch_crypt_progress": "Käsitellään muistiinpanoja...",
+    "dialog_batch_crypt_cancel": "Peruuta",
+    "dialog_batch_crypt_result": "Käsitelty: {processed}, epäonnistui: {failed}, ohitettu: {skipped}",
+
     "dialog_message_box_title": "Viesti",
     "dialog_message_box_button_ok": "Sulje",
 
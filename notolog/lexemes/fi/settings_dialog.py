@@ -37,6 +37,10 @@ lexemes = {
     "editor_config_label": "Editorin konfigurointi",
     "editor_config_show_line_numbers_checkbox": "Näytä rivinumerot",
     "editor_config_show_line_numbers_checkbox_accessible_description": "Näytä rivinumerot editorissa",
+    "editor_config_enc_chunked_migration_checkbox": "Päivitä salatut muistiinpanot lohkomuotoon tallennettaessa",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "Salaa vanhemmat salatut muistiinpanot uudelleen lohkomuodossa, kun ne tallennetaan. "
+        "Aiemmat versiot eivät voi avata tällaisia muistiinpanoja.",
 
     "viewer_config_label": "Katselimen konfigurointi",
     "viewer_config_process_emojis_checkbox": "Muunna tekstiemojit graafisiksi",
@@ -49,6 +53,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "Tallenna ulkoiset kuvat automaattisesti levylle",
     "viewer_config_save_resources_checkbox_accessible_description":
         "Tallenna automaattisesti ulkoisten kuvien kopiot levylle offline-käyttöä varten.",
+    "viewer_config_render_cache_disk_checkbox": "Säilytä renderöidyt muistiinpanot levyllä",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "Tallentaa muistiinpanojen renderöidyn näkymän levylle, jotta muuttumattomat muistiinpanot avautuvat nopeammin.",
+    "viewer_config_render_cache_clear_button": "Tyhjennä renderöintivälimuisti",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "Poista välimuistissa olevat renderöidyt muistiinpanot muistista ja levyltä",
 
     "ai_config_inference_module_label": "Päätöksentekomoduuli",
     "ai_config_inference_module_names_combo_label": "Aktiivinen päätöksentekomoduuli",
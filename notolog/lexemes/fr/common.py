@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "Supprimer définitivement",
     "menu_action_restore": "Restaurer",
     "menu_action_create_new_dir": "Créer un nouveau répertoire",
+    "menu_action_search_notes": "Rechercher dans les notes",
+    "menu_action_encrypt_notes": "Chiffrer les notes du dossier",
+    "menu_action_decrypt_notes": "Déchiffrer les notes du dossier",
+    "menu_action_rekey_notes": "Changer le mot de passe des notes du dossier",
 
     "dialog_file_rename_title": "Renommer le fichier",
     "dialog_file_rename_field_label": "Entrer le nouveau nom du fichier",
@@ -46,6 +50,18 @@ lexemes = {
     "dialog_create_new_dir_error": "Impossible de créer le répertoire. Assurez-vous que le répertoire de destination "
                                    "{base_dir} est accessible en écriture",
 
+    "dialog_workspace_search_title": "Rechercher dans les notes",
+    "dialog_workspace_search_input_placeholder_text": "Mots à rechercher",
+    "dialog_workspace_search_results_count": "Notes trouvées : {count}",
+    "dialog_workspace_search_indexing": "Indexation des notes...",
+    "dialog_workspace_search_not_available": "Sélectionnez le dossier par défaut des notes pour y rechercher",
+    "dialog_batch_crypt_title": "Notes du dossier",
+    "dialog_batch_crypt_text": "Notes à traiter dans le dossier et ses sous-dossiers : {count}. Continuer ?",
+    "dialog_batch_crypt_no_notes": "Aucune note à traiter dans le dossier",
+    "dialog_batch_crypt_progress": "Traitement des notes...",
+    "dialog_batch_crypt_cancel": "Annuler",
+    "dialog_batch_crypt_result": "Notes traitées : {processed}, échouées : {failed}, ignorées : {skipped}",
+
     "dialog_message_box_title": "Message",
     "dialog_message_box_button_ok": "Fermer",
 
@@ -38,6 +38,11 @@ lexemes = {
     "editor_config_label": "Configuration de l'éditeur",
     "editor_config_show_line_numbers_checkbox": "Afficher les numéros de ligne",
     "editor_config_show_line_numbers_checkbox_accessible_description": "Afficher les numéros de ligne dans l'éditeur",
+    "editor_config_enc_chunked_migration_checkbox":
+        "Convertir les notes chiffrées au format par segments lors de l'enregistrement",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "Chiffre à nouveau les anciennes notes chiffrées au format par segments lors de leur enregistrement. "
+        "Les versions antérieures ne peuvent pas ouvrir ces notes.",
 
     "viewer_config_label": "Configuration du visualiseur",
     "viewer_config_process_emojis_checkbox": "Convertir les emojis de texte en graphiques",
@@ -51,6 +56,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "Enregistrer automatiquement les images externes sur le disque",
     "viewer_config_save_resources_checkbox_accessible_description":
         "Enregistre automatiquement des copies des images externes sur le disque pour un accès hors ligne.",
+    "viewer_config_render_cache_disk_checkbox": "Conserver les notes rendues sur le disque",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "Met en cache sur le disque le rendu des notes pour ouvrir plus vite les notes inchangées.",
+    "viewer_config_render_cache_clear_button": "Vider le cache de rendu",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "Supprimer les notes rendues en cache de la mémoire et du disque",
 
     "ai_config_inference_module_label": "Module d'inférence",
     "ai_config_inference_module_names_combo_label": "Module d'inférence actif",
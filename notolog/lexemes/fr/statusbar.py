@@ -10,6 +10,9 @@ lexemes = {
     "statusbar_litter_bin_accessible_name": "Afficher le contenu de la corbeille",
 
     "statusbar_save_progress_label": b'\xf0\x9f\x92\xbe',
+    "statusbar_render_progress_label": b'\xe2\x8f\xb3',
+    "statusbar_load_progress_label": "{icon} {percent}%",
+    "statusbar_key_progress_label": b'\xf0\x9f\x94\x91',
     "statusbar_encryption_symbol_encrypted_label": b'\xf0\x9f\x94\x92',
     "statusbar_encryption_symbol_unencrypted_label": b'\xf0\x9f\x94\x93',
 
@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "სრული წაშლა",
     "menu_action_restore": "აღდგენა",
     "menu_action_create_new_dir": "ახალი დირექტორიის შექმნა",
+    "menu_action_search_notes": "ჩანაწერებში ძებნა",
+    "menu_action_encrypt_notes": "საქაღალდის ჩანაწერების დაშიფვრა",
+    "menu_action_decrypt_notes": "საქაღალდის ჩანაწერების გაშიფვრა",
+    "menu_action_rekey_notes": "საქაღალდის ჩანაწერების პაროლის შეცვლა",
 
     "dialog_file_rename_title": "ფაილის გადარქმევა",
     "dialog_file_rename_field_label": "შეიყვანეთ ახალი ფაილის სახელი",
@@ -46,6 +50,18 @@ lexemes = {
     "dialog_create_new_dir_error": "ვერ შევქმენით დირექტორია. დარწმუნდით, რომ სამიზნე დირექტორია "
                                    "{base_dir} ჩაწერის შესაძლებლობით არის",
 
+    "dialog_workspace_search_title": "ჩანაწერებში ძებნა",
+    "dialog_workspace_search_input_placeholder_text": "საძიებო სიტყვები",
+    "dialog_workspace_search_results_count": "ნაპოვნი ჩანაწერები: {count}",
+    "dialog_workspace_search_indexing": "ჩანაწერების ინდექსირება...",
+    "dialog_workspace_search_not_available": "აირჩიეთ ჩანაწერების ნაგულისხმევი საქაღალდე მასში საძიებლად",
+    "dialog_batch_crypt_title": "საქაღალდის ჩანაწერები",
+    "dialog_batch_crypt_text": "დასამუშავებელი ჩანაწერები საქაღალდესა და მის ქვესაქაღალდეებში: {count}. გავაგრძელოთ?",
+    "dialog_batch_crypt_no_notes": "საქაღალდეში დასამუშავებელი ჩანაწერები არ არის",
+    "dialog_batch_crypt_progress": "ჩანაწერების დამუშავება...",
+    "dialog_batch_crypt_cancel": "გაუქმება",
+    "dialog_batch_crypt_result": "დამუშავებულია: {processed}, ვერ მოხერხდა: {failed}, გამოტოვებულია: {skipped}",
+
     "dialog_message_box_title": "შეტყობინება",
     "dialog_message_box_button_ok": "დახურვა",
 
@@ -37,6 +37,10 @@ lexemes = {
     "editor_config_label": "რედაქტორის კონფიგურაცია",
     "editor_config_show_line_numbers_checkbox": "ხაზების ნომრების ჩვენება",
     "editor_config_show_line_numbers_checkbox_accessible_description": "ხაზების ნომრების ჩვენება რედაქტორში",
+    "editor_config_enc_chunked_migration_checkbox": "დაშიფრული ჩანაწერების ფრაგმენტულ ფორმატზე გადაყვანა შენახვისას",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "შენახვისას ძველ დაშიფრულ ჩანაწერებს ხელახლა შიფრავს ფრაგმენტულ ფორმატში. "
+        "ასეთ ჩანაწერებს ადრინდელი ვერსიები ვერ გახსნის.",
 
     "viewer_config_label": "დამკვრელის კონფიგურაცია",
     "viewer_config_process_emojis_checkbox": "ტექსტური ემოჯის გრაფიკულად გარდაქმნა",
@@ -49,6 +53,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "გარე სურათების ავტომატური შენახვა დისკზე",
     "viewer_config_save_resources_checkbox_accessible_description":
         "გარე სურათების ასლების ავტომატურად შენახვა დისკზე ოფლაინ წვდომისთვის.",
+    "viewer_config_render_cache_disk_checkbox": "დამუშავებული ჩანაწერების დისკზე შენახვა",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "ინახავს ჩანაწერების დამუშავებულ ხედს დისკზე, რათა უცვლელი ჩანაწერები უფრო სწრაფად გაიხსნას.",
+    "viewer_config_render_cache_clear_button": "დამუშავების ქეშის გასუფთავება",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "ქეშირებული დამუშავებული ჩანაწერების წაშლა მეხსიერებიდან და დისკიდან",
 
     "ai_config_inference_module_label": "ინფერენციის მოდული",
     "ai_config_inference_module_names_combo_label": "აქტიური ინფერენციის მოდული",
@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "Ολοκληρωτική διαγραφή",
     "menu_action_restore": "Επαναφορά",
     "menu_action_create_new_dir": "Δημιουργία νέου καταλόγου",
+    "menu_action_search_notes": "Αναζήτηση στις σημειώσεις",
+    "menu_action_encrypt_notes": "Κρυπτογράφηση σημειώσεων του φακέλου",
+    "menu_action_decrypt_notes": "Αποκρυπτογράφηση σημειώσεων του φακέλου",
+    "menu_action_rekey_notes": "Αλλαγή κωδικού πρόσβασης σημειώσεων του φακέλου",
 
     "dialog_file_rename_title": "Μετονομασία αρχείου",
     "dialog_file_rename_field_label": "Εισάγετε νέο όνομα αρχείου",
@@ -46,6 +50,18 @@ lexemes = {
     "dialog_create_new_dir_error": "Δεν είναι δυνατή η δημιουργία του καταλόγου. Βεβαιωθείτε ότι ο κατάλογος "
                                    "προορισμού {base_dir} είναι εγγράψιμος",
 
+    "dialog_workspace_search_title": "Αναζήτηση στις σημειώσεις",
+    "dialog_workspace_search_input_placeholder_text": "Λέξεις προς αναζήτηση",
+    "dialog_workspace_search_results_count": "Σημειώσεις που βρέθηκαν: {count}",
+    "dialog_workspace_search_indexing": "Ευρετηρίαση σημειώσεων...",
+    "dialog_workspace_search_not_available": "Επιλέξτε τον προεπιλεγμένο φάκελο σημειώσεων για αναζήτηση",
+    "dialog_batch_crypt_title": "Σημειώσεις του φακέλου",
+    "dialog_batch_crypt_text": "Σημειώσεις προς επεξεργασία στον φάκελο και τους υποφακέλους του: {count}. Συνέχεια;",
+    "dialog_batch_crypt_no_notes": "Δεν υπάρχουν σημειώσεις προς επεξεργασία στον φάκελο",
+    "dialog_batch_crypt_progress": "Επεξεργασία σημειώσεων...",
+    "dialog_batch_crypt_cancel": "Ακύρωση",
+    "dialog_batch_crypt_result": "Επεξεργάστηκαν: {processed}, απέτυχαν: {failed}, παραλείφθηκαν: {skipped}",
+
     "dialog_message_box_title": "Μήνυμα",
     "dialog_message_box_button_ok": "Κλείσιμο",
 
@@ -40,6 +40,11 @@ lexemes = {
     "editor_config_label": "Ρυθμίσεις Επεξεργαστή",
     "editor_config_show_line_numbers_checkbox": "Εμφάνιση Αριθμών Γραμμών",
     "editor_config_show_line_numbers_checkbox_accessible_description": "Εμφάνιση αριθμών γραμμών στον επεξεργαστή",
+    "editor_config_enc_chunked_migration_checkbox":
+        "Αναβάθμιση κρυπτογραφημένων σημειώσεων σε τμηματική μορφή κατά την αποθήκευση",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "Κρυπτογραφεί ξανά τις παλαιότερες κρυπτογραφημένες σημειώσεις σε τμηματική μορφή κατά την αποθήκευσή τους. "
+        "Τέτοιες σημειώσεις δεν ανοίγουν σε προηγούμενες εκδόσεις.",
 
     "viewer_config_label": "Ρυθμίσεις Προβολέα",
     "viewer_config_process_emojis_checkbox": "Μετατροπή Εικονιδίων Κειμένου σε Γραφικά",
@@ -53,6 +58,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "Αυτόματη αποθήκευση εξωτερικών εικόνων στον δίσκο",
     "viewer_config_save_resources_checkbox_accessible_description":
         "Αυτόματη αποθήκευση αντιγράφων εξωτερικών εικόνων στον δίσκο για πρόσβαση χωρίς σύνδεση.",
+    "viewer_config_render_cache_disk_checkbox": "Διατήρηση αποδοσμένων σημειώσεων στον δίσκο",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "Αποθηκεύει στον δίσκο την αποδοσμένη προβολή των σημειώσεων για ταχύτερο άνοιγμα των αμετάβλητων σημειώσεων.",
+    "viewer_config_render_cache_clear_button": "Εκκαθάριση προσωρινής μνήμης απόδοσης",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "Αφαίρεση των αποδοσμένων σημειώσεων από τη μνήμη και τον δίσκο",
 
     "ai_config_inference_module_label": "Μονάδα Συμπερασμού",
     "ai_config_inference_module_names_combo_label": "Ενεργή Μονάδα Συμπερασμού",
@@ -10,6 +10,9 @@ lexemes = {
     "statusbar_litter_bin_accessible_name": "Εμφάνιση περιεχομένου κάδου απορριμμάτων",
 
     "statusbar_save_progress_label": b'\xf0\x9f\x92\xbe',  # Unicode for save icon
+    "statusbar_render_progress_label": b'\xe2\x8f\xb3',  # Unicode for hourglass icon
+    "statusbar_load_progress_label": "{icon} {percent}%",
+    "statusbar_key_progress_label": b'\xf0\x9f\x94\x91',
     "statusbar_encryption_symbol_encrypted_label": b'\xf0\x9f\x94\x92',  # Unicode for encrypted icon
     "statusbar_encryption_symbol_unencrypted_label": b'\xf0\x9f\x94\x93',  # Unicode for unencrypted icon
 
@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "Hapus sepenuhnya",
     "menu_action_restore": "Pulihkan",
     "menu_action_create_new_dir": "Buat direktori baru",
+    "menu_action_search_notes": "Cari di catatan",
+    "menu_action_encrypt_notes": "Enkripsi catatan di folder",
+    "menu_action_decrypt_notes": "Dekripsi catatan di folder",
+    "menu_action_rekey_notes": "Ubah kata sandi catatan di folder",
 
     "dialog_file_rename_title": "Ubah nama berkas",
     "dialog_file_rename_field_label": "Masukkan nama berkas baru",
@@ -44,6 +48,18 @@ lexemes = {
     "dialog_create_new_dir_error_existed": "Direktori sudah ada",
     "dialog_create_new_dir_error": "Tidak dapat membuat direktori. Pastikan direktori tujuan {base_dir} dapat ditulis",
 
+    "dialog_workspace_search_title": "Cari di catatan",
+    "dialog_workspace_search_input_placeholder_text": "Kata yang dicari",
+    "dialog_workspace_search_results_count": "Catatan ditemukan: {count}",
+    "dialog_workspace_search_indexing": "Mengindeks catatan...",
+    "dialog_workspace_search_not_available": "Pilih folder default catatan untuk mencari di dalamnya",
+    "dialog_batch_crypt_title": "Catatan di folder",
+    "dialog_batch_crypt_text": "Catatan yang akan diproses di folder dan subfoldernya: {count}. Lanjutkan?",
+    "dialog_batch_crypt_no_notes": "Tidak ada catatan untuk diproses di folder",
+    "dialog_batch_crypt_progress": "Memproses catatan...",
+    "dialog_batch_crypt_cancel": "Batal",
+    "dialog_batch_crypt_result": "Catatan diproses: {processed}, gagal: {failed}, dilewati: {skipped}",
+
     "dialog_message_box_title": "Pesan",
     "dialog_message_box_button_ok": "Tutup",
 
@@ -38,6 +38,10 @@ lexemes = {
     "editor_config_label": "Konfigurasi Editor",
     "editor_config_show_line_numbers_checkbox": "Tampilkan Nomor Baris",
     "editor_config_show_line_numbers_checkbox_accessible_description": "Tampilkan nomor baris di editor",
+    "editor_config_enc_chunked_migration_checkbox": "Tingkatkan catatan terenkripsi ke format potongan saat disimpan",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "Mengenkripsi ulang catatan terenkripsi lama dalam format potongan saat disimpan. "
+        "Catatan tersebut tidak dapat dibuka oleh versi sebelumnya.",
 
     "viewer_config_label": "Konfigurasi Penampil",
     "viewer_config_process_emojis_checkbox": "Konversi Emoji Teks ke Grafis",
@@ -50,6 +54,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "Simpan otomatis gambar eksternal ke disk",
     "viewer_config_save_resources_checkbox_accessible_description":
         "Menyimpan salinan gambar eksternal ke disk secara otomatis untuk akses offline.",
+    "viewer_config_render_cache_disk_checkbox": "Simpan catatan yang dirender di disk",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "Menyimpan tampilan catatan yang dirender di disk agar catatan yang tidak berubah terbuka lebih cepat.",
+    "viewer_config_render_cache_clear_button": "Hapus cache render",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "Hapus catatan yang dirender dari memori dan disk",
 
     "ai_config_inference_module_label": "Modul Inferensi",
     "ai_config_inference_module_names_combo_label": "Modul Inferensi Aktif",
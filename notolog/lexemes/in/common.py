@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "पूरी तरह से हटाएं",
     "menu_action_restore": "पुनर्स्थापित करें",
     "menu_action_create_new_dir": "नई निर्देशिका बनाएँ",
+    "menu_action_search_notes": "नोट्स में खोजें",
+    "menu_action_encrypt_notes": "फ़ोल्डर के नोट्स एन्क्रिप्ट करें",
+    "menu_action_decrypt_notes": "फ़ोल्डर के नोट्स डिक्रिप्ट करें",
+    "menu_action_rekey_notes": "फ़ोल्डर के नोट्स का पासवर्ड बदलें",
 
     "dialog_file_rename_title": "फ़ाइल का नाम बदलें",
     "dialog_file_rename_field_label": "नया फ़ाइल नाम दर्ज करें",
@@ -46,6 +50,18 @@ lexemes = {
     "dialog_create_new_dir_error": "निर्देशिका नहीं बनाई जा सकती। सुनिश्चित करें कि गंतव्य निर्देशिका "
                                    "{base_dir} लिखने योग्य है",
 
+    "dialog_workspace_search_title": "नोट्स में खोजें",
+    "dialog_workspace_search_input_placeholder_text": "खोजने के लिए शब्द",
+    "dialog_workspace_search_results_count": "मिले नोट्स: {count}",
+    "dialog_workspace_search_indexing": "नोट्स अनुक्रमित किए जा रहे हैं...",
+    "dialog_workspace_search_not_available": "खोजने के लिए नोट्स का डिफ़ॉल्ट फ़ोल्डर चुनें",
+    "dialog_batch_crypt_title": "फ़ोल्डर के नोट्स",
+    "dialog_batch_crypt_text": "फ़ोल्डर और उसके उप-फ़ोल्डरों में संसाधित किए जाने वाले नोट्स: {count}. जारी रखें?",
+    "dialog_batch_crypt_no_notes": "फ़ोल्डर में संसाधित करने के लिए कोई नोट्स नहीं हैं",
+    "dialog_batch_crypt_progress": "नोट्स संसाधित किए जा रहे हैं...",
+    "dialog_batch_crypt_cancel": "रद्द करें",
+    "dialog_batch_crypt_result": "संसाधित नोट्स: {processed}, विफल: {failed}, छोड़े गए: {skipped}",
+
     "dialog_message_box_title": "संदेश",
     "dialog_message_box_button_ok": "बंद करें",
 
@@ -37,6 +37,10 @@ lexemes = {
     "editor_config_label": "संपादक कॉन्फ़िगरेशन",
     "editor_config_show_line_numbers_checkbox": "लाइन संख्याएँ दिखाएं",
     "editor_config_show_line_numbers_checkbox_accessible_description": "संपादक में लाइन संख्याएँ दिखाएं",
+    "editor_config_enc_chunked_migration_checkbox": "सहेजते समय एन्क्रिप्टेड नोट्स को खंडित प्रारूप में अपग्रेड करें",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "पुराने एन्क्रिप्टेड नोट्स को सहेजते समय खंडित प्रारूप में फिर से एन्क्रिप्ट करता है। "
+        "ऐसे नोट्स पिछले संस्करणों में नहीं खुल सकते।",
 
     "viewer_config_label": "दर्शक कॉन्फ़िगरेशन",
     "viewer_config_process_emojis_checkbox": "पाठ इमोजी को ग्राफिक में परिवर्तित करें",
@@ -49,6 +53,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "बाहरी छवियों को डिस्क में स्वचालित रूप से सहेजें",
     "viewer_config_save_resources_checkbox_accessible_description":
         "ऑफ़लाइन पहुंच के लिए बाहरी छवियों की स्वचालित प्रतिलिपियाँ डिस्क में सहेजें।",
+    "viewer_config_render_cache_disk_checkbox": "रेंडर किए गए नोट्स डिस्क पर रखें",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "अपरिवर्तित नोट्स को तेज़ी से खोलने के लिए नोट्स के रेंडर किए गए दृश्य को डिस्क पर कैश करता है।",
+    "viewer_config_render_cache_clear_button": "रेंडर कैश साफ़ करें",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "कैश किए गए रेंडर नोट्स को मेमोरी और डिस्क से हटाएं",
 
     "ai_config_inference_module_label": "अनुमान मॉड्यूल",
     "ai_config_inference_module_names_combo_label": "सक्रिय अनुमान मॉड्यूल",
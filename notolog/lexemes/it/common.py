@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "Elimina completamente",
     "menu_action_restore": "Ripristina",
     "menu_action_create_new_dir": "Crea una nuova directory",
+    "menu_action_search_notes": "Cerca nelle note",
+    "menu_action_encrypt_notes": "Cifra le note della cartella",
+    "menu_action_decrypt_notes": "Decifra le note della cartella",
+    "menu_action_rekey_notes": "Cambia la password delle note della cartella",
 
     "dialog_file_rename_title": "Rinomina file",
     "dialog_file_rename_field_label": "Inserisci nuovo nome file",
@@ -46,6 +50,18 @@ lexemes = {
     "dialog_create_new_dir_error": "Impossibile creare la directory. Assicurati che la directory di destinazione "
                                    "{base_dir} sia scrivibile",
 
+    "dialog_workspace_search_title": "Cerca nelle note",
+    "dialog_workspace_search_input_placeholder_text": "Parole da cercare",
+    "dialog_workspace_search_results_count": "Note trovate: {count}",
+    "dialog_workspace_search_indexing": "Indicizzazione delle note...",
+    "dialog_workspace_search_not_available": "Seleziona la cartella predefinita delle note per cercarvi",
+    "dialog_batch_crypt_title": "Note della cartella",
+    "dialog_batch_crypt_text": "Note da elaborare nella cartella e nelle sue sottocartelle: {count}. Continuare?",
+    "dialog_batch_crypt_no_notes": "Nessuna nota da elaborare nella cartella",
+    "dialog_batch_crypt_progress": "Elaborazione delle note...",
+    "dialog_batch_crypt_cancel": "Annulla",
+    "dialog_batch_crypt_result": "Note elaborate: {processed}, non riuscite: {failed}, saltate: {skipped}",
+
     "dialog_message_box_title": "Messaggio",
     "dialog_message_box_button_ok": "Chiudi",
 
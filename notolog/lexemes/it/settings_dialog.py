@@ -39,6 +39,10 @@ lexemes = {
     "editor_config_label": "Configurazione Editor",
     "editor_config_show_line_numbers_checkbox": "Mostra Numeri di Riga",
     "editor_config_show_line_numbers_checkbox_accessible_description": "Visualizza i numeri di riga nell'editor",
+    "editor_config_enc_chunked_migration_checkbox": "Aggiorna le note cifrate al formato a segmenti al salvataggio",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "Cifra nuovamente le note cifrate meno recenti nel formato a segmenti quando vengono salvate. "
+        "Tali note non possono essere aperte dalle versioni precedenti.",
 
     "viewer_config_label": "Configurazione Visualizzatore",
     "viewer_config_process_emojis_checkbox": "Converti Emoji di Testo in Grafica",
@@ -52,6 +56,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "Salva automaticamente le immagini esterne sul disco",
     "viewer_config_save_resources_checkbox_accessible_description":
         "Salva automaticamente copie delle immagini esterne sul disco per l'accesso offline.",
+    "viewer_config_render_cache_disk_checkbox": "Conserva le note renderizzate su disco",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "Memorizza nella cache su disco la vista renderizzata delle note per aprire più velocemente le note non modificate.",
+    "viewer_config_render_cache_clear_button": "Svuota cache di rendering",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "Rimuovi le note renderizzate dalla memoria e dal disco",
 
     "ai_config_inference_module_label": "Modulo di Inferenza",
     "ai_config_inference_module_names_combo_label": "Modulo di Inferenza Attivo",
@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "完全に削除",
     "menu_action_restore": "復元",
     "menu_action_create_new_dir": "新しいディレクトリを作成",
+    "menu_action_search_notes": "ノート内を検索",
+    "menu_action_encrypt_notes": "フォルダー内のノートを暗号化",
+    "menu_action_decrypt_notes": "フォルダー内のノートを復号",
+    "menu_action_rekey_notes": "フォルダー内のノートのパスワードを変更",
 
     "dialog_file_rename_title": "ファイル名の変更",
     "dialog_file_rename_field_label": "新しいファイル名を入力",
@@ -46,6 +50,18 @@ lexemes = {
     "dialog_create_new_dir_error": "ディレクトリを作成できません。ターゲットディレクトリ "
                                    "{base_dir} が書き込み可能であることを確認してください",
 
+    "dialog_workspace_search_title": "ノート内を検索",
+    "dialog_workspace_search_input_placeholder_text": "検索する単語",
+    "dialog_workspace_search_results_count": "見つかったノート: {count}",
+    "dialog_workspace_search_indexing": "ノートをインデックス中...",
+    "dialog_workspace_search_not_available": "検索するノートのデフォルトフォルダーを選択してください",
+    "dialog_batch_crypt_title": "フォルダー内のノート",
+    "dialog_batch_crypt_text": "フォルダーとそのサブフォルダーで処理するノート: {count}。続行しますか？",
+    "dialog_batch_crypt_no_notes": "フォルダーに処理するノートがありません",
+    "dialog_batch_crypt_progress": "ノートを処理しています...",
+    "dialog_batch_crypt_cancel": "キャンセル",
+    "dialog_batch_crypt_result": "処理済み: {processed}、失敗: {failed}、スキップ: {skipped}",
+
     "dialog_message_box_title": "メッセージ",
     "dialog_message_box_button_ok": "閉じる",
 
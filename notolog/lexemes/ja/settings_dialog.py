@@ -37,6 +37,9 @@ lexemes = {
     "editor_config_label": "エディタ設定",
     "editor_config_show_line_numbers_checkbox": "行番号を表示",
     "editor_config_show_line_numbers_checkbox_accessible_description": "エディタ内で行番号を表示する",
+    "editor_config_enc_chunked_migration_checkbox": "保存時に暗号化ノートを分割形式に更新",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "古い暗号化ノートを保存時に分割形式で再暗号化します。このようなノートは以前のバージョンでは開けません。",
 
     "viewer_config_label": "ビューワ設定",
     "viewer_config_process_emojis_checkbox": "テキスト絵文字をグラフィックに変換",
@@ -48,6 +51,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "外部画像をディスクに自動保存",
     "viewer_config_save_resources_checkbox_accessible_description":
         "オフラインアクセスのために外部画像のコピーをディスクに自動保存します。",
+    "viewer_config_render_cache_disk_checkbox": "レンダリング済みのノートをディスクに保持",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "変更のないノートをすばやく開くため、ノートのレンダリング結果をディスクにキャッシュします。",
+    "viewer_config_render_cache_clear_button": "レンダリングキャッシュをクリア",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "キャッシュされたレンダリング済みノートをメモリとディスクから削除します",
 
     "ai_config_inference_module_label": "推論モジュール",
     "ai_config_inference_module_names_combo_label": "アクティブ推論モジュール",
@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "완전히 삭제",
     "menu_action_restore": "복원",
     "menu_action_create_new_dir": "새 디렉터리 만들기",
+    "menu_action_search_notes": "노트에서 검색",
+    "menu_action_encrypt_notes": "폴더의 노트 암호화",
+    "menu_action_decrypt_notes": "폴더의 노트 복호화",
+    "menu_action_rekey_notes": "폴더의 노트 비밀번호 변경",
 
     "dialog_file_rename_title": "파일 이름 바꾸기",
     "dialog_file_rename_field_label": "새 파일 이름 입력",
@@ -46,6 +50,18 @@ lexemes = {
     "dialog_create_new_dir_error": "디렉터리를 만들 수 없습니다. 대상 디렉터리 "
                                    "{base_dir} 이 쓰기 가능한지 확인하십시오",
 
+    "dialog_workspace_search_title": "노트에서 검색",
+    "dialog_workspace_search_input_placeholder_text": "검색할 단어",
+    "dialog_workspace_search_results_count": "찾은 노트: {count}",
+    "dialog_workspace_search_indexing": "노트 색인 중...",
+    "dialog_workspace_search_not_available": "검색할 노트의 기본 폴더를 선택하세요",
+    "dialog_batch_crypt_title": "폴더의 노트",
+    "dialog_batch_crypt_text": "폴더와 하위 폴더에서 처리할 노트: {count}. 계속하시겠습니까?",
+    "dialog_batch_crypt_no_notes": "폴더에 처리할 노트가 없습니다",
+    "dialog_batch_crypt_progress": "노트 처리 중...",
+    "dialog_batch_crypt_cancel": "취소",
+    "dialog_batch_crypt_result": "처리됨: {processed}, 실패: {failed}, 건너뜀: {skipped}",
+
     "dialog_message_box_title": "메시지",
     "dialog_message_box_button_ok": "닫기",
 
@@ -37,6 +37,9 @@ lexemes = {
     "editor_config_label": "편집기 설정",
     "editor_config_show_line_numbers_checkbox": "줄 번호 표시",
     "editor_config_show_line_numbers_checkbox_accessible_description": "편집기에서 줄 번호 표시",
+    "editor_config_enc_chunked_migration_checkbox": "저장 시 암호화된 노트를 분할 형식으로 업그레이드",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "이전 암호화 노트를 저장할 때 분할 형식으로 다시 암호화합니다. 이러한 노트는 이전 버전에서 열 수 없습니다.",
 
     "viewer_config_label": "뷰어 설정",
     "viewer_config_process_emojis_checkbox": "텍스트 이모지를 그래픽으로 변환",
@@ -49,6 +52,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "외부 이미지를 디스크에 자동 저장",
     "viewer_config_save_resources_checkbox_accessible_description":
         "오프라인 액세스를 위해 외부 이미지의 복사본을 디스크에 자동으로 저장합니다.",
+    "viewer_config_render_cache_disk_checkbox": "렌더링된 노트를 디스크에 보관",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "변경되지 않은 노트를 더 빠르게 열 수 있도록 노트의 렌더링 결과를 디스크에 캐시합니다.",
+    "viewer_config_render_cache_clear_button": "렌더링 캐시 지우기",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "캐시된 렌더링 노트를 메모리와 디스크에서 제거합니다",
 
     "ai_config_inference_module_label": "추론 모듈",
     "ai_config_inference_module_names_combo_label": "활성 추론 모듈",
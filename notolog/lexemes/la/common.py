@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "Delere prorsus",
     "menu_action_restore": "Restituere",
     "menu_action_create_new_dir": "Crea novum directory",
+    "menu_action_search_notes": "Quaere in notis",
+    "menu_action_encrypt_notes": "Notas in directorio cifra",
+    "menu_action_decrypt_notes": "Notas in directorio decifra",
+    "menu_action_rekey_notes": "Tesseram notarum in directorio muta",
 
     "dialog_file_rename_title": "Fasciculum renominare",
     "dialog_file_rename_field_label": "Nomen novum fasciculi ingredi",
@@ -46,6 +50,18 @@ lexemes = {
     "dialog_create_new_dir_error": "Fieri non potest directory creare. Fac ut directory destinatum "
                                    "{base_dir} scribibile sit",
 
+    "dialog_workspace_search_title": "Quaere in notis",
+    "dialog_workspace_search_input_placeholder_text": "Verba quaerenda",
+    "dialog_workspace_search_results_count": "Notae inventae: {count}",
+    "dialog_workspace_search_indexing": "Notae indicantur...",
+    "dialog_workspace_search_not_available": "Elige directorium praedefinitum notarum ad quaerendum",
+    "dialog_batch_crypt_title": "Notae in directorio",
+    "dialog_batch_crypt_text": "Notae tractandae in directorio et subdirectoriis eius: {count}. Pergere?",
+    "dialog_batch_crypt_no_notes": "Nullae notae tractandae in directorio",
+    "dialog_batch_crypt_progress": "Notae tractantur...",
+    "dialog_batch_crypt_cancel": "Abrogare",
+    "dialog_batch_crypt_result": "Notae tractatae: {processed}, defectae: {failed}, omissae: {skipped}",
+
     "dialog_message_box_title": "Nuntius",
     "dialog_message_box_button_ok": "Claudere",
 
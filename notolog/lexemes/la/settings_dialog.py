@@ -38,6 +38,10 @@ lexemes = {
     "editor_config_label": "Editoris Configuratio",
     "editor_config_show_line_numbers_checkbox": "Ostende Numeros Linearum",
     "editor_config_show_line_numbers_checkbox_accessible_description": "Ostende numeros linearum in editor",
+    "editor_config_enc_chunked_migration_checkbox": "Notas cryptas in formam partitam servando converte",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "Notas cryptas veteres in forma partita servando iterum cryptat. "
+        "Tales notae a versionibus prioribus aperiri non possunt.",
 
     "viewer_config_label": "Visoris Configuratio",
     "viewer_config_process_emojis_checkbox": "Converte Textum Emojis ad Graphica",
@@ -51,6 +55,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "Serva imagines externas in disco automatice",
     "viewer_config_save_resources_checkbox_accessible_description":
         "Automatice servat exemplaria imaginum externarum in disco ad usum sine nexu.",
+    "viewer_config_render_cache_disk_checkbox": "Notas redditas in disco serva",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "Speciem redditam notarum in disco servat, ut notae immutatae celerius aperiantur.",
+    "viewer_config_render_cache_clear_button": "Memoriam reddendi purga",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "Notas redditas e memoria et disco remove",
 
     "ai_config_inference_module_label": "Modulus Inferentiae",
     "ai_config_inference_module_names_combo_label": "Modulus Inferentiae Activus",
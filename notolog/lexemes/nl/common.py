@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "Volledig verwijderen",
     "menu_action_restore": "Herstellen",
     "menu_action_create_new_dir": "Maak een nieuwe map",
+    "menu_action_search_notes": "Zoeken in notities",
+    "menu_action_encrypt_notes": "Notities in map versleutelen",
+    "menu_action_decrypt_notes": "Notities in map ontsleutelen",
+    "menu_action_rekey_notes": "Wachtwoord van notities in map wijzigen",
 
     "dialog_file_rename_title": "Bestand hernoemen",
     "dialog_file_rename_field_label": "Voer nieuwe bestandsnaam in",
@@ -44,6 +48,18 @@ lexemes = {
     "dialog_create_new_dir_error_existed": "Map bestaat al",
     "dialog_create_new_dir_error": "Kan map niet maken. Zorg ervoor dat de doelmap {base_dir} beschrijfbaar is",
 
+    "dialog_workspace_search_title": "Zoeken in notities",
+    "dialog_workspace_search_input_placeholder_text": "Te zoeken woorden",
+    "dialog_workspace_search_results_count": "Gevonden notities: {count}",
+    "dialog_workspace_search_indexing": "Notities worden geïndexeerd...",
+    "dialog_workspace_search_not_available": "Selecteer de standaardmap voor notities om daarin te zoeken",
+    "dialog_batch_crypt_title": "Notities in map",
+    "dialog_batch_crypt_text": "Te verwerken notities in de map en de submappen: {count}. Doorgaan?",
+    "dialog_batch_crypt_no_notes": "Geen notities om te verwerken in de map",
+    "dialog_batch_crypt_progress": "Notities verwerken...",
+    "dialog_batch_crypt_cancel": "Annuleren",
+    "dialog_batch_crypt_result": "Verwerkte notities: {processed}, mislukt: {failed}, overgeslagen: {skipped}",
+
     "dialog_message_box_title": "Bericht",
     "dialog_message_box_button_ok": "Sluiten",
 
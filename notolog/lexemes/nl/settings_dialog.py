@@ -38,6 +38,11 @@ lexemes = {
     "editor_config_label": "Editor Configuratie",
     "editor_config_show_line_numbers_checkbox": "Toon regelnummers",
     "editor_config_show_line_numbers_checkbox_accessible_description": "Toon regelnummers in de editor",
+    "editor_config_enc_chunked_migration_checkbox":
+        "Versleutelde notities bij opslaan omzetten naar het gesegmenteerde formaat",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "Versleutelt oudere versleutelde notities opnieuw in het gesegmenteerde formaat wanneer ze worden opgeslagen. "
+        "Zulke notities kunnen niet door eerdere versies worden geopend.",
 
     "viewer_config_label": "Viewer Configuratie",
     "viewer_config_process_emojis_checkbox": "Zet tekstemoji's om naar grafische afbeeldingen",
@@ -50,6 +55,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "Auto-save externe afbeeldingen naar schijf",
     "viewer_config_save_resources_checkbox_accessible_description":
         "Sla automatisch kopieën van externe afbeeldingen op schijf op voor offline toegang.",
+    "viewer_config_render_cache_disk_checkbox": "Gerenderde notities op schijf bewaren",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "Slaat de gerenderde weergave van notities op schijf op om ongewijzigde notities sneller te openen.",
+    "viewer_config_render_cache_clear_button": "Rendercache wissen",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "Gecachte gerenderde notities uit geheugen en van schijf verwijderen",
 
     "ai_config_inference_module_label": "Inferentiemodule",
     "ai_config_inference_module_names_combo_label": "Actieve Inferentiemodule",
@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "Excluir completamente",
     "menu_action_restore": "Restaurar",
     "menu_action_create_new_dir": "Criar um novo diretório",
+    "menu_action_search_notes": "Pesquisar nas notas",
+    "menu_action_encrypt_notes": "Criptografar as notas da pasta",
+    "menu_action_decrypt_notes": "Descriptografar as notas da pasta",
+    "menu_action_rekey_notes": "Alterar a senha das notas da pasta",
 
     "dialog_file_rename_title": "Renomear arquivo",
     "dialog_file_rename_field_label": "Digite o novo nome do arquivo",
@@ -46,6 +50,18 @@ lexemes = {
     "dialog_create_new_dir_error": "Não é possível criar o diretório. Certifique-se de que o diretório de destino "
                                    "{base_dir} seja gravável",
 
+    "dialog_workspace_search_title": "Pesquisar nas notas",
+    "dialog_workspace_search_input_placeholder_text": "Palavras a pesquisar",
+    "dialog_workspace_search_results_count": "Notas encontradas: {count}",
+    "dialog_workspace_search_indexing": "Indexando notas...",
+    "dialog_workspace_search_not_available": "Selecione a pasta padrão de notas para pesquisar nela",
+    "dialog_batch_crypt_title": "Notas da pasta",
+    "dialog_batch_crypt_text": "Notas a processar na pasta e nas suas subpastas: {count}. Continuar?",
+    "dialog_batch_crypt_no_notes": "Nenhuma nota para processar na pasta",
+    "dialog_batch_crypt_progress": "Processando as notas...",
+    "dialog_batch_crypt_cancel": "Cancelar",
+    "dialog_batch_crypt_result": "Notas processadas: {processed}, com falha: {failed}, ignoradas: {skipped}",
+
     "dialog_message_box_title": "Mensagem",
     "dialog_message_box_button_ok": "Fechar",
 
@@ -38,6 +38,10 @@ lexemes = {
     "editor_config_label": "Configuração do Editor",
     "editor_config_show_line_numbers_checkbox": "Mostrar Números de Linha",
     "editor_config_show_line_numbers_checkbox_accessible_description": "Exibir números de linha no editor",
+    "editor_config_enc_chunked_migration_checkbox": "Atualizar notas criptografadas para o formato em blocos ao salvar",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "Criptografa novamente as notas criptografadas antigas no formato em blocos ao salvá-las. "
+        "Essas notas não podem ser abertas por versões anteriores.",
 
     "viewer_config_label": "Configuração do Visualizador",
     "viewer_config_process_emojis_checkbox": "Converter Emojis de Texto em Gráficos",
@@ -51,6 +55,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "Salvar automaticamente imagens externas no disco",
     "viewer_config_save_resources_checkbox_accessible_description":
         "Salva automaticamente cópias de imagens externas no disco para acesso offline.",
+    "viewer_config_render_cache_disk_checkbox": "Manter notas renderizadas no disco",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "Armazena em cache no disco a visualização renderizada das notas para abrir mais rápido as notas inalteradas.",
+    "viewer_config_render_cache_clear_button": "Limpar cache de renderização",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "Remover as notas renderizadas em cache da memória e do disco",
 
     "ai_config_inference_module_label": "Módulo de Inferência",
     "ai_config_inference_module_names_combo_label": "Módulo de Inferência Ativo",
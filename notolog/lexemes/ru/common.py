@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "Удалить полностью",
     "menu_action_restore": "Восстановить",
     "menu_action_create_new_dir": "Создать новую директорию",
+    "menu_action_search_notes": "Искать в заметках",
+    "menu_action_encrypt_notes": "Зашифровать заметки в папке",
+    "menu_action_decrypt_notes": "Расшифровать заметки в папке",
+    "menu_action_rekey_notes": "Сменить пароль заметок в папке",
 
     "dialog_file_rename_title": "Переименовать файл",
     "dialog_file_rename_field_label": "Введите новое имя файла",
@@ -46,6 +50,18 @@ lexemes = {
     "dialog_create_new_dir_error": "Не удается создать директорию. Убедитесь, что директория назначения "
                                    "{base_dir} доступна для записи",
 
+    "dialog_workspace_search_title": "Поиск в заметках",
+    "dialog_workspace_search_input_placeholder_text": "Слова для поиска",
+    "dialog_workspace_search_results_count": "Найдено заметок: {count}",
+    "dialog_workspace_search_indexing": "Индексация заметок...",
+    "dialog_workspace_search_not_available": "Выберите папку для заметок по умолчанию, чтобы искать в ней",
+    "dialog_batch_crypt_title": "Заметки в папке",
+    "dialog_batch_crypt_text": "Заметок для обработки в папке и её подпапках: {count}. Продолжить?",
+    "dialog_batch_crypt_no_notes": "В папке нет заметок для обработки",
+    "dialog_batch_crypt_progress": "Обработка заметок...",
+    "dialog_batch_crypt_cancel": "Отмена",
+    "dialog_batch_crypt_result": "Обработано заметок: {processed}, с ошибкой: {failed}, пропущено: {skipped}",
+
     "dialog_message_box_title": "Сообщение",
     "dialog_message_box_button_ok": "Закрыть",
 
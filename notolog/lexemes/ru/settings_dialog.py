@@ -38,6 +38,10 @@ lexemes = {
     "editor_config_label": "Настройки редактора",
     "editor_config_show_line_numbers_checkbox": "Показать номера строк",
     "editor_config_show_line_numbers_checkbox_accessible_description": "Отображать номера строк в редакторе",
+    "editor_config_enc_chunked_migration_checkbox": "Переводить зашифрованные заметки в блочный формат при сохранении",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "Повторно шифрует старые зашифрованные заметки в блочном формате при сохранении. "
+        "Такие заметки не открываются в предыдущих версиях.",
 
     "viewer_config_label": "Настройки просмотрщика",
     "viewer_config_process_emojis_checkbox": "Преобразовать текстовые эмодзи в графику",
@@ -51,6 +55,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "Автосохранение внешних изображений на диск",
     "viewer_config_save_resources_checkbox_accessible_description":
         "Автоматически сохраняет копии внешних изображений на диск для доступа без подключения к интернету.",
+    "viewer_config_render_cache_disk_checkbox": "Хранить отрисованные заметки на диске",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "Кэширует отрисованный вид заметок на диске, чтобы неизменённые заметки открывались быстрее.",
+    "viewer_config_render_cache_clear_button": "Очистить кэш отрисовки",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "Удалить кэшированные отрисованные заметки из памяти и с диска",
 
     "ai_config_inference_module_label": "Модуль вывода",
     "ai_config_inference_module_names_combo_label": "Активный модуль вывода",
@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "Radera helt",
     "menu_action_restore": "Återställ",
     "menu_action_create_new_dir": "Skapa en ny katalog",
+    "menu_action_search_notes": "Sök i anteckningar",
+    "menu_action_encrypt_notes": "Kryptera anteckningar i mappen",
+    "menu_action_decrypt_notes": "Dekryptera anteckningar i mappen",
+    "menu_action_rekey_notes": "Byt lösenord för anteckningar i mappen",
 
     "dialog_file_rename_title": "Byt namn på fil",
     "dialog_file_rename_field_label": "Ange nytt filnamn",
@@ -44,6 +48,18 @@ lexemes = {
     "dialog_create_new_dir_error_existed": "Katalogen finns redan",
     "dialog_create_new_dir_error": "Det går inte att skapa katalogen. Se till att målkatalogen {base_dir} är skrivbar",
 
+    "dialog_workspace_search_title": "Sök i anteckningar",
+    "dialog_workspace_search_input_placeholder_text": "Ord att söka efter",
+    "dialog_workspace_search_results_count": "Hittade anteckningar: {count}",
+    "dialog_workspace_search_indexing": "Indexerar anteckningar...",
+    "dialog_workspace_search_not_available": "Välj standardmappen för anteckningar för att söka i den",
+    "dialog_batch_crypt_title": "Anteckningar i mappen",
+    "dialog_batch_crypt_text": "Anteckningar att bearbeta i mappen och dess undermappar: {count}. Fortsätta?",
+    "dialog_batch_crypt_no_notes": "Inga anteckningar att bearbeta i mappen",
+    "dialog_batch_crypt_progress": "Bearbetar anteckningar...",
+    "dialog_batch_crypt_cancel": "Avbryt",
+    "dialog_batch_crypt_result": "Bearbetade anteckningar: {processed}, misslyckade: {failed}, överhoppade: {skipped}",
+
     "dialog_message_box_title": "Meddelande",
     "dialog_message_box_button_ok": "Stäng",
 
@@ -37,6 +37,10 @@ lexemes = {
     "editor_config_label": "Redigerarkonfiguration",
     "editor_config_show_line_numbers_checkbox": "Visa radnummer",
     "editor_config_show_line_numbers_checkbox_accessible_description": "Visa radnummer i redigeraren",
+    "editor_config_enc_chunked_migration_checkbox": "Uppgradera krypterade anteckningar till segmenterat format vid sparning",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "Krypterar om äldre krypterade anteckningar i segmenterat format när de sparas. "
+        "Sådana anteckningar kan inte öppnas av tidigare versioner.",
 
     "viewer_config_label": "Visarkonfiguration",
     "viewer_config_process_emojis_checkbox": "Konvertera textemojis till grafik",
@@ -49,6 +53,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "Spara automatiskt externa bilder på disk",
     "viewer_config_save_resources_checkbox_accessible_description":
         "Sparar automatiskt kopior av externa bilder på disken för offline-åtkomst",
+    "viewer_config_render_cache_disk_checkbox": "Behåll renderade anteckningar på disk",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "Cachar den renderade vyn av anteckningar på disken för att öppna oförändrade anteckningar snabbare.",
+    "viewer_config_render_cache_clear_button": "Rensa renderingscache",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "Ta bort cachade renderade anteckningar från minnet och disken",
 
     "ai_config_inference_module_label": "Inferensmodul",
     "ai_config_inference_module_names_combo_label": "Aktiv inferensmodul",
@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "Tamamen Sil",
     "menu_action_restore": "Geri Yükle",
     "menu_action_create_new_dir": "Yeni dizin oluştur",
+    "menu_action_search_notes": "Notlarda ara",
+    "menu_action_encrypt_notes": "Klasördeki notları şifrele",
+    "menu_action_decrypt_notes": "Klasördeki notların şifresini çöz",
+    "menu_action_rekey_notes": "Klasördeki notların parolasını değiştir",
 
     "dialog_file_rename_title": "Dosyayı Yeniden Adlandır",
     "dialog_file_rename_field_label": "Yeni dosya adını girin",
@@ -44,6 +48,18 @@ lexemes = {
     "dialog_create_new_dir_error_existed": "Dizin zaten var",
     "dialog_create_new_dir_error": "Dizin oluşturulamıyor. Hedef dizinin {base_dir} yazılabilir olduğundan emin olun",
 
+    "dialog_workspace_search_title": "Notlarda ara",
+    "dialog_workspace_search_input_placeholder_text": "Aranacak kelimeler",
+    "dialog_workspace_search_results_count": "Bulunan notlar: {count}",
+    "dialog_workspace_search_indexing": "Notlar dizinleniyor...",
+    "dialog_workspace_search_not_available": "Aramak için notların varsayılan klasörünü seçin",
+    "dialog_batch_crypt_title": "Klasördeki notlar",
+    "dialog_batch_crypt_text": "Klasörde ve alt klasörlerinde işlenecek notlar: {count}. Devam edilsin mi?",
+    "dialog_batch_crypt_no_notes": "Klasörde işlenecek not yok",
+    "dialog_batch_crypt_progress": "Notlar işleniyor...",
+    "dialog_batch_crypt_cancel": "İptal",
+    "dialog_batch_crypt_result": "İşlenen notlar: {processed}, başarısız: {failed}, atlanan: {skipped}",
+
     "dialog_message_box_title": "Mesaj",
     "dialog_message_box_button_ok": "Kapat",
 
@@ -38,6 +38,9 @@ lexemes = {
     "editor_config_label": "Editör Yapılandırması",
     "editor_config_show_line_numbers_checkbox": "Satır Numaralarını Göster",
     "editor_config_show_line_numbers_checkbox_accessible_description": "Editörde satır numaralarını göster",
+    "editor_config_enc_chunked_migration_checkbox": "Şifreli notları kaydederken parçalı biçime yükselt",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "Eski şifreli notları kaydedilirken parçalı biçimde yeniden şifreler. Bu notlar önceki sürümlerde açılamaz.",
 
     "viewer_config_label": "Görüntüleyici Yapılandırması",
     "viewer_config_process_emojis_checkbox": "Metin Emojilerini Grafiklere Dönüştür",
@@ -49,6 +52,12 @@ lexemes = {
     "viewer_config_save_resources_checkbox": "Dış Resimleri Diskte Otomatik Kaydet",
     "viewer_config_save_resources_checkbox_accessible_description":
         "Dış resimlerin kopyalarını çevrimdışı erişim için diske otomatik olarak kaydet",
+    "viewer_config_render_cache_disk_checkbox": "İşlenmiş notları diskte tut",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "Değişmemiş notları daha hızlı açmak için notların işlenmiş görünümünü diskte önbelleğe alır.",
+    "viewer_config_render_cache_clear_button": "İşleme önbelleğini temizle",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "Önbelleğe alınmış işlenmiş notları bellekten ve diskten kaldır",
 
     "ai_config_inference_module_label": "Çıkarım Modülü",
     "ai_config_inference_module_names_combo_label": "Aktif Çıkarım Modülü",
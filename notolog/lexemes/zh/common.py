@@ -14,6 +14,10 @@ lexemes = {
     "menu_action_delete_completely": "彻底删除",
     "menu_action_restore": "恢复",
     "menu_action_create_new_dir": "创建新目录",
+    "menu_action_search_notes": "在笔记中搜索",
+    "menu_action_encrypt_notes": "加密文件夹中的笔记",
+    "menu_action_decrypt_notes": "解密文件夹中的笔记",
+    "menu_action_rekey_notes": "更改文件夹中笔记的密码",
 
     "dialog_file_rename_title": "重命名文件",
     "dialog_file_rename_field_label": "输入新的文件名",
@@ -44,6 +48,18 @@ lexemes = {
     "dialog_create_new_dir_error_existed": "目录已存在",
     "dialog_create_new_dir_error": "无法创建目录。请确保目标目录 {base_dir} 可写",
 
+    "dialog_workspace_search_title": "在笔记中搜索",
+    "dialog_workspace_search_input_placeholder_text": "要搜索的词语",
+    "dialog_workspace_search_results_count": "找到的笔记：{count}",
+    "dialog_workspace_search_indexing": "正在索引笔记...",
+    "dialog_workspace_search_not_available": "请选择笔记的默认文件夹以在其中搜索",
+    "dialog_batch_crypt_title": "文件夹中的笔记",
+    "dialog_batch_crypt_text": "文件夹及其子文件夹中要处理的笔记：{count}。是否继续？",
+    "dialog_batch_crypt_no_notes": "文件夹中没有要处理的笔记",
+    "dialog_batch_crypt_progress": "正在处理笔记...",
+    "dialog_batch_crypt_cancel": "取消",
+    "dialog_batch_crypt_result": "已处理：{processed}，失败：{failed}，已跳过：{skipped}",
+
     "dialog_message_box_title": "消息",
     "dialog_message_box_button_ok": "关闭",
 
@@ -37,6 +37,9 @@ lexemes = {
     "editor_config_label": "编辑器配置",
     "editor_config_show_line_numbers_checkbox": "显示行号",
     "editor_config_show_line_numbers_checkbox_accessible_description": "在编辑器中显示行号",
+    "editor_config_enc_chunked_migration_checkbox": "保存时将加密笔记升级为分块格式",
+    "editor_config_enc_chunked_migration_checkbox_accessible_description":
+        "保存时以分块格式重新加密旧的加密笔记。此类笔记无法在早期版本中打开。",
 
     "viewer_config_label": "查看器配置",
     "viewer_config_process_emojis_checkbox": "将文本表情转换为图形",
@@ -48,6 +51,12 @@ lexemes = {
         "打开链接前询问确认",
     "viewer_config_save_resources_checkbox": "自动保存外部图片到硬盘",
     "viewer_config_save_resources_checkbox_accessible_description": "自动将外部图片的副本保存到硬盘以供离线访问。",
+    "viewer_config_render_cache_disk_checkbox": "在硬盘上保留渲染的笔记",
+    "viewer_config_render_cache_disk_checkbox_accessible_description":
+        "将笔记的渲染视图缓存到硬盘，以便更快地打开未更改的笔记。",
+    "viewer_config_render_cache_clear_button": "清除渲染缓存",
+    "viewer_config_render_cache_clear_button_accessible_description":
+        "从内存和硬盘中删除缓存的渲染笔记",
 
     "ai_config_inference_module_label": "推理模块",
     "ai_config_inference_module_names_combo_label": "活跃推理模块",
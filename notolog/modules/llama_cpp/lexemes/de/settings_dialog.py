@@ -16,6 +16,11 @@ lexemes = {
         "Legt die Anzahl der Tokens fest, die das Modell für die Erzeugung von Antworten berücksichtigt.\n"
         "Steuert, wie viel vorheriger Kontext verwendet wird.",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "Prompt-Cache auf der Festplatte speichern",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "Speichert den ausgewerteten Zustand der vorherigen Gesprächsrunden auf der Festplatte statt im RAM,\n"
+        "sodass nur der neue Teil der Aufforderung ausgewertet wird. Wirkt beim nächsten Laden des Modells.",
+
     "module_llama_cpp_config_chat_formats_label": "Chat-Formate",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "Chat-Format auswählen",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
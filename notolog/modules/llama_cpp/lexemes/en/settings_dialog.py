@@ -15,6 +15,11 @@ lexemes = {
         "Sets the number of tokens the model considers for generating responses. "
         "Controls how much prior context is used.",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "Keep the prompt cache on disk",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "Stores the evaluated state of the previous conversation turns on disk instead of in RAM,\n"
+        "so only the new part of the prompt is evaluated. Takes effect the next time the model is loaded.",
+
     "module_llama_cpp_config_chat_formats_label": "Chat Formats",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "Select a chat format",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
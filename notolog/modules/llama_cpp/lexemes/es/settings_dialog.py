@@ -15,6 +15,11 @@ lexemes = {
         "Establece el número de tokens que el modelo considera para generar respuestas.\n"
         "Controla cuánto contexto previo se utiliza.",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "Guardar la caché de prompts en el disco",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "Almacena el estado evaluado de los turnos anteriores de la conversación en el disco en lugar de la RAM,\n"
+        "de modo que solo se evalúa la parte nueva del prompt. Se aplica la próxima vez que se cargue el modelo.",
+
     "module_llama_cpp_config_chat_formats_label": "Formatos de chat",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "Seleccione un formato de chat",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
@@ -15,6 +15,11 @@ lexemes = {
         "Asettaa tokenien määrän, jota malli harkitsee vastauksia tuottaessaan.\n"
         "Hallitsee kuinka paljon aiempaa kontekstia käytetään.",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "Säilytä kehotevälimuisti levyllä",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "Tallentaa keskustelun aiempien vuorojen arvioidun tilan levylle RAM-muistin sijaan,\n"
+        "joten vain kehotteen uusi osa arvioidaan. Tulee voimaan, kun malli ladataan seuraavan kerran.",
+
     "module_llama_cpp_config_chat_formats_label": "Keskustelumuodot",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "Valitse keskustelumuoto",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
@@ -16,6 +16,11 @@ lexemes = {
         "Définit le nombre de jetons que le modèle considère pour générer des réponses.\n"
         "Contrôle la quantité de contexte préalable utilisée.",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "Conserver le cache des invites sur le disque",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "Stocke l'état évalué des tours précédents de la conversation sur le disque au lieu de la RAM,\n"
+        "afin que seule la nouvelle partie de l'invite soit évaluée. Prend effet au prochain chargement du modèle.",
+
     "module_llama_cpp_config_chat_formats_label": "Formats de chat",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "Sélectionnez un format de chat",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
@@ -15,6 +15,11 @@ lexemes = {
         "აყენებს ტოკენების რაოდენობას, რომელსაც მოდელი გამოიყენებს პასუხების გენერირებისთვის. კონტროლირებს წინა კონტექსტის\n"
         "გამოყენების რაოდენობას.",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "პრომპტის ქეშის დისკზე შენახვა",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "ინახავს საუბრის წინა რაუნდების შეფასებულ მდგომარეობას დისკზე RAM-ის ნაცვლად,\n"
+        "ასე რომ, ფასდება მხოლოდ პრომპტის ახალი ნაწილი. ძალაში შედის მოდელის შემდეგი ჩატვირთვისას.",
+
     "module_llama_cpp_config_chat_formats_label": "ჩეთის ფორმატები",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "აირჩიეთ ჩეთის ფორმატი",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
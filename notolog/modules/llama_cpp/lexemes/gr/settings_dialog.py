@@ -16,6 +16,11 @@ lexemes = {
         "Καθορίζει τον αριθμό των tokens που λαμβάνει υπόψη το μοντέλο για τη δημιουργία απαντήσεων.\n"
         "Ελέγχει πόσο προηγούμενο πλαίσιο χρησιμοποιείται.",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "Διατήρηση της κρυφής μνήμης προτροπών στον δίσκο",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "Αποθηκεύει την αξιολογημένη κατάσταση των προηγούμενων γύρων της συνομιλίας στον δίσκο αντί για τη RAM,\n"
+        "ώστε να αξιολογείται μόνο το νέο μέρος της προτροπής. Ισχύει την επόμενη φορά που θα φορτωθεί το μοντέλο.",
+
     "module_llama_cpp_config_chat_formats_label": "Μορφές Συνομιλίας",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "Επιλέξτε μια μορφή συνομιλίας",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
@@ -15,6 +15,11 @@ lexemes = {
         "Mengatur jumlah token yang dipertimbangkan model untuk menghasilkan respons. "
         "Mengontrol seberapa banyak konteks sebelumnya yang digunakan.",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "Simpan cache prompt di disk",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "Menyimpan status yang telah dievaluasi dari giliran percakapan sebelumnya di disk alih-alih di RAM,\n"
+        "sehingga hanya bagian baru dari prompt yang dievaluasi. Berlaku saat model dimuat berikutnya.",
+
     "module_llama_cpp_config_chat_formats_label": "Format Obrolan",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "Pilih format obrolan",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
@@ -17,6 +17,11 @@ lexemes = {
         "वह संख्या निर्धारित करता है जिसे मॉडल प्रतिक्रियाएं उत्पन्न करने के लिए विचार में रखता है। यह\n"
         "नियंत्रित करता है कि कितना पूर्व संदर्भ प्रयुक्त होता है।",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "प्रॉम्प्ट कैश को डिस्क पर रखें",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "वार्तालाप के पिछले चरणों की मूल्यांकित स्थिति को RAM के बजाय डिस्क पर संग्रहीत करता है,\n"
+        "ताकि केवल प्रॉम्प्ट के नए भाग का मूल्यांकन हो। मॉडल के अगली बार लोड होने पर प्रभावी होता है।",
+
     "module_llama_cpp_config_chat_formats_label": "चैट प्रारूप",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "एक चैट प्रारूप का चयन करें",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
@@ -16,6 +16,11 @@ lexemes = {
         "Imposta il numero di token che il modello considera per generare risposte.\n"
         "Controlla quanta contestazione precedente viene utilizzata.",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "Mantieni la cache dei prompt su disco",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "Memorizza lo stato valutato dei turni precedenti della conversazione su disco anziché in RAM,\n"
+        "così viene valutata solo la nuova parte del prompt. Ha effetto al prossimo caricamento del modello.",
+
     "module_llama_cpp_config_chat_formats_label": "Formati di chat",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "Seleziona un formato di chat",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
@@ -14,6 +14,11 @@ lexemes = {
     "module_llama_cpp_config_context_window_input_accessible_description":
         "モデルがレスポンスを生成するために考慮するトークンの数を設定します。どれだけの前のコンテキストが使用されるかを制御します。",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "プロンプトキャッシュをディスクに保存",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "会話の前のターンの評価済み状態をRAMではなくディスクに保存し、\n"
+        "プロンプトの新しい部分のみが評価されるようにします。次回モデルを読み込むときに有効になります。",
+
     "module_llama_cpp_config_chat_formats_label": "チャット形式",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "チャット形式を選択してください",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
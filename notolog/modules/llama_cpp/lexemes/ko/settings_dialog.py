@@ -14,6 +14,11 @@ lexemes = {
     "module_llama_cpp_config_context_window_input_accessible_description":
         "모델이 응답을 생성하는 데 고려하는 토큰 수를 설정합니다. 얼마나 많은 이전 콘텍스트가 사용되는지를 제어합니다.",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "프롬프트 캐시를 디스크에 보관",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "이전 대화 턴의 평가된 상태를 RAM 대신 디스크에 저장하여\n"
+        "프롬프트의 새로운 부분만 평가되도록 합니다. 다음에 모델을 로드할 때 적용됩니다.",
+
     "module_llama_cpp_config_chat_formats_label": "채팅 형식",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "채팅 형식 선택",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
@@ -14,6 +14,11 @@ lexemes = {
     "module_llama_cpp_config_context_window_input_accessible_description":
         "Statuit numerum signorum quae model considerat ad responsa generanda. Moderatur quantum contextus prioris utitur.",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "Thesaurum promptorum in disco serva",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "Statum aestimatum priorum vicium colloquii in disco pro RAM servat,\n"
+        "ut sola nova pars prompti aestimetur. Valet cum exemplar proxime oneratur.",
+
     "module_llama_cpp_config_chat_formats_label": "Formae Colloquii",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "Elige formam colloquii",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
@@ -16,6 +16,11 @@ lexemes = {
         "Stelt het aantal tokens in dat het model overweegt bij het genereren van reacties.\n"
         "Beheert hoeveel voorgaande context wordt gebruikt.",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "Promptcache op schijf bewaren",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "Slaat de geëvalueerde toestand van de vorige gespreksbeurten op schijf op in plaats van in het RAM,\n"
+        "zodat alleen het nieuwe deel van de prompt wordt geëvalueerd. Wordt van kracht bij het volgende laden van het model.",
+
     "module_llama_cpp_config_chat_formats_label": "Chatformaten",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "Selecteer een chatformaat",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
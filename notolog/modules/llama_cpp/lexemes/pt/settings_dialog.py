@@ -14,6 +14,11 @@ lexemes = {
     "module_llama_cpp_config_context_window_input_accessible_description":
         "Define o número de tokens que o modelo considera para gerar respostas. Controla quanto do contexto anterior é usado.",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "Manter o cache de prompts no disco",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "Armazena o estado avaliado dos turnos anteriores da conversa no disco em vez da RAM,\n"
+        "para que apenas a parte nova do prompt seja avaliada. Entra em vigor na próxima vez que o modelo for carregado.",
+
     "module_llama_cpp_config_chat_formats_label": "Formatos de Chat",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "Selecione um formato de chat",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
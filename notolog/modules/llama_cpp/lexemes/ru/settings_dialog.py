@@ -16,6 +16,11 @@ lexemes = {
         "Устанавливает количество токенов, которые модель учитывает при генерации ответов.\n"
         "Контролирует, сколько предыдущего контекста используется.",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "Хранить кэш промптов на диске",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "Сохраняет вычисленное состояние предыдущих реплик диалога на диске вместо оперативной памяти,\n"
+        "чтобы вычислялась только новая часть промпта. Вступает в силу при следующей загрузке модели.",
+
     "module_llama_cpp_config_chat_formats_label": "Форматы чата",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "Выберите формат чата",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
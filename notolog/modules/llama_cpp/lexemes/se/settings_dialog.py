@@ -16,6 +16,11 @@ lexemes = {
         "Anger antalet tokens som modellen överväger för att generera svar.\n"
         "Kontrollerar hur mycket tidigare kontext som används.",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "Behåll promptcachen på disken",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "Lagrar det utvärderade tillståndet för samtalets tidigare turer på disken i stället för i RAM,\n"
+        "så att endast den nya delen av prompten utvärderas. Träder i kraft nästa gång modellen laddas.",
+
     "module_llama_cpp_config_chat_formats_label": "Chatformat",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "Välj ett chattformat",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
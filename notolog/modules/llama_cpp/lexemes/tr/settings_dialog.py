@@ -15,6 +15,11 @@ lexemes = {
         "Modelin yanıtları üretmek için dikkate aldığı token sayısını belirler.\n"
         "Ne kadar önceki bağlamın kullanıldığını kontrol eder.",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "İstem önbelleğini diskte tut",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "Konuşmanın önceki turlarının değerlendirilmiş durumunu RAM yerine diskte saklar,\n"
+        "böylece istemin yalnızca yeni kısmı değerlendirilir. Model bir sonraki yüklendiğinde geçerli olur.",
+
     "module_llama_cpp_config_chat_formats_label": "Sohbet Formatları",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "Bir sohbet formatı seçin",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
@@ -14,6 +14,11 @@ lexemes = {
     "module_llama_cpp_config_context_window_input_accessible_description":
         "设置模型生成响应时考虑的令牌数量。控制使用多少先前上下文。",
 
+    "module_llama_cpp_config_prompt_cache_disk_checkbox": "将提示缓存保存在磁盘上",
+    "module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description":
+        "将之前对话轮次的已评估状态存储在磁盘上而不是内存中，\n"
+        "因此只评估提示的新部分。在下次加载模型时生效。",
+
     "module_llama_cpp_config_chat_formats_label": "聊天格式",
     "module_llama_cpp_config_chat_formats_combo_placeholder_text": "选择聊天格式",
     "module_llama_cpp_config_chat_formats_combo_accessible_description":
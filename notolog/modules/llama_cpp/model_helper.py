@@ -5,6 +5,8 @@ An open-source Markdown editor built with Python.
 File Details:
 - Purpose: Part of the 'Module llama.cpp' module.
 - Functionality: Provides helper functions to initialize and manage llama.cpp models for supported LLMs.
+  The tokens are generated on a worker thread and passed over to the event loop through a bounded queue.
+  The evaluated state of the previous turn's prompt is cached, so only the new suffix of the prompt is evaluated.
 
 Repository: https://github.com/notolog/notolog-editor
 Website: https://notolog.app
@@ -19,16 +21,22 @@ For detailed instructions and project information, please see the repository's R
 
 import os
 import sys
+import hashlib
 
 import logging
 import asyncio
+import threading
 import multiprocessing
+import concurrent.futures
 
 from threading import Lock, Event
 
-from typing import Union, Iterator, Optional
+from typing import Union, Iterator, Optional, Any, AsyncIterator, Dict, List
 
 from llama_cpp import Llama, CreateChatCompletionResponse, CreateChatCompletionStreamResponse
+from llama_cpp import LlamaRAMCache, LlamaDiskCache
+
+from ...app_config import AppConfig
 
 
 class ModelHelper:
@@ -45,6 +53,13 @@ class ModelHelper:
 
     search_options = {}
 
+    # Chunks generated ahead of the event loop taking them, the generation waits once the queue is full
+    QUEUE_SIZE = 64
+
+    # Capacity of the prompt cache, the state of a prompt includes the KV cache of its tokens
+    PROMPT_CACHE_RAM_CAPACITY = 2 << 30  # 2 GiB
+    PROMPT_CACHE_DISK_CAPACITY = 10 << 30  # 10 GiB
+
     @staticmethod
     def is_macos() -> bool:
         """Check if running on macOS."""
@@ -75,7 +90,7 @@ class ModelHelper:
             cls._instance = super().__new__(cls, *args, **kwargs)
 
     def __init__(self, model_path: str, n_ctx: int = None, chat_format: str = None,
-                 n_gpu_layers: int = None, search_options: dict = None):
+                 n_gpu_layers: int = None, search_options: dict = None, prompt_cache_disk: bool = False):
         # Prevent reinitialization if the instance is already configured
         if hasattr(self, 'logger'):
             return
@@ -108,6 +123,20 @@ class ModelHelper:
             # None = auto-detect based on platform, 0 = CPU only, -1 = all layers on GPU
             self.n_gpu_layers_setting = n_gpu_layers
 
+            # Prompt states cache, spilled to the disk rather than kept in RAM if set
+            self.prompt_cache_disk = prompt_cache_disk
+            self.prompt_cache: Optional[Union[LlamaRAMCache, LlamaDiskCache]] = None
+            # Stable prefix of the prompts the cached states were evaluated for, see get_stable_prefix()
+            self.cached_prefix: List[dict] = []
+
+            # Worker threads of the generations running by their stop events
+            self.generations: Dict[Event, threading.Thread] = {}
+            # The model decodes a single generation at a time, the one stopped is done before the next one starts
+            self.generation_lock = threading.Lock()
+            # Output stream of the generator taken by generate_output() one output at a time
+            self.output_stream: Optional[AsyncIterator[str]] = None
+            self.output_source: Any = None
+
             # Validate and set search options
             if search_options:
                 supported_search_options = [
@@ -175,6 +204,8 @@ class ModelHelper:
                 f"Model initialized: n_ctx={self.n_ctx}, "
                 f"n_threads={n_threads}, n_gpu_layers={n_gpu_layers}"
             )
+
+            self.init_prompt_cache()
         except asyncio.CancelledError:
             self.logger.info("Model loading was cancelled")
             raise
@@ -188,6 +219,86 @@ class ModelHelper:
             # Clear the cancellation event
             self._cancel_event = None
 
+    def init_prompt_cache(self) -> None:
+        """
+        Attach the prompt states cache to the model. Upon a completion the model saves the state of the evaluated
+        tokens into the cache, and upon the next one loads the state with the longest common prefix, so only the
+        suffix of the prompt following the prefix, e.g. the new turn of the conversation, is evaluated.
+        The cache is optional, the model works without it if the cache cannot be created.
+        """
+        self.prompt_cache = None
+        self.cached_prefix = []
+        try:
+            if self.prompt_cache_disk:
+                self.prompt_cache = LlamaDiskCache(cache_dir=self.get_prompt_cache_dir(),
+                                                   capacity_bytes=self.PROMPT_CACHE_DISK_CAPACITY)
+            else:
+                self.prompt_cache = LlamaRAMCache(capacity_bytes=self.PROMPT_CACHE_RAM_CAPACITY)
+            self.model.set_cache(self.prompt_cache)
+            self.logger.info(f"Prompt cache is set: {type(self.prompt_cache).__name__}")
+        except Exception as e:
+            self.logger.warning(f"Prompt cache cannot be set: {e}")
+            self.prompt_cache = None
+
+    def get_prompt_cache_dir(self) -> str:
+        """
+        Directory next to the app config file, with a subdirectory per model and context window, as the states
+        saved are only valid for the model they were evaluated by.
+        """
+        config_path = AppConfig().get_app_config_path()
+        config_name, _ext = os.path.splitext(os.path.basename(config_path))
+        cache_dir = os.path.join(os.path.dirname(config_path), config_name.replace('app_config', 'llama_cpp_cache'))
+
+        model_stat = os.stat(self.model_path)
+        model_key = hashlib.sha256(
+            f"{os.path.abspath(self.model_path)}:{model_stat.st_size}:{model_stat.st_mtime_ns}:{self.n_ctx}"
+            .encode('utf-8')).hexdigest()[:16]
+        return os.path.join(cache_dir, model_key)
+
+    def invalidate_prompt_cache(self, prompt_messages: List[dict]) -> bool:
+        """
+        Clear the cached states once the stable prefix of the prompt is changed, e.g. the system prompt, as no state
+        cached for the previous one has a common prefix with the next prompts anymore.
+        The turns following the prefix change upon each request, e.g. the oldest ones are dropped or shortened to fit
+        the token budget, or only the last request is sent in the single-turn mode, so they are not compared: the
+        states still share the prefix with the prompt, and the ones not used are evicted by the cache capacity.
+
+        Args:
+            prompt_messages (List[dict]): Messages of the prompt to evaluate next
+
+        Returns:
+            bool: Whether the cache is cleared
+        """
+        if self.prompt_cache is None:
+            return False
+        cached_prefix = self.cached_prefix
+        self.cached_prefix = self.get_stable_prefix(prompt_messages)
+        if not cached_prefix or self.cached_prefix == cached_prefix:
+            return False
+        self.clear_prompt_cache()
+        return True
+
+    @staticmethod
+    def get_stable_prefix(prompt_messages: List[dict]) -> List[dict]:
+        """
+        The leading system messages of the prompt, the part of it every request of the conversation starts with.
+        """
+        prefix = []  # type: List[dict]
+        for message in prompt_messages:
+            if message.get('role') != 'system':
+                break
+            prefix.append(dict(message))
+        return prefix
+
+    def clear_prompt_cache(self) -> None:
+        # Not while a generation is saving or loading the states, see wait_generations()
+        with self.generation_lock:
+            if isinstance(self.prompt_cache, LlamaRAMCache):
+                self.prompt_cache.cache_state.clear()
+            elif isinstance(self.prompt_cache, LlamaDiskCache):
+                self.prompt_cache.cache.clear()
+        self.logger.debug('Prompt cache is cleared')
+
     def cancel_loading(self):
         """
         Signal cancellation of model loading.
@@ -274,6 +385,9 @@ class ModelHelper:
         if not getattr(self, 'model', None):
             return None
 
+        # The states cached for another prefix of the prompt are of no use
+        self.invalidate_prompt_cache(prompt_messages)
+
         generator = self.model.create_chat_completion(
             messages=prompt_messages,
             stream=True,
@@ -286,8 +400,9 @@ class ModelHelper:
         """
         Asynchronously wrap the synchronous iterator from llama.cpp.
 
-        This method processes the streaming output in a non-blocking way,
-        yielding control to the event loop between chunks to keep the UI responsive.
+        Each step of the iterator decodes a token natively and blocks for the whole step, so the iterator is run
+        on a worker thread pushing the chunks into a bounded queue, and the event loop only drains the queue.
+        The generation stops between the tokens once the iteration is over or stop_generation() is called.
 
         Args:
             iterator: The synchronous iterator from create_chat_completion(stream=True)
@@ -295,36 +410,138 @@ class ModelHelper:
         Yields:
             str: Content tokens from the model output
         """
-        # Process chunks from the synchronous iterator
-        for chunk in iterator:
-            # Yield control to the event loop to prevent blocking
-            await asyncio.sleep(0)
-
-            # Extract delta from the response structure
-            delta = chunk['choices'][0]['delta']
-
-            if 'role' in delta:
-                # Role indicator (e.g., 'assistant')
-                output = f"{delta['role']}: "
-                self.logger.debug(f"Role output: {output}")
-                yield ''  # Don't display role prefix in UI
-            elif 'content' in delta:
-                # Actual content tokens - preserve all characters including spaces
-                tokens = delta['content']
-                self.logger.debug(f"Output token(s): {tokens}")
-                yield tokens
-            elif 'finish_reason' in delta:
-                # Completion finished
-                if delta['finish_reason'] is not None:
-                    # For instance, if max_tokens limit reached: 'finish_reason': 'length'
-                    self.logger.debug(f"Output finished with reason: '{delta['finish_reason']}'")
-                    yield ''
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        stop_event = Event()
+
+        worker = threading.Thread(target=self.generate_in_thread, args=(iterator, loop, queue, stop_event),
+                                  name='llama_cpp_generation', daemon=True)
+        self.generations[stop_event] = worker
+        worker.start()
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    # The iterator is exhausted
+                    break
+                chunk, error = item
+                if error is not None:
+                    raise error
+
+                # Extract delta from the response structure
+                delta = chunk['choices'][0]['delta']
+
+                if 'role' in delta:
+                    # Role indicator (e.g., 'assistant')
+                    output = f"{delta['role']}: "
+                    self.logger.debug(f"Role output: {output}")
+                    yield ''  # Don't display role prefix in UI
+                elif 'content' in delta:
+                    # Actual content tokens - preserve all characters including spaces
+                    tokens = delta['content']
+                    self.logger.debug(f"Output token(s): {tokens}")
+                    yield tokens
+                elif 'finish_reason' in delta:
+                    # Completion finished
+                    if delta['finish_reason'] is not None:
+                        # For instance, if max_tokens limit reached: 'finish_reason': 'length'
+                        self.logger.debug(f"Output finished with reason: '{delta['finish_reason']}'")
+                        yield ''
+        finally:
+            # Stop the generation if the output is not needed anymore, e.g. upon cancellation
+            stop_event.set()
+
+    def generate_in_thread(self, iterator, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue,
+                           stop_event: Event) -> None:
+        """
+        Iterate over the chunks on the worker thread and push them into the queue, as (chunk, error) pairs followed
+        by None once the iteration is over.
+        """
+        try:
+            with self.generation_lock:
+                try:
+                    for chunk in iterator:
+                        if stop_event.is_set() or not self.put_threadsafe(loop, queue, (chunk, None), stop_event):
+                            self.logger.debug('Generation stopped')
+                            break
+                finally:
+                    # Closing the generator stops the native generation loop
+                    close = getattr(iterator, 'close', None)
+                    if callable(close):
+                        try:
+                            close()
+                        except Exception as e:
+                            self.logger.warning(f"Error while closing the generator: {e}")
+        except Exception as e:
+            self.put_threadsafe(loop, queue, (None, e), stop_event)
+        finally:
+            self.put_threadsafe(loop, queue, None, stop_event)
+            self.generations.pop(stop_event, None)
+
+    @staticmethod
+    def put_threadsafe(loop: asyncio.AbstractEventLoop, queue: asyncio.Queue, item: Any, stop_event: Event) -> bool:
+        """
+        Put the item into the loop's queue from another thread, waiting while the queue is full.
+
+        Returns:
+            bool: False if the generation is stopped or the loop is closed and the item is dropped
+        """
+        if loop.is_closed():
+            return False
+        try:
+            future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        except RuntimeError:
+            # The loop is closed meanwhile
+            return False
+        while True:
+            try:
+                future.result(timeout=0.1)
+                return True
+            except concurrent.futures.TimeoutError:
+                if stop_event.is_set() or loop.is_closed():
+                    future.cancel()
+                    return False
+            except (concurrent.futures.CancelledError, RuntimeError):
+                return False
+
+    def stop_generation(self, timeout: float = None) -> None:
+        """
+        Stop the generations running, the native loop stops once the token being decoded is done.
+
+        Args:
+            timeout (float, optional): Time to wait for the worker threads to finish, in seconds, not to wait if None
+        """
+        for stop_event in list(self.generations):
+            stop_event.set()
+        if timeout is not None:
+            self.join_generations(timeout)
+        self.output_stream = None
+        self.output_source = None
+
+    def join_generations(self, timeout: float = None) -> None:
+        """
+        Wait for the worker threads of the generations to finish, e.g. the ones stopped.
+
+        Args:
+            timeout (float, optional): Time to wait for each worker thread, in seconds, to wait until it is done if None
+        """
+        for worker in list(self.generations.values()):
+            worker.join(timeout)
+
+    async def wait_generations(self) -> None:
+        """
+        Wait for the generations stopped to finish before the next one is started, without blocking the event loop.
+        The token being decoded is done first, as well as the generator is closed.
+        """
+        if self.generations:
+            await asyncio.get_running_loop().run_in_executor(None, self.join_generations)
 
     async def generate_output(self, generator):
         """
         Generate outputs from the model asynchronously.
 
-        This method iterates through the async wrapper and returns one item at a time,
+        This method takes the outputs of the generator's stream (see async_wrap_iterator()) one item at a time,
         raising StopAsyncIteration when complete.
 
         Args:
@@ -336,12 +553,16 @@ class ModelHelper:
         Raises:
             StopAsyncIteration: When the iteration is complete
         """
+        if self.output_stream is None or self.output_source is not generator:
+            self.output_stream = self.async_wrap_iterator(generator)
+            self.output_source = generator
+
         try:
-            async for item in self.async_wrap_iterator(generator):
-                return item
-        except (StopIteration, GeneratorExit):
+            return await self.output_stream.__anext__()
+        except (StopAsyncIteration, StopIteration, GeneratorExit):
             # Generator exhausted
-            pass
+            self.output_stream = None
+            self.output_source = None
 
         # To stop the iteration
         raise StopAsyncIteration
@@ -387,6 +608,9 @@ class ModelHelper:
         following best practices from llama-cpp-python.
         """
         try:
+            # Stop the generation on the worker thread, if any, before the model is released
+            self.stop_generation(timeout=5.0)
+
             if hasattr(self, 'generator') and self.generator:
                 self.generator = None
 
@@ -397,6 +621,9 @@ class ModelHelper:
                 del self.model
                 self.model = None
 
+            self.prompt_cache = None
+            self.cached_prefix = []
+
             self.logger.info("Model resources released successfully")
         except Exception as e:
             self.logger.error(f"Error during cleanup: {e}")
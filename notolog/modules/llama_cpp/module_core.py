@@ -19,7 +19,7 @@ For detailed instructions and project information, please see the repository's R
 """
 
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtWidgets import (QVBoxLayout, QWidget, QLabel, QSpinBox, QSlider,
+from PySide6.QtWidgets import (QVBoxLayout, QWidget, QLabel, QSpinBox, QSlider, QCheckBox,
                                QSizePolicy, QPlainTextEdit, QScrollArea, QApplication)
 from PySide6.QtGui import QCursor
 
@@ -30,11 +30,13 @@ import asyncio
 from asyncio import Task
 from qasync import asyncSlot
 
-from typing import Callable
+from typing import Callable, Union
 
 from .model_helper import ModelHelper
 from .prompt_manager import PromptManager
 
+from ..token_budget import TokenBudget
+
 from ..base_ai_core import BaseAiCore
 
 from .. import Settings
@@ -95,11 +97,12 @@ class ModuleCore(BaseAiCore):
         context_window = self.settings.module_llama_cpp_context_window
         chat_format = self.settings.module_llama_cpp_chat_format
         gpu_layers = self.settings.module_llama_cpp_gpu_layers
+        prompt_cache_disk = self.settings.module_llama_cpp_prompt_cache_disk
         search_options = self.get_search_options()
         # Cached helper instance for efficiency
         self.model_helper = ModelHelper(model_path=model_path, n_ctx=context_window, chat_format=chat_format,
                                         n_gpu_layers=gpu_layers if gpu_layers is not None else None,
-                                        search_options=search_options)
+                                        search_options=search_options, prompt_cache_disk=prompt_cache_disk)
 
         # Use for debugging asynchronous events if necessary:
         # asyncio.get_event_loop().set_debug(True)
@@ -119,10 +122,18 @@ class ModuleCore(BaseAiCore):
         Prompt manager handles prompt management and appends messages to the prompt history.
         Note: It may not be initiated if called out of context, such as from settings.
         """
+        token_budget = TokenBudget(count_tokens=self.count_tokens, max_tokens=TokenBudget.get_prompt_budget(
+            self.settings.module_llama_cpp_context_window, self.settings.module_llama_cpp_response_max_tokens))
         self.prompt_manager = PromptManager(system_prompt=self.settings.module_llama_cpp_system_prompt,
                                             max_history_size=self.settings.module_llama_cpp_prompt_history_size,
+                                            token_budget=token_budget,
                                             parent=ai_dialog)
 
+    def count_tokens(self, text: str) -> Union[int, None]:
+        # Tokens counted by the model's tokenizer, None until the model is loaded
+        input_tokens = self.model_helper.get_input_tokens(text)
+        return len(input_tokens) if input_tokens is not None else None
+
     def get_prompt_manager(self):
         return self.prompt_manager
 
@@ -318,6 +329,8 @@ class ModuleCore(BaseAiCore):
         generator = None
 
         try:
+            # The previous generation may still be decoding its last token, the model is used by one at a time
+            await self.model_helper.wait_generations()
             # Initialize generator with proper exception handling
             generator = self.model_helper.init_generator(user_prompt, ModelHelper.search_options)
             if generator is None:
@@ -337,8 +350,8 @@ class ModuleCore(BaseAiCore):
             while not self.generator_task.done():
                 try:
                     await self.async_generator(generator, request_msg_id, response_msg_id)
-                    # Yield control to allow UI updates
-                    await asyncio.sleep(0.01)
+                    # Yield control to allow UI updates; the tokens are generated on the worker thread meanwhile
+                    await asyncio.sleep(0)
                 except StopAsyncIteration:
                     # Generation completed normally
                     self.logger.debug("Async generation completed")
@@ -394,6 +407,9 @@ class ModuleCore(BaseAiCore):
         This method ensures proper cleanup when generation is stopped,
         whether by user cancellation or completion.
         """
+        # Stop the native generation loop on the worker thread between the tokens
+        self.model_helper.stop_generation()
+
         if self.generator_task and not self.generator_task.done():
             self.logger.debug("Stopping generator task")
             # Cancel the task
@@ -469,6 +485,15 @@ class ModuleCore(BaseAiCore):
              "callback": lambda obj: tab_module_llama_cpp_config_layout.addWidget(obj, alignment=Qt.AlignmentFlag.AlignTop),
              "accessible_description":
                  self.lexemes.get('module_llama_cpp_config_context_window_input_accessible_description')},
+            # Toggle to keep the evaluated prompt states on the disk rather than in RAM
+            {"type": QCheckBox,
+             # Lexeme key : Setting name
+             "name": "settings_dialog_module_llama_cpp_config_prompt_cache_disk_checkbox:"
+                     "module_llama_cpp_prompt_cache_disk",
+             "callback": lambda obj: tab_module_llama_cpp_config_layout.addWidget(obj, alignment=Qt.AlignmentFlag.AlignTop),
+             "text": self.lexemes.get('module_llama_cpp_config_prompt_cache_disk_checkbox'),
+             "accessible_description":
+                 self.lexemes.get('module_llama_cpp_config_prompt_cache_disk_checkbox_accessible_description')},
             # Vertical spacer
             {"type": QWidget, "name": None, "size_policy": (QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Minimum),
              "callback": lambda obj: tab_module_llama_cpp_config_layout.addWidget(obj)},
@@ -600,6 +625,8 @@ class ModuleCore(BaseAiCore):
         if callable(extend_func):
             extend_func("module_llama_cpp_model_path", str, "")
             extend_func("module_llama_cpp_context_window", int, 2048)
+            # Keep the prompt states cache on the disk rather than in RAM
+            extend_func("module_llama_cpp_prompt_cache_disk", bool, False)
             extend_func("module_llama_cpp_chat_format", str, str(LlmChatFormats.default()))
             # GPU layers: None = auto-detect, 0 = CPU only, -1 = all layers on GPU
             extend_func("module_llama_cpp_gpu_layers", int, None)
@@ -629,6 +656,7 @@ class ModuleCore(BaseAiCore):
             'module_llama_cpp_context_window',
             'module_llama_cpp_chat_format',
             'module_llama_cpp_gpu_layers',
+            'module_llama_cpp_prompt_cache_disk',
             'module_llama_cpp_response_temperature',
             'module_llama_cpp_response_max_tokens',
             # 'module_llama_cpp_system_prompt',
@@ -655,6 +683,10 @@ class ModuleCore(BaseAiCore):
                 if gpu_layers == -2:
                     gpu_layers = None
 
+            prompt_cache_disk = self.settings.module_llama_cpp_prompt_cache_disk
+            if 'module_llama_cpp_prompt_cache_disk' in data:
+                prompt_cache_disk = data['module_llama_cpp_prompt_cache_disk']
+
             # Reload the model helper
             ModelHelper.reload()
 
@@ -664,7 +696,7 @@ class ModuleCore(BaseAiCore):
             self.model_helper = ModelHelper(
                 model_path=model_path, n_ctx=context_window, chat_format=chat_format,
                 n_gpu_layers=gpu_layers if gpu_layers is not None else None,
-                search_options=search_options
+                search_options=search_options, prompt_cache_disk=prompt_cache_disk
             )
 
     def temperature_change_handler(self, source_object, source_widget):
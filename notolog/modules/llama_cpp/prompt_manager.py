@@ -26,6 +26,8 @@ from typing import Union
 
 from ...ui.ai_assistant.ai_assistant import EnumMessageType
 
+from ..token_budget import TokenBudget
+
 
 class PromptManager(QObject):
 
@@ -56,7 +58,7 @@ class PromptManager(QObject):
             # Create a new instance
             cls._instance = super().__new__(cls, *args, **kwargs)
 
-    def __init__(self, system_prompt=None, max_history_size=None, parent=None):
+    def __init__(self, system_prompt=None, max_history_size=None, token_budget: TokenBudget = None, parent=None):
 
         # Prevent re-initialization if the instance is already set up.
         if hasattr(self, 'logger'):
@@ -74,6 +76,8 @@ class PromptManager(QObject):
 
             self.system_input = system_prompt
             self.max_history_size = max_history_size
+            # Token budget of the prompt, not limited unless set
+            self.token_budget = token_budget if token_budget else TokenBudget()
 
             self.init_history()
 
@@ -97,7 +101,7 @@ class PromptManager(QObject):
 
     def get_prompt(self, multi_turn=True):
         if multi_turn:
-            prompt = self.format_history()
+            prompt = self.pack_history(self.format_history())
         else:
             prompt = [
                 self.get_prompt_message(role='system', content=self.system_input),
@@ -196,6 +200,34 @@ class PromptManager(QObject):
             formatted_history.append(data)
         return formatted_history
 
+    def pack_history(self, messages: list) -> list:
+        """
+        Fit the messages into the token budget, keeping the system prompt and the newest messages, see TokenBudget.
+
+        Args:
+            messages (list): Formatted history, see format_history()
+
+        Returns:
+            list: Messages of the prompt
+        """
+        system_prompt_shift = 1 if messages and messages[0]['role'] == 'system' else 0
+        system_messages, messages = messages[:system_prompt_shift], messages[system_prompt_shift:]
+        reserved = sum(self.token_budget.count(message['content'] or '') + TokenBudget.MESSAGE_OVERHEAD
+                       for message in system_messages)
+
+        messages = self.token_budget.pack(messages, get_text=lambda message: message['content'] or '',
+                                          reserved=reserved, shorten=self.shorten_message)
+
+        # Start the conversation with a request, as some chat templates expect
+        while len(messages) > 1 and messages[0]['role'] != 'user':
+            messages.pop(0)
+
+        return system_messages + messages
+
+    def shorten_message(self, message: dict, max_tokens: int) -> Union[dict, None]:
+        content = self.token_budget.shorten_text(message['content'] or '', max_tokens)
+        return dict(message, content=content) if content else None
+
     def get_history(self) -> str:
         # Get history object
         history = self.format_history()
@@ -28,11 +28,13 @@ import asyncio
 from asyncio import Task
 from qasync import asyncSlot
 
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Union
 
 from .model_helper import ModelHelper, ExecutionProvider
 from .prompt_manager import PromptManager
 
+from ..token_budget import TokenBudget
+
 from ..base_ai_core import BaseAiCore
 
 from .. import Settings
@@ -124,9 +126,19 @@ class ModuleCore(BaseAiCore):
         Prompt manager for prompt management and to add / append messages to prompt history.
         Note: It may not be initiated if called out of the context, from settings for example.
         """
+        # The max length covers both the prompt and the response
+        token_budget = TokenBudget(count_tokens=self.count_tokens,
+                                   max_tokens=TokenBudget.get_prompt_budget(ModelHelper.search_options.get('max_length', 0)))
         self.prompt_manager = PromptManager(max_history_size=self.settings.module_ondevice_llm_prompt_history_size,
+                                            token_budget=token_budget,
                                             parent=ai_dialog)
 
+    def count_tokens(self, text: str) -> Union[int, None]:
+        # Tokens counted by the model's tokenizer, None until the model is loaded
+        if not getattr(self.model_helper, 'tokenizer', None):
+            return None
+        return len(self.model_helper.get_input_tokens(text))
+
     def get_prompt_manager(self):
         return self.prompt_manager
 
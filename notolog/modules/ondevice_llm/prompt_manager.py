@@ -26,6 +26,8 @@ from typing import Any, Union
 
 from ...ui.ai_assistant.ai_assistant import EnumMessageType
 
+from ..token_budget import TokenBudget
+
 
 class PromptManager(QObject):
 
@@ -62,7 +64,7 @@ class PromptManager(QObject):
             # Create a new instance
             cls._instance = super().__new__(cls, *args, **kwargs)
 
-    def __init__(self, system_prompt=None, max_history_size=None, parent=None):
+    def __init__(self, system_prompt=None, max_history_size=None, token_budget: TokenBudget = None, parent=None):
 
         # Prevent re-initialization if the instance is already set up.
         if hasattr(self, 'logger'):
@@ -80,6 +82,8 @@ class PromptManager(QObject):
 
             self.system_input = system_prompt  # Not yet supported
             self.max_history_size = max_history_size
+            # Token budget of the prompt, not limited unless set
+            self.token_budget = token_budget if token_budget else TokenBudget()
 
             self.init_history()
 
@@ -233,17 +237,41 @@ class PromptManager(QObject):
         else:
             return formatted_history
 
-        for record in self.history:
-            request_text = record['user']['text']
-            response_text = record['assistant']['text'] if record['assistant'] is not None else ""
-            formatted_history += self.get_multi_turn_prompt_message(
-                request_text=request_text, response_text=response_text,
-                # History is always multi-turn, check either the input was a last message
-                is_last_input=(last_user_msg_id == record['user']['msg_id']
-                               and not hasattr(record['assistant'], 'msg_id')))
+        # Fit the records into the token budget, the newest first
+        records = self.token_budget.pack(
+            self.history, get_text=lambda _record: self.get_record_prompt(_record, last_user_msg_id),
+            reserved=self.token_budget.count(formatted_history), shorten=self.shorten_record)
+
+        for record in records:
+            formatted_history += self.get_record_prompt(record, last_user_msg_id)
         # Return formatted history prompt
         return formatted_history
 
+    def get_record_prompt(self, record: dict, last_user_msg_id: int) -> str:
+        request_text = record['user']['text']
+        response_text = record['assistant']['text'] if record['assistant'] is not None else ""
+        return self.get_multi_turn_prompt_message(
+            request_text=request_text, response_text=response_text,
+            # History is always multi-turn, check either the input was a last message
+            is_last_input=(last_user_msg_id == record['user']['msg_id']
+                           and not hasattr(record['assistant'], 'msg_id')))
+
+    def shorten_record(self, record: dict, max_tokens: int) -> Union[dict, None]:
+        """
+        Copy of the record with the request and the response shortened to share the tokens given.
+        """
+        # Tokens of the template itself
+        max_tokens -= self.token_budget.count(self.get_multi_turn_prompt_message(request_text='', response_text=''))
+        if record['assistant'] is None:
+            request_text = self.token_budget.shorten_text(record['user']['text'], max_tokens)
+            return dict(record, user=dict(record['user'], text=request_text)) if request_text else None
+        request_text = self.token_budget.shorten_text(record['user']['text'], max_tokens // 2)
+        response_text = self.token_budget.shorten_text(record['assistant']['text'], max_tokens // 2)
+        if not request_text or not response_text:
+            return None
+        return dict(record, user=dict(record['user'], text=request_text),
+                    assistant=dict(record['assistant'], text=response_text))
+
     def get_history(self) -> str:
         result = ''
         # Format each entry and combine them into a text
@@ -5,6 +5,7 @@ An open-source Markdown editor built with Python.
 File Details:
 - Purpose: Part of the 'OpenAI API' module.
 - Functionality: Facilitates initialization and management of OpenAI API requests and responses.
+  The requests share a network manager to reuse the connections; the streamed responses are parsed incrementally.
 
 Repository: https://github.com/notolog/notolog-editor
 Website: https://notolog.app
@@ -18,12 +19,13 @@ For detailed instructions and project information, please see the repository's R
 """
 
 from PySide6.QtCore import QUrl, QByteArray
-from PySide6.QtNetwork import QNetworkRequest
+from PySide6.QtNetwork import QNetworkRequest, QNetworkAccessManager
 
 import json
 import logging
 
 from threading import Lock
+from typing import List, Union
 
 
 class ApiHelper:
@@ -56,7 +58,18 @@ class ApiHelper:
 
             self.logger = logging.getLogger('openai_api_helper')
 
-    def init_request(self, api_url, api_key) -> QNetworkRequest:
+            self.network_manager = None  # type: Union[QNetworkAccessManager, None]
+
+    def get_network_manager(self) -> QNetworkAccessManager:
+        """
+        Network access manager shared by the requests, so the keep-alive and HTTP/2 connections to the API are reused
+        rather than set up again per request.
+        """
+        if self.network_manager is None:
+            self.network_manager = QNetworkAccessManager()
+        return self.network_manager
+
+    def init_request(self, api_url, api_key, stream: bool = False) -> QNetworkRequest:
 
         url = QUrl(api_url)  # API endpoint
         request = QNetworkRequest(url)
@@ -70,6 +83,10 @@ class ApiHelper:
         # Set request type to POST
         request.setRawHeader(b"Custom-Request", b"POST")
 
+        if stream:
+            # Response as the server-sent events
+            request.setRawHeader(b"Accept", b"text/event-stream")
+
         return request
 
     def init_request_params(self, prompt_messages, api_model,
@@ -97,6 +114,9 @@ class ApiHelper:
             post_params.update({"n": options['n']})
         if 'stream' in options:
             post_params.update({"stream": bool(options['stream'])})
+        if post_params['stream']:
+            # Usage of the streamed response comes with the final chunk
+            post_params.update({"stream_options": {"include_usage": True}})
 
         json_post_params = json.dumps(post_params)
 
@@ -113,3 +133,62 @@ class ApiHelper:
     def convert_temperature(temperature: int = 0):
         """ Convert the integer value of temperature to a float. """
         return temperature / 100
+
+
+class EventStreamParser:
+    """
+    Incremental parser of the server-sent events (text/event-stream). Takes the chunks of the response body as they
+    arrive and returns the data of the events completed so far; a line or an event may span the chunks.
+    """
+
+    def __init__(self):
+        # Incomplete line of the latest chunk
+        self.buffer = b''  # type: bytes
+        # Data lines of the event being received
+        self.data = []  # type: List[str]
+
+    def feed(self, chunk: bytes) -> List[str]:
+        """
+        Args:
+            chunk (bytes): Next chunk of the response body
+
+        Returns:
+            List[str]: Data of the events completed
+        """
+        lines = (self.buffer + chunk).split(b'\n')
+        # The last line is complete once the next line break arrives
+        self.buffer = lines.pop()
+        events = []
+        for line in lines:
+            # The line breaks do not occur within the UTF-8 multibyte sequences, so each line is decoded as a whole
+            event = self.process_line(line.rstrip(b'\r').decode('utf-8', errors='replace'))
+            if event is not None:
+                events.append(event)
+        return events
+
+    def flush(self) -> List[str]:
+        """
+        Data of the event left once the body is over, e.g. without the final empty line.
+        """
+        events = self.feed(b'\n') if self.buffer else []
+        event = self.process_line('')
+        if event is not None:
+            events.append(event)
+        return events
+
+    def process_line(self, line: str) -> Union[str, None]:
+        if not line:
+            # An empty line completes the event
+            if not self.data:
+                return None
+            event = '\n'.join(self.data)
+            self.data = []
+            return event
+        if line.startswith(':'):
+            # Comment, e.g. a keep-alive one
+            return None
+        field, _sep, value = line.partition(':')
+        if field == 'data':
+            self.data.append(value[1:] if value.startswith(' ') else value)
+        # Other fields (event, id, retry) are not in use
+        return None
@@ -35,8 +35,17 @@ lexemes = {
         "Maximale Anzahl von Token, die in einer Antwort empfangen werden, wie Wörter und Zeichensetzung, "
         "steuert die Länge der Ausgabe.",
 
+    "module_openai_api_base_response_stream_checkbox": "Antwort streamen",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "Zeigt die Antwort während ihrer Generierung an, statt erst nach ihrer Fertigstellung.",
+
     "module_openai_api_config_prompt_history_size_label": "Größe der Prompt-Historie",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "Steuert die Anzahl der Einträge in der Prompt-Historie, die das System zur Referenz behält.\n"
-        "Ein Wert von null ermöglicht unbegrenzte Einträge."
+        "Ein Wert von null ermöglicht unbegrenzte Einträge.",
+
+    "module_openai_api_config_context_window_label": "Größe des Kontextfensters",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "Anzahl der Token, die das Modell aufnimmt. Der Aufforderungsverlauf wird darin eingepasst, die neuesten zuerst,\n"
+        "wobei Platz für die Antwort bleibt. Ein Wert von null erlaubt eine unbegrenzte Anzahl von Token."
 }
@@ -34,8 +34,17 @@ lexemes = {
         "Maximum number of tokens to receive in response, such as words and punctuation, "
         "controlling the length of the output.",
 
+    "module_openai_api_base_response_stream_checkbox": "Stream the response",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "Shows the response as it is generated rather than once it is complete.",
+
     "module_openai_api_config_prompt_history_size_label": "Prompt History Size",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "Controls the number of entries in the prompt history that the system retains for reference.\n"
-        "A zero value allows for unlimited entries."
+        "A zero value allows for unlimited entries.",
+
+    "module_openai_api_config_context_window_label": "Context Window Size",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "Number of tokens the model takes in. The prompt history is fitted into it, newest first,\n"
+        "leaving room for the response. A zero value allows for unlimited tokens."
 }
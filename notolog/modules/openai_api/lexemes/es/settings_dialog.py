@@ -35,8 +35,17 @@ lexemes = {
         "Número máximo de tokens que se recibirán en una respuesta, como palabras y puntuación, "
         "controlando la longitud de la salida.",
 
+    "module_openai_api_base_response_stream_checkbox": "Transmitir la respuesta",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "Muestra la respuesta a medida que se genera en lugar de cuando está completa.",
+
     "module_openai_api_config_prompt_history_size_label": "Tamaño del historial de prompts",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "Controla el número de entradas en el historial de prompts que el sistema retiene para referencia.\n"
-        "Un valor cero permite entradas ilimitadas."
+        "Un valor cero permite entradas ilimitadas.",
+
+    "module_openai_api_config_context_window_label": "Tamaño de la ventana de contexto",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "Número de tokens que recibe el modelo. El historial de prompts se ajusta a él, los más recientes primero,\n"
+        "dejando espacio para la respuesta. Un valor de cero permite tokens ilimitados."
 }
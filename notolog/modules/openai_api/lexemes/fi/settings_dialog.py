@@ -35,8 +35,17 @@ lexemes = {
         "Määrittää vastauksessa vastaanotettavien tokenien enimmäismäärän, kuten sanat ja välimerkit, "
         "halliten tulosteen pituutta.",
 
+    "module_openai_api_base_response_stream_checkbox": "Suoratoista vastaus",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "Näyttää vastauksen sitä mukaa kuin se luodaan eikä vasta, kun se on valmis.",
+
     "module_openai_api_config_prompt_history_size_label": "Kehotushistorian koko",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "Hallitsee järjestelmän säilyttämien kehotushistorian merkintöjen määrää.\n"
-        "Nolla-arvo sallii rajattomat merkinnät."
+        "Nolla-arvo sallii rajattomat merkinnät.",
+
+    "module_openai_api_config_context_window_label": "Konteksti-ikkunan koko",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "Mallin vastaanottamien tokenien määrä. Kehotehistoria sovitetaan siihen uusimmat ensin,\n"
+        "jättäen tilaa vastaukselle. Nolla-arvo sallii rajattoman määrän tokeneita."
 }
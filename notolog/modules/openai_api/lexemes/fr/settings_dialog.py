@@ -34,8 +34,17 @@ lexemes = {
         "Le nombre maximum de tokens à recevoir en réponse, tels que des mots et de la ponctuation, "
         "contrôlant la longueur de la sortie.",
 
+    "module_openai_api_base_response_stream_checkbox": "Diffuser la réponse",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "Affiche la réponse au fur et à mesure de sa génération plutôt qu'une fois terminée.",
+
     "module_openai_api_config_prompt_history_size_label": "Taille de l'historique des prompts",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "Contrôle le nombre d'entrées dans l'historique des prompts que le système conserve pour référence.\n"
-        "Une valeur nulle permet un nombre illimité d'entrées."
+        "Une valeur nulle permet un nombre illimité d'entrées.",
+
+    "module_openai_api_config_context_window_label": "Taille de la fenêtre de contexte",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "Nombre de jetons que le modèle reçoit. L'historique des invites y est ajusté, les plus récentes d'abord,\n"
+        "en laissant de la place pour la réponse. Une valeur nulle permet un nombre illimité de jetons."
 }
@@ -36,8 +36,17 @@ lexemes = {
         "მაქსიმალური ტოკენების რაოდენობას ანიჭებს, რომელიც პასუხში მიიღება, როგორიცაა სიტყვები და პუნქტუაცია, "
         "რეგულირებს შედეგის სიგრძეს.",
 
+    "module_openai_api_base_response_stream_checkbox": "პასუხის ნაკადური გადაცემა",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "აჩვენებს პასუხს მისი გენერირებისას და არა მხოლოდ დასრულების შემდეგ.",
+
     "module_openai_api_config_prompt_history_size_label": "პრომპტის ისტორიის ზომა",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "კონტროლებს სისტემაში შენახული პრომპტის ისტორიის შენახვის შენახულ ჩანაწერების რაოდენობას.\n"
-        "ნულოვანი მნიშვნელობა გამოიყენება შეუზღუდავ ჩანაწერებისთვის."
+        "ნულოვანი მნიშვნელობა გამოიყენება შეუზღუდავ ჩანაწერებისთვის.",
+
+    "module_openai_api_config_context_window_label": "კონტექსტური ფანჯრის ზომა",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "ტოკენების რაოდენობა, რომელსაც მოდელი იღებს. პრომპტების ისტორია მასში თავსდება, ჯერ უახლესი,\n"
+        "პასუხისთვის ადგილის დატოვებით. ნულოვანი მნიშვნელობა უშვებს ულიმიტო ტოკენებს."
 }
@@ -36,8 +36,17 @@ lexemes = {
         "Ο μέγιστος αριθμός tokens που λαμβάνονται σε μια απόκριση, όπως λέξεις και στίξη, "
         "διαχειρίζοντας το μήκος της εξόδου.",
 
+    "module_openai_api_base_response_stream_checkbox": "Ροή της απάντησης",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "Εμφανίζει την απάντηση καθώς δημιουργείται αντί για όταν ολοκληρωθεί.",
+
     "module_openai_api_config_prompt_history_size_label": "Μέγεθος Ιστορικού Προτροπών",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "Ελέγχει τον αριθμό των καταχωρήσεων στο ιστορικό προτροπών που διατηρεί το σύστημα για αναφορά.\n"
-        "Μια τιμή μηδέν επιτρέπει απεριόριστες καταχωρήσεις."
+        "Μια τιμή μηδέν επιτρέπει απεριόριστες καταχωρήσεις.",
+
+    "module_openai_api_config_context_window_label": "Μέγεθος παραθύρου περιβάλλοντος",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "Αριθμός των διακριτικών που δέχεται το μοντέλο. Το ιστορικό προτροπών προσαρμόζεται σε αυτό, πρώτα τα νεότερα,\n"
+        "αφήνοντας χώρο για την απάντηση. Μηδενική τιμή επιτρέπει απεριόριστα διακριτικά."
 }
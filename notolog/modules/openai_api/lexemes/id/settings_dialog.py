@@ -34,8 +34,17 @@ lexemes = {
         "Jumlah maksimum token yang diterima dalam respons, seperti kata dan tanda baca, "
         "mengontrol panjang output.",
 
+    "module_openai_api_base_response_stream_checkbox": "Alirkan respons",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "Menampilkan respons saat sedang dihasilkan, bukan setelah selesai.",
+
     "module_openai_api_config_prompt_history_size_label": "Ukuran Riwayat Perintah",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "Mengontrol jumlah entri dalam riwayat perintah yang disimpan sistem untuk referensi.\n"
-        "Nilai nol memungkinkan entri tak terbatas."
+        "Nilai nol memungkinkan entri tak terbatas.",
+
+    "module_openai_api_config_context_window_label": "Ukuran Jendela Konteks",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "Jumlah token yang diterima model. Riwayat perintah disesuaikan ke dalamnya, yang terbaru lebih dahulu,\n"
+        "dengan menyisakan ruang untuk respons. Nilai nol memungkinkan token tak terbatas."
 }
@@ -34,8 +34,17 @@ lexemes = {
         "प्रतिक्रिया में प्राप्त होने वाले टोकनों की अधिकतम संख्या निर्धारित करता है, जैसे शब्द और विराम चिह्न,\n"
         "आउटपुट की लंबाई को नियंत्रित करता है।",
 
+    "module_openai_api_base_response_stream_checkbox": "प्रतिक्रिया स्ट्रीम करें",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "प्रतिक्रिया को पूरा होने के बजाय उसके उत्पन्न होते समय ही दिखाता है।",
+
     "module_openai_api_config_prompt_history_size_label": "प्रॉम्प्ट इतिहास का आकार",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "प्रणाली द्वारा संदर्भ के लिए बनाए रखी गई प्रॉम्प्ट इतिहास की प्रविष्टियों की संख्या को नियंत्रित करता है।\n"
-        "शून्य मूल्य असीमित प्रविष्टियों की अनुमति देता है।"
+        "शून्य मूल्य असीमित प्रविष्टियों की अनुमति देता है।",
+
+    "module_openai_api_config_context_window_label": "संदर्भ विंडो का आकार",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "टोकन की संख्या जो मॉडल ग्रहण करता है। प्रॉम्प्ट इतिहास को इसमें फिट किया जाता है, नवीनतम पहले,\n"
+        "प्रतिक्रिया के लिए स्थान छोड़ते हुए। शून्य मूल्य असीमित टोकन की अनुमति देता है।"
 }
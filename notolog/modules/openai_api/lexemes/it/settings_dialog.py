@@ -34,8 +34,17 @@ lexemes = {
         "Il numero massimo di token da ricevere in risposta, come parole e punteggiatura, "
         "controllando la lunghezza dell'output.",
 
+    "module_openai_api_base_response_stream_checkbox": "Trasmetti la risposta",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "Mostra la risposta mentre viene generata anziché una volta completata.",
+
     "module_openai_api_config_prompt_history_size_label": "Dimensione della cronologia dei prompt",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "Controlla il numero di voci nella cronologia dei prompt che il sistema mantiene per riferimento.\n"
-        "Un valore zero permette voci illimitate."
+        "Un valore zero permette voci illimitate.",
+
+    "module_openai_api_config_context_window_label": "Dimensione della finestra di contesto",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "Numero di token che il modello riceve. La cronologia dei prompt viene adattata ad esso, i più recenti per primi,\n"
+        "lasciando spazio per la risposta. Un valore zero permette token illimitati."
 }
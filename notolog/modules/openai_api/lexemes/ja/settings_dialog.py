@@ -34,8 +34,17 @@ lexemes = {
         "応答で受け取るトークンの最大数を設定します。これには単語や句読点が含まれ、\n"
         "出力の長さを制御します。",
 
+    "module_openai_api_base_response_stream_checkbox": "応答をストリーミング",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "応答が完了してからではなく、生成されるにつれて表示します。",
+
     "module_openai_api_config_prompt_history_size_label": "プロンプト履歴のサイズ",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "システムが参照用に保持するプロンプト履歴のエントリ数を制御します。\n"
-        "0の値は無制限のエントリを許可します。"
+        "0の値は無制限のエントリを許可します。",
+
+    "module_openai_api_config_context_window_label": "コンテキストウィンドウのサイズ",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "モデルが受け取るトークンの数。プロンプト履歴は新しいものから順にこれに収められ、\n"
+        "応答のための余地が残されます。ゼロの値はトークン数を無制限にします。"
 }
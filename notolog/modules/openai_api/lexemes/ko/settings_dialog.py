@@ -34,8 +34,17 @@ lexemes = {
         "응답에서 받을 수 있는 최대 토큰 수를 설정합니다. 이에는 단어와 구두점이 포함되며,\n"
         "출력의 길이를 제어합니다.",
 
+    "module_openai_api_base_response_stream_checkbox": "응답 스트리밍",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "응답이 완료된 후가 아니라 생성되는 대로 표시합니다.",
+
     "module_openai_api_config_prompt_history_size_label": "프롬프트 이력 크기",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "시스템이 참조용으로 유지하는 프롬프트 이력의 항목 수를 제어합니다.\n"
-        "0의 값은 무제한 항목을 허용합니다."
+        "0의 값은 무제한 항목을 허용합니다.",
+
+    "module_openai_api_config_context_window_label": "컨텍스트 창 크기",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "모델이 받아들이는 토큰의 수입니다. 프롬프트 기록은 최신 항목부터 여기에 맞춰지며,\n"
+        "응답을 위한 공간이 남겨집니다. 0 값은 토큰을 무제한으로 허용합니다."
 }
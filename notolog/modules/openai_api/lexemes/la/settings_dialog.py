@@ -35,8 +35,17 @@ lexemes = {
         "Maximum numerum tokenorum quos in responsione accipere potes, verba et interpunctionem includens, "
         "longitudinem exitus moderans.",
 
+    "module_openai_api_base_response_stream_checkbox": "Responsum fluens",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "Responsum ostendit dum generatur potius quam cum perfectum est.",
+
     "module_openai_api_config_prompt_history_size_label": "Magnitudo Historiae Promptorum",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "Numerum introituum in historia promptorum quae systema retinet ad referentiam moderatur.\n"
-        "Valor nullos introitus indefinitos permittit."
+        "Valor nullos introitus indefinitos permittit.",
+
+    "module_openai_api_config_context_window_label": "Magnitudo fenestrae contextus",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "Numerus signorum quae exemplar accipit. Historia promptorum in eam aptatur, recentissima primum,\n"
+        "spatio responso relicto. Valor nullus signa infinita permittit."
 }
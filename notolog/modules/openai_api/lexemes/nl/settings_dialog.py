@@ -35,8 +35,17 @@ lexemes = {
         "Het maximale aantal tokens dat ontvangen kan worden in een respons, zoals woorden en leestekens, "
         "regelt de lengte van de uitvoer.",
 
+    "module_openai_api_base_response_stream_checkbox": "Antwoord streamen",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "Toont het antwoord terwijl het wordt gegenereerd in plaats van wanneer het klaar is.",
+
     "module_openai_api_config_prompt_history_size_label": "Grootte van de promptgeschiedenis",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "Regelt het aantal invoeren in de promptgeschiedenis die het systeem bewaart voor referentie.\n"
-        "Een waarde van nul laat een onbeperkt aantal invoeren toe."
+        "Een waarde van nul laat een onbeperkt aantal invoeren toe.",
+
+    "module_openai_api_config_context_window_label": "Grootte van het contextvenster",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "Aantal tokens dat het model opneemt. De promptgeschiedenis wordt erin gepast, de nieuwste eerst,\n"
+        "met ruimte voor het antwoord. Een waarde van nul staat onbeperkte tokens toe."
 }
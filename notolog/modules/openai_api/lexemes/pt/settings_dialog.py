@@ -35,8 +35,17 @@ lexemes = {
         "O número máximo de tokens que podem ser recebidos em uma resposta, incluindo palavras e pontuação, "
         "controlando o comprimento da saída.",
 
+    "module_openai_api_base_response_stream_checkbox": "Transmitir a resposta",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "Mostra a resposta à medida que é gerada em vez de quando estiver completa.",
+
     "module_openai_api_config_prompt_history_size_label": "Tamanho do histórico de prompts",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "Controla o número de entradas no histórico de prompts que o sistema retém para referência.\n"
-        "Um valor zero permite entradas ilimitadas."
+        "Um valor zero permite entradas ilimitadas.",
+
+    "module_openai_api_config_context_window_label": "Tamanho da janela de contexto",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "Número de tokens que o modelo recebe. O histórico de prompts é ajustado a ele, os mais recentes primeiro,\n"
+        "deixando espaço para a resposta. Um valor zero permite tokens ilimitados."
 }
@@ -35,8 +35,17 @@ lexemes = {
         "Максимальное количество токенов, которые можно получить в ответ, таких как слова и пунктуация, "
         "контролируя длину вывода.",
 
+    "module_openai_api_base_response_stream_checkbox": "Потоковая передача ответа",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "Показывает ответ по мере его генерации, а не после его завершения.",
+
     "module_openai_api_config_prompt_history_size_label": "Размер истории промптов",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "Контролирует количество записей в истории промптов, которые система сохраняет для справки.\n"
-        "Значение ноль позволяет неограниченное количество записей."
+        "Значение ноль позволяет неограниченное количество записей.",
+
+    "module_openai_api_config_context_window_label": "Размер контекстного окна",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "Количество токенов, которое принимает модель. История промптов вписывается в него, начиная с последних,\n"
+        "оставляя место для ответа. Значение ноль позволяет неограниченное количество токенов."
 }
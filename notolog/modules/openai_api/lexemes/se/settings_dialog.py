@@ -34,8 +34,17 @@ lexemes = {
         "Maximalt antal token som tas emot i ett svar, såsom ord och skiljetecken, "
         "styr längden på utdatan.",
 
+    "module_openai_api_base_response_stream_checkbox": "Strömma svaret",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "Visar svaret medan det genereras i stället för när det är klart.",
+
     "module_openai_api_config_prompt_history_size_label": "Storlek på prompt-historik",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "Kontrollerar antalet poster i prompt-historiken som systemet behåller för referens.\n"
-        "Ett värde på noll tillåter obegränsade poster."
+        "Ett värde på noll tillåter obegränsade poster.",
+
+    "module_openai_api_config_context_window_label": "Storlek på kontextfönstret",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "Antal tokens som modellen tar emot. Prompthistoriken anpassas till det, de senaste först,\n"
+        "med utrymme kvar för svaret. Ett nollvärde tillåter obegränsat antal tokens."
 }
@@ -34,8 +34,17 @@ lexemes = {
         "Yanıtta alınacak maksimum token sayısını belirler, bu da kelimeler ve noktalama işaretlerini içerir, "
         "çıktının uzunluğunu kontrol eder.",
 
+    "module_openai_api_base_response_stream_checkbox": "Yanıtı akışla aktar",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "Yanıtı tamamlandığında değil, oluşturuldukça gösterir.",
+
     "module_openai_api_config_prompt_history_size_label": "İstem Geçmişi Boyutu",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "Sistem tarafından referans için tutulan istem geçmişindeki giriş sayısını kontrol eder.\n"
-        "Sıfır değer sınırsız girişe izin verir."
+        "Sıfır değer sınırsız girişe izin verir.",
+
+    "module_openai_api_config_context_window_label": "Bağlam Penceresi Boyutu",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "Modelin aldığı token sayısı. İstem geçmişi, en yeniler önce olmak üzere buna sığdırılır\n"
+        "ve yanıt için yer bırakılır. Sıfır değeri sınırsız tokena izin verir."
 }
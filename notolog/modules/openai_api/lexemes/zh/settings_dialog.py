@@ -34,8 +34,17 @@ lexemes = {
         "接收响应中的最大令牌数，如单词和标点，"
         "控制输出的长度。",
 
+    "module_openai_api_base_response_stream_checkbox": "流式传输响应",
+    "module_openai_api_base_response_stream_checkbox_accessible_description":
+        "在生成响应的同时显示响应，而不是在完成后才显示。",
+
     "module_openai_api_config_prompt_history_size_label": "提示历史大小",
     "module_openai_api_config_prompt_history_size_input_accessible_description":
         "控制系统保留的提示历史记录中的条目数量。\n"
-        "零值允许无限条目。"
+        "零值允许无限条目。",
+
+    "module_openai_api_config_context_window_label": "上下文窗口大小",
+    "module_openai_api_config_context_window_input_accessible_description":
+        "模型接收的令牌数量。提示历史按从新到旧的顺序适配其中，\n"
+        "并为响应留出空间。零值表示令牌数量不受限制。"
 }
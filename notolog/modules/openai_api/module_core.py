@@ -19,8 +19,8 @@ For detailed instructions and project information, please see the repository's R
 
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import QVBoxLayout, QWidget, QLabel, QLineEdit, QSizePolicy, QPlainTextEdit, QSpinBox, QSlider
-from PySide6.QtWidgets import QScrollArea
-from PySide6.QtNetwork import QNetworkRequest, QNetworkAccessManager, QNetworkReply
+from PySide6.QtWidgets import QScrollArea, QCheckBox
+from PySide6.QtNetwork import QNetworkRequest, QNetworkReply
 
 import os
 import json
@@ -30,11 +30,13 @@ import asyncio
 from asyncio import Task
 from qasync import asyncSlot
 
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Union
 
-from .api_helper import ApiHelper
+from .api_helper import ApiHelper, EventStreamParser
 from .prompt_manager import PromptManager
 
+from ..token_budget import TokenBudget
+
 from ..base_ai_core import BaseAiCore
 
 from .. import Settings
@@ -102,10 +104,15 @@ class ModuleCore(BaseAiCore):
         # Additional request params
         self.response_temperature = self.settings.module_openai_api_base_response_temperature
         self.response_max_tokens = self.settings.module_openai_api_base_response_max_tokens
+        self.response_stream = self.settings.module_openai_api_response_stream
 
         # API helper
         self.api_helper = ApiHelper()
 
+        # Reply of the request in progress, and whether its streamed response has started
+        self.reply = None  # type: Union[QNetworkReply, None]
+        self.stream_started = False
+
         # Just in case of debug of async events
         # asyncio.get_event_loop().set_debug(True)
 
@@ -116,9 +123,13 @@ class ModuleCore(BaseAiCore):
         Prompt manager for prompt management and to add / append messages to prompt history.
         Note: It may not be initiated if called out of the context, from settings for example.
         """
+        # The API's tokenizer is not available, the tokens are estimated
+        token_budget = TokenBudget(max_tokens=TokenBudget.get_prompt_budget(
+            self.settings.module_openai_api_context_window, self.settings.module_openai_api_base_response_max_tokens))
         self.prompt_manager = PromptManager(
             system_prompt=self.settings.module_openai_api_base_system_prompt,
             max_history_size=self.settings.module_openai_api_prompt_history_size,
+            token_budget=token_budget,
             parent=ai_dialog)
 
     def get_prompt_manager(self):
@@ -219,24 +230,106 @@ class ModuleCore(BaseAiCore):
         options = {'temperature': temperature_float}
         if self.response_max_tokens > 0:
             options.update({'max_tokens': self.response_max_tokens})
+        if self.response_stream:
+            options.update({'stream': True})
         # Request
-        request = self.api_helper.init_request(api_url=self.openai_api_url, api_key=self.openai_api_key)
+        request = self.api_helper.init_request(api_url=self.openai_api_url, api_key=self.openai_api_key,
+                                               stream=self.response_stream)
         # Request data
         request_data = self.api_helper.init_request_params(
             prompt_messages=user_prompt, api_model=self.openai_api_model, options=options)
 
-        # Set request data
-        manager = QNetworkAccessManager(self)
-        reply = manager.post(request, request_data)
+        # Set request data, the shared manager reuses the connections to the API
+        reply = self.api_helper.get_network_manager().post(request, request_data)
+        self.reply = reply
+        self.stream_started = False
+
+        parser = None
+        if self.response_stream:
+            # Output the response as its chunks arrive
+            parser = EventStreamParser()
+            reply.readyRead.connect(
+                lambda _reply=reply, _parser=parser: self.handle_stream(_reply, _parser, request_msg_id, response_msg_id))
 
         # Connect finished signal
         reply.finished.connect(
-            lambda _reply=reply: self.handle_response(_reply, request_msg_id, response_msg_id))
+            lambda _reply=reply, _parser=parser: self.handle_response(_reply, request_msg_id, response_msg_id,
+                                                                      parser=_parser))
         # Connect error signal
         reply.errorOccurred.connect(
-            lambda error, _reply=reply: self.handle_response(_reply, request_msg_id, response_msg_id, error))
+            lambda error, _reply=reply, _parser=parser: self.handle_response(_reply, request_msg_id, response_msg_id,
+                                                                             error, parser=_parser))
+
+    def handle_stream(self, reply: QNetworkReply, parser: EventStreamParser, request_msg_id, response_msg_id) -> None:
+        if not self.is_event_stream(reply):
+            # The whole body is left in the reply until it is finished, see handle_response()
+            return
+        for data in parser.feed(reply.readAll().data()):
+            self.process_stream_event(data, request_msg_id, response_msg_id)
+
+    @staticmethod
+    def is_event_stream(reply: QNetworkReply) -> bool:
+        """
+        Whether the response is streamed as the server-sent events. Some servers answer with a single JSON body even
+        if the stream is requested, the response without the content type is taken as the stream requested.
+        """
+        content_type = reply.header(QNetworkRequest.KnownHeaders.ContentTypeHeader)
+        if not isinstance(content_type, str) or not content_type:
+            return True
+        return content_type.split(';')[0].strip().lower() == 'text/event-stream'
+
+    def process_stream_event(self, data: str, request_msg_id, response_msg_id) -> None:
+        """
+        Process an event of the streamed response: a chunk with the response delta, the usage (the final chunk)
+        or an error.
+        """
+        if data == '[DONE]':
+            # End of the stream marker
+            return
+        try:
+            json_data = json.loads(data)
+        except json.JSONDecodeError as e:
+            self.logger.warning("Error decoding JSON chunk: %s" % e)
+            return
+        if not isinstance(json_data, dict):
+            return
 
-    def handle_response(self, reply: QNetworkReply, request_msg_id, response_msg_id, error_code=None):
+        model = json_data['model'] if json_data.get('model') else self.openai_api_model
+
+        if 'error' in json_data:
+            error = json_data['error']
+            message = error['message'] if isinstance(error, dict) and 'message' in error else str(error)
+            self.logger.warning(f"API error within the stream: {message}")
+            self.update_signal.emit(message, None, None, EnumMessageType.DEFAULT, EnumMessageStyle.ERROR)
+            return
+
+        choices = json_data['choices'] if 'choices' in json_data else None
+        if choices and isinstance(choices[0].get('delta'), dict) and choices[0]['delta'].get('content'):
+            if not self.stream_started:
+                self.stream_started = True
+                # The response has started, update the waiting status
+                if self.init_callback and callable(self.init_callback):
+                    self.init_callback()
+                # Reset the usage counted by the chunks
+                self.update_usage_signal.emit(model, 0, 0, 0, False)
+            # Emit update message signal, appended to the response message
+            self.update_signal.emit(choices[0]['delta']['content'], request_msg_id, response_msg_id,
+                                    EnumMessageType.RESPONSE, EnumMessageStyle.DEFAULT)
+            # Emit update usage signal (a chunk per token, until the usage comes with the final chunk)
+            self.update_usage_signal.emit(model, 0, 1, 1, True)
+
+        if json_data.get('usage'):
+            self.process_usage(json_data['usage'], model)
+
+    def process_stream_end(self, reply: QNetworkReply, parser: EventStreamParser, request_msg_id,
+                           response_msg_id) -> str:
+        # The rest of the body, if any, and the event left without the final empty line
+        for data in parser.feed(reply.readAll().data()) + parser.flush():
+            self.process_stream_event(data, request_msg_id, response_msg_id)
+        return self.lexemes.get('network_connection_error_empty', scope='common')
+
+    def handle_response(self, reply: QNetworkReply, request_msg_id, response_msg_id, error_code=None,
+                        parser: EventStreamParser = None):
         # Get received status code, say 200
         status_code = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
 
@@ -244,7 +337,13 @@ class ModuleCore(BaseAiCore):
 
         # Make sure there is no error
         if reply.error() == QNetworkReply.NetworkError.NoError:
-            result_message = self.process_response(reply, request_msg_id, response_msg_id, status_code)
+            if parser is not None and self.is_event_stream(reply):
+                result_message = self.process_stream_end(reply, parser, request_msg_id, response_msg_id)
+            else:
+                result_message = self.process_response(reply, request_msg_id, response_msg_id, status_code)
+        elif reply.error() == QNetworkReply.NetworkError.OperationCanceledError:
+            # The request is stopped, see stop_generator()
+            result_message = None
         elif reply.error() == QNetworkReply.NetworkError.HostNotFoundError:
             # The host was not found, indicating possible DNS issues or no internet connection
             result_message = self.lexemes.get('network_connection_error_connection_or_dns', scope='common')
@@ -264,7 +363,7 @@ class ModuleCore(BaseAiCore):
             result_message = self.lexemes.get('network_connection_error_generic_with_status_code', scope='common',
                                               status_code=status_code)
 
-        if error_code is not None:
+        if error_code is not None and reply.error() != QNetworkReply.NetworkError.OperationCanceledError:
             self.logger.warning(result_message)
             self.logger.warning(f"Failed to fetch information [{status_code}]: {reply.errorString()}")
             # Emit update message signal
@@ -282,6 +381,10 @@ class ModuleCore(BaseAiCore):
 
         reply.finished.disconnect()
         reply.errorOccurred.disconnect()
+        if parser is not None:
+            reply.readyRead.disconnect()
+        if self.reply is reply:
+            self.reply = None
         reply.deleteLater()  # Clean up the QNetworkReply object
 
     def process_response(self, reply: QNetworkReply, request_msg_id, response_msg_id, status_code) -> str:
@@ -320,26 +423,32 @@ class ModuleCore(BaseAiCore):
                 self.update_signal.emit(outputs, request_msg_id, response_msg_id,
                                         EnumMessageType.RESPONSE, EnumMessageStyle.DEFAULT)
             if 'usage' in json_data:
-                prompt_tokens, response_tokens, total_tokens = 0, 0, 0
-                try:
-                    # Ensure that all expected keys are present
-                    keys = ('prompt_tokens', 'completion_tokens', 'total_tokens')
-                    prompt_tokens, response_tokens, total_tokens = (json_data['usage'][key] for key in keys)
-                except KeyError as e:
-                    self.logger.warning(f"Missing key: {e}")
-                except ValueError as e:
-                    self.logger.warning(f"Value error: {e}")
-                finally:
-                    # Inference model
-                    model = json_data['model'] if 'model' in json_data else None
-                    # Emit update usage signal
-                    self.update_usage_signal.emit(model, prompt_tokens, response_tokens, total_tokens, False)
+                # Inference model
+                model = json_data['model'] if 'model' in json_data else None
+                self.process_usage(json_data['usage'], model)
         except json.JSONDecodeError as e:
             self.logger.warning("Error decoding JSON: %s" % e)
 
         return result_message
 
+    def process_usage(self, usage: dict, model: Union[str, None]) -> None:
+        prompt_tokens, response_tokens, total_tokens = 0, 0, 0
+        try:
+            # Ensure that all expected keys are present
+            keys = ('prompt_tokens', 'completion_tokens', 'total_tokens')
+            prompt_tokens, response_tokens, total_tokens = (usage[key] for key in keys)
+        except KeyError as e:
+            self.logger.warning(f"Missing key: {e}")
+        except ValueError as e:
+            self.logger.warning(f"Value error: {e}")
+        finally:
+            # Emit update usage signal
+            self.update_usage_signal.emit(model, prompt_tokens, response_tokens, total_tokens, False)
+
     async def stop_generator(self):
+        # Abort the request in progress, e.g. the streamed response
+        if self.reply is not None and self.reply.isRunning():
+            self.reply.abort()
         # Cancel async task(s)
         if self.generator_task and not self.generator_task.done():
             # Allow to finish callback, do not remove:
@@ -477,6 +586,15 @@ class ModuleCore(BaseAiCore):
              "callback": lambda obj: tab_openai_api_config_layout.addWidget(obj, alignment=Qt.AlignmentFlag.AlignTop),
              "accessible_description":
                  self.lexemes.get('module_openai_api_base_response_max_tokens_input_accessible_description')},
+            # Toggle to output the response as it is generated
+            {"type": QCheckBox,
+             # Lexeme key : Setting name
+             "name": "settings_dialog_module_openai_api_base_response_stream_checkbox:"
+                     "module_openai_api_response_stream",
+             "callback": lambda obj: tab_openai_api_config_layout.addWidget(obj, alignment=Qt.AlignmentFlag.AlignTop),
+             "text": self.lexemes.get('module_openai_api_base_response_stream_checkbox'),
+             "accessible_description":
+                 self.lexemes.get('module_openai_api_base_response_stream_checkbox_accessible_description')},
             # Horizontal line spacer
             {"type": HorizontalLineSpacer, "callback": lambda obj: tab_openai_api_config_layout.addWidget(obj)},
             # Label for the prompt history maximum capacity settings
@@ -495,6 +613,25 @@ class ModuleCore(BaseAiCore):
              "callback": lambda obj: tab_openai_api_config_layout.addWidget(obj, alignment=Qt.AlignmentFlag.AlignTop),
              "accessible_description":
                  self.lexemes.get('module_openai_api_config_prompt_history_size_input_accessible_description')},
+            # Vertical spacer
+            {"type": QWidget, "name": None, "size_policy": (QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Minimum),
+             "callback": lambda obj: tab_openai_api_config_layout.addWidget(obj)},
+            # Label for the context window setting
+            {"type": LabelWithHint, "kwargs": {
+                "tooltip": ('module_openai_api_config_context_window_input_accessible_description',
+                            self.lexemes.get('module_openai_api_config_context_window_input_accessible_description'))},
+             "name": "settings_dialog_module_openai_api_config_context_window_label",
+             "alignment": Qt.AlignmentFlag.AlignLeft,
+             "text": self.lexemes.get('module_openai_api_config_context_window_label'),
+             "callback": lambda obj: tab_openai_api_config_layout.addWidget(obj, alignment=Qt.AlignmentFlag.AlignTop)},
+            # Input field for the context window setting
+            {"type": QSpinBox, "props": {'setMinimum': 0, 'setMaximum': 2097152},  # Update the highest range
+             "size_policy": (QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred),
+             "name": "settings_dialog_module_openai_api_config_context_window:"
+                     "module_openai_api_context_window",
+             "callback": lambda obj: tab_openai_api_config_layout.addWidget(obj, alignment=Qt.AlignmentFlag.AlignTop),
+             "accessible_description":
+                 self.lexemes.get('module_openai_api_config_context_window_input_accessible_description')},
             # Spacer to align elements at the top of the layout
             {"type": QWidget, "name": None, "size_policy": (QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding),
              "callback": lambda obj: tab_openai_api_config_layout.addWidget(obj)},
@@ -510,7 +647,11 @@ class ModuleCore(BaseAiCore):
             extend_func("module_openai_api_base_system_prompt", str, "")
             extend_func("module_openai_api_base_response_temperature", int, 20)
             extend_func("module_openai_api_base_response_max_tokens", int, 0)
+            # Output the response as it is generated, as the server-sent events
+            extend_func("module_openai_api_response_stream", bool, True)
             extend_func("module_openai_api_prompt_history_size", int, 0)
+            # Tokens of the prompt and the response, 0 for no limit
+            extend_func("module_openai_api_context_window", int, 0)
 
     def settings_update_handler(self, data) -> None:
         """
@@ -535,6 +676,7 @@ class ModuleCore(BaseAiCore):
             'module_openai_api_base_system_prompt',
             'module_openai_api_base_response_temperature',
             'module_openai_api_base_response_max_tokens',
+            'module_openai_api_response_stream',
         ]
         if any(option in data for option in options) or 'ai_config_inference_module' in data:
             pass
@@ -0,0 +1,174 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Part of the base module.
+- Functionality: Fits the prompt history of the AI modules into a token budget, the newest turns first.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from collections import OrderedDict
+
+import re
+
+from typing import TYPE_CHECKING, Any, Callable, Union
+
+if TYPE_CHECKING:
+    from typing import List  # noqa: F401
+
+
+class TokenBudget:
+    """
+    Counts the tokens of the prompt parts, with the model's tokenizer once it is available or estimated otherwise,
+    and packs the history into the budget newest-first. The counts are cached by the text, so each turn is counted
+    once across the requests of the conversation.
+    """
+
+    # Tokens a chat template adds around each message, e.g. the role markers
+    MESSAGE_OVERHEAD = 4  # type: int
+    # Share of the context window left for the response if the response size is not limited
+    RESPONSE_SHARE = 0.25  # type: float
+    # Shortened turn is not worth keeping with less than that
+    MIN_SHORTENED_TOKENS = 64  # type: int
+    # Marker of the shortened turn's text
+    SHORTENED_MARKER = ' [...]'  # type: str
+    # Counts cached, by the text
+    CACHE_SIZE = 1024  # type: int
+
+    # Words, groups of up to 3 digits and the other symbols one by one, the same way BPE tokenizers split text
+    ESTIMATE_RE = re.compile(r'[^\W\d_]+|\d{1,3}|\S')
+
+    def __init__(self, count_tokens: Callable[[str], Union[int, None]] = None, max_tokens: int = 0,
+                 shorten_oversized: bool = True):
+        """
+        Args:
+            count_tokens (Callable[[str], Union[int, None]], optional): Tokenizer's count, None while unavailable
+            max_tokens (int, optional): Budget of the prompt, in tokens, 0 for no limit
+            shorten_oversized (bool, optional): Shorten the oldest turn that does not fit rather than drop it
+        """
+        self.count_tokens = count_tokens
+        self.max_tokens = max_tokens
+        self.shorten_oversized = shorten_oversized
+
+        self.cache = OrderedDict()  # type: OrderedDict[str, int]
+
+    @classmethod
+    def get_prompt_budget(cls, context_size: int, response_tokens: int = 0) -> int:
+        """
+        Budget of the prompt within the context window, leaving room for the response.
+
+        Args:
+            context_size (int): Context window size, in tokens, 0 if not limited
+            response_tokens (int, optional): Max response size, 0 to leave the share of the context window
+
+        Returns:
+            int: Budget of the prompt, 0 for no limit
+        """
+        if not context_size or context_size <= 0:
+            return 0
+        reserved = response_tokens if 0 < response_tokens < context_size else int(context_size * cls.RESPONSE_SHARE)
+        return max(context_size - reserved, cls.MIN_SHORTENED_TOKENS)
+
+    @classmethod
+    def estimate_tokens(cls, text: str) -> int:
+        """
+        Estimate of the tokens count without the tokenizer: a token per about 4 characters of a Latin word, 2 of
+        another alphabet and a token per an ideograph or a symbol.
+        """
+        tokens = 0
+        for match in cls.ESTIMATE_RE.finditer(text):
+            piece = match.group()
+            if piece.isascii():
+                tokens += -(-len(piece) // 4)
+            else:
+                wide = sum(1 for char in piece if ord(char) >= 0x2E80)
+                tokens += wide + -(-(len(piece) - wide) // 2)
+        return tokens
+
+    def count(self, text: str, cache: bool = True) -> int:
+        """
+        Tokens of the text. The estimate is not cached, so the count is taken again once the tokenizer is available.
+        """
+        if text in self.cache:
+            self.cache.move_to_end(text)
+            return self.cache[text]
+
+        tokens = self.count_tokens(text) if self.count_tokens else None
+        if tokens is None:
+            return self.estimate_tokens(text)
+
+        if cache:
+            self.cache[text] = tokens
+            if len(self.cache) > self.CACHE_SIZE:
+                self.cache.popitem(last=False)
+        return tokens
+
+    def pack(self, items: list, get_text: Callable[[Any], str], reserved: int = 0,
+             shorten: Callable[[Any, int], Any] = None) -> list:
+        """
+        Items that fit the budget, the newest first; the newest one, e.g. the request, is kept regardless.
+        The oldest item that does not fit is shortened if allowed and the budget left is enough, the older ones
+        are dropped.
+
+        Args:
+            items (list): Items of the history, from the oldest to the newest
+            get_text (Callable[[Any], str]): Text of the item to count
+            reserved (int, optional): Tokens of the budget taken already, e.g. by the system prompt
+            shorten (Callable[[Any, int], Any], optional): Copy of the item shortened to the tokens given, or None
+
+        Returns:
+            list: Items kept, from the oldest to the newest
+        """
+        if not self.max_tokens or not items:
+            return list(items)
+
+        left = self.max_tokens - reserved
+        packed = []  # type: List[Any]
+        for index in range(len(items) - 1, -1, -1):
+            item = items[index]
+            tokens = self.count(get_text(item)) + self.MESSAGE_OVERHEAD
+            if tokens <= left or not packed:
+                packed.append(item)
+                left -= tokens
+                continue
+            if self.shorten_oversized and shorten is not None and left >= self.MIN_SHORTENED_TOKENS:
+                shortened = shorten(item, left - self.MESSAGE_OVERHEAD)
+                if (shortened is not None
+                        and self.count(get_text(shortened), cache=False) + self.MESSAGE_OVERHEAD <= left):
+                    packed.append(shortened)
+            break
+
+        packed.reverse()
+        return packed
+
+    def shorten_text(self, text: str, max_tokens: int) -> str:
+        """
+        Head of the text that fits the tokens given, cut at a word boundary and marked as shortened.
+
+        Returns:
+            str: Shortened text, empty if even a short head does not fit
+        """
+        tokens = self.count(text)
+        if tokens <= max_tokens:
+            return text
+        length = len(text) * max_tokens // max(tokens, 1)
+        # The ratio of the characters to the tokens varies along the text, so the head is narrowed down a few times
+        for _attempt in range(4):
+            head = text[:length]
+            if ' ' in head.strip():
+                head = head.rstrip().rsplit(None, 1)[0]
+            shortened = head.rstrip() + self.SHORTENED_MARKER
+            if self.count(shortened, cache=False) <= max_tokens:
+                return shortened
+            length = length * 4 // 5
+        return ''
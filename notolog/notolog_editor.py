@@ -41,6 +41,10 @@ from .view_processor import ViewProcessor
 from .view_decorator import ViewDecorator
 from .image_downloader import ImageDownloader
 from .async_highlighter import AsyncHighlighter
+from .render_pipeline import RenderPipeline
+from .render_cache import RenderCache
+from .save_pipeline import SavePipeline
+from .workspace_index import WorkspaceIndex
 from .file_history_manager import FileHistoryManager
 
 # UI
@@ -52,10 +56,6 @@ from .ui.statusbar import StatusBar
 from .ui.line_numbers import LineNumbers
 from .ui.common_dialog import CommonDialog
 from .ui.rename_file_dialog import RenameFileDialog
-from .ui.color_picker_dialog import ColorPickerDialog
-from .ui.settings_dialog import SettingsDialog
-from .ui.ai_assistant.ai_assistant import AIAssistant
-from .ui.about_popup import AboutPopup
 from .ui.file_tree_context_menu import FileTreeContextMenu
 from .ui.message_box import MessageBox
 from .ui.default_path_dialog import DefaultPathDialog
@@ -63,20 +63,19 @@ from .ui.default_path_dialog import DefaultPathDialog
 # Highlight
 from .highlight.md_highlighter import MdHighlighter
 from .highlight.view_highlighter import ViewHighlighter
+from .highlight.lazy_highlighter import LazyHighlighter
 
 # Encrypt
 from .encrypt.enc_helper import EncHelper
+from .encrypt.key_derivation import KeyDerivation
 from .encrypt.enc_password import EncPassword
-from .encrypt.enc_new_password_dialog import EncNewPasswordDialog
-from .encrypt.enc_password_dialog import EncPasswordDialog
-from .encrypt.enc_password_reset_dialog import EncPasswordResetDialog
 from cryptography.fernet import InvalidToken, InvalidSignature
 
 # Helpers
 from .helpers.theme_helper import ThemeHelper
 from .helpers.clipboard_helper import ClipboardHelper
-from .helpers.update_helper import UpdateHelper
 from .helpers import file_helper
+from .helpers.import_helper import LazyImport
 
 # Lexemes
 from .lexemes.lexemes import Lexemes
@@ -84,39 +83,49 @@ from .lexemes.lexemes import Lexemes
 # Editor state
 from .editor_state import EditorState, Mode, Source, Encryption
 
-from PySide6.QtCore import Slot, Qt, QDir, QPoint, QTimer, QSize, QUrl
+from PySide6.QtCore import Slot, Qt, QDir, QPoint, QTimer, QSize, QUrl, QEventLoop
 from PySide6.QtCore import QRegularExpression, QItemSelectionModel, QFileSystemWatcher
 from PySide6.QtGui import QGuiApplication, QIcon, QAction, QPalette, QShortcut, QFont, QKeySequence
 from PySide6.QtGui import QTextDocument, QTextCursor, QTextBlock, QDesktopServices, QPixmap, QPixmapCache
 from PySide6.QtWidgets import QWidget, QMainWindow, QVBoxLayout, QSplitter, QListView, QTextBrowser
 from PySide6.QtWidgets import QPlainTextEdit, QSizePolicy, QDialog, QStyle, QFileSystemModel, QFileDialog
+from PySide6.QtWidgets import QProgressDialog
 
 from qasync import asyncClose
 import asyncio
 
-# Markdown library
-import markdown
-# Markdown library extensions
-from markdown.extensions.codehilite import CodeHiliteExtension
-# Custom markdown extension to process element tree
-from .etree_extension import ElementTreeExtension
-
-# Emojis support
-import emoji
-
 import os
+import copy
 import time
-from typing import TYPE_CHECKING, Union, Optional, Callable, List, Dict, Any
+from typing import TYPE_CHECKING, Union, Optional, Callable, Iterable, List, Dict, Any
 
 import logging
 
 if TYPE_CHECKING:
+    import markdown  # noqa: F401
     from PySide6.QtGui import QScreen  # noqa: F401
     from PySide6.QtWidgets import QStatusBar, QToolBar, QMenu  # noqa: F401
     from PySide6.QtGui import QTextBlockUserData  # noqa: F401
     from .text_block_data import TextBlockData  # noqa: F401
 
 
+# The dialogs, the batch encryption and the libraries not needed to show the window are imported upon their first use
+ColorPickerDialog = LazyImport('.ui.color_picker_dialog', 'ColorPickerDialog', package=__package__)
+SettingsDialog = LazyImport('.ui.settings_dialog', 'SettingsDialog', package=__package__)
+AIAssistant = LazyImport('.ui.ai_assistant.ai_assistant', 'AIAssistant', package=__package__)
+AboutPopup = LazyImport('.ui.about_popup', 'AboutPopup', package=__package__)
+WorkspaceSearchDialog = LazyImport('.ui.workspace_search_dialog', 'WorkspaceSearchDialog', package=__package__)
+EncNewPasswordDialog = LazyImport('.encrypt.enc_new_password_dialog', 'EncNewPasswordDialog', package=__package__)
+EncPasswordDialog = LazyImport('.encrypt.enc_password_dialog', 'EncPasswordDialog', package=__package__)
+EncPasswordResetDialog = LazyImport('.encrypt.enc_password_reset_dialog', 'EncPasswordResetDialog',
+                                    package=__package__)
+BatchCrypt = LazyImport('.encrypt.batch_crypt', 'BatchCrypt', package=__package__)
+BatchCryptRunner = LazyImport('.encrypt.batch_crypt', 'BatchCryptRunner', package=__package__)
+UpdateHelper = LazyImport('.helpers.update_helper', 'UpdateHelper', package=__package__)
+# Emojis support
+emoji = LazyImport('emoji')
+
+
 class NotologEditor(QMainWindow):
     """
     Main UI class to set up the application's UI and to process any user actions.
@@ -127,6 +136,9 @@ class NotologEditor(QMainWindow):
     AREA_WEIGHT_EDIT = 4
     AREA_WEIGHT_VIEW = 4
 
+    # Max number of the notes nearby to read the headers of, to prefetch the keys of the encrypted ones
+    MAX_PREFETCH_PROBES = 64
+
     # Template to apply to the view mode.
     HTML_TPL = """
         <!DOCTYPE html>
@@ -144,24 +156,8 @@ class NotologEditor(QMainWindow):
         </html>
         """
 
-    """
-    Some extensions like `codehilite` extension will be included later.
-
-    Extra contains:
-    * Abbreviations
-    * Attribute Lists
-    * Definition Lists
-    * Fenced Code Blocks
-    * Footnotes
-    * Tables
-    * Markdown in HTML
-
-    More info https://python-markdown.github.io/extensions/extra/
-    """
-    md_extensions = [
-        'markdown.extensions.extra',  # Or 'extra'
-        'markdown.extensions.toc',  # 'toc' stands for 'Table of Contents', provides anchors for header tags
-    ]
+    # Markdown extensions, the headless export uses the same ones
+    md_extensions = RenderPipeline.MD_EXTENSIONS
 
     def __init__(self, parent=None, **kwargs):
         super(NotologEditor, self).__init__(parent=parent)
@@ -228,6 +224,11 @@ class NotologEditor(QMainWindow):
         It could be a few of them as file specific salt may differ.
         """
         self.encrypt_helpers = {}
+        # Keys are derived from the password in background and kept for a while
+        self.key_derivation = KeyDerivation(parent=self)
+        self.key_derivation.busy_changed.connect(self.key_derivation_busy_handler)
+        # The helpers keep the keys, they are dropped along with the keys wiped
+        self.key_derivation.keys_wiped.connect(self.encrypt_helpers.clear)
         # Encryption password object for this session
         self.enc_password = None  # type: Union[EncPassword, None]
         # The number of how many times a password dialog was shown before success
@@ -256,10 +257,22 @@ class NotologEditor(QMainWindow):
         # Highlighters
         self.md_highlighter = None  # type: Union[MdHighlighter, None]
         self.view_highlighter = None  # type: Union[ViewHighlighter, None]
+        # Viewport-first highlighting of the large notes in EDIT mode
+        self.lazy_highlighter = None  # type: Union[LazyHighlighter, None]
 
         # Async highlighter
         self.async_highlighter = AsyncHighlighter(callback=lambda is_full: self.rehighlight_editor(is_full))
 
+        # Background Markdown to HTML rendering for VIEW mode
+        self.render_pipeline = RenderPipeline(md_factory=self.create_md, md_config=self.md_extensions,
+                                              cache=RenderCache(disk_dir=self.get_render_cache_dir()), parent=self)
+        self.render_pipeline.busy_changed.connect(self.render_busy_handler)
+        # The html of the encrypted notes is not kept once the keys are wiped
+        self.key_derivation.keys_wiped.connect(self.render_pipeline.cache.clear_private)
+
+        # Background saving of the notes, used upon auto-saving
+        self.save_pipeline = SavePipeline(parent=self)
+
         # Resource Downloader
         self.resource_downloader = None  # type: Union[ImageDownloader, None]
 
@@ -272,6 +285,10 @@ class NotologEditor(QMainWindow):
 
         self.supported_file_extensions = ['md', 'txt', 'htm', 'html', 'enc']
 
+        # Full-text search index of the notes within the default folder, encrypted notes are not indexed
+        self.workspace_index = WorkspaceIndex(
+            extensions=[ext for ext in self.supported_file_extensions if ext != 'enc'], parent=self)
+
         # Line numbers within the document
         self.line_numbers = None  # type: Union[LineNumbers, None]
 
@@ -293,6 +310,7 @@ class NotologEditor(QMainWindow):
         # Dialogs
         self.ai_assistant = None  # type: Union[QDialog, None]
         self.color_picker = None  # type: Union[QDialog, None]
+        self.workspace_search = None  # type: Union[WorkspaceSearchDialog, None]
 
         self.loop = asyncio.get_event_loop()
 
@@ -342,6 +360,16 @@ class NotologEditor(QMainWindow):
         )
         shortcut_search.activated.connect(self.search_text)
 
+        # Ctrl+Shift+F search across the notes
+        shortcut_search_notes = QShortcut(
+            QKeySequence(Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.ShiftModifier | Qt.Key.Key_F),  # noqa
+            self
+        )
+        shortcut_search_notes.activated.connect(self.action_search_notes)
+
+        # Index the notes once the event loop is running, to do it in background
+        QTimer.singleShot(0, self.update_workspace_index)
+
     def init_font(self):
         # Use default ratio
         font_size_ratio = 1.0
@@ -452,6 +480,9 @@ class NotologEditor(QMainWindow):
 
             # Refresh syntax highlighting with the new theme
             self.md_highlighter = MdHighlighter(document=edit_widget.document())
+            if self.lazy_highlighter is not None:
+                self.lazy_highlighter.stop()
+            self.lazy_highlighter = LazyHighlighter(self.md_highlighter, edit_widget)
             self.view_highlighter = ViewHighlighter(document=view_doc)
 
             # Reload active file to apply the updated styles
@@ -467,6 +498,14 @@ class NotologEditor(QMainWindow):
                 and self.get_mode() == Mode.VIEW):
             self.reload_active_file()
 
+        if 'default_path' in data:
+            # Index the notes within the new default folder
+            self.update_workspace_index()
+
+        if 'viewer_render_cache_disk' in data:
+            # Enable or disable the on-disk tier of the render cache
+            self.render_pipeline.cache.set_disk_dir(self.get_render_cache_dir())
+
         if 'show_global_cursor_position' in data:
             # Refresh the status bar to reflect cursor position updates
             self.estate.refresh()
@@ -561,9 +600,76 @@ class NotologEditor(QMainWindow):
         Salt could be empty or file dependant.
         """
         self.enc_password = enc_password
-        encrypt_helper = EncHelper(enc_password=self.enc_password, salt=salt, iterations=iterations)
+        key = None
+        if enc_password is not None and enc_password.password and salt is not None:
+            if iterations is None:
+                iterations = EncHelper.get_default_iterations()
+            key = self.derive_enc_key(enc_password.password, salt, iterations)
+        encrypt_helper = EncHelper(enc_password=self.enc_password, salt=salt, iterations=iterations, key=key)
         return self.set_encrypt_helper(salt, encrypt_helper)
 
+    def derive_enc_key(self, password: str, salt: str, iterations: int) -> bytes:
+        """
+        Derive the encryption key on the worker thread, the window is kept responsive meanwhile.
+        The keys derived are cached, so the same password, salt and iterations are not derived again.
+        """
+        future = self.key_derivation.derive(password.encode(), salt.encode(), iterations)
+        if not future.done():
+            # The file to load is set as the current one already, do not auto-save the previous content into it
+            is_save_timer_active = hasattr(self, 'save_timer') and self.save_timer.isActive()
+            if is_save_timer_active:
+                self.toggle_save_timer(state=False)
+            self.setCursor(Qt.CursorShape.WaitCursor)
+            # Wait for the key processing the events, except the user input ones
+            wait_loop = QEventLoop(self)
+            self.key_derivation.key_derived.connect(wait_loop.quit)
+            while not future.done():
+                wait_loop.exec(QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
+            self.key_derivation.key_derived.disconnect(wait_loop.quit)
+            self.setCursor(Qt.CursorShape.ArrowCursor)
+            if is_save_timer_active:
+                self.toggle_save_timer(state=True)
+        return future.result()
+
+    def prefetch_enc_keys(self, dir_path: str) -> None:
+        """
+        Derive the keys of the encrypted notes within the directory in background, with the current password.
+        The directory is scanned in background as well, only the headers of the notes are read.
+        """
+        if self.enc_password is None or not self.enc_password.password:
+            return
+        self.key_derivation.prefetch_scan(self.enc_password.password.encode(),
+                                          lambda: self.get_enc_key_params(dir_path))
+
+    def get_enc_key_params(self, dir_path: str) -> set:
+        """
+        Get the salts and iterations of the encrypted notes within the directory, probing up to the max number of
+        the notes, see prefetch_enc_keys(). Runs on the prefetch worker thread.
+        """
+        params = set()
+        probes = 0
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if len(params) >= self.key_derivation.MAX_PREFETCH or probes >= self.MAX_PREFETCH_PROBES:
+                        break
+                    if not entry.is_file() or not entry.name.endswith(tuple(self.supported_file_extensions)):
+                        continue
+                    probes += 1
+                    file_header = FileHeader().probe(entry.path)
+                    if file_header.is_file_encrypted() and file_header.get_enc_param('slt'):
+                        params.add((file_header.get_enc_param('slt').encode(),
+                                    int(file_header.get_enc_param('itr') or EncHelper.get_default_iterations())))
+        except OSError as e:
+            self.logger.debug(f"Cannot list the directory '{dir_path}': {e}")
+        return params
+
+    @Slot(bool)
+    def key_derivation_busy_handler(self, busy: bool) -> None:
+        # Show the key derivation progress in the statusbar
+        if hasattr(self, 'statusbar') and self.statusbar is not None:
+            self.statusbar['key_progress_label'].setVisible(busy)
+
     def reset_encrypt_helper(self, callback: Optional[Callable[..., Any]] = None):
         """
         Reset if a file encrypted with another key or when ever it needed
@@ -610,12 +716,15 @@ class NotologEditor(QMainWindow):
     def init_md(self) -> None:
         """
         Init Markdown object and set it to variable.
-        Add custom element tree extensions if needed.
-        Add `codehilite` to make actual highlighter work (CodeHiliteExtension() or ['codehilite'])
         """
-        extensions = self.md_extensions + [ElementTreeExtension(), CodeHiliteExtension(linenums=True)]
+        self.md = self.create_md()
+
+    def create_md(self) -> 'markdown.Markdown':
+        """
+        Create Markdown object, the render pipeline creates its own one as well.
+        """
         # Init markdown object with the selected extensions
-        self.md = markdown.Markdown(extensions=extensions)
+        return RenderPipeline.create_md(self.md_extensions)
 
     def convert_markdown_to_html(self, md_content: str) -> str:
         """
@@ -629,6 +738,8 @@ class NotologEditor(QMainWindow):
             md_content = self.convert_emojis(text_content=md_content)
         # Convert markdown to html
         html_content = self.md.convert(md_content)
+        # Reset the extensions state, e.g. the footnotes are kept across the notes otherwise
+        self.md.reset()
         # Converted html data
         return html_content
 
@@ -924,16 +1035,27 @@ class NotologEditor(QMainWindow):
         watch_path = QDir.currentPath()  # Consider using self.get_tree_active_dir() for dynamic tracking
         self.file_watcher.addPath(watch_path)  # Watch for changes in the selected directory
         self.file_watcher.directoryChanged.connect(self.on_dir_changed)
+        self.file_watcher.fileChanged.connect(self.on_file_changed)
 
         return file_tree  # Return the main navigation panel
 
     def on_dir_changed(self, path) -> None:
         """
-        Method reserved for future use.
+        Update the notes index upon a file is added, removed or renamed within the directory.
         @param path: QString path from the signal, more info https://doc.qt.io/qt-6/qfilesystemwatcher.html#signals
         @return: None
         """
         self.logger.debug('Dir changed "%s"' % path)
+        self.workspace_index.update_path(path, callback=self.watch_workspace_dirs)
+
+    def on_file_changed(self, path) -> None:
+        """
+        Update the notes index upon a watched file is changed, e.g. the opened one is saved.
+        @param path: QString path from the signal
+        @return: None
+        """
+        self.logger.debug('File changed "%s"' % path)
+        self.workspace_index.update_path(path)
 
     def on_tree_filter_text_changed(self, text: str) -> None:
         """
@@ -1483,6 +1605,7 @@ class NotologEditor(QMainWindow):
 
         # Set up markdown highlighter
         self.md_highlighter = MdHighlighter(document=edit_widget.document())
+        self.lazy_highlighter = LazyHighlighter(self.md_highlighter, edit_widget)
 
         # Restore widget's signals
         edit_widget.blockSignals(was_blocked)
@@ -1748,6 +1871,11 @@ class NotologEditor(QMainWindow):
         # Await tasks to complete
         await cleanup_tasks()
 
+        # Drop the background render and the re-highlighting scheduled if any
+        self.render_pipeline.shutdown()
+        self.workspace_index.shutdown()
+        self.async_highlighter.cancel()
+
         if self.get_mode() == Mode.EDIT:
             # Save any unsaved changes
             if self.save_active_file(clear_after=False) is False:
@@ -1768,6 +1896,11 @@ class NotologEditor(QMainWindow):
         self.settings.mode = self.get_mode().value
         self.settings.source = self.get_source().value
 
+        # Finish the background save in progress, if any
+        self.save_pipeline.shutdown()
+        # Wipe the keys derived
+        self.key_derivation.shutdown()
+
         event.accept()
 
     def rehighlight_editor(self, full_rehighlight: bool = False) -> None:
@@ -1781,8 +1914,12 @@ class NotologEditor(QMainWindow):
         # Prevent QTextEdit's on_text_changed() method invocation by blocking signals
         was_blocked = edit_widget.blockSignals(True)
         self.logger.debug(f'Re-highlighting the text > signals was blocked "{was_blocked}"')
+        # Re-highlight the changed blocks only, the cost depends on the edit size rather than the document size;
+        # the visible ones first, the rest of a large change is re-highlighted in the background
+        if self.md_highlighter.engine is not None:
+            self.lazy_highlighter.process()
         # Re-highlight the whole document or a particular block
-        if full_rehighlight:
+        elif full_rehighlight:
             self.md_highlighter.rehighlight()
         else:
             block = edit_widget.get_current_block()
@@ -1825,13 +1962,11 @@ class NotologEditor(QMainWindow):
         if not changed:
             return
 
-        # Asynchronous highlighting: Schedules a task to re-highlight the entire document.
-        # Faster rendering, but code block processing is queued, and results may appear later.
+        # Asynchronous highlighting: Schedules a task to re-highlight the changed blocks (see IncrementalEngine),
+        # coalesced with the one of the text change. The engine carries the cross-block state changes, e.g. of the
+        # code blocks, over to the following blocks, so there is no need to re-highlight the whole document.
         if hasattr(self, 'async_highlighter') and self.async_highlighter:
-            self.async_highlighter.rehighlight_in_queue(full_rehighlight=True)
-
-        # Synchronous highlighting: Direct call for instant results with processed code blocks, but slower overall.
-        # self.rehighlight_editor(full_rehighlight=True)
+            self.async_highlighter.rehighlight_in_queue(full_rehighlight=False)
 
     def on_block_count_changed(self, new_block_count: int) -> None:
         """
@@ -2417,9 +2552,11 @@ class NotologEditor(QMainWindow):
             self.logger.warning(f"Permission denied when accessing the file {file_path}")
             MessageBox(text=self.lexemes.get('open_file_permission_error'), icon_type=2, parent=self)
 
-    def action_save_file(self, file_path: str = None) -> None:
+    def action_save_file(self, file_path: str = None, background: bool = False) -> None:
         """
         Action: Save file.
+        @param file_path: File path, the currently open file if not set
+        @param background: Save in background, e.g. upon auto-saving
         """
         # Choose currently open file if another one is not explicitly passed
         if file_path is None:
@@ -2430,7 +2567,7 @@ class NotologEditor(QMainWindow):
             return
 
         # Save any unsaved changes, keep text edit field's content
-        self.save_active_file(clear_after=False)
+        self.save_active_file(clear_after=False, background=background)
 
     def action_save_as_file(self) -> None:
         """
@@ -2499,10 +2636,10 @@ class NotologEditor(QMainWindow):
         # Show source according to which self.source set
         if self.get_source() == Source.MARKDOWN:
             # Show header data and source content.
-            source_data = '%s\n%s' % (self.header, self.content)
+            source_data = '%s\n%s' % (self.header, self.get_content())
         else:
             # Convert current content to html to show html source.
-            source_data = self.convert_markdown_to_html(self.content)
+            source_data = self.convert_markdown_to_html(self.get_content())
 
         """
         Do not use `view_widget.setPlainText(html_data)` as it inherit styles from the prev view.
@@ -2585,10 +2722,8 @@ class NotologEditor(QMainWindow):
         file_iterations = int(file_header.get_enc_param('itr'))
 
         # Encrypt
-        encrypted_file_body_b = (self.get_encrypt_helper(
-            salt=file_salt, new_password=True, iterations=file_iterations).encrypt_data(file_body.encode("utf-8")))
-        if encrypted_file_body_b:
-            encrypted_file_body = encrypted_file_body_b.decode("utf-8")
+        encrypt_helper = self.get_encrypt_helper(salt=file_salt, new_password=True, iterations=file_iterations)
+        if encrypt_helper.is_password_valid():
             # Check and adjust header params if needed
             if (not file_header.get_enc_param('hint')
                     and self.enc_password
@@ -2597,9 +2732,9 @@ class NotologEditor(QMainWindow):
                     file_header.set_enc_param('hint', self.enc_password.hint)
                 except Exception as e:
                     self.logger.error('File header cannot be updated "%s"' % e)
-            # Pack file header and file body
-            content = file_header.pack(encrypted_file_body)
-            result = self.save_file_content(to_file_path, content)
+            # Pack file header and the encrypted file body
+            content = file_header.pack_encrypted(file_body or '', encrypt_helper)
+            result = content is not None and self.save_file_content(to_file_path, content)
         else:
             result = False
 
@@ -2662,7 +2797,7 @@ class NotologEditor(QMainWindow):
             # This method will be called again with new params within "callback" set above
             return
 
-        file_header, encrypted_file_body = FileHeader().load_file(from_file_path)
+        file_header = FileHeader().probe(from_file_path)
         # Check file header contains salt and the other params. May update migration params.
         # Only if the file is encrypted!
         try:
@@ -2674,10 +2809,9 @@ class NotologEditor(QMainWindow):
         file_iterations = int(file_header.get_enc_param('itr'))
 
         try:
-            decrypted_file_body = self.get_encrypt_helper(
-                salt=file_salt, iterations=file_iterations).decrypt_data(encrypted_file_body.encode("utf-8"))
-            if decrypted_file_body:
-                file_body = decrypted_file_body.decode("utf-8")
+            file_body = file_header.load_encrypted(
+                from_file_path, self.get_encrypt_helper(salt=file_salt, iterations=file_iterations))
+            if file_body:
                 # Write decrypted file
                 new_header = FileHeader().get_new()
                 content = new_header.pack(file_body)
@@ -2703,6 +2837,99 @@ class NotologEditor(QMainWindow):
         if callable(callback):
             callback()
 
+    def action_batch_crypt(self, operation: str, dir_path: str) -> None:
+        """
+        Action: Encrypt, decrypt or change the password of the notes within the folder and its sub-folders.
+        @param operation: One of the BatchCrypt operations
+        @param dir_path: Folder with the notes
+        @return: None
+        """
+
+        self.logger.debug('Batch %s of the notes within "%s"' % (operation, dir_path))
+        # Save active file data if needed
+        self.save_active_file(clear_after=False)
+
+        batch_crypt = BatchCrypt(operation)
+        files = batch_crypt.collect([dir_path], recursive=True)
+        if not files:
+            MessageBox(text=self.lexemes.get('dialog_batch_crypt_no_notes'), icon_type=2, parent=self)
+            return
+
+        self.common_dialog(
+            self.lexemes.get('dialog_batch_crypt_title'),
+            self.lexemes.get(name='dialog_batch_crypt_text', count=len(files)),
+            callback=lambda dialog_callback: self.batch_crypt_dialog_callback(dialog_callback, batch_crypt, files))
+
+    def batch_crypt_dialog_callback(self, callback: Callable[..., Any], batch_crypt: BatchCrypt,
+                                    files: List[tuple]) -> None:
+        """
+        The callback method passed to the batch dialog, asks for the passwords and starts the batch.
+        """
+
+        if callable(callback):
+            callback()
+
+        # The password dialog counts the attempts to open the encrypted file, this one is not
+        dialog_cnt = self.get_enc_password_dialog_cnt()
+        if batch_crypt.operation in (BatchCrypt.DECRYPT, BatchCrypt.REKEY):
+            enc_password = self.enc_password_dialog()
+            self.enc_password_dialog_cnt = dialog_cnt
+            if enc_password is None or not enc_password.password:
+                return
+            batch_crypt.password = enc_password.password
+        if batch_crypt.operation in (BatchCrypt.ENCRYPT, BatchCrypt.REKEY):
+            new_enc_password = self.enc_new_password_dialog()
+            if new_enc_password is None or not new_enc_password.password:
+                return
+            batch_crypt.new_password = new_enc_password.password
+            # The hints of the notes are kept unless a new one is set
+            batch_crypt.hint = new_enc_password.hint or None
+            batch_crypt.iterations = EncHelper.get_default_iterations()
+
+        # The note open must not be saved over the one processed
+        is_save_timer_active = hasattr(self, 'save_timer') and self.save_timer.isActive()
+        if is_save_timer_active:
+            self.toggle_save_timer(state=False)
+
+        progress_dialog = QProgressDialog(self.lexemes.get('dialog_batch_crypt_progress'),
+                                          self.lexemes.get('dialog_batch_crypt_cancel'), 0, len(files), self)
+        progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        progress_dialog.setMinimumDuration(0)
+        progress_dialog.setAutoClose(False)
+        progress_dialog.setValue(0)
+
+        runner = BatchCryptRunner(batch_crypt, parent=self)
+        runner.progress_changed.connect(
+            lambda done, total: (progress_dialog.setMaximum(total), progress_dialog.setValue(done)))
+        progress_dialog.canceled.connect(runner.cancel)
+        runner.finished.connect(lambda result: self.batch_crypt_finished(
+            result, batch_crypt, is_save_timer_active, progress_dialog, runner))
+        runner.start(files)
+
+    def batch_crypt_finished(self, result: Dict[str, Any], batch_crypt: BatchCrypt, is_save_timer_active: bool,
+                             progress_dialog: QProgressDialog, runner: BatchCryptRunner) -> None:
+        progress_dialog.canceled.disconnect(runner.cancel)
+        progress_dialog.close()
+        progress_dialog.deleteLater()
+        runner.deleteLater()
+
+        current_file_path = self.get_current_file_path()
+        if batch_crypt.operation == BatchCrypt.REKEY and current_file_path in result['processed']:
+            # The note open is encrypted with the new password now
+            enc_password = EncPassword()
+            enc_password.password = batch_crypt.new_password
+            enc_password.hint = batch_crypt.hint
+            self.reset_encrypt_helper()
+            self.enc_password = enc_password
+            self.load_file(current_file_path)
+
+        if is_save_timer_active:
+            self.toggle_save_timer(state=True)
+
+        MessageBox(text=self.lexemes.get(name='dialog_batch_crypt_result', processed=len(result['processed']),
+                                         failed=len(result['failed']), skipped=len(result['skipped'])),
+                   icon_type=2 if result['failed'] else 1, parent=self)
+
     def action_text_bold(self) -> None:
         """
         Action: Text format BOLD.
@@ -3047,11 +3274,15 @@ class NotologEditor(QMainWindow):
         # Store current state
         self.content = content
         self.header = header
+        # The content rendered in background, if any, is outdated now
+        self.render_pipeline.cancel()
         # Update the content size label in the statusbar
         if hasattr(self, 'statusbar'):
             self.statusbar['data_size_label'].setText("%s" % file_helper.size_f(len(self.content)))
         if self.get_mode() == Mode.EDIT:
             self.load_content_edit(self.header, self.content)
+            # The document is the only copy of the content in EDIT mode, see get_content()
+            self.content = None
             # Restore cursor applied later upon document 'content_set' event
         elif self.get_mode() == Mode.VIEW:
             self.load_content_html(self.header, self.content)
@@ -3064,6 +3295,15 @@ class NotologEditor(QMainWindow):
         # Set cursor back
         self.setCursor(Qt.CursorShape.ArrowCursor)
 
+    def get_content(self) -> str:
+        """
+        Getter: Get the current content. In EDIT mode it is kept by the document only, unless the edit field is
+        cleared after saving.
+        """
+        if self.content is None:
+            return self.get_edit_widget().toPlainText()
+        return self.content
+
     def load_file(self, file_path: str) -> bool:  # noqa: C901 - consider simplifying this method
         """
         Helper: Load content of the file.
@@ -3083,9 +3323,14 @@ class NotologEditor(QMainWindow):
             self.file_model.highlight(self.file_model.index(current_file_path), os.path.basename(current_file_path),
                                       color=in_transit_color)
 
-        # Check is file encrypted
-        if self.is_file_encrypted(file_path):
+        # The header tells whether the file is encrypted, the encrypted content is read upon decryption
+        file_header = FileHeader().probe(file_path)
+        file_body = None
+        if not file_header.is_file_encrypted():
             file_header, file_body = FileHeader().load_file(file_path)
+
+        # Check is file encrypted
+        if file_header.is_file_encrypted():
             # Check file header contains salt and the other params. May update migration params.
             # Only if the file is encrypted!
             try:
@@ -3097,13 +3342,12 @@ class NotologEditor(QMainWindow):
             file_iterations = int(file_header.get_enc_param('itr'))
 
             try:
-                decrypted_data = (
-                    self.get_encrypt_helper(
-                        salt=file_salt, hint=file_header.get_enc_param('hint'),
-                        iterations=file_iterations).decrypt_data(file_body.encode("utf-8")))
+                decrypted_data = file_header.load_encrypted(
+                    file_path, self.get_encrypt_helper(
+                        salt=file_salt, hint=file_header.get_enc_param('hint'), iterations=file_iterations))
                 # File content can be an empty string
-                if decrypted_data is not None and type(decrypted_data) is bytes:
-                    file_body = decrypted_data.decode("utf-8")
+                if decrypted_data is not None:
+                    file_body = decrypted_data
                     self.set_encryption(Encryption.ENCRYPTED)
                 else:
                     self.logger.info('Cannot decrypt file "%s"' % file_path)
@@ -3113,6 +3357,8 @@ class NotologEditor(QMainWindow):
                     raise InvalidToken
                 # Reset encryption password dialogue count
                 self.enc_password_dialog_cnt = 0
+                # The notes nearby are likely to be opened next
+                self.prefetch_enc_keys(os.path.dirname(file_path))
             except (InvalidToken, InvalidSignature, TypeError):
                 self.logger.debug('Cannot apply encryption password!')
                 # Setup file's cursor position to a very beginning
@@ -3212,10 +3458,6 @@ class NotologEditor(QMainWindow):
                                               os.path.basename(current_file_path), color=default_color)
 
                 return False
-        # File is not encrypted
-        else:
-            # Load the file as usual
-            file_header, file_body = FileHeader().load_file(file_path)
 
         # Load fields content
         if file_header or file_body:  # File body equal to None when file is just created but the header was removed
@@ -3245,8 +3487,8 @@ class NotologEditor(QMainWindow):
         Previous approach was as simple as:
         True if file_path[-4:] == '.enc' else False
         """
-        file_header, _ = FileHeader().load_file(file_path)
-        return file_header.is_file_encrypted()
+        # Only the header line is read, if the file is not probed or loaded since it is changed
+        return FileHeader().probe(file_path).is_file_encrypted()
 
     def search_text(self) -> None:
         """
@@ -3288,9 +3530,9 @@ class NotologEditor(QMainWindow):
         """
         self.logger.debug('Check auto save possibility for the file "%s"' % file_path)
 
-        self.action_save_file(file_path)
+        self.action_save_file(file_path, background=True)
 
-    def save_file_content(self, file_path: str, content: str) -> bool:
+    def save_file_content(self, file_path: str, content: Union[str, Iterable[str]]) -> bool:
         """
         Saves the content to the specified file path.
 
@@ -3299,7 +3541,7 @@ class NotologEditor(QMainWindow):
 
         Args:
             file_path (str): The path where the file will be saved.
-            content (str): The content to write to the file.
+            content (Union[str, Iterable[str]]): The content to write to the file, or its parts.
 
         Returns:
             bool: True if the file was successfully saved, False otherwise.
@@ -3307,8 +3549,8 @@ class NotologEditor(QMainWindow):
 
         self.logger.debug('Saving file "%s"' % file_path)
 
-        # Save the file
-        write_res = file_helper.save_file(file_path, content)
+        # Save the file, the existing one is replaced at once
+        write_res = file_helper.save_file_atomic(file_path, content)
 
         if write_res is False:
             # Display a warning in the status bar if the save fails
@@ -3318,11 +3560,13 @@ class NotologEditor(QMainWindow):
         return write_res
 
     def save_active_file(self, clear_after: bool = False,  # noqa: C901
-                         allow_save_empty_content: bool = None) -> Union[bool, None]:
+                         allow_save_empty_content: bool = None, background: bool = False) -> Union[bool, None]:
         """
         Helper: Save currently opened file.
         @param clear_after: bool, clear edit field after saving (when applicable, say switching view mode)
         @param allow_save_empty_content: bool, dialog answer of either to allow to save an empty file or not
+        @param background: bool, encrypt and write the content snapshot on the worker thread (e.g. upon auto-saving),
+            the result is handled once the save is finished; True is returned as soon as the save is started
         @return: None
         """
 
@@ -3358,10 +3602,19 @@ class NotologEditor(QMainWindow):
 
         # Edit widget
         edit_widget = self.get_edit_widget()  # type: Union[EditWidget, QPlainTextEdit]
-        file_content = edit_widget.toPlainText()
 
-        # If there are no changes to save, do nothing.
-        if self.content == file_content:
+        # If there are no changes to save, do nothing. Unless the document is edited, the content is not even taken.
+        file_content = None
+        content_hash = None
+        revision = edit_widget.document().revision()
+        if edit_widget.is_changed():
+            file_content = edit_widget.toPlainText()
+            content_hash = edit_widget.get_content_hash(file_content)
+            if edit_widget.is_saved_hash(content_hash):
+                # Edited back to the content saved
+                edit_widget.set_saved(content_hash, revision=revision)
+                file_content = None
+        if file_content is None:
             # Disable the save button in the toolbar if it was active
             if hasattr(self.toolbar, 'toolbar_save_button'):
                 self.toolbar.toolbar_save_button.setDisabled(True)
@@ -3377,8 +3630,6 @@ class NotologEditor(QMainWindow):
 
         # If new content is empty ask confirmation to be sure
         if (not file_content
-                # Previous content not the same as a current one
-                and self.content != file_content
                 # Allow empty content dialog not answered
                 and (self.estate.allow_save_empty is None)):
             # Set this globally to avoid a lot of annoying dialogs
@@ -3393,7 +3644,7 @@ class NotologEditor(QMainWindow):
                      dialog_callback()))
 
         # Save if any changes
-        if (file_content or self.estate.allow_save_empty) and self.content != file_content:
+        if file_content or self.estate.allow_save_empty:
             # Show saving progress in the status bar
             if hasattr(self, 'statusbar'):
                 self.statusbar['save_progress_label'].setVisible(True)
@@ -3402,12 +3653,10 @@ class NotologEditor(QMainWindow):
                 self.toolbar.toolbar_save_button.setDisabled(True)
 
             def restore_saving_ui_state() -> None:
-                if hasattr(self, 'statusbar'):
+                if hasattr(self, 'statusbar') and not self.save_pipeline.is_busy():
                     self.statusbar['save_progress_label'].setVisible(False)
                 # Keep it switched off to explicitly show the nothing to save state
                 # self.toolbar.toolbar_save_button.setEnabled(True)
-            # Restore saving UI state automatically.
-            QTimer.singleShot(1500, restore_saving_ui_state)
 
             if self.header is None or not self.header.is_valid():
                 # Get empty file header here, it's needed for compatibility and will not be applied to the file
@@ -3419,8 +3668,7 @@ class NotologEditor(QMainWindow):
             # Update the header with a new date
             header.refresh()
 
-            # To keep initial content unencrypted
-            content = file_content
+            encrypt_helper = None  # type: Union[EncHelper, None]
             if self.get_encryption() == Encryption.ENCRYPTED:
                 # Check file header contains salt and the other params. May update migration params.
                 # Only if the file is encrypted!
@@ -3431,33 +3679,68 @@ class NotologEditor(QMainWindow):
                 # Get file specific salt
                 file_salt = header.get_enc_param('slt')
                 file_iterations = int(header.get_enc_param('itr'))
-
-                # Encrypt
-                encrypted_content_b = self.get_encrypt_helper(
-                    salt=file_salt, iterations=file_iterations).encrypt_data(content.encode("utf-8"))
-                if encrypted_content_b:
-                    content = encrypted_content_b.decode("utf-8")
-
-            content = header.pack(content)
-            save_result = self.save_file_content(current_file_path, content)
-
-            if save_result:
-                self.header = header
-                self.content = file_content
-                # Clear field's data
-                if clear_after:
-                    edit_widget.clear()
-                elif hasattr(self, 'statusbar'):
-                    # Update the content size label in the statusbar
-                    self.statusbar['data_size_label'].setText("%s" % file_helper.size_f(len(self.content)))
-            else:
-                self.toggle_save_timer(state=False)
-                MessageBox(text=self.lexemes.get('save_active_file_error_occurred'), icon_type=2,
-                           callback=self.toggle_save_timer, parent=self)
-
-            # Disable the save button in the toolbar
-            if hasattr(self.toolbar, 'toolbar_save_button'):
-                self.toolbar.toolbar_save_button.setDisabled(save_result)
+                # Get the helper here, as it may ask for the password
+                encrypt_helper = self.get_encrypt_helper(salt=file_salt, iterations=file_iterations)
+                # Upgrade the note to the chunked format if opted in, the key stays the same
+                if header.get_enc_version() == EncHelper.FORMAT_FERNET and self.settings.enc_chunked_migration:
+                    header.set_enc_param('ver', EncHelper.FORMAT_CHUNKED)
+
+            def prepare_content(content: str, file_header: FileHeader = header) -> Union[str, Iterable[str]]:
+                # To keep initial content unencrypted
+                if encrypt_helper is not None:
+                    # Encrypt
+                    encrypted_content = file_header.pack_encrypted(content, encrypt_helper)
+                    if encrypted_content is not None:
+                        return encrypted_content
+                return file_header.pack(content)
+
+            def save_finished(save_result: bool) -> None:
+                # Restore saving UI state automatically.
+                QTimer.singleShot(1500, restore_saving_ui_state)
+
+                if save_result:
+                    if self.get_current_file_path() != current_file_path:
+                        # Another file is open already
+                        return
+                    self.header = header
+                    # The document keeps the content saved as of the revision taken, unless it is edited since then
+                    edit_widget.set_saved(content_hash, revision=revision)
+                    # The watcher drops the file replaced by the atomic save
+                    if self.file_watcher and current_file_path not in self.file_watcher.files():
+                        self.file_watcher.addPath(current_file_path)
+                    # Clear field's data
+                    if clear_after:
+                        # The content is not in the document anymore
+                        self.content = file_content
+                        edit_widget.clear()
+                    elif hasattr(self, 'statusbar'):
+                        # Update the content size label in the statusbar
+                        self.statusbar['data_size_label'].setText("%s" % file_helper.size_f(len(file_content)))
+                else:
+                    if background and hasattr(self, 'statusbar'):
+                        # Display a warning in the status bar, the same as save_file_content() does it
+                        self.statusbar.show_warning(visible=True)
+                    self.toggle_save_timer(state=False)
+                    MessageBox(text=self.lexemes.get('save_active_file_error_occurred'), icon_type=2,
+                               callback=self.toggle_save_timer, parent=self)
+
+                # Disable the save button in the toolbar
+                if hasattr(self.toolbar, 'toolbar_save_button'):
+                    self.toolbar.toolbar_save_button.setDisabled(save_result)
+
+            if background:
+                # The header may be refreshed again while the content is packed on the worker thread, pack its snapshot
+                header_snapshot = FileHeader()
+                header_snapshot.header = copy.deepcopy(header.header)
+                if self.save_pipeline.save(current_file_path, file_content,
+                                           prepare=lambda content: prepare_content(content, header_snapshot),
+                                           callback=save_finished):
+                    return True
+
+            # The background save of the file, if any, must not overwrite this one
+            self.save_pipeline.flush(current_file_path)
+            save_result = self.save_file_content(current_file_path, prepare_content(file_content))
+            save_finished(save_result)
 
             return save_result
 
@@ -3575,39 +3858,39 @@ class NotologEditor(QMainWindow):
         # Set either default or extended title
         self.set_app_title(title)
 
-        # Additional steps to make sure extensions work as expected
-        if hasattr(self, 'md') and self.md:
-            try:
-                """
-                Unregistering is not necessary when extension can be reset.
-                self.md.postprocessors.deregister(name='footnote')
-                self.md.inlinePatterns.deregister('footnote')
-                """
-                for _ext in self.md.registeredExtensions:
-                    if _ext and 'FootnoteExtension' in str(_ext):
-                        # Without this the extension tends to keep footnotes across the various notes
-                        _ext.reset()  # type: ignore
-                        # To remove use: self.md.registeredExtensions.remove(_ext)
-                        self.logger.debug('Resetting extension "%s"' % _ext)
-                        break
-            except ValueError as e:
-                self.logger.warning('Extension error', e)
+        """
+        Pre-process content, convert it to html and post-process the result in background.
+        The document is updated on the UI thread once the html is ready.
+        """
+        process_emojis = bool(self.settings.viewer_process_emojis)
+        # The decrypted content is not written to the disk cache
+        private = header.is_file_encrypted()
+        if not self.render_pipeline.render(
+                content, process_emojis=process_emojis,
+                callback=lambda html_data: self.set_content_html(title, css_data, html_data),
+                theme=self.settings.app_theme, private=private):
+            # No event loop running, render synchronously
+            html_data = self.render_pipeline.render_sync(content, process_emojis=process_emojis,
+                                                         theme=self.settings.app_theme, private=private)
+            self.set_content_html(title, css_data, html_data)
+
+    def set_content_html(self, title: str, css_data: str, html_data: str) -> None:
+        """
+        Set up the rendered html to the VIEW mode document and apply the document level processing.
+        """
+
+        # View widget
+        view_widget = self.get_view_widget()  # type: Union[ViewWidget, QTextBrowser]
+        # View document
+        view_doc = self.get_view_doc()  # type: QTextDocument
 
         view_processor = ViewProcessor(highlighter=self.view_highlighter)
         # Connecting view's mouse press event to the view processor's method
         view_widget.mousePressEvent = view_processor.mouse_click_event
 
-        # Pre-process content before markdown conversion
-        content = view_processor.pre_md_process(content)
-
-        # Convert data to html
-        html_data = self.convert_markdown_to_html(content)
         # This will set cursor position to the end of the content
         view_doc.setPlainText(html_data)
 
-        # Post-process content after markdown conversion
-        view_processor.post_md_process()
-
         # Processing changes of the document passed within, to modify it before any extra elements are being added to.
         view_processor.process()
 
@@ -3640,6 +3923,94 @@ class NotologEditor(QMainWindow):
         cursor.movePosition(QTextCursor.MoveOperation.Start)  # Or just: cursor.setPosition(0)
         view_widget.setTextCursor(cursor)
 
+    def get_render_cache_dir(self) -> Union[str, None]:
+        # The rendered html is kept on disk only if enabled in the settings
+        return RenderCache.get_default_disk_dir() if self.settings.viewer_render_cache_disk else None
+
+    def clear_render_cache(self) -> None:
+        self.render_pipeline.cache.clear()
+
+    @Slot(bool)
+    def render_busy_handler(self, busy: bool) -> None:
+        # Show the render progress in the statusbar
+        if hasattr(self, 'statusbar') and self.statusbar is not None:
+            self.statusbar['render_progress_label'].setVisible(busy)
+
+    def load_progress_handler(self, percent: int) -> None:
+        # Show the content loading progress in the statusbar
+        if not hasattr(self, 'statusbar') or self.statusbar is None:
+            return
+        load_progress_label = self.statusbar['load_progress_label']
+        load_progress_label.setText(self.lexemes.get('statusbar_load_progress_label', scope='statusbar',
+                                                     icon=self.lexemes.get('statusbar_render_progress_label',
+                                                                           scope='statusbar'),
+                                                     percent=percent))
+        load_progress_label.setVisible(percent < 100)
+        # The content is loaded within the same event, repaint the label right away
+        load_progress_label.repaint()
+
+    def update_workspace_index(self) -> None:
+        """
+        Index the notes within the default folder, the changed ones only if the index exists.
+        """
+        self.workspace_index.set_root(self.settings.default_path, callback=self.watch_workspace_dirs)
+
+    def watch_workspace_dirs(self, dirs: List[str]) -> None:
+        """
+        Watch the directories found within the notes tree, to keep the index up to date.
+        """
+        if not self.file_watcher:
+            return
+        # Avoid exhausting the system watches limit on the huge trees
+        available = WorkspaceIndex.MAX_WATCHED_DIRS - len(self.file_watcher.directories())
+        if available < len(dirs):
+            self.logger.info(f'Too many directories to watch, {len(dirs) - max(available, 0)} skipped')
+        if available > 0:
+            self.file_watcher.addPaths(dirs[:available])
+
+    def action_search_notes(self) -> None:
+        """
+        Action: Search across the notes within the default folder.
+        """
+        if self.workspace_search is None:
+            self.workspace_search = WorkspaceSearchDialog(
+                self.workspace_index, open_callback=self.open_workspace_search_result, parent=self)
+        self.workspace_search.show()
+        self.workspace_search.raise_()
+        self.workspace_search.activateWindow()
+        self.workspace_search.search_field.setFocus()
+
+    def open_workspace_search_result(self, file_path: str, line_num: int, query: str) -> None:
+        """
+        Open the note found, placing the cursor at the line given in EDIT mode.
+        @param file_path: Note path
+        @param line_num: Line number within the note content, starts from 0
+        @param query: Search query to highlight the first word of
+        @return: None
+        """
+        # Save any unsaved changes
+        self.save_active_file(clear_after=False)
+        # Reset stored cursor values within settings
+        self.reset_settings_cursor_pos()
+        if not self.load_file(file_path):
+            return
+
+        if self.get_mode() == Mode.EDIT:
+            edit_widget = self.get_edit_widget()  # type: Union[EditWidget, QPlainTextEdit]
+            block = edit_widget.document().findBlockByNumber(line_num)
+            if block.isValid():
+                text_cursor = edit_widget.textCursor()
+                text_cursor.setPosition(block.position())
+                edit_widget.setTextCursor(text_cursor)
+                edit_widget.ensureCursorVisible()
+
+        words = WorkspaceIndex.get_words(query)
+        if words and hasattr(self, 'toolbar') and hasattr(self.toolbar, 'search_form'):
+            self.toolbar.search_form.set_text(words[0])
+            if self.get_mode() == Mode.EDIT:
+                # Select the occurrence within the line
+                self.action_search_next()
+
     def is_resource_attached(self, resource_url: str) -> bool:
         """
         Check either resource attached to the document or not.
@@ -3772,10 +4143,17 @@ class NotologEditor(QMainWindow):
         self.set_app_title(title)
 
         """
-        Set content as an editable plain text
+        Set content as an editable plain text, a large one is set chunk by chunk showing the progress.
         More info about QPlainTextEdit and setPlainText() method https://doc.qt.io/qt-6/qplaintextedit.html#setPlainText
-        """
-        edit_widget.setPlainText(content)
+        A large content is highlighted once it is set, the visible blocks first and the rest in the background.
+        """
+        lazy_highlighting = len(content) > LazyHighlighter.MIN_LENGTH and self.lazy_highlighter is not None
+        if lazy_highlighting:
+            self.lazy_highlighter.defer()
+        edit_widget.set_plain_text_chunked(content, progress_callback=self.load_progress_handler)
+        if lazy_highlighting:
+            self.lazy_highlighter.resume()
+        edit_widget.set_saved(edit_widget.get_content_hash(content))
         edit_widget.setReadOnly(False)
 
         # After resizing data updates
@@ -0,0 +1,265 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Content-addressed cache of the rendered html.
+- Functionality: Keeps the html converted from Markdown by the hash of the content and the rendering params, so an
+  unchanged note is shown without the conversion. Has an in-memory LRU tier and an optional on-disk tier under the
+  app config directory, both limited in size. The private html, e.g. of the encrypted notes, is kept in memory only.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Union
+
+import os
+import hashlib
+import logging
+
+from .app_config import AppConfig
+
+
+class RenderCache:
+
+    # Memory tier limits, the number of items and the total length of the html stored
+    MAX_ITEMS = 64  # type: int
+    MAX_SIZE = 32 * 1024 * 1024  # type: int
+    # Disk tier limit in bytes
+    MAX_DISK_SIZE = 128 * 1024 * 1024  # type: int
+
+    FILE_EXT = '.html'  # type: str
+
+    def __init__(self, disk_dir: str = None, max_items: int = None, max_size: int = None, max_disk_size: int = None):
+        """
+        Args:
+            disk_dir (str, optional): Directory of the on-disk tier, the tier is off if not set
+            max_items (int, optional): Max number of items in memory
+            max_size (int, optional): Max total length of the html in memory
+            max_disk_size (int, optional): Max total size of the files on disk
+        """
+        self.logger = logging.getLogger('render_cache')
+
+        self.max_items = max_items if max_items is not None else self.MAX_ITEMS
+        self.max_size = max_size if max_size is not None else self.MAX_SIZE
+        self.max_disk_size = max_disk_size if max_disk_size is not None else self.MAX_DISK_SIZE
+
+        # Least recently used items go first
+        self.items = OrderedDict()  # type: OrderedDict[str, str]
+        self.size = 0  # type: int
+        # Keys of the items not to be written to disk and to be dropped by clear_private()
+        self.private_keys = set()  # type: set[str]
+
+        self.disk_dir = None  # type: Union[str, None]
+        self.disk_size = 0  # type: int
+
+        # The cache is filled up from the render worker thread
+        self.lock = Lock()
+
+        self.hits = 0  # type: int
+        self.misses = 0  # type: int
+
+        self.set_disk_dir(disk_dir)
+
+    @staticmethod
+    def get_default_disk_dir() -> str:
+        """
+        Directory next to the app config file, with the same suffixes for the test mode and package type.
+        """
+        config_path = AppConfig().get_app_config_path()
+        config_name, _ext = os.path.splitext(os.path.basename(config_path))
+        return os.path.join(os.path.dirname(config_path), config_name.replace('app_config', 'render_cache'))
+
+    @staticmethod
+    def get_key(content: str, *params) -> str:
+        """
+        Hash of the content and anything else the result depends on, e.g. extensions config, emoji setting or theme.
+        """
+        key_hash = hashlib.sha256()
+        for param in params:
+            key_hash.update(repr(param).encode('utf-8'))
+            key_hash.update(b'\0')
+        key_hash.update(content.encode('utf-8', errors='surrogatepass'))
+        return key_hash.hexdigest()
+
+    def set_disk_dir(self, disk_dir: Union[str, None]) -> None:
+        """
+        Enable the on-disk tier in the directory given, or disable it with None.
+        """
+        with self.lock:
+            self.disk_dir = disk_dir
+            self.disk_size = 0
+            if disk_dir is None:
+                return
+            try:
+                os.makedirs(disk_dir, exist_ok=True)
+                self.disk_size = sum(entry.stat().st_size for entry in os.scandir(disk_dir)
+                                     if entry.is_file() and entry.name.endswith(self.FILE_EXT))
+            except OSError as e:
+                self.logger.warning(f"Render cache directory '{disk_dir}' is not available: {e}")
+                self.disk_dir = None
+
+        self.logger.debug(f"Render cache on disk {'disabled' if disk_dir is None else disk_dir}")
+
+    def get(self, key: str) -> Union[str, None]:
+        with self.lock:
+            html = self.items.get(key)
+            if html is not None:
+                self.items.move_to_end(key)
+            else:
+                html = self.read_file(key)
+                if html is not None:
+                    # Promote to the memory tier
+                    self.put_item(key, html)
+
+            if html is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        self.logger.debug(f"Render cache {'miss' if html is None else 'hit'} [{self.hits}/{self.misses}]")
+
+        return html
+
+    def put(self, key: str, html: str, private: bool = False) -> None:
+        """
+        Args:
+            key (str): Cache key, see get_key()
+            html (str): Rendered html
+            private (bool, optional): Keep the item in memory only, e.g. the decrypted content of an encrypted note
+        """
+        with self.lock:
+            self.put_item(key, html)
+            if private:
+                if key in self.items:
+                    self.private_keys.add(key)
+            else:
+                self.write_file(key, html)
+
+    def clear(self) -> None:
+        """
+        Clear both tiers.
+        """
+        with self.lock:
+            self.items.clear()
+            self.size = 0
+            self.private_keys.clear()
+            if self.disk_dir is not None:
+                for file_path in self.get_files():
+                    self.remove_file(file_path)
+                self.disk_size = 0
+
+        self.logger.debug('Render cache cleared')
+
+    def clear_private(self) -> None:
+        """
+        Drop the private items from memory, e.g. once the encryption keys are wiped.
+        """
+        with self.lock:
+            for key in self.private_keys:
+                html = self.items.pop(key, None)
+                if html is not None:
+                    self.size -= len(html)
+            self.private_keys.clear()
+
+        self.logger.debug('Render cache private items cleared')
+
+    def put_item(self, key: str, html: str) -> None:
+        if len(html) > self.max_size:
+            return
+        if key in self.items:
+            self.size -= len(self.items.pop(key))
+        self.items[key] = html
+        self.size += len(html)
+        # Evict the least recently used items
+        while len(self.items) > self.max_items or self.size > self.max_size:
+            _key, _html = self.items.popitem(last=False)
+            self.size -= len(_html)
+            self.private_keys.discard(_key)
+
+    def get_file_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key + self.FILE_EXT)
+
+    def get_files(self) -> list:
+        try:
+            return [entry.path for entry in os.scandir(self.disk_dir)
+                    if entry.is_file() and entry.name.endswith(self.FILE_EXT)]
+        except OSError:
+            return []
+
+    def read_file(self, key: str) -> Union[str, None]:
+        if self.disk_dir is None:
+            return None
+        file_path = self.get_file_path(key)
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                html = f.read()
+            # Modification time is used as the last access time upon eviction
+            os.utime(file_path)
+            return html
+        except FileNotFoundError:
+            return None
+        except (OSError, UnicodeDecodeError) as e:
+            self.logger.warning(f"Render cache file '{file_path}' read error: {e}")
+            return None
+
+    def write_file(self, key: str, html: str) -> None:
+        if self.disk_dir is None:
+            return
+        file_path = self.get_file_path(key)
+        if os.path.exists(file_path):
+            return
+        data = html.encode('utf-8', errors='surrogatepass')
+        if len(data) > self.max_disk_size:
+            return
+        tmp_path = file_path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, file_path)
+            self.disk_size += len(data)
+        except OSError as e:
+            self.logger.warning(f"Render cache file '{file_path}' write error: {e}")
+            self.remove_file(tmp_path)
+            return
+        if self.disk_size > self.max_disk_size:
+            self.evict_files()
+
+    def evict_files(self) -> None:
+        """
+        Remove the least recently used files to get the disk tier back within its size limit.
+        """
+        files = []
+        for file_path in self.get_files():
+            try:
+                stat = os.stat(file_path)
+                files.append((stat.st_mtime, stat.st_size, file_path))
+            except OSError:
+                continue
+        files.sort()
+        self.disk_size = sum(file[1] for file in files)
+        for _mtime, size, file_path in files:
+            if self.disk_size <= self.max_disk_size:
+                break
+            if self.remove_file(file_path):
+                self.disk_size -= size
+
+    def remove_file(self, file_path: str) -> bool:
+        try:
+            os.remove(file_path)
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            self.logger.warning(f"Render cache file '{file_path}' remove error: {e}")
+            return False
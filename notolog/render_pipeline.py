@@ -0,0 +1,261 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Background Markdown to HTML rendering for VIEW mode.
+- Functionality: Runs the string-only stages (details/summary tags rewriting, emoji and Markdown conversion) on a
+  worker thread, so the window stays responsive on large notes. The result is delivered back to the UI thread,
+  where the QTextDocument work is done. A newer render or a mode switch cancels the pending one.
+  The html is cached, so an unchanged note is shown without the conversion.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from PySide6.QtCore import QObject, Signal
+
+from concurrent.futures import ThreadPoolExecutor, Future
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Union
+
+import asyncio
+import logging
+
+from .app_config import AppConfig
+from .render_cache import RenderCache
+from .view_processor import ViewProcessor
+from .helpers.import_helper import LazyImport
+
+if TYPE_CHECKING:
+    from typing import List  # noqa: F401
+
+# The converters are imported upon the first render, they are not needed to show the window
+emoji = LazyImport('emoji')
+markdown = LazyImport('markdown')
+pygments = LazyImport('pygments')
+ElementTreeExtension = LazyImport('.etree_extension', 'ElementTreeExtension', package=__package__)
+HiliteCacheExtension = LazyImport('.hilite_cache_extension', 'HiliteCacheExtension', package=__package__)
+
+
+class RenderPipeline(QObject):  # QObject to allow signal emitting
+
+    # Signal to emit upon a render is started (True) or there is no render in progress anymore (False)
+    busy_changed = Signal(bool)
+
+    """
+    Some extensions like `codehilite` extension will be included later.
+
+    Extra contains:
+    * Abbreviations
+    * Attribute Lists
+    * Definition Lists
+    * Fenced Code Blocks
+    * Footnotes
+    * Tables
+    * Markdown in HTML
+
+    More info https://python-markdown.github.io/extensions/extra/
+    """
+    MD_EXTENSIONS = [
+        'markdown.extensions.extra',  # Or 'extra'
+        'markdown.extensions.toc',  # 'toc' stands for 'Table of Contents', provides anchors for header tags
+    ]  # type: List[str]
+
+    def __init__(self, md_factory: Callable[[], 'markdown.Markdown'], md_config: Any = None,
+                 cache: RenderCache = None, parent=None):
+        """
+        Args:
+            md_factory (Callable[[], markdown.Markdown]): Creates the Markdown object with the extensions to use.
+                The pipeline owns its own object, as Markdown objects are not thread-safe.
+            md_config (Any, optional): Extensions config the Markdown object is created with, a part of the cache key
+            cache (RenderCache, optional): Cache of the rendered html
+        """
+        super().__init__(parent)
+
+        self.md_factory = md_factory
+        # Versions of the converters are the part of the config, as they may change the output, see get_md_config()
+        self.md_config = md_config
+        self.md_config_versions = None  # type: Union[tuple, None]
+        self.cache = cache if cache is not None else RenderCache()
+        self.md = None  # type: Union[markdown.Markdown, None]
+        # The Markdown object is shared by the worker and the synchronous fallback
+        self.md_lock = Lock()
+
+        self.logger = logging.getLogger('render_pipeline')
+
+        # A single worker is enough, only the latest render matters
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='render_pipeline')
+
+        # Id of the latest render, the earlier ones are cancelled
+        self.render_id = 0  # type: int
+        self.future = None  # type: Union[Future, None]
+        self.callback = None  # type: Union[Callable[[str], Any], None]
+
+    def render(self, content: str, process_emojis: bool, callback: Callable[[str], Any], theme: str = None,
+               private: bool = False) -> bool:
+        """
+        Start rendering in background, cancelling the pending render if any.
+        The cached html is passed to the callback right away.
+
+        Args:
+            content (str): Markdown content
+            process_emojis (bool): Convert emojis, like :cat: to 🐱
+            callback (Callable[[str], Any]): Called on the UI thread with the resulting html
+            theme (str, optional): App theme, a part of the cache key
+            private (bool, optional): Content of an encrypted note, its html is not cached on disk
+
+        Returns:
+            bool: False if the event loop is not running and the content has to be rendered synchronously
+        """
+        self.cancel()
+
+        cache_key = self.get_cache_key(content, process_emojis, theme)
+        html_content = self.cache.get(cache_key)
+        if html_content is not None:
+            callback(html_content)
+            return True
+
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or not loop.is_running():
+            self.logger.debug('Skipping the background render because the async loop is not running.')
+            return False
+
+        render_id = self.render_id
+        self.callback = callback
+        self.future = self.executor.submit(self.run_stages, render_id, content, process_emojis, cache_key, private)
+        # Done callbacks are called on the worker thread, pass the result over to the loop's (UI) thread
+        self.future.add_done_callback(
+            lambda future: loop.call_soon_threadsafe(self.render_finished, render_id, future))
+
+        self.logger.debug(f'Render {render_id} started [{len(content)} chars]')
+        self.busy_changed.emit(True)
+
+        return True
+
+    def render_sync(self, content: str, process_emojis: bool, theme: str = None, private: bool = False) -> str:
+        """
+        Render on the current thread, e.g. when there is no event loop running.
+        """
+        self.cancel()
+        cache_key = self.get_cache_key(content, process_emojis, theme)
+        html_content = self.cache.get(cache_key)
+        if html_content is None:
+            html_content = self.run_stages(self.render_id, content, process_emojis, cache_key, private)
+        return html_content
+
+    def cancel(self) -> None:
+        """
+        Cancel the pending render. The running stage cannot be interrupted, the rest of the stages are skipped and the
+        result is dropped.
+        """
+        self.render_id += 1
+        self.callback = None
+        if self.future is not None:
+            self.future.cancel()
+            self.future = None
+            self.logger.debug(f'Render {self.render_id - 1} cancelled')
+            self.busy_changed.emit(False)
+
+    def shutdown(self) -> None:
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def is_busy(self) -> bool:
+        # The future is released once its result is delivered to the UI thread
+        return self.future is not None
+
+    def get_md_config(self) -> tuple:
+        if self.md_config_versions is None:
+            self.md_config_versions = (self.md_config, AppConfig().get_app_version(),
+                                       markdown.__version__, pygments.__version__, emoji.__version__)
+        return self.md_config_versions
+
+    def get_cache_key(self, content: str, process_emojis: bool, theme: str = None) -> str:
+        return self.cache.get_key(content, self.get_md_config(), process_emojis, theme)
+
+    def run_stages(self, render_id: int, content: str, process_emojis: bool,
+                   cache_key: str = None, private: bool = False) -> Union[str, None]:
+        """
+        Run the string stages one by one, checking the render is still actual in between.
+        The result is cached with the key given, if any, the private one in memory only.
+
+        Returns:
+            Union[str, None]: Html content or None if the render was cancelled
+        """
+        stages = [self.pre_md_process]  # type: List[Callable[[str], str]]
+        if process_emojis:
+            stages.append(self.convert_emojis)
+        stages += [self.convert_markdown_to_html, self.post_md_process]
+
+        with self.md_lock:
+            for stage in stages:
+                if render_id != self.render_id:
+                    return None
+                content = stage(content)
+
+        if cache_key is not None:
+            self.cache.put(cache_key, content, private=private)
+
+        return content
+
+    def render_finished(self, render_id: int, future: Future) -> None:
+        if render_id != self.render_id or future.cancelled():
+            # Superseded by another render or cancelled, busy state is updated by the cancel() call
+            return
+
+        callback = self.callback
+        self.future = None
+        self.callback = None
+        self.busy_changed.emit(False)
+
+        try:
+            html_content = future.result()
+        except Exception as e:
+            self.logger.warning(f'Render {render_id} failed: {e}')
+            return
+
+        self.logger.debug(f'Render {render_id} finished')
+
+        if html_content is not None and callable(callback):
+            callback(html_content)
+
+    @staticmethod
+    def create_md(extensions: 'List[str]') -> 'markdown.Markdown':
+        """
+        Create Markdown object with the extensions given and the custom element tree extension.
+        Add `codehilite` to make actual highlighter work (CodeHiliteExtension() or ['codehilite']),
+        the HiliteCacheExtension is the CodeHilite one that doesn't re-highlight unchanged code blocks.
+        """
+        return markdown.Markdown(extensions=extensions + [ElementTreeExtension(), HiliteCacheExtension(linenums=True)])
+
+    @staticmethod
+    def pre_md_process(content: str) -> str:
+        return ViewProcessor.replace_tags(content, ViewProcessor.forward_replacements)
+
+    @staticmethod
+    def post_md_process(content: str) -> str:
+        return ViewProcessor.replace_tags(content, ViewProcessor.backward_replacements)
+
+    @staticmethod
+    def convert_emojis(content: str) -> str:
+        # TODO emojis language: pass the app language over
+        return emoji.emojize(content, language='en')
+
+    def convert_markdown_to_html(self, content: str) -> str:
+        if self.md is None:
+            self.md = self.md_factory()
+        else:
+            # Resets extensions as well, without this the footnotes tend to be kept across the various notes
+            self.md.reset()
+        return self.md.convert(content)
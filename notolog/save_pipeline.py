@@ -0,0 +1,149 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Background saving of the notes.
+- Functionality: Prepares the content snapshot (e.g. encrypts it and packs the header) and writes it atomically on
+  a worker thread, so the window stays responsive upon auto-saving large or encrypted notes. Saves of a file
+  requested while the previous one is still in progress are coalesced into the latest one.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from PySide6.QtCore import QObject, Signal
+
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from typing import TYPE_CHECKING, Any, Callable, Union
+
+import asyncio
+import logging
+
+from .helpers import file_helper
+
+if TYPE_CHECKING:
+    from typing import Dict, Tuple  # noqa: F401
+
+
+class SavePipeline(QObject):  # QObject to allow signal emitting
+
+    # Signal to emit upon a save is started (True) or there is no save in progress anymore (False)
+    busy_changed = Signal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.logger = logging.getLogger('save_pipeline')
+
+        # A single worker keeps the saves in order
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='save_pipeline')
+
+        # Saves in progress by the file path
+        self.futures = {}  # type: Dict[str, Future]
+        # The latest save requested while the previous one of the same file is in progress
+        self.pending = {}  # type: Dict[str, Tuple[str, Union[Callable[[str], str], None], Any]]
+
+    def save(self, file_path: str, content: str, prepare: Callable[[str], str] = None,
+             callback: Callable[[bool], Any] = None) -> bool:
+        """
+        Start saving in background. If the file is being saved already, the save is started once the previous one is
+        finished, replacing any other save requested in the meantime.
+
+        Args:
+            file_path (str): The path where the file will be saved
+            content (str): Content snapshot to save
+            prepare (Callable[[str], str], optional): Turns the content into the file data on the worker thread
+            callback (Callable[[bool], Any], optional): Called on the UI thread with the save result, unless the
+                save is superseded by another one
+
+        Returns:
+            bool: False if the event loop is not running and the content has to be saved synchronously
+        """
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or not loop.is_running():
+            self.logger.debug('Skipping the background save because the async loop is not running.')
+            return False
+
+        if file_path in self.futures:
+            if file_path in self.pending:
+                self.logger.debug(f'Pending save of "{file_path}" is coalesced')
+            self.pending[file_path] = (content, prepare, callback)
+            return True
+
+        self.start(loop, file_path, content, prepare, callback)
+
+        return True
+
+    def flush(self, file_path: str) -> None:
+        """
+        Finish the save of the file in progress, if any, and drop the pending one as outdated, e.g. before saving the
+        file synchronously. The result of the save finished is not passed to its callback.
+        """
+        self.pending.pop(file_path, None)
+        future = self.futures.pop(file_path, None)
+        if future is not None:
+            wait([future])
+            if not self.futures:
+                self.busy_changed.emit(False)
+
+    def start(self, loop: asyncio.AbstractEventLoop, file_path: str, content: str,
+              prepare: Union[Callable[[str], str], None], callback: Union[Callable[[bool], Any], None]) -> None:
+        future = self.executor.submit(self.write, file_path, content, prepare)
+        if not self.futures:
+            self.busy_changed.emit(True)
+        self.futures[file_path] = future
+        # Done callbacks are called on the worker thread, pass the result over to the loop's (UI) thread
+        future.add_done_callback(
+            lambda _future: loop.call_soon_threadsafe(self.save_finished, loop, file_path, _future, callback))
+
+        self.logger.debug(f'Save of "{file_path}" started [{len(content)} chars]')
+
+    def save_finished(self, loop: asyncio.AbstractEventLoop, file_path: str, future: Future,
+                      callback: Union[Callable[[bool], Any], None]) -> None:
+        if self.futures.get(file_path) is not future:
+            # Flushed to be superseded by a synchronous save
+            return
+
+        del self.futures[file_path]
+
+        try:
+            result = future.result()
+        except Exception as e:
+            self.logger.warning(f'Save of "{file_path}" failed: {e}')
+            result = False
+
+        self.logger.debug(f'Save of "{file_path}" finished [{result}]')
+
+        if file_path in self.pending:
+            self.start(loop, file_path, *self.pending.pop(file_path))
+        elif not self.futures:
+            self.busy_changed.emit(False)
+
+        if callable(callback):
+            callback(result)
+
+    def write(self, file_path: str, content: str, prepare: Union[Callable[[str], str], None]) -> bool:
+        if callable(prepare):
+            content = prepare(content)
+        return file_helper.save_file_atomic(file_path, content)
+
+    def is_busy(self) -> bool:
+        return bool(self.futures)
+
+    def shutdown(self) -> None:
+        """
+        Drop the pending saves and wait for the ones in progress, as they cannot be interrupted.
+        """
+        self.pending.clear()
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,264 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Index of the searched text occurrences within a document.
+- Functionality: Finds the occurrences in the plain text of the document at once and keeps their positions sorted,
+  so the occurrence index is found by the bisection. The index follows the document edits by re-matching the edited
+  region only and shifting the positions after it.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from PySide6.QtGui import QTextDocument, QTextCursor
+
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Union
+
+import re
+import logging
+
+if TYPE_CHECKING:
+    from typing import List  # noqa: F401
+
+
+class SearchIndex:
+    """
+    Occurrences are found the same way QTextDocument.find() does it moving forward from the document start: the next
+    search starts from the end of the previous occurrence, so the occurrences do not overlap.
+    """
+
+    # Characters outside the BMP take two positions in the document (UTF-16), but a single one in a Python string
+    ASTRAL_RE = re.compile('[\U00010000-\U0010FFFF]')
+    # Separators of the selected text replaced the same way QTextDocument.toPlainText() does it
+    PLAIN_TEXT_TABLE = str.maketrans({'\u2029': '\n', '\u2028': '\n', '\ufdd0': '\n', '\ufdd1': '\n',
+                                      '\u00a0': ' '})
+
+    def __init__(self):
+        self.logger = logging.getLogger('search_index')
+
+        self.document = None  # type: Union[QTextDocument, None]
+        self.pattern = None  # type: Union[re.Pattern, None]
+        # Search params the index is built for
+        self.params = None  # type: Union[tuple, None]
+        # Document revision the index is actual for
+        self.revision = -1  # type: int
+
+        self.text = ''  # type: str
+        # Occurrences start indexes within the text, sorted
+        self.starts = []  # type: List[int]
+        # Text indexes of the astral characters and their document positions, to map the positions both ways
+        self.astral = []  # type: List[int]
+        self.astral_positions = []  # type: List[int]
+        # Document positions of the occurrences ends, sorted; built on demand
+        self._end_positions = None  # type: Union[List[int], None]
+
+    def search(self, document: QTextDocument, searched_text: str, find_flags) -> int:
+        """
+        Build the index for the text given unless it is built already, and count the occurrences.
+
+        Args:
+            document (QTextDocument): The document to search within
+            searched_text (str): The text string to search for
+            find_flags (QTextDocument.FindFlags): Flags to control the search behavior, like case sensitivity
+
+        Returns:
+            int: The number of times the searched text appears in the document.
+        """
+        find_flags = QTextDocument.FindFlag(find_flags)
+        # Backward flag does not matter for the count
+        params = (searched_text,
+                  bool(find_flags & QTextDocument.FindFlag.FindCaseSensitively),
+                  bool(find_flags & QTextDocument.FindFlag.FindWholeWords))
+
+        if document is not self.document:
+            self.set_document(document)
+        elif params == self.params and document.revision() == self.revision:
+            # The index is kept up to date with the edits
+            return len(self.starts)
+
+        self.params = params
+        self.pattern = self.get_pattern(*params) if searched_text else None
+        self.rebuild()
+
+        return len(self.starts)
+
+    def index(self, position: int) -> int:
+        """
+        Index of the occurrence ending at the document position given (where the cursor is placed once found).
+
+        Returns:
+            int: 1-based index of the occurrence, or 0 if there is no occurrence ending there
+        """
+        if self._end_positions is None:
+            length = len(self.params[0]) if self.params else 0
+            self._end_positions = [self.get_position(start + length) for start in self.starts]
+        index = bisect_left(self._end_positions, position)
+        if index < len(self._end_positions) and self._end_positions[index] == position:
+            return index + 1
+        return 0
+
+    def clear(self) -> None:
+        self.set_document(None)
+
+    @staticmethod
+    def get_pattern(searched_text: str, case_sensitive: bool, whole_words: bool) -> re.Pattern:
+        expression = re.escape(searched_text)
+        if whole_words:
+            # Words are bounded by the letters and numbers, the same as Qt does it; the underscore is not a part of
+            # a word, unlike in the \w class
+            expression = r'(?<![^\W_])%s(?![^\W_])' % expression
+        return re.compile(expression, 0 if case_sensitive else re.IGNORECASE)
+
+    def set_document(self, document: Union[QTextDocument, None]) -> None:
+        if self.document is not None:
+            try:
+                self.document.contentsChange.disconnect(self.contents_change)
+            except (RuntimeError, TypeError):
+                # The document is deleted already or not connected
+                pass
+        self.document = document
+        self.params = None
+        self.pattern = None
+        self.revision = -1
+        self.text = ''
+        self.starts = []
+        self.astral = []
+        self.astral_positions = []
+        self._end_positions = None
+        if document is not None:
+            document.contentsChange.connect(self.contents_change)
+
+    def rebuild(self) -> None:
+        self.update_text()
+        if self.pattern is None:
+            self.starts = []
+        else:
+            self.starts = self.find_all(0)
+        self._end_positions = None
+
+    def update_text(self) -> None:
+        # Plain text keeps the positions, the paragraph separators and the nbsp chars are replaced by one char each
+        self.text = self.document.toPlainText()
+        self.revision = self.document.revision()
+        if self.text.isascii():
+            self.astral = []
+        else:
+            self.astral = [match.start() for match in self.ASTRAL_RE.finditer(self.text)]
+        self.astral_positions = [index + count for count, index in enumerate(self.astral)]
+
+    def splice_text(self, position: int, chars_removed: int, chars_added: int) -> Union[tuple, None]:
+        """
+        Replace the edited region of the text with the document's one, rather than take the whole text again.
+
+        Returns:
+            Union[tuple, None]: Text indexes of the edited region: its start, its end before and after the edit;
+                None if the text is out of sync with the document and has to be taken as a whole
+        """
+        start_index = self.get_index(position)
+        removed_end_index = min(self.get_index(position + chars_removed), len(self.text))
+
+        # The document ends with a paragraph separator that is not a part of the plain text
+        doc_length = self.document.characterCount() - 1
+        cursor = QTextCursor(self.document)
+        cursor.setPosition(min(position, doc_length))
+        cursor.setPosition(min(position + chars_added, doc_length), QTextCursor.MoveMode.KeepAnchor)
+        added = cursor.selectedText().translate(self.PLAIN_TEXT_TABLE)
+
+        self.text = self.text[:start_index] + added + self.text[removed_end_index:]
+        self.revision = self.document.revision()
+
+        delta = len(added) - (removed_end_index - start_index)
+        keep = bisect_left(self.astral, start_index)
+        tail = bisect_left(self.astral, removed_end_index)
+        added_astral = [] if added.isascii() else [start_index + match.start()
+                                                   for match in self.ASTRAL_RE.finditer(added)]
+        self.astral = self.astral[:keep] + added_astral + [index + delta for index in self.astral[tail:]]
+        self.astral_positions = [index + count for count, index in enumerate(self.astral)]
+
+        if len(self.text) + len(self.astral) != doc_length:
+            # The change reported does not cover the edit
+            self.logger.debug('Search index text is out of sync with the document')
+            return None
+
+        return start_index, removed_end_index, start_index + len(added)
+
+    def find_all(self, index: int) -> 'List[int]':
+        """
+        Find the occurrences from the text index given.
+        """
+        # Matches of the escaped text are never empty and do not overlap, the same as finditer() returns them
+        return [match.start() for match in self.pattern.finditer(self.text, index)]
+
+    def get_position(self, index: int) -> int:
+        """
+        Document position of the text index.
+        """
+        return index + bisect_left(self.astral, index)
+
+    def get_index(self, position: int) -> int:
+        """
+        Text index of the document position.
+        """
+        return position - bisect_left(self.astral_positions, position)
+
+    def contents_change(self, position: int, chars_removed: int, chars_added: int) -> None:
+        """
+        Update the index upon the document edit. The occurrences before the edit stay the same, the edited region is
+        matched again until the occurrences are the same as before the edit, then the rest of them are shifted.
+        """
+        if self.pattern is None:
+            # Nothing is searched, just keep the index params actual
+            self.revision = self.document.revision()
+            return
+
+        if self.revision < 0 or not self.text:
+            self.rebuild()
+            return
+
+        # Only the edited region of the text is taken from the document
+        edited = self.splice_text(position, chars_removed, chars_added)
+        if edited is None:
+            self.rebuild()
+            return
+        start_index, removed_end_index, added_end_index = edited
+        delta = added_end_index - removed_end_index
+        length = len(self.params[0])
+
+        # Occurrences ending before the edit are not affected by it (whole words depend on the next char as well)
+        keep = bisect_left(self.starts, start_index - length + 1 - int(self.params[2]))
+        # Occurrences starting after the edit are still there, but shifted
+        tail = bisect_left(self.starts, removed_end_index)
+        shifted = [start + delta for start in self.starts[tail:]]
+
+        starts = self.starts[:keep]
+        index = starts[-1] + length if starts else 0
+        search = self.pattern.search
+        # Match again until an occurrence is the same as before the edit, the next ones are the same as well
+        shifted_index = 0
+        while (match := search(self.text, index)) is not None:
+            start = match.start()
+            # Skip the previous occurrences overlapping the new ones or not found anymore
+            while shifted_index < len(shifted) and shifted[shifted_index] < start:
+                shifted_index += 1
+            if shifted_index < len(shifted) and shifted[shifted_index] == start:
+                break
+            starts.append(start)
+            index = start + length
+        else:
+            shifted_index = len(shifted)
+
+        self.starts = starts + shifted[shifted_index:]
+        self._end_positions = None
+
+        self.logger.debug(f'Search index updated at {position} [-{chars_removed}/+{chars_added}]: '
+                          f'{len(self.starts)} occurrence(s)')
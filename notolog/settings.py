@@ -155,10 +155,13 @@ class Settings(QSettings):
         self.create_property("viewer_highlight_todos", bool, True)
         self.create_property("viewer_open_link_confirmation", bool, True)
         self.create_property("viewer_save_resources", bool, True)
+        self.create_property("viewer_render_cache_disk", bool, False)
         # Icons to show on the toolbar. Can be checked like:
         # if value is not None and value.isValid() and isinstance(value.toInt()[0], int): ...
         self.create_property("toolbar_icons", int, None)
         self.create_property("enc_iterations", int, None)
+        # Upgrade the Fernet encrypted notes to the chunked format upon saving
+        self.create_property("enc_chunked_migration", bool, False)
         # AI assistant
         self.create_property("ai_config_inference_module", str, "openai_api")
         self.create_property("ai_config_multi_turn_dialogue", bool, True)
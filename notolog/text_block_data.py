@@ -27,6 +27,8 @@ class TextBlockData(QTextBlockUserData):
 
         self.block_number = block_number
         self.data = {}
+        # Highlighter's cross-block state the block ends with, see MainHighlighter.get_block_state()
+        self.state = None
 
     def put(self, tag=str, opened=bool, within=bool, closed=bool, start: int = 0, end: int = 0) -> None:
         new_data = {'opened': opened, 'within': within, 'closed': closed, 'start': start, 'end': end}
@@ -10,6 +10,7 @@ File Details:
 
 Features:
 - Sends requests and receives responses based on user inputs or contextual cues.
+- Shows the streamed responses in batches and converts the finished ones to html in background.
 - Implements robust error handling to manage API limitations or failures, ensuring consistent application performance.
 - Adaptable functionality to suit different application needs.
 
@@ -24,19 +25,23 @@ License: MIT License
 For detailed instructions and project information, please see the repository's README.md.
 """
 
-from PySide6.QtCore import Qt, QSize, Signal, Slot
+from PySide6.QtCore import Qt, QSize, QTimer, Signal, Slot
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QWidget, QPushButton
 from PySide6.QtWidgets import QLabel, QSizePolicy, QHBoxLayout, QScrollArea
 from PySide6.QtGui import QPixmap, QColor
 
-import logging
-
+from concurrent.futures import ThreadPoolExecutor, Future
+from threading import Lock
 from typing import TYPE_CHECKING, Union
 
+import asyncio
+import logging
+
 from . import Settings
 from . import Lexemes
 from . import ThemeHelper
 
+from .ai_message_buffer import AIMessageBuffer
 from .ai_message_label import AIMessageLabel
 from .ai_prompt_input import AIPromptInput
 
@@ -53,6 +58,7 @@ from datetime import datetime
 import markdown
 
 if TYPE_CHECKING:
+    from typing import Dict, Tuple  # noqa: F401
     from PySide6.QtWidgets import QScrollBar  # noqa: F401
 
 
@@ -85,6 +91,9 @@ class AIAssistant(QDialog):
     # Set the inference status
     is_in_progress = False
 
+    # Interval of showing the streamed chunks, in milliseconds
+    FLUSH_INTERVAL = 50  # type: int
+
     def __init__(self, parent):
         super().__init__(parent, Qt.WindowType.Window)
 
@@ -166,6 +175,17 @@ class AIAssistant(QDialog):
         # Prompt and response tokens
         self.token_usage = {}
 
+        # Streamed messages by the type and id, their chunks are shown at most once per flush interval
+        self.message_buffers = {}  # type: Dict[Tuple[EnumMessageType, int], AIMessageBuffer]
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(self.FLUSH_INTERVAL)
+        self.flush_timer.timeout.connect(self.flush_messages)
+
+        # Markdown conversion of the finished responses, the Markdown object is shared with the synchronous fallback
+        self.md_executor = None  # type: Union[ThreadPoolExecutor, None]
+        self.md_lock = Lock()
+
         self.init_ui()
 
     def init_ui(self):
@@ -397,21 +417,59 @@ class AIAssistant(QDialog):
     def append_to_message(self, additional_text, request_msg_id=None, response_msg_id=None,
                           message_type: EnumMessageType = EnumMessageType.default(),
                           message_style: EnumMessageStyle = EnumMessageStyle.DEFAULT):
-        last_message = None
+        message_buffer = self.get_message_buffer(message_type, response_msg_id)
+        if message_buffer is not None:
+            # Shown with the next flush, along with the other chunks arrived meanwhile
+            message_buffer.append(additional_text)
+            if not self.flush_timer.isActive():
+                self.flush_timer.start()
+            return
+
+        self.add_message(additional_text, request_msg_id, response_msg_id, message_type, message_style)
         if response_msg_id:
-            # Message with the same id
+            # The label is looked up once, the following chunks of the message are buffered
             last_message = self.findChild(QLabel, f'msg_{message_type}_{response_msg_id}')
-        # Double check found object type
-        if isinstance(last_message, QLabel):
-            current_text = last_message.text()
-            new_text = current_text + additional_text
-            last_message.setText(new_text)
-            last_message.adjustSize()
-        else:
-            self.add_message(additional_text, request_msg_id, response_msg_id, message_type, message_style)
+            # Double check found object type
+            if isinstance(last_message, QLabel):
+                self.message_buffers[(message_type, response_msg_id)] = AIMessageBuffer(last_message,
+                                                                                        last_message.text())
 
         self.messages_area.verticalScrollBar().setValue(self.messages_area.verticalScrollBar().maximum())
 
+    def get_message_buffer(self, message_type: EnumMessageType, message_id) -> Union[AIMessageBuffer, None]:
+        if not message_id:
+            return None
+        return self.message_buffers.get((message_type, message_id))
+
+    def flush_messages(self) -> None:
+        """
+        Show the chunks of the streamed messages arrived since the previous flush.
+        """
+        updated = False
+        for key, message_buffer in list(self.message_buffers.items()):
+            try:
+                updated = message_buffer.flush() or updated
+            except RuntimeError:  # The label is already deleted
+                del self.message_buffers[key]
+        if updated:
+            self.messages_area.verticalScrollBar().setValue(self.messages_area.verticalScrollBar().maximum())
+
+    def release_message_buffer(self, message_type: EnumMessageType, message_id) -> Union[AIMessageBuffer, None]:
+        """
+        Show the rest of the chunks of the finished message and stop buffering it.
+        """
+        message_buffer = self.get_message_buffer(message_type, message_id)
+        if message_buffer is None:
+            return None
+        del self.message_buffers[(message_type, message_id)]
+        if not self.message_buffers:
+            self.flush_timer.stop()
+        try:
+            message_buffer.flush()
+        except RuntimeError:  # The label is already deleted
+            return None
+        return message_buffer
+
     def gen_next_message_id(self) -> int:
         # Update with gaps to allow extra space in case of race condition
         self.message_id += 3
@@ -439,13 +497,47 @@ class AIAssistant(QDialog):
         """
         Process Markdown syntax and convert it to html.
         """
-        if not self.md:
-            self.init_md()
-        # Convert markdown to html
-        html_content = self.md.convert(md_content)
+        with self.md_lock:
+            if not self.md:
+                self.init_md()
+            # Convert markdown to html
+            html_content = self.md.convert(md_content)
         # Converted html data
         return html_content
 
+    def convert_message_to_html(self, message_label: QLabel, md_content: str) -> None:
+        """
+        Convert the message to html in background and show the result once ready; the message is converted right
+        away if the event loop is not running.
+        """
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or not loop.is_running():
+            message_label.setText(self.convert_markdown_to_html(md_content))
+            return
+
+        if self.md_executor is None:
+            self.md_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ai_assistant_md')
+        future = self.md_executor.submit(self.convert_markdown_to_html, md_content)
+        # Done callbacks are called on the worker thread, pass the result over to the loop's (UI) thread
+        future.add_done_callback(
+            lambda _future: loop.call_soon_threadsafe(self.message_converted, message_label, md_content, _future))
+
+    def message_converted(self, message_label: QLabel, md_content: str, future: Future) -> None:
+        try:
+            html_content = future.result()
+        except Exception as e:
+            self.logger.warning(f'Error occurred during the message conversion: {e}')
+            return
+        try:
+            # Skip the message changed meanwhile
+            if message_label.text() == md_content:
+                message_label.setText(html_content)
+        except RuntimeError:  # Object is already deleted
+            pass
+
     def update_usage(self, model, prompt_tokens=None, response_tokens=None, total_tokens=None, append=False):
         if not append:
             # Count token usage
@@ -621,9 +713,12 @@ class AIAssistant(QDialog):
         try:
             # Return ready status
             self.set_status_ready()
-            # Find the target message
+            # Find the target message, with the rest of the streamed chunks shown
             finished_msg = None
-            if response_msg_id:
+            message_buffer = self.release_message_buffer(message_type, response_msg_id)
+            if message_buffer is not None:
+                finished_msg = message_buffer.label
+            elif response_msg_id:
                 # Message (response) with the same id
                 finished_msg = self.findChild(QLabel, f'msg_{message_type}_{response_msg_id}')
             # Double check found object type
@@ -631,9 +726,8 @@ class AIAssistant(QDialog):
                 plain_text = finished_msg.text()
                 # Check if postprocessing is needed
                 if self.settings.ai_config_convert_to_md:
-                    # Convert markdown response
-                    md_text = self.convert_markdown_to_html(plain_text)
-                    finished_msg.setText(md_text)
+                    # Convert markdown response, off the UI thread
+                    self.convert_message_to_html(finished_msg, plain_text)
                 # Emit message added signal to update final variant of the message (might not be completed yet)
                 self.message_added.emit(plain_text, request_msg_id, response_msg_id, EnumMessageType.RESPONSE)
         except RuntimeError as e:  # Object is already deleted
@@ -746,6 +840,10 @@ class AIAssistant(QDialog):
     @asyncClose
     async def closeEvent(self, event):
         self.logger.info('Closing AI Assistant')
+        self.flush_timer.stop()
+        self.message_buffers.clear()
+        if self.md_executor is not None:
+            self.md_executor.shutdown(wait=False, cancel_futures=True)
         self.dialog_closed.emit()
         self.deleteLater()
         # event.accept()  # Event handled
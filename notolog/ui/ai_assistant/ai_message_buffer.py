@@ -0,0 +1,74 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Buffer of a streamed AI Assistant message.
+- Functionality: Accumulates the chunks of the response as they arrive and writes them over to the message label
+  in batches, so the label is not re-laid out per token.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from PySide6.QtWidgets import QLabel
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import List  # noqa: F401
+
+
+class AIMessageBuffer:
+    """
+    Chunks of the message not shown yet, along with the label they go to. The label is looked up once per message,
+    and the text is joined once per flush rather than concatenated per chunk.
+    """
+
+    def __init__(self, label: QLabel, text: str = ''):
+        """
+        Args:
+            label (QLabel): Label of the message
+            text (str, optional): Text the label shows already
+        """
+        self.label = label
+        self.text = text
+        self.chunks = []  # type: List[str]
+
+    def append(self, chunk: str) -> None:
+        self.chunks.append(chunk)
+
+    def is_pending(self) -> bool:
+        return len(self.chunks) > 0
+
+    def get_text(self) -> str:
+        """
+        The whole text of the message, including the chunks not shown yet.
+        """
+        if self.chunks:
+            self.text += ''.join(self.chunks)
+            self.chunks.clear()
+        return self.text
+
+    def flush(self) -> bool:
+        """
+        Show the pending chunks.
+
+        Returns:
+            bool: True if the label was updated
+
+        Raises:
+            RuntimeError: The label is already deleted
+        """
+        if not self.chunks:
+            return False
+        self.label.setText(self.get_text())
+        self.label.adjustSize()
+        return True
@@ -25,10 +25,14 @@ from . import ThemeHelper
 from . import ClipboardHelper
 
 from ..ui.create_new_dir_dialog import CreateNewDirDialog
+from ..helpers.import_helper import LazyImport
 
 import os
 import logging
 
+# Imported upon the context menu of a folder is shown
+BatchCrypt = LazyImport('..encrypt.batch_crypt', 'BatchCrypt', package=__package__)
+
 
 class FileTreeContextMenu(QMenu):
     def __init__(self, file_path: str = None, parent=None):
@@ -119,6 +123,30 @@ class FileTreeContextMenu(QMenu):
         # Add the action to the toolbar
         self.addAction(create_new_dir_action)
 
+        # Search across the notes context action
+        search_notes_icon = self.theme_helper.get_icon(
+            theme_icon='eyeglasses.svg', system_icon='edit-find',
+            color=QColor(self.theme_helper.get_color('main_tree_context_menu_search_notes')))
+        self.addAction(search_notes_icon, self.lexemes.get('menu_action_search_notes'),
+                       lambda: self.parent.action_search_notes())
+
+        # Batch encryption of the notes within the folder context actions
+        self.addSeparator()
+        is_dir_writable = os.access(dir_path, os.W_OK)
+        for operation, lexeme, theme_icon, color in (
+                (BatchCrypt.ENCRYPT, 'menu_action_encrypt_notes', 'shield-lock.svg', 'toolbar_icon_color_encrypt'),
+                (BatchCrypt.DECRYPT, 'menu_action_decrypt_notes', 'shield-lock-fill.svg', 'toolbar_icon_color_decrypt'),
+                (BatchCrypt.REKEY, 'menu_action_rekey_notes', 'file-earmark-lock2.svg', 'toolbar_icon_color_encrypt')):
+            batch_crypt_icon = self.theme_helper.get_icon(
+                theme_icon=theme_icon, system_icon='dialog-password',
+                color=QColor(self.theme_helper.get_color(color)))
+            batch_crypt_action = QAction(self.lexemes.get(lexeme), self)
+            batch_crypt_action.setIcon(batch_crypt_icon)
+            batch_crypt_action.triggered.connect(
+                lambda _checked=False, _operation=operation: self.parent.action_batch_crypt(_operation, dir_path))
+            batch_crypt_action.setEnabled(is_dir_writable)
+            self.addAction(batch_crypt_action)
+
     def copy_file_path_dialog(self, file_path):
         # Copy text to the clipboard
         ClipboardHelper.set_text(file_path)
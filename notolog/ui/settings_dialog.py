@@ -298,6 +298,14 @@ class SettingsDialog(QDialog):
              "text": self.lexemes.get('editor_config_show_line_numbers_checkbox'),
              "accessible_description":
                  self.lexemes.get('editor_config_show_line_numbers_checkbox_accessible_description')},
+            # Upgrade the encrypted notes to the chunked format upon saving
+            {"type": QCheckBox,
+             # Lexeme key : Setting name
+             "name": "settings_dialog_editor_config_enc_chunked_migration_checkbox:enc_chunked_migration",
+             "callback": lambda obj: tab_editor_config_layout.addWidget(obj, alignment=Qt.AlignmentFlag.AlignTop),
+             "text": self.lexemes.get('editor_config_enc_chunked_migration_checkbox'),
+             "accessible_description":
+                 self.lexemes.get('editor_config_enc_chunked_migration_checkbox_accessible_description')},
             # Spacer to keep elements above on top
             {"type": QWidget, "name": None, "size_policy": (QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding),
              "callback": lambda obj: tab_editor_config_layout.addWidget(obj)},
@@ -368,6 +376,26 @@ class SettingsDialog(QDialog):
              "text": self.lexemes.get('viewer_config_save_resources_checkbox'),
              "accessible_description":
                  self.lexemes.get('viewer_config_save_resources_checkbox_accessible_description')},
+            # Spacer
+            {"type": QWidget, "name": None, "size_policy": (QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Minimum),
+             "callback": lambda obj: tab_viewer_config_layout.addWidget(obj)},
+            # Keep the rendered html on disk to show unchanged notes faster
+            {"type": QCheckBox,
+             # Lexeme key : Setting name
+             "name": "settings_dialog_viewer_config_render_cache_disk_checkbox:viewer_render_cache_disk",
+             "callback": lambda obj: tab_viewer_config_layout.addWidget(obj, alignment=Qt.AlignmentFlag.AlignTop),
+             "text": self.lexemes.get('viewer_config_render_cache_disk_checkbox'),
+             "accessible_description":
+                 self.lexemes.get('viewer_config_render_cache_disk_checkbox_accessible_description')},
+            # Clear the render cache
+            {"type": QPushButton,
+             "name": "settings_dialog_viewer_config_render_cache_clear_button",
+             "callback": lambda obj: (
+                 tab_viewer_config_layout.addWidget(obj, alignment=Qt.AlignmentFlag.AlignLeft),
+                 obj.clicked.connect(self.clear_render_cache)),
+             "text": self.lexemes.get('viewer_config_render_cache_clear_button'),
+             "accessible_description":
+                 self.lexemes.get('viewer_config_render_cache_clear_button_accessible_description')},
             # Spacer to keep elements above on top
             {"type": QWidget, "name": None, "size_policy": (QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding),
              "callback": lambda obj: tab_viewer_config_layout.addWidget(obj)},
@@ -537,6 +565,11 @@ class SettingsDialog(QDialog):
         # Return the dynamically created object
         return obj
 
+    def clear_render_cache(self) -> None:
+        # The cache belongs to the main window's render pipeline
+        if hasattr(self.parent, 'clear_render_cache') and callable(self.parent.clear_render_cache):
+            self.parent.clear_render_cache()
+
     def parse_object_name(self, object_name: str):
         return self.settings.settings_helper.parse_object_name(object_name)
 
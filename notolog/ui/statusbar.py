@@ -72,6 +72,9 @@ class StatusBar(QStatusBar):
         self.data_size_label = None  # type: Union[QLabel, None]
         self.mode_label = None  # type: Union[QLabel, None]
         self.save_progress_label = None  # type: Union[QLabel, None]
+        self.render_progress_label = None  # type: Union[QLabel, None]
+        self.load_progress_label = None  # type: Union[QLabel, None]
+        self.key_progress_label = None  # type: Union[QLabel, None]
         self.encryption_label = None  # type: Union[QLabel, None]
         self.source_label = None  # type: Union[QLabel, None]
         self.cursor_label = None  # type: Union[QLabel, None]
@@ -122,6 +125,26 @@ class StatusBar(QStatusBar):
         self.save_progress_label.setText(self.lexemes.get('statusbar_save_progress_label'))
         self.labels_layout.addWidget(self.save_progress_label)
 
+        # Render in progress label
+        self.render_progress_label = QLabel(self)
+        self.render_progress_label.setFont(self.font())
+        self.render_progress_label.setVisible(False)
+        self.render_progress_label.setText(self.lexemes.get('statusbar_render_progress_label'))
+        self.labels_layout.addWidget(self.render_progress_label)
+
+        # Load in progress label, the text is set along with the progress
+        self.load_progress_label = QLabel(self)
+        self.load_progress_label.setFont(self.font())
+        self.load_progress_label.setVisible(False)
+        self.labels_layout.addWidget(self.load_progress_label)
+
+        # Encryption key derivation in progress label
+        self.key_progress_label = QLabel(self)
+        self.key_progress_label.setFont(self.font())
+        self.key_progress_label.setVisible(False)
+        self.key_progress_label.setText(self.lexemes.get('statusbar_key_progress_label'))
+        self.labels_layout.addWidget(self.key_progress_label)
+
         self.labels_layout.addWidget(VerticalLineSpacer())
 
         # Main editor area mode label
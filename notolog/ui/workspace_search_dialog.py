@@ -0,0 +1,166 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Provides the panel to search across the notes.
+- Functionality: Searches the workspace index while typing and opens the selected note at the matching line.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QLineEdit, QLabel, QListWidget, QListWidgetItem
+
+from . import Settings
+from . import Lexemes
+
+from typing import TYPE_CHECKING, Any, Callable
+
+import os
+import logging
+
+if TYPE_CHECKING:
+    from typing import List, Tuple, Union  # noqa: F401
+    from ..workspace_index import WorkspaceIndex  # noqa: F401
+
+
+class WorkspaceSearchDialog(QDialog):
+
+    # Delay to search upon typing, in milliseconds
+    SEARCH_DELAY = 250  # type: int
+
+    def __init__(self, workspace_index: 'WorkspaceIndex', open_callback: Callable[[str, int, str], Any], parent=None):
+        """
+        Args:
+            workspace_index (WorkspaceIndex): Index to search within
+            open_callback (Callable[[str, int, str], Any]): Opens the note, receives the file path, line number and the
+                query
+            parent (optional): Parent object
+        """
+        super(WorkspaceSearchDialog, self).__init__(parent)
+
+        self.parent = parent
+        self.workspace_index = workspace_index
+        self.open_callback = open_callback
+
+        if self.parent and hasattr(self.parent, 'font'):
+            # Apply the font from the main window to this dialog
+            self.setFont(self.parent.font())
+
+        self.settings = Settings(parent=self)
+
+        self.logger = logging.getLogger('workspace_search_dialog')
+
+        # Load lexemes for the selected language and scope
+        self.lexemes = Lexemes(self.settings.app_language, default_scope='common')
+
+        self.search_field = None  # type: Union[QLineEdit, None]
+        self.results_list = None  # type: Union[QListWidget, None]
+        self.status_label = None  # type: Union[QLabel, None]
+
+        # Id of the latest search, results of the earlier ones are dropped
+        self.search_id = 0  # type: int
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DELAY)
+        self.search_timer.timeout.connect(self.search)
+
+        self.init_ui()
+
+        # Search again once the notes are indexed
+        self.workspace_index.busy_changed.connect(lambda _busy: self.update_status(self.results_list.count()))
+        self.workspace_index.updated.connect(self.index_updated_handler)
+
+    def init_ui(self):
+        self.setWindowTitle(self.lexemes.get('dialog_workspace_search_title'))
+
+        self.search_field = QLineEdit(self)
+        self.search_field.setPlaceholderText(self.lexemes.get('dialog_workspace_search_input_placeholder_text'))
+        self.search_field.textChanged.connect(lambda _text: self.search_timer.start())
+        self.search_field.returnPressed.connect(self.open_current)
+
+        self.results_list = QListWidget(self)
+        self.results_list.itemActivated.connect(self.open_item)
+
+        self.status_label = QLabel(self)
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.search_field)
+        layout.addWidget(self.results_list)
+        layout.addWidget(self.status_label)
+        self.setLayout(layout)
+
+        if self.parent:
+            self.resize(int(self.parent.width() * 0.5), int(self.parent.height() * 0.5))
+
+        self.update_status()
+
+    def search(self) -> None:
+        self.search_id += 1
+        search_id = self.search_id
+        query = self.search_field.text()
+        if not query.strip():
+            self.show_results([])
+            return
+        self.workspace_index.search(query, lambda results: self.search_finished(search_id, results))
+
+    def search_finished(self, search_id: int, results: 'List[Tuple[str, int, str]]') -> None:
+        if search_id != self.search_id:
+            # Superseded by another search
+            return
+        self.show_results(results)
+
+    def show_results(self, results: 'List[Tuple[str, int, str]]') -> None:
+        self.results_list.clear()
+        root_dir = self.workspace_index.root_dir
+        for file_path, line_num, line in results:
+            display_path = os.path.relpath(file_path, root_dir) if root_dir else file_path
+            item = QListWidgetItem(f'{display_path}:{line_num + 1}  {line}')
+            item.setToolTip(file_path)
+            item.setData(Qt.ItemDataRole.UserRole, (file_path, line_num))
+            self.results_list.addItem(item)
+        if results:
+            self.results_list.setCurrentRow(0)
+        self.update_status(len(results))
+
+    def update_status(self, count: int = None) -> None:
+        if self.workspace_index.root_dir is None:
+            text = self.lexemes.get('dialog_workspace_search_not_available')
+        elif self.workspace_index.is_busy():
+            text = self.lexemes.get('dialog_workspace_search_indexing')
+        elif count is not None:
+            text = self.lexemes.get('dialog_workspace_search_results_count', count=count)
+        else:
+            text = ''
+        self.status_label.setText(text)
+
+    def index_updated_handler(self) -> None:
+        if self.isVisible() and self.search_field.text().strip():
+            # Coalesce the updates coming one by one
+            self.search_timer.start()
+
+    def open_current(self) -> None:
+        item = self.results_list.currentItem()
+        if item is not None:
+            self.open_item(item)
+
+    def open_item(self, item: QListWidgetItem) -> None:
+        file_path, line_num = item.data(Qt.ItemDataRole.UserRole)
+        self.logger.debug(f"Opening search result '{file_path}' at line {line_num}")
+        if callable(self.open_callback):
+            self.open_callback(file_path, line_num, self.search_field.text())
+
+    def done(self, result: int) -> None:
+        # The dialog is kept to be shown again with the same results
+        self.search_timer.stop()
+        super().done(result)
@@ -30,6 +30,7 @@ from typing import TYPE_CHECKING, Union
 from .settings import Settings
 from .highlight.view_highlighter import ViewHighlighter
 from .lexemes.lexemes import Lexemes
+from .helpers.regex_helper import RegexRegistry
 
 if TYPE_CHECKING:
     from PySide6.QtCore import QObject  # noqa: F401
@@ -42,6 +43,29 @@ class ViewProcessor:
 
     zero_width_space = '\u200B'  # '&#8203;' or '​'
 
+    # Replacements of the expandable tokens before markdown conversion, regex patterns
+    forward_replacements = {
+        r'<details([^>]*?)>': r'[details\1]',
+        r'</details>': '[/details]',
+        r'<summary([^>]*?)>': r'[summary\1]',
+        r'</summary>': '[/summary]',
+    }
+
+    # Backward replacements after markdown conversion, regex patterns
+    backward_replacements = {
+        r'\[details([^>]*?)\]': r'<details\1>',
+        r'\[/details\]': '</details>',
+        r'\[summary([^>]*?)\]': r'<summary\1>',
+        r'\[/summary\]': '</summary>',
+    }
+
+    # Open and close tags of the expandable blocks, found within each block of the document at once
+    details_tags_re = RegexRegistry.compile(r'(<details.*?>)|(</details>)')
+    # Summary of the expandable block with the spaces around
+    summary_re = RegexRegistry.compile(r"[\s]*?<summary.*?>(.*?)<\/summary>[\s]*?",
+                                       re.DOTALL | re.MULTILINE | re.UNICODE)
+    spaces_re = RegexRegistry.compile(r"([\s]+)", re.DOTALL | re.UNICODE)
+
     def __init__(self, highlighter: Union[QSyntaxHighlighter, ViewHighlighter]):
         """
         Args:
@@ -80,15 +104,14 @@ class ViewProcessor:
     @staticmethod
     def replace_tags(content, replacements) -> str:
         """
-        Function to perform replacements.
+        Function to perform replacements. The replacements are independent, so they are performed within a single
+        pass over the content, see Replacer.
 
         Args:
             content (str): Source content.
             replacements (dict): Replacements mapping.
         """
-        for pattern, replacement in replacements.items():
-            content = re.sub(pattern, replacement, content)
-        return content
+        return RegexRegistry.get_replacer(replacements).sub(content)
 
     def pre_md_process(self, content: str):
         """
@@ -102,15 +125,7 @@ class ViewProcessor:
             str: Pre-processed content.
         """
 
-        # Define the replacements in a dictionary with regex patterns
-        forward_replacements = {
-            r'<details([^>]*?)>': r'[details\1]',
-            r'</details>': '[/details]',
-            r'<summary([^>]*?)>': r'[summary\1]',
-            r'</summary>': '[/summary]',
-        }
-
-        return self.replace_tags(content, forward_replacements)
+        return self.replace_tags(content, self.forward_replacements)
 
     def post_md_process(self, content: str = None):
         """
@@ -129,16 +144,8 @@ class ViewProcessor:
         if doc_processing:
             content = self.doc.toPlainText()
 
-        # Define the backward replacements in a dictionary
-        backward_replacements = {
-            r'\[details([^>]*?)\]': r'<details\1>',
-            r'\[/details\]': '</details>',
-            r'\[summary([^>]*?)\]': r'<summary\1>',
-            r'\[/summary\]': '</summary>',
-        }
-
         # Perform the replacements
-        post_processed_text = self.replace_tags(content, backward_replacements)
+        post_processed_text = self.replace_tags(content, self.backward_replacements)
 
         if doc_processing:
             self.doc.setPlainText(post_processed_text)
@@ -157,22 +164,17 @@ class ViewProcessor:
             @return: None
             """
             block = cursor_internal.block()
-            pattern = r"<details.*?>"
-            # Find all matches of the pattern in provided string
-            matches = re.finditer(pattern, block.text())
-            for match in matches:
-                _open_start = match.start()
-                _open_end = match.end()
-                _open_length = _open_end - _open_start
-                self.blocks_start.append((block.position() + _open_start, _open_length))
-            pattern = r"</details>"
-            # Find all matches of the pattern in provided string
-            matches = re.finditer(pattern, block.text())
-            for match in matches:
-                _close_start = match.start()
-                _close_end = match.end()
-                _close_length = _close_end - _close_start
-                self.blocks_end.append((block.position() + _close_start, _close_length))
+            block_text = block.text()
+            if '<' not in block_text:
+                return
+            # Find all the open and close tags in provided string within a single pass
+            for match in self.details_tags_re.finditer(block_text):
+                _start = match.start()
+                _length = match.end() - _start
+                if match.lastindex == 1:
+                    self.blocks_start.append((block.position() + _start, _length))
+                else:
+                    self.blocks_end.append((block.position() + _start, _length))
 
         cursor.movePosition(QTextCursor.MoveOperation.Start)
         # Iterate through each block
@@ -331,8 +333,7 @@ class ViewProcessor:
                 Select extra space characters before and after to strip the cursor's text the way where the summary's
                 content starts right after the details tag.
                 """
-                pattern = r"[\s]*?<summary.*?>(.*?)<\/summary>[\s]*?"
-                match = re.search(pattern, selected_text, flags=re.DOTALL | re.MULTILINE | re.UNICODE)
+                match = self.summary_re.search(selected_text)
                 summary = self.lexemes.get('expandable_block_default_title')
                 if match:
                     summary = f"{match.group(1).strip()}"
@@ -433,8 +434,7 @@ class ViewProcessor:
 
         # Remove all trailing spaces and save the cursor position
         pre_cursor_char = cursor.document().characterAt(cursor.position() - 1)
-        pattern = r"([\s]+)"
-        match = re.search(pattern, pre_cursor_char, flags=re.DOTALL | re.UNICODE)
+        match = self.spaces_re.search(pre_cursor_char)
         if match and match.group(1):
             j = 0
             while j < len(match.group(1)):
@@ -21,6 +21,7 @@ from PySide6.QtGui import QFont
 from PySide6.QtWidgets import QTextBrowser
 
 from .app_config import AppConfig
+from .search_index import SearchIndex
 
 import logging
 
@@ -47,8 +48,8 @@ class ViewWidget(QTextBrowser):
 
         self.logger = logging.getLogger('view_widget')
 
-        # Initialize storage for positions and indexes of searched text occurrences.
-        self._searched_text_positions = []
+        # Index of the searched text occurrences, it follows the document edits
+        self.search_index = SearchIndex()
 
     def setDocument(self, document):
         # Override setDocument() to allow additional actions like emit the document set signal
@@ -96,6 +97,7 @@ class ViewWidget(QTextBrowser):
     def searched_text_count(self, searched_text, find_flags) -> int:
         """
         Counts the number of occurrences of a given text within the document.
+        The occurrences are indexed, so the repeated searches on the same document are not scanning it again.
 
         Args:
             searched_text (str): The text string to search for within the document.
@@ -105,29 +107,7 @@ class ViewWidget(QTextBrowser):
         Returns:
             int: The number of times the searched text appears in the document.
         """
-        count = 0
-        # Reset stored text positions from previous searches to prepare for a new search.
-        self._searched_text_positions = []
-        # Create a temporary cursor for the search
-        # This way, the actual cursor position that the user sees will not be affected.
-        temp_cursor = self.textCursor()
-
-        # Move the temporary cursor to the start of the document
-        temp_cursor.movePosition(temp_cursor.MoveOperation.Start)
-
-        # Find and count occurrences
-        while temp_cursor := self.document().find(searched_text, temp_cursor, find_flags):
-            count += 1
-            pos = temp_cursor.position()
-            if pos not in self._searched_text_positions:
-                self._searched_text_positions.append(pos)
-
-        # Reset the stored positions if no occurrence index is found.
-        if count == 0:
-            self._searched_text_positions = []
-
-        # No need to reset the visual cursor since the original cursor was not moved
-        return count
+        return self.search_index.search(self.document(), searched_text, find_flags)
 
     def searched_text_index(self, position) -> int:
         """
@@ -139,8 +119,4 @@ class ViewWidget(QTextBrowser):
         Returns:
             int: The index of the occurrence at a given cursor position within the document.
         """
-
-        if position in self._searched_text_positions:
-            return self._searched_text_positions.index(position) + 1
-        else:
-            return 0
+        return self.search_index.index(position)
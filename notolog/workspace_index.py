@@ -0,0 +1,499 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Full-text search index of the notes within the default folder.
+- Functionality: Keeps the notes content in an SQLite FTS5 table next to the app config, so the notes are searched
+  without reading them. The files are indexed by their modification time and size in background, the whole tree
+  once it is set and the particular directories and files upon the file system watcher events afterwards.
+  Encrypted notes are not indexed.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from PySide6.QtCore import QObject, Signal
+
+from concurrent.futures import ThreadPoolExecutor, Future
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Union
+
+import os
+import re
+import asyncio
+import logging
+import sqlite3
+
+from .app_config import AppConfig
+from .file_header import FileHeader
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Tuple  # noqa: F401
+
+
+class WorkspaceIndex(QObject):  # QObject to allow signal emitting
+
+    # Signal to emit upon indexing is started (True) or there is no indexing in progress anymore (False)
+    busy_changed = Signal(bool)
+    # Signal to emit upon the index is updated, e.g. to search again
+    updated = Signal()
+
+    # Version of the tables, the index is re-created if it does not match
+    SCHEMA_VERSION = 1  # type: int
+
+    FILE_EXTENSIONS = ('md', 'txt', 'htm', 'html')  # type: Tuple[str, ...]
+    # Larger files are not indexed
+    MAX_FILE_SIZE = 8 * 1024 * 1024  # type: int
+    MAX_RESULTS = 100  # type: int
+    # Length of the matching line shown within the results
+    MAX_LINE_LENGTH = 256  # type: int
+    # Limit of the directories to watch for the changes
+    MAX_WATCHED_DIRS = 4096  # type: int
+
+    def __init__(self, db_path: str = None, extensions: 'List[str]' = None, parent=None):
+        """
+        Args:
+            db_path (str, optional): Index database path, next to the app config by default; ':memory:' is supported
+            extensions (List[str], optional): Extensions of the files to index
+        """
+        super().__init__(parent)
+
+        self.logger = logging.getLogger('workspace_index')
+
+        self.db_path = db_path if db_path is not None else self.get_default_db_path()
+        self.extensions = tuple(ext.lower() for ext in extensions) if extensions else self.FILE_EXTENSIONS
+
+        self.root_dir = None  # type: Union[str, None]
+        # Directories found while indexing the tree, e.g. to watch them for the changes
+        self.dirs = set()  # type: set[str]
+
+        self.connection = None  # type: Union[sqlite3.Connection, None]
+        # Fallback to the plain table search if the SQLite build lacks FTS5
+        self.fts = True  # type: bool
+        # The connection is used by the worker and by the synchronous fallback
+        self.lock = Lock()
+
+        # A single worker keeps the tasks in order
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='workspace_index')
+        self.futures = set()  # type: set[Future]
+        # Number of the indexing tasks in progress
+        self.syncs = 0  # type: int
+
+    @staticmethod
+    def get_default_db_path() -> str:
+        """
+        File next to the app config file, with the same suffixes for the test mode and package type.
+        """
+        config_path = AppConfig().get_app_config_path()
+        config_name, _ext = os.path.splitext(os.path.basename(config_path))
+        return os.path.join(os.path.dirname(config_path), config_name.replace('app_config', 'workspace_index') + '.db')
+
+    def set_root(self, root_dir: Union[str, None], callback: Callable[['List[str]'], Any] = None) -> None:
+        """
+        Index the whole tree of the directory given, dropping the notes outside it.
+
+        Args:
+            root_dir (str): Notes directory, the index is not updated if None
+            callback (Callable[[List[str]], Any], optional): Called on the UI thread with the directories found
+        """
+        self.root_dir = os.path.abspath(root_dir) if root_dir else None
+        if self.root_dir is None or not os.path.isdir(self.root_dir):
+            self.logger.debug(f"Workspace index root '{root_dir}' is not a directory")
+            return
+        self.run_sync(self.sync_root, (self.root_dir,), callback)
+
+    def update_path(self, path: str, callback: Callable[['List[str]'], Any] = None) -> None:
+        """
+        Update the index upon the file system change of a directory (non-recursive) or a file.
+
+        Args:
+            path (str): Changed directory or file path, e.g. from the file system watcher signal
+            callback (Callable[[List[str]], Any], optional): Called on the UI thread with the new directories found
+        """
+        path = os.path.abspath(path)
+        if not self.is_within_root(path):
+            return
+        if os.path.isdir(path):
+            self.run_sync(self.sync_dir, (path, False), callback)
+        else:
+            self.run_sync(self.sync_file, (path,), callback)
+
+    def search(self, query: str, callback: Callable[['List[Tuple[str, int, str]]'], Any]) -> None:
+        """
+        Search the notes in background.
+
+        Args:
+            query (str): Words to search, the last one may be incomplete
+            callback (Callable[[List[Tuple[str, int, str]]], Any]): Called on the UI thread with the results,
+                see search_sync()
+        """
+        self.run(self.search_sync, (query,), callback)
+
+    def is_busy(self) -> bool:
+        return self.syncs > 0
+
+    def shutdown(self) -> None:
+        for future in self.futures:
+            future.cancel()
+        self.futures.clear()
+        self.syncs = 0
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def close(self) -> None:
+        """
+        Close the database connection once the tasks are finished.
+        """
+        self.executor.shutdown(wait=True)
+        with self.lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+    def run(self, task: Callable, args: tuple, callback: Callable[[Any], Any] = None) -> None:
+        """
+        Run the task on the worker, or on the current thread if the event loop is not running.
+        """
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or not loop.is_running():
+            result = task(*args)
+            if callable(callback):
+                callback(result)
+            return
+
+        future = self.executor.submit(task, *args)
+        self.futures.add(future)
+        # Done callbacks are called on the worker thread, pass the result over to the loop's (UI) thread
+        future.add_done_callback(lambda _future: loop.call_soon_threadsafe(self.task_finished, _future, callback))
+
+    def task_finished(self, future: Future, callback: Callable[[Any], Any] = None) -> None:
+        if future not in self.futures:
+            # Shut down already
+            return
+        self.futures.discard(future)
+
+        try:
+            result = future.result()
+        except Exception as e:
+            self.logger.warning(f'Workspace index task failed: {e}')
+            result = None
+
+        if callable(callback):
+            callback(result)
+
+    def run_sync(self, task: Callable, args: tuple, callback: Callable[['List[str]'], Any] = None) -> None:
+        """
+        Run the indexing task, keeping the busy state.
+        """
+        self.syncs += 1
+        if self.syncs == 1:
+            self.busy_changed.emit(True)
+        self.run(task, args, lambda new_dirs: self.sync_finished(new_dirs, callback))
+
+    def sync_finished(self, new_dirs: Union['List[str]', None], callback: Callable[['List[str]'], Any] = None) -> None:
+        self.syncs = max(self.syncs - 1, 0)
+        if self.syncs == 0:
+            self.busy_changed.emit(False)
+        self.updated.emit()
+        if new_dirs and callable(callback):
+            callback(new_dirs)
+
+    def is_within_root(self, path: str) -> bool:
+        return self.root_dir is not None and (path == self.root_dir or path.startswith(self.root_dir + os.sep))
+
+    def is_indexable(self, file_name: str) -> bool:
+        _name, ext = os.path.splitext(file_name)
+        return ext[1:].lower() in self.extensions
+
+    @staticmethod
+    def is_hidden(name: str) -> bool:
+        return name.startswith('.')
+
+    @staticmethod
+    def get_sub_dir(dir_path: str, path: str) -> str:
+        """
+        Direct sub-directory of the directory given, the path is within.
+        """
+        return os.path.join(dir_path, os.path.relpath(path, dir_path).split(os.sep)[0])
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Open the database, creating the tables if needed. Called with the lock acquired.
+        """
+        if self.connection is not None:
+            return self.connection
+
+        if self.db_path != ':memory:':
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        connection = sqlite3.connect(self.db_path, check_same_thread=False)
+
+        version = connection.execute('PRAGMA user_version').fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            connection.execute('DROP TABLE IF EXISTS notes')
+            connection.execute('DROP TABLE IF EXISTS files')
+        connection.execute('CREATE TABLE IF NOT EXISTS files '
+                           '(id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, mtime REAL, size INTEGER)')
+        try:
+            # Notes rowid is the file id
+            connection.execute("CREATE VIRTUAL TABLE IF NOT EXISTS notes USING fts5"
+                               "(content, tokenize='unicode61 remove_diacritics 2')")
+        except sqlite3.OperationalError as e:
+            self.logger.info(f'FTS5 is not available, falling back to the plain table search: {e}')
+            self.fts = False
+            connection.execute('CREATE TABLE IF NOT EXISTS notes (rowid INTEGER PRIMARY KEY, content TEXT)')
+        connection.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+        connection.commit()
+
+        self.connection = connection
+        return connection
+
+    def get_indexed_files(self, connection: sqlite3.Connection, dir_path: str) -> 'Dict[str, Tuple[int, float, int]]':
+        """
+        Indexed files within the directory tree given, by path.
+        """
+        prefix = dir_path.rstrip(os.sep) + os.sep
+        # Range of the paths starting with the prefix, uses the path index
+        rows = connection.execute('SELECT path, id, mtime, size FROM files WHERE path >= ? AND path < ?',
+                                  (prefix, prefix + '\U0010FFFF'))
+        return {path: (file_id, mtime, size) for path, file_id, mtime, size in rows}
+
+    def sync_root(self, root_dir: str) -> 'List[str]':
+        """
+        Index the whole tree, dropping the notes outside it.
+        """
+        self.dirs = set()
+        with self.lock:
+            connection = self.get_connection()
+            prefix = root_dir.rstrip(os.sep) + os.sep
+            outside = [row[0] for row in connection.execute(
+                'SELECT id FROM files WHERE path < ? OR path >= ?', (prefix, prefix + '\U0010FFFF'))]
+            self.delete_files(connection, outside)
+            connection.commit()
+        return self.sync_dir(root_dir, recursive=True)
+
+    def sync_dir(self, dir_path: str, recursive: bool = True) -> 'List[str]':
+        """
+        Index the files changed within the directory, and remove the ones that are not there anymore.
+        The new sub-directories are indexed recursively either way.
+
+        Returns:
+            List[str]: Directories found that were not known before
+        """
+        files, new_dirs, sub_dirs = self.scan_dir(dir_path, recursive)
+
+        with self.lock:
+            connection = self.get_connection()
+            indexed = self.get_indexed_files(connection, dir_path)
+            removed = self.get_removed_files(indexed, files, dir_path, recursive, sub_dirs)
+            self.delete_files(connection, removed)
+            updated = self.update_files(connection, indexed, files)
+            connection.commit()
+
+        # Forget the removed sub-directories
+        self.dirs = {path for path in self.dirs
+                     if not path.startswith(dir_path + os.sep) or self.get_sub_dir(dir_path, path) in sub_dirs}
+
+        self.logger.debug(f"Workspace index synced '{dir_path}': {updated} updated, {len(removed)} removed")
+
+        return new_dirs
+
+    def scan_dir(self, dir_path: str, recursive: bool) -> tuple:
+        """
+        Find the files to index within the directory, descending into the sub-directories if recursive, and into the
+        new ones either way.
+
+        Returns:
+            tuple: Files found with their stats by path, the directories not known before and the direct
+                sub-directories (to find out the removed ones)
+        """
+        files = {}  # type: Dict[str, os.stat_result]
+        new_dirs = []  # type: List[str]
+        sub_dirs = set()  # type: set[str]
+
+        if dir_path not in self.dirs:
+            self.dirs.add(dir_path)
+            new_dirs.append(dir_path)
+
+        scan_dirs = [dir_path]
+        while scan_dirs:
+            scan_dir = scan_dirs.pop()
+            try:
+                entries = list(os.scandir(scan_dir))
+            except OSError as e:
+                self.logger.debug(f"Cannot scan directory '{scan_dir}': {e}")
+                continue
+            for entry in entries:
+                if self.is_hidden(entry.name):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if scan_dir == dir_path:
+                            sub_dirs.add(entry.path)
+                        if recursive or entry.path not in self.dirs:
+                            if entry.path not in self.dirs:
+                                self.dirs.add(entry.path)
+                                new_dirs.append(entry.path)
+                            scan_dirs.append(entry.path)
+                    elif entry.is_file() and self.is_indexable(entry.name):
+                        files[entry.path] = entry.stat()
+                except OSError:
+                    continue
+
+        return files, new_dirs, sub_dirs
+
+    def get_removed_files(self, indexed: 'Dict[str, Tuple[int, float, int]]', files: 'Dict[str, os.stat_result]',
+                          dir_path: str, recursive: bool, sub_dirs: 'set[str]') -> 'List[int]':
+        """
+        Ids of the indexed files that are not there anymore. Without the recursion only the directory's own files and
+        the files of its removed sub-directories are checked, the rest of the tree is not scanned.
+        """
+        removed = []  # type: List[int]
+        for path, (file_id, _mtime, _size) in indexed.items():
+            if path in files:
+                continue
+            if (recursive or os.path.dirname(path) == dir_path
+                    # Files of the removed sub-directories
+                    or self.get_sub_dir(dir_path, path) not in sub_dirs):
+                removed.append(file_id)
+        return removed
+
+    def update_files(self, connection: sqlite3.Connection, indexed: 'Dict[str, Tuple[int, float, int]]',
+                     files: 'Dict[str, os.stat_result]') -> int:
+        """
+        Index the files that are new or changed since indexed.
+
+        Returns:
+            int: Number of the files indexed
+        """
+        updated = 0
+        for path, stat in files.items():
+            if path in indexed and indexed[path][1:] == (stat.st_mtime, stat.st_size):
+                continue
+            self.index_file(connection, path, stat, indexed[path][0] if path in indexed else None)
+            updated += 1
+        return updated
+
+    def sync_file(self, file_path: str) -> 'List[str]':
+        """
+        Index the file again, or remove it if it is not there anymore.
+        """
+        with self.lock:
+            connection = self.get_connection()
+            row = connection.execute('SELECT id, mtime, size FROM files WHERE path = ?', (file_path,)).fetchone()
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                stat = None
+            if stat is None or not self.is_indexable(file_path):
+                if row is not None:
+                    self.delete_files(connection, [row[0]])
+            elif row is None or row[1:] != (stat.st_mtime, stat.st_size):
+                self.index_file(connection, file_path, stat, row[0] if row is not None else None)
+            connection.commit()
+
+        return []
+
+    def index_file(self, connection: sqlite3.Connection, file_path: str, stat: os.stat_result,
+                   file_id: Union[int, None]) -> None:
+        if file_id is None:
+            file_id = connection.execute('INSERT INTO files (path, mtime, size) VALUES (?, ?, ?)',
+                                         (file_path, stat.st_mtime, stat.st_size)).lastrowid
+        else:
+            connection.execute('UPDATE files SET mtime = ?, size = ? WHERE id = ?',
+                               (stat.st_mtime, stat.st_size, file_id))
+            connection.execute('DELETE FROM notes WHERE rowid = ?', (file_id,))
+        # The file is kept within the files table anyway, so it is not read again until changed
+        content = self.read_note(file_path, stat)
+        if content is not None:
+            connection.execute('INSERT INTO notes (rowid, content) VALUES (?, ?)', (file_id, content))
+
+    def read_note(self, file_path: str, stat: os.stat_result) -> Union[str, None]:
+        """
+        Note content without the header, or None if the note is not to be indexed (encrypted, too large, etc.).
+        """
+        if stat.st_size > self.MAX_FILE_SIZE:
+            return None
+        # The encrypted notes are skipped without reading their content
+        if FileHeader().probe(file_path).is_file_encrypted():
+            return None
+        try:
+            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+                file_data = f.read()
+        except OSError as e:
+            self.logger.debug(f"Cannot read file '{file_path}': {e}")
+            return None
+        file_header, file_body = FileHeader().load(file_data)
+        if file_header.is_file_encrypted():
+            return None
+        return file_body if file_body else ''
+
+    @staticmethod
+    def delete_files(connection: sqlite3.Connection, file_ids: 'List[int]') -> None:
+        for file_id in file_ids:
+            connection.execute('DELETE FROM notes WHERE rowid = ?', (file_id,))
+            connection.execute('DELETE FROM files WHERE id = ?', (file_id,))
+
+    @staticmethod
+    def get_words(query: str) -> 'List[str]':
+        return re.findall(r'\w+', query)
+
+    def get_terms(self, query: str) -> 'List[str]':
+        return [word.lower() for word in self.get_words(query)]
+
+    def search_sync(self, query: str) -> 'List[Tuple[str, int, str]]':
+        """
+        Find the notes containing all the words of the query, the last one as a prefix, best matches first.
+
+        Returns:
+            List[Tuple[str, int, str]]: File path, number of the matching line within the note content
+                (starting from 0, without the header) and the line itself
+        """
+        terms = self.get_terms(query)
+        if not terms:
+            return []
+
+        with self.lock:
+            connection = self.get_connection()
+            if self.fts:
+                match = ' '.join('"%s"' % term for term in terms) + '*'
+                rows = connection.execute(
+                    'SELECT files.path, notes.content FROM notes JOIN files ON files.id = notes.rowid '
+                    'WHERE notes MATCH ? ORDER BY rank LIMIT ?', (match, self.MAX_RESULTS)).fetchall()
+            else:
+                condition = ' AND '.join(['instr(lower(content), ?) > 0'] * len(terms))
+                rows = connection.execute(
+                    'SELECT files.path, notes.content FROM notes JOIN files ON files.id = notes.rowid '
+                    f'WHERE {condition} ORDER BY files.path LIMIT ?', (*terms, self.MAX_RESULTS)).fetchall()
+
+        results = []
+        for path, content in rows:
+            line_num, line = self.find_line(content, terms)
+            results.append((path, line_num, line))
+
+        self.logger.debug(f"Workspace search '{query}': {len(results)} result(s)")
+
+        return results
+
+    def find_line(self, content: str, terms: 'List[str]') -> 'Tuple[int, str]':
+        """
+        The first line containing the most of the terms.
+        """
+        best_num, best_line, best_count = 0, '', 0
+        for line_num, line in enumerate(content.splitlines()):
+            line_lower = line.lower()
+            count = sum(1 for term in terms if term in line_lower)
+            if count > best_count:
+                best_num, best_line, best_count = line_num, line, count
+                if count == len(terms):
+                    break
+        return best_num, best_line.strip()[:self.MAX_LINE_LENGTH]
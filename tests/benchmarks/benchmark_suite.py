@@ -0,0 +1,384 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Benchmark suite of the editor.
+- Functionality: Measures the startup time to the window shown, the mode switches (VIEW and EDIT mode content
+  loading), the full Markdown re-highlighting, the search occurrences counting and the encryption round-trip on
+  synthetic notes of various sizes. Runs headless and writes the results to a JSON file, to compare the results of
+  the various versions with compare.py.
+
+Usage:
+    QT_QPA_PLATFORM=offscreen python -m tests.benchmarks.benchmark_suite -o results.json
+    python -m tests.benchmarks.compare baseline.json results.json
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from typing import TYPE_CHECKING, Any, Callable
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import statistics
+import subprocess
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Union  # noqa: F401
+
+# For headless operation
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+BENCHMARKS = ('startup', 'load_content_html', 'load_content_edit', 'rehighlight', 'searched_text_count',
+              'crypt_roundtrip', 'crypt_roundtrip_chunked')  # type: tuple
+
+DEFAULT_SIZES = '1K,10K,100K,1M,10M,50M'  # type: str
+
+# Markdown block the synthetic notes are made of, with the elements of the various highlighting rules
+NOTE_BLOCK = """## Heading with `code`
+
+Some **bold**, *italic* and ***bold italic*** text with a [link](https://notolog.app), ~~strikethrough~~ and :cat:.
+> Blockquote with **bold** text
+
+- List item
+    1. Nested ordered item
+- [ ] Task item
+
+```python
+def main():
+    return 'code block'
+```
+
+| Column | Value |
+|--------|-------|
+| a      | 1     |
+
+<!-- Comment -->
+---
+
+"""
+
+# The startup is measured within a new process each time, from its start up to the window shown and painted
+STARTUP_CODE = """
+import time
+started_at = time.perf_counter()
+import os
+import sys
+import json
+from PySide6.QtWidgets import QApplication
+from notolog import app
+from notolog.app_config import AppConfig
+from notolog.notolog_editor import NotologEditor
+
+# The test settings are used, not the user ones
+AppConfig().set_test_mode(True)
+AppConfig.get_settings_app_name = AppConfig.get_settings_app_name_qa
+NotologEditor.select_default_path_dialog = lambda self: None
+show = NotologEditor.show
+
+def show_first(self):
+    show(self)
+    QApplication.processEvents()
+    print(json.dumps({'startup': time.perf_counter() - started_at}), flush=True)
+    os._exit(0)
+
+NotologEditor.show = show_first
+sys.argv = ['notolog']
+app.main()
+"""
+
+
+def parse_size(value: str) -> int:
+    """
+    Parse the size like 1K, 10M or 512 to the number of characters.
+    """
+    value = value.strip().upper()
+    units = {'K': 1024, 'M': 1024 ** 2}
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+def format_size(size: int) -> str:
+    for unit, unit_size in (('M', 1024 ** 2), ('K', 1024)):
+        if size >= unit_size and size % unit_size == 0:
+            return f'{size // unit_size}{unit}'
+    return str(size)
+
+
+def make_note(size: int) -> str:
+    """
+    Synthetic Markdown note of the size given, in characters.
+    """
+    return (NOTE_BLOCK * (size // len(NOTE_BLOCK) + 1))[:size]
+
+
+def measure(func: Callable[[], Any], repeat: int, setup: Callable[[], Any] = None) -> 'Dict[str, Any]':
+    """
+    Run the function a number of times, the setup (e.g. to clear the caches) is run before each run untimed.
+
+    Returns:
+        Dict[str, Any]: Times of the runs and their median, min and mean, in seconds
+    """
+    runs = []  # type: List[float]
+    for _run in range(repeat):
+        if callable(setup):
+            setup()
+        start = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - start)
+    return summarize(runs)
+
+
+def summarize(runs: 'List[float]') -> 'Dict[str, Any]':
+    return {'median': statistics.median(runs), 'min': min(runs), 'mean': statistics.mean(runs), 'runs': runs}
+
+
+class BenchmarkSuite:
+    """
+    Runs the benchmarks selected. The sized benchmarks run from the smallest note up, the larger notes are skipped
+    once the benchmark is estimated to take longer than the time budget, as some of them are not linear.
+    """
+
+    def __init__(self, sizes: 'List[int]', repeat: int = 3, budget: float = 60.0, benchmarks: 'List[str]' = None):
+        """
+        Args:
+            sizes (List[int]): Sizes of the notes, in characters
+            repeat (int, optional): Number of the runs of each benchmark
+            budget (float, optional): Estimated time of all the runs of a benchmark to skip the note size, in seconds
+            benchmarks (List[str], optional): Benchmarks to run, all of them by default
+        """
+        self.sizes = sorted(sizes)
+        self.repeat = max(repeat, 1)
+        self.budget = budget
+        self.benchmarks = benchmarks or list(BENCHMARKS)
+
+        self.results = {}  # type: Dict[str, Dict[str, Any]]
+        self.editor = None  # type: Any
+
+    def run(self, progress: Callable[[str, 'Dict[str, Any]'], Any] = None) -> 'Dict[str, Any]':
+        """
+        Returns:
+            Dict[str, Any]: The environment details ('meta') and the results of the benchmarks ('results')
+        """
+        for name in BENCHMARKS:
+            if name not in self.benchmarks:
+                continue
+            if name == 'startup':
+                self.add_result('startup', self.bench_startup(), progress)
+            else:
+                self.run_sized(name, getattr(self, f'bench_{name}'), progress)
+
+        return {'meta': self.get_meta(), 'results': self.results}
+
+    def add_result(self, key: str, result: 'Dict[str, Any]', progress: Callable = None) -> None:
+        self.results[key] = result
+        if callable(progress):
+            progress(key, result)
+
+    def run_sized(self, name: str, bench: Callable[[str], 'Dict[str, Any]'], progress: Callable = None) -> None:
+        previous = None  # type: Union[tuple, None]
+        for size in self.sizes:
+            key = f'{name}/{format_size(size)}'
+            if previous is not None:
+                estimate = previous[1] * size / previous[0] * self.repeat
+                if estimate > self.budget:
+                    self.add_result(key, {'skipped': f'estimated {estimate:.1f} s exceeds the budget'}, progress)
+                    continue
+            result = bench(make_note(size))
+            previous = (size, result['median'])
+            self.add_result(key, result, progress)
+
+    def get_meta(self) -> 'Dict[str, Any]':
+        import PySide6
+        from notolog.app_config import AppConfig
+        return {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'app_version': AppConfig().get_app_version(),
+            'python': platform.python_version(),
+            'pyside': PySide6.__version__,
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count(),
+            'repeat': self.repeat,
+        }
+
+    def bench_startup(self) -> 'Dict[str, Any]':
+        """
+        Time from the process start up to the window shown, the interpreter start up itself is not included.
+        """
+        runs = []  # type: List[float]
+        env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+        # The first run compiles the bytecode and warms up the file system cache, it is not counted
+        for _run in range(self.repeat + 1):
+            output = subprocess.run([sys.executable, '-c', STARTUP_CODE], capture_output=True, text=True, env=env,
+                                    cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                                    timeout=300)
+            lines = [line for line in output.stdout.splitlines() if line.startswith('{')]
+            if not lines:
+                raise RuntimeError(f'Startup benchmark failed: {output.stderr[-2000:]}')
+            runs.append(json.loads(lines[-1])['startup'])
+        return summarize(runs[1:])
+
+    def get_editor(self) -> Any:
+        if self.editor is not None:
+            return self.editor
+
+        from PySide6.QtCore import QCoreApplication
+        from PySide6.QtWidgets import QApplication
+        from notolog.app_config import AppConfig
+        from notolog.notolog_editor import NotologEditor
+
+        app = QApplication.instance() or QApplication(sys.argv)
+        # The test settings are used, not the user ones
+        QCoreApplication.setOrganizationName(AppConfig().get_settings_org_name())
+        QCoreApplication.setApplicationName(AppConfig().get_settings_app_name_qa())
+        AppConfig().set_test_mode(True)
+        # No default directory prompt
+        NotologEditor.select_default_path_dialog = lambda self: None
+
+        self.editor = NotologEditor(screen=app.screens()[0])
+        self.editor.show()
+        app.processEvents()
+        return self.editor
+
+    def bench_load_content_html(self, content: str) -> 'Dict[str, Any]':
+        from notolog.file_header import FileHeader
+        from notolog.hilite_cache_extension import HiliteCache
+
+        editor = self.get_editor()
+
+        def setup():
+            # Rendered from scratch each time
+            editor.clear_render_cache()
+            HiliteCache.clear()
+
+        result = measure(lambda: editor.load_content_html(FileHeader(), content), self.repeat, setup=setup)
+        editor.get_view_doc().clear()
+        return result
+
+    def bench_load_content_edit(self, content: str) -> 'Dict[str, Any]':
+        from notolog.file_header import FileHeader
+
+        editor = self.get_editor()
+        result = measure(lambda: editor.load_content_edit(FileHeader(), content), self.repeat,
+                         setup=lambda: editor.get_edit_widget().clear())
+        editor.get_edit_widget().clear()
+        return result
+
+    def bench_rehighlight(self, content: str) -> 'Dict[str, Any]':
+        from PySide6.QtGui import QTextDocument
+        from notolog.highlight.md_highlighter import MdHighlighter
+
+        self.get_editor()
+        # The document is set before the highlighter is attached, so only the re-highlighting is measured
+        document = QTextDocument()
+        document.setPlainText(content)
+        md_highlighter = MdHighlighter(document=document)
+        result = measure(md_highlighter.rehighlight, self.repeat)
+        md_highlighter.setDocument(None)
+        return result
+
+    def bench_searched_text_count(self, content: str) -> 'Dict[str, Any]':
+        from PySide6.QtGui import QTextDocument
+        from notolog.edit_widget import EditWidget
+
+        self.get_editor()
+        # Without the highlighter, as only the search is measured
+        edit_widget = EditWidget()
+        edit_widget.setPlainText(content)
+        find_flags = QTextDocument.FindFlag.FindCaseSensitively
+        # The occurrences are indexed from scratch each time
+        result = measure(lambda: edit_widget.searched_text_count('bold', find_flags), self.repeat,
+                         setup=edit_widget.search_index.clear)
+        result['count'] = edit_widget.searched_text_count('bold', find_flags)
+        edit_widget.deleteLater()
+        return result
+
+    @staticmethod
+    def get_enc_helper() -> Any:
+        from notolog.encrypt.enc_helper import EncHelper
+        from notolog.encrypt.enc_password import EncPassword
+
+        enc_password = EncPassword()
+        enc_password.password = 'benchmark'
+        # The key derivation itself is not measured
+        return EncHelper(enc_password=enc_password, salt=EncHelper.generate_salt(), iterations=1, key=os.urandom(32))
+
+    def bench_crypt_roundtrip(self, content: str) -> 'Dict[str, Any]':
+        enc_helper = self.get_enc_helper()
+
+        def roundtrip():
+            assert enc_helper.decrypt_data(enc_helper.encrypt_data(content.encode('utf-8'))) is not None
+
+        return measure(roundtrip, self.repeat)
+
+    def bench_crypt_roundtrip_chunked(self, content: str) -> 'Dict[str, Any]':
+        """
+        The chunked format the notes are saved with, see EncHelper.encrypt_text().
+        """
+        enc_helper = self.get_enc_helper()
+
+        def roundtrip():
+            assert enc_helper.decrypt_text(list(enc_helper.encrypt_text(content))) == content
+
+        return measure(roundtrip, self.repeat)
+
+
+def main(argv: 'List[str]' = None) -> int:
+    parser = argparse.ArgumentParser(description='Run the benchmarks of the editor and write the results to JSON.')
+    parser.add_argument('-o', '--output', help='JSON file to write the results to, stdout if not set')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                        help=f'comma separated sizes of the synthetic notes, in characters (default: {DEFAULT_SIZES})')
+    parser.add_argument('--repeat', type=int, default=3, help='number of the runs of each benchmark (default: 3)')
+    parser.add_argument('--budget', type=float, default=60.0,
+                        help='skip the larger notes once a benchmark is estimated to take longer, in seconds '
+                             '(default: 60)')
+    parser.add_argument('--only', help=f'comma separated benchmarks to run: {", ".join(BENCHMARKS)}')
+    args = parser.parse_args(argv)
+
+    benchmarks = [name.strip() for name in args.only.split(',')] if args.only else None
+    unknown = set(benchmarks or []) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f'unknown benchmarks: {", ".join(sorted(unknown))}')
+
+    # Logging is not measured
+    logging.disable(logging.WARNING)
+
+    def progress(key: str, result: 'Dict[str, Any]') -> None:
+        if 'skipped' in result:
+            print(f'{key:<32} skipped, {result["skipped"]}', file=sys.stderr)
+        else:
+            print(f'{key:<32} {result["median"] * 1e3:>12.2f} ms', file=sys.stderr)
+
+    suite = BenchmarkSuite([parse_size(size) for size in args.sizes.split(',')], repeat=args.repeat,
+                           budget=args.budget, benchmarks=benchmarks)
+    data = json.dumps(suite.run(progress=progress), indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(data)
+    else:
+        print(data)
+
+    return 0
+
+
+if __name__ == '__main__':
+    exit_code = main()
+    # Skip the Qt teardown of the editor
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(exit_code)
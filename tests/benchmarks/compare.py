@@ -0,0 +1,122 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Comparison of the benchmark results.
+- Functionality: Compares the median times of the benchmarks of two result files written by benchmark_suite.py and
+  flags the benchmarks slower than the baseline beyond the threshold. Exits with 1 if there are any regressions,
+  e.g. to fail a CI job.
+
+Usage:
+    python -m tests.benchmarks.compare baseline.json results.json --threshold 0.2
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+import sys
+import json
+import argparse
+
+if TYPE_CHECKING:
+    from typing import Dict, List  # noqa: F401
+
+REGRESSION = 'regression'  # type: str
+IMPROVEMENT = 'improvement'  # type: str
+UNCHANGED = 'ok'  # type: str
+NEW = 'new'  # type: str
+MISSING = 'missing'  # type: str
+SKIPPED = 'skipped'  # type: str
+
+
+def load_results(file_path: str) -> 'Dict[str, Dict[str, Any]]':
+    with open(file_path, encoding='utf-8') as f:
+        return json.load(f).get('results', {})
+
+
+def compare(baseline: 'Dict[str, Dict[str, Any]]', current: 'Dict[str, Dict[str, Any]]', threshold: float = 0.2,
+            min_delta: float = 0.005) -> 'List[Dict[str, Any]]':
+    """
+    Compare the median times of the benchmarks.
+
+    Args:
+        baseline (Dict[str, Dict[str, Any]]): Results of the baseline
+        current (Dict[str, Dict[str, Any]]): Results to compare with the baseline
+        threshold (float, optional): Relative slowdown to flag as a regression, 0.2 is 20% slower
+        min_delta (float, optional): Absolute difference below which the change is considered as noise, in seconds
+
+    Returns:
+        List[Dict[str, Any]]: Rows of the benchmarks with the 'name', 'baseline' and 'current' median times, relative
+            'change' and 'status'
+    """
+    rows = []  # type: List[Dict[str, Any]]
+    for name in list(baseline) + [name for name in current if name not in baseline]:
+        base_time = baseline.get(name, {}).get('median')
+        current_time = current.get(name, {}).get('median')
+        row = {'name': name, 'baseline': base_time, 'current': current_time, 'change': None}
+        if name not in current:
+            row['status'] = MISSING
+        elif name not in baseline:
+            row['status'] = NEW
+        elif base_time is None or current_time is None:
+            # Skipped within either of the runs, e.g. over the time budget
+            row['status'] = SKIPPED
+        else:
+            row['change'] = (current_time - base_time) / base_time if base_time > 0 else 0.0
+            if abs(current_time - base_time) < min_delta:
+                row['status'] = UNCHANGED
+            elif row['change'] > threshold:
+                row['status'] = REGRESSION
+            elif row['change'] < -threshold:
+                row['status'] = IMPROVEMENT
+            else:
+                row['status'] = UNCHANGED
+        rows.append(row)
+    return rows
+
+
+def format_rows(rows: 'List[Dict[str, Any]]') -> str:
+    def format_time(value: Any) -> str:
+        return f'{value * 1e3:.2f} ms' if value is not None else '-'
+
+    lines = [f'{"benchmark":<36} {"baseline":>14} {"current":>14} {"change":>9}  status']
+    for row in rows:
+        change = f'{row["change"] * 100:+.1f}%' if row['change'] is not None else '-'
+        lines.append(f'{row["name"]:<36} {format_time(row["baseline"]):>14} {format_time(row["current"]):>14} '
+                     f'{change:>9}  {row["status"]}')
+    return '\n'.join(lines)
+
+
+def main(argv: 'List[str]' = None) -> int:
+    parser = argparse.ArgumentParser(description='Compare the benchmark results with the baseline ones.')
+    parser.add_argument('baseline', help='JSON file with the baseline results')
+    parser.add_argument('current', help='JSON file with the results to compare')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='relative slowdown to flag as a regression (default: 0.2, 20%% slower)')
+    parser.add_argument('--min-delta', type=float, default=0.005,
+                        help='absolute difference to ignore as noise, in seconds (default: 0.005)')
+    args = parser.parse_args(argv)
+
+    rows = compare(load_results(args.baseline), load_results(args.current), threshold=args.threshold,
+                   min_delta=args.min_delta)
+    print(format_rows(rows))
+
+    regressions = [row['name'] for row in rows if row['status'] == REGRESSION]
+    if regressions:
+        print(f'\nRegressions beyond {args.threshold * 100:.0f}%: {", ".join(regressions)}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
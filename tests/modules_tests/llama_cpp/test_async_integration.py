@@ -17,9 +17,11 @@ For detailed instructions and project information, please see the repository's R
 """
 
 import pytest
+import time
 import asyncio
 import logging
-from unittest.mock import MagicMock, patch
+import threading
+from unittest.mock import MagicMock
 
 from notolog.app_config import AppConfig
 
@@ -46,7 +48,7 @@ class TestAsyncIntegration:
     @pytest.mark.skipif(not is_module_available('llama_cpp'), reason="llama_cpp module not available")
     @pytest.mark.asyncio
     async def test_async_wrap_iterator_yields_control(self, mocker, tmp_path):
-        """Test that async_wrap_iterator properly yields control to event loop."""
+        """Test that async_wrap_iterator runs the iterator on a worker thread, keeping the event loop responsive."""
         # Create a dummy model file
         dummy_model = tmp_path / "test.gguf"
         dummy_model.touch()
@@ -64,31 +66,139 @@ class TestAsyncIntegration:
             {'choices': [{'delta': {'finish_reason': 'stop'}}]},
         ]
 
+        iterator_threads = set()
+
         def mock_iterator():
             for item in mock_data:
+                iterator_threads.add(threading.get_ident())
+                # Blocking decode step
+                time.sleep(0.05)
                 yield item
 
-        # Track how many times asyncio.sleep was called
-        sleep_count = 0
-        original_sleep = asyncio.sleep
+        # Count the event loop iterations while the chunks are generated
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
 
-        async def counted_sleep(delay):
-            nonlocal sleep_count
-            sleep_count += 1
-            await original_sleep(delay)
+        ticker_task = asyncio.ensure_future(ticker())
 
         # Collect outputs
         outputs = []
-        with patch('asyncio.sleep', side_effect=counted_sleep):
-            async for output in helper.async_wrap_iterator(mock_iterator()):
-                outputs.append(output)
+        async for output in helper.async_wrap_iterator(mock_iterator()):
+            outputs.append(output)
+        ticker_task.cancel()
 
-        # Should have yielded control multiple times
-        assert sleep_count >= len(mock_data), "Should yield control for each chunk"
+        # Generated on the worker thread, the loop was not blocked by the decode steps
+        assert iterator_threads and threading.get_ident() not in iterator_threads
+        assert ticks >= len(mock_data) * 3
         # Should have correct outputs (role is empty, content is preserved)
-        assert '' in outputs  # Role output
-        assert 'Hello' in outputs
-        assert ' world' in outputs
+        assert outputs == ['', 'Hello', ' world', '']
+
+    @pytest.mark.skipif(not is_module_available('llama_cpp'), reason="llama_cpp module not available")
+    @pytest.mark.asyncio
+    async def test_stop_generation(self, mocker, tmp_path):
+        """Test that stop_generation stops the iteration between the chunks and closes the generator."""
+        dummy_model = tmp_path / "test.gguf"
+        dummy_model.touch()
+
+        ModelHelper._instance = None
+        helper = ModelHelper(model_path=str(dummy_model), search_options={})
+
+        generated = []
+        closed = []
+
+        def endless_iterator():
+            try:
+                while True:
+                    time.sleep(0.01)
+                    generated.append(True)
+                    yield {'choices': [{'delta': {'content': 'token'}}]}
+            finally:
+                closed.append(True)
+
+        generator = endless_iterator()
+        outputs = []
+        while len(outputs) < 3:
+            outputs.append(await helper.generate_output(generator))
+
+        helper.stop_generation(timeout=5)
+        assert closed == [True]
+        assert not helper.generations
+        # The generation ahead of the outputs taken is bounded by the queue
+        assert len(generated) <= len(outputs) + ModelHelper.QUEUE_SIZE + 1
+
+    @pytest.mark.skipif(not is_module_available('llama_cpp'), reason="llama_cpp module not available")
+    @pytest.mark.asyncio
+    async def test_generations_serialized(self, mocker, tmp_path):
+        """Test that the generation stopped is done before the next one decodes, without blocking the event loop."""
+        dummy_model = tmp_path / "test.gguf"
+        dummy_model.touch()
+
+        ModelHelper._instance = None
+        helper = ModelHelper(model_path=str(dummy_model), search_options={})
+
+        active = []
+        overlaps = []
+
+        def slow_iterator(name):
+            for _index in range(3):
+                active.append(name)
+                if len(active) > 1:
+                    overlaps.append(list(active))
+                # Blocking decode step, longer than the stop takes
+                time.sleep(0.1)
+                active.remove(name)
+                yield {'choices': [{'delta': {'content': name}}]}
+
+        first = slow_iterator('first')
+        assert await helper.generate_output(first) == 'first'
+        # Stopped while the next token is being decoded
+        helper.stop_generation()
+        assert helper.generations
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker_task = asyncio.ensure_future(ticker())
+        await helper.wait_generations()
+        ticker_task.cancel()
+        assert not helper.generations
+        # Waited off the loop
+        assert ticks >= 3
+
+        second = slow_iterator('second')
+        assert await helper.generate_output(second) == 'second'
+        helper.stop_generation(timeout=5)
+        assert not overlaps
+
+    @pytest.mark.skipif(not is_module_available('llama_cpp'), reason="llama_cpp module not available")
+    @pytest.mark.asyncio
+    async def test_async_wrap_iterator_error(self, mocker, tmp_path):
+        """Test that the errors of the iterator are raised on the event loop side."""
+        dummy_model = tmp_path / "test.gguf"
+        dummy_model.touch()
+
+        ModelHelper._instance = None
+        helper = ModelHelper(model_path=str(dummy_model), search_options={})
+
+        def failing_iterator():
+            yield {'choices': [{'delta': {'content': 'Hello'}}]}
+            raise ValueError("Decode failed")
+
+        outputs = []
+        with pytest.raises(ValueError, match="Decode failed"):
+            async for output in helper.async_wrap_iterator(failing_iterator()):
+                outputs.append(output)
+        assert outputs == ['Hello']
 
     @pytest.mark.skipif(not is_module_available('llama_cpp'), reason="llama_cpp module not available")
     @pytest.mark.asyncio
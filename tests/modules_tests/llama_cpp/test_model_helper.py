@@ -23,9 +23,10 @@ from .. import is_module_available
 # Explicitly check if the module is available to avoid importing non-existent libraries.
 if is_module_available('llama_cpp'):
     from notolog.modules.llama_cpp.model_helper import ModelHelper
-    from llama_cpp import Llama
+    from llama_cpp import Llama, LlamaRAMCache, LlamaDiskCache
 else:
     from PySide6.QtCore import QObject as ModelHelper, QObject as Llama
+    from PySide6.QtCore import QObject as LlamaRAMCache, QObject as LlamaDiskCache
 
 import os
 import pytest
@@ -251,6 +252,71 @@ class TestModelHelper:
         # Assert the outputs match the expected results
         assert outputs == expected_outputs
 
+    @pytest.mark.parametrize("prompt_cache_disk, exp_cache_type", [(False, LlamaRAMCache), (True, LlamaDiskCache)])
+    def test_init_prompt_cache(self, mocker, tmp_path, prompt_cache_disk, exp_cache_type):
+        dummy_model = tmp_path / "test.gguf"
+        dummy_model.touch()
+        mocker.patch.object(AppConfig, 'get_app_config_path', return_value=str(tmp_path / "app_config.toml"))
+
+        ModelHelper.reload()
+        helper = ModelHelper(model_path=str(dummy_model), search_options={}, prompt_cache_disk=prompt_cache_disk)
+        helper.model = MagicMock(spec=Llama)
+
+        helper.init_prompt_cache()
+
+        assert isinstance(helper.prompt_cache, exp_cache_type)
+        helper.model.set_cache.assert_called_once_with(helper.prompt_cache)
+        if prompt_cache_disk:
+            # Separate directory per model next to the app config
+            cache_dir = helper.get_prompt_cache_dir()
+            assert os.path.dirname(cache_dir) == str(tmp_path / "llama_cpp_cache")
+            helper.n_ctx = helper.n_ctx * 2
+            assert helper.get_prompt_cache_dir() != cache_dir
+
+    def test_init_prompt_cache_error(self, mocker, test_model_helper: ModelHelper):
+        # The model works without the cache
+        test_model_helper.model = MagicMock(spec=Llama)
+        test_model_helper.model.set_cache.side_effect = RuntimeError('Cache error')
+
+        test_model_helper.init_prompt_cache()
+
+        assert test_model_helper.prompt_cache is None
+
+    def test_invalidate_prompt_cache(self, mocker, test_model_helper: ModelHelper):
+        test_model_helper.model = MagicMock(spec=Llama)
+        test_model_helper.init_prompt_cache()
+        clear_cache = mocker.patch.object(test_model_helper, 'clear_prompt_cache')
+
+        system = {'role': 'system', 'content': 'System prompt'}
+        turns = [{'role': 'user', 'content': 'Request 1'}, {'role': 'assistant', 'content': 'Response 1'},
+                 {'role': 'user', 'content': 'Request 2'}, {'role': 'assistant', 'content': 'Response 2'},
+                 {'role': 'user', 'content': 'Request 3'}]
+
+        # The next turns continue the prompt, so the cached states are kept
+        assert test_model_helper.invalidate_prompt_cache([system] + turns[:1]) is False
+        assert test_model_helper.invalidate_prompt_cache([system] + turns[:3]) is False
+        # The oldest turns are dropped from the history or shortened to fit the budget, the system prompt is reused
+        assert test_model_helper.invalidate_prompt_cache([system] + turns[2:]) is False
+        assert test_model_helper.invalidate_prompt_cache(
+            [system, dict(turns[2], content='Request')] + turns[3:]) is False
+        # Single-turn mode
+        assert test_model_helper.invalidate_prompt_cache([system, turns[4]]) is False
+        clear_cache.assert_not_called()
+
+        # The system prompt is changed
+        assert test_model_helper.invalidate_prompt_cache([dict(system, content='Other')] + turns[2:]) is True
+        assert test_model_helper.invalidate_prompt_cache([dict(system, content='Other'), turns[4]]) is False
+        assert clear_cache.call_count == 1
+
+    def test_clear_prompt_cache(self, test_model_helper: ModelHelper):
+        test_model_helper.model = MagicMock(spec=Llama)
+        test_model_helper.init_prompt_cache()
+        test_model_helper.prompt_cache.cache_state[(1, 2, 3)] = 'state'
+
+        test_model_helper.clear_prompt_cache()
+
+        assert len(test_model_helper.prompt_cache.cache_state) == 0
+
     @pytest.mark.skipif(not is_module_available('llama_cpp'), reason="llama_cpp module not available")
     def test_is_model_loaded_initially_false(self, mocker, tmp_path):
         """Test that is_model_loaded returns False when no model is loaded."""
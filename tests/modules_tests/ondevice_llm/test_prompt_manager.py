@@ -24,6 +24,7 @@ from .. import is_module_available
 # Explicitly check if the module is available to avoid importing non-existent libraries.
 if is_module_available('ondevice_llm'):
     from notolog.modules.ondevice_llm.prompt_manager import PromptManager
+    from notolog.modules.token_budget import TokenBudget
 else:
     from PySide6.QtCore import QObject as PromptManager
 
@@ -290,3 +291,30 @@ class TestPromptManager:
         result = test_prompt_manager.find_last_message_by_role(role)
 
         assert result == exp_result
+
+    def test_format_history_token_budget(self):
+        PromptManager.reload()
+        token_budget = TokenBudget(count_tokens=lambda text: len(text.split()), max_tokens=60, shorten_oversized=False)
+        prompt_manager = PromptManager(token_budget=token_budget, parent=None)
+        for msg_id in range(1, 6):
+            prompt_manager.add_message(f'Request{msg_id} ' + 'word ' * 4, msg_id * 2, None,
+                                       EnumMessageType.USER_INPUT)
+            prompt_manager.add_message(f'Response{msg_id} ' + 'word ' * 4, msg_id * 2, msg_id * 2 + 1,
+                                       EnumMessageType.RESPONSE)
+        prompt_manager.add_message('The last request', 12, None, EnumMessageType.USER_INPUT)
+
+        # The newest records that fit, each of them is a request and a response
+        prompt = prompt_manager.get_prompt(multi_turn=True)
+        assert 'Request3' not in prompt
+        assert prompt.index('Request4') < prompt.index('Response4') < prompt.index('Request5')
+        assert prompt.endswith(PromptManager.prompt_template.format(input='The last request'))
+        assert len(prompt.split()) + 3 * TokenBudget.MESSAGE_OVERHEAD <= 60
+
+        # The oldest record that does not fit is shortened instead
+        prompt_manager.history[3]['user']['text'] = 'Request4 ' + 'word ' * 100
+        prompt_manager.history[3]['assistant']['text'] = 'Response4 ' + 'word ' * 100
+        token_budget.shorten_oversized = True
+        token_budget.max_tokens = 100
+        prompt = prompt_manager.get_prompt(multi_turn=True)
+        assert prompt.count(TokenBudget.SHORTENED_MARKER) == 2
+        assert 'Request4 word' in prompt and 'Response4 word' in prompt and 'Request3' not in prompt
@@ -24,6 +24,7 @@ from .. import is_module_available
 # Explicitly check if the module is available to avoid importing non-existent libraries.
 if is_module_available('openai_api'):
     from notolog.modules.openai_api.prompt_manager import PromptManager
+    from notolog.modules.token_budget import TokenBudget
 else:
     from PySide6.QtCore import QObject as PromptManager
 
@@ -333,3 +334,33 @@ class TestPromptManager:
         result = test_prompt_manager.find_last_message_by_role(role)
 
         assert result == exp_result
+
+    def test_get_prompt_token_budget(self):
+        PromptManager.reload()
+        # A token per word, fits the system prompt and about 3 messages of 10 words
+        token_budget = TokenBudget(count_tokens=lambda text: len(text.split()),
+                                   max_tokens=3 + TokenBudget.MESSAGE_OVERHEAD + 3 * 14, shorten_oversized=False)
+        prompt_manager = PromptManager(system_prompt='The system prompt', token_budget=token_budget, parent=None)
+        for msg_id in range(1, 6):
+            prompt_manager.add_message(f'Request {msg_id} ' + 'word ' * 8, msg_id * 2, None,
+                                       EnumMessageType.USER_INPUT)
+            prompt_manager.add_message(f'Response {msg_id} ' + 'word ' * 8, msg_id * 2, msg_id * 2 + 1,
+                                       EnumMessageType.RESPONSE)
+        prompt_manager.add_message('The last request', 12, None, EnumMessageType.USER_INPUT)
+
+        prompt = prompt_manager.get_prompt(multi_turn=True)
+        # The system prompt and the newest messages, starting with a request
+        assert [message['content'].split(' word')[0] for message in prompt] == [
+            'The system prompt', 'Request 5', 'Response 5', 'The last request']
+        # The history itself is kept
+        assert len(prompt_manager.history) == 12
+
+        # The oldest message that does not fit is shortened instead
+        prompt_manager.add_message('Request 5 ' + 'word ' * 200, 10, None, EnumMessageType.USER_INPUT)
+        token_budget.shorten_oversized = True
+        token_budget.max_tokens += TokenBudget.MIN_SHORTENED_TOKENS
+        prompt = prompt_manager.get_prompt(multi_turn=True)
+        assert len(prompt) == 4
+        assert prompt[1]['content'].startswith('Request 5 word')
+        assert prompt[1]['content'].endswith(TokenBudget.SHORTENED_MARKER)
+        assert prompt[-2:] == [message['data'] for message in prompt_manager.history[-2:]]
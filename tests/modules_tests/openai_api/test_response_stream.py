@@ -0,0 +1,214 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from PySide6.QtCore import QByteArray
+from PySide6.QtNetwork import QNetworkReply
+
+from notolog.app_config import AppConfig
+from notolog.ui.ai_assistant.ai_assistant import EnumMessageType, EnumMessageStyle
+
+from .. import is_module_available
+
+# Explicitly check if the module is available to avoid importing non-existent libraries.
+if is_module_available('openai_api'):
+    from notolog.modules.openai_api.api_helper import ApiHelper, EventStreamParser
+    from notolog.modules.openai_api.module_core import ModuleCore
+else:
+    from PySide6.QtCore import QObject as ApiHelper, QObject as EventStreamParser, QObject as ModuleCore
+
+from unittest.mock import MagicMock
+
+import json
+import pytest
+import logging
+import asyncio
+
+
+def get_chunk(content=None, usage=None):
+    chunk = {'id': 'chatcmpl-1', 'object': 'chat.completion.chunk', 'model': 'test-model',
+             'choices': [{'index': 0, 'delta': {'content': content} if content is not None else {},
+                          'finish_reason': None if content is not None else 'stop'}]}
+    if usage is not None:
+        chunk.update({'choices': [], 'usage': usage})
+    return 'data: %s\n\n' % json.dumps(chunk, ensure_ascii=False)
+
+
+USAGE = {'prompt_tokens': 7, 'completion_tokens': 3, 'total_tokens': 10}
+
+
+class TestResponseStream:
+
+    @pytest.fixture(scope="function", autouse=True)
+    def test_obj_app_config(self, mocker):
+        # Mock AppConfig's get_logger_level method to suppress logging during tests.
+        mocker.patch.object(AppConfig, 'get_logger_level', return_value=logging.NOTSET)
+
+        # Create an AppConfig instance and set it to test mode.
+        _app_config = AppConfig()
+        _app_config.set_test_mode(True)
+
+        yield _app_config
+
+    @pytest.fixture(scope="function")
+    def test_obj_reply(self):
+        reply = MagicMock(spec=QNetworkReply)
+        reply.error.return_value = QNetworkReply.NetworkError.NoError
+        reply.attribute.return_value = 200
+        reply.isRunning.return_value = True
+        reply.readAll.return_value = QByteArray(b'')
+        reply.header.return_value = 'text/event-stream; charset=utf-8'
+        yield reply
+
+    @pytest.fixture(scope="function")
+    def test_obj_core(self, mocker, test_obj_reply):
+        core = ModuleCore()
+        core.openai_api_url = 'https://localhost/v1/chat/completions'
+        core.openai_api_key = 'test-key'
+        core.openai_api_model = 'default-model'
+        core.response_stream = True
+        network_manager = MagicMock()
+        network_manager.post.return_value = test_obj_reply
+        mocker.patch.object(core.api_helper, 'get_network_manager', return_value=network_manager)
+
+        core.outputs, core.usages, core.finished, core.inits = [], [], [], []
+        core.update_signal.connect(lambda text, *args: core.outputs.append((text,) + args))
+        core.update_usage_signal.connect(lambda *args: core.usages.append(args))
+        core.init_callback = lambda: core.inits.append(len(core.outputs))
+        core.finished_callback = lambda **kwargs: core.finished.append(kwargs)
+        yield core
+
+    @staticmethod
+    def receive(reply, data: bytes):
+        # The chunk arrived, as the reply's readyRead signal does
+        reply.readAll.return_value = QByteArray(data)
+        reply.readyRead.connect.call_args[0][0]()
+
+    @staticmethod
+    def finish(reply):
+        reply.readAll.return_value = QByteArray(b'')
+        reply.finished.connect.call_args[0][0]()
+
+    def test_parser(self):
+        parser = EventStreamParser()
+        assert parser.feed(b': comment\n\ndata: first\r\n\r\ndata: sec') == ['first']
+        assert parser.feed(b'ond\ndata: line\n') == []
+        assert parser.feed(b'\nevent: other\nid: 1\ndata:third\n\n') == ['second\nline', 'third']
+        # A multibyte character split across the chunks
+        data = 'data: wörld\n\n'.encode('utf-8')
+        split_at = data.index('ö'.encode('utf-8')) + 1
+        assert parser.feed(data[:split_at]) == []
+        assert parser.feed(data[split_at:]) == ['wörld']
+        # The event left without the final empty line
+        assert parser.feed(b'data: [DONE]') == []
+        assert parser.flush() == ['[DONE]']
+        assert parser.flush() == []
+
+    def test_network_manager_shared(self):
+        # The connections to the API are reused by the requests
+        assert ApiHelper().get_network_manager() is ApiHelper().get_network_manager()
+
+    def test_stream_request(self, test_obj_core, test_obj_reply):
+        asyncio.run(test_obj_core.run_generator([{'role': 'user', 'content': 'Hi'}], 1, 2))
+
+        request, request_data = test_obj_core.api_helper.get_network_manager().post.call_args[0]
+        assert request.rawHeader('Accept').data() == b'text/event-stream'
+        body = json.loads(request_data.data())
+        assert body['stream'] is True and body['stream_options'] == {'include_usage': True}
+        assert test_obj_core.reply is test_obj_reply
+        test_obj_reply.readyRead.connect.assert_called_once()
+
+    def test_no_stream_request(self, test_obj_core, test_obj_reply):
+        test_obj_core.response_stream = False
+        asyncio.run(test_obj_core.run_generator([{'role': 'user', 'content': 'Hi'}], 1, 2))
+
+        request, request_data = test_obj_core.api_helper.get_network_manager().post.call_args[0]
+        assert not request.hasRawHeader('Accept')
+        body = json.loads(request_data.data())
+        assert body['stream'] is False and 'stream_options' not in body
+        test_obj_reply.readyRead.connect.assert_not_called()
+
+    def test_stream(self, test_obj_core, test_obj_reply):
+        asyncio.run(test_obj_core.run_generator([{'role': 'user', 'content': 'Hi'}], 1, 2))
+
+        # The response is output as the chunks arrive, an event split across the chunks
+        events = (': keep-alive\n\n' + get_chunk('Hello') + get_chunk(', wörld')).encode('utf-8')
+        split_at = events.index('ö'.encode('utf-8')) + 1
+        self.receive(test_obj_reply, events[:split_at])
+        assert [output[0] for output in test_obj_core.outputs] == ['Hello']
+        assert test_obj_core.outputs[0][1:] == (1, 2, EnumMessageType.RESPONSE, EnumMessageStyle.DEFAULT)
+        # The waiting status is updated once the response starts
+        assert test_obj_core.inits == [0]
+        self.receive(test_obj_reply, events[split_at:])
+        assert [output[0] for output in test_obj_core.outputs] == ['Hello', ', wörld']
+        # Counted by the chunks meanwhile
+        assert test_obj_core.usages == [('test-model', 0, 0, 0, False),
+                                        ('test-model', 0, 1, 1, True), ('test-model', 0, 1, 1, True)]
+
+        # The final chunk comes with the usage, the end marker is left without the final empty line
+        self.receive(test_obj_reply,
+                     (get_chunk('!') + get_chunk() + get_chunk(usage=USAGE) + 'data: [DONE]').encode('utf-8'))
+        assert not test_obj_core.finished
+        self.finish(test_obj_reply)
+
+        assert [output[0] for output in test_obj_core.outputs] == ['Hello', ', wörld', '!']
+        assert test_obj_core.usages[-1] == ('test-model', 7, 3, 10, False)
+        assert len(test_obj_core.finished) == 1
+        assert test_obj_core.reply is None
+
+    def test_stream_json_response(self, test_obj_core, test_obj_reply):
+        asyncio.run(test_obj_core.run_generator([{'role': 'user', 'content': 'Hi'}], 1, 2))
+
+        # The server answers with a single JSON body, even though the stream is requested
+        test_obj_reply.header.return_value = 'application/json'
+        response = {'model': 'test-model', 'choices': [{'message': {'role': 'assistant', 'content': 'Hello'}}],
+                    'usage': USAGE}
+        body = json.dumps(response).encode('utf-8')
+        self.receive(test_obj_reply, body[:10])
+        test_obj_reply.readAll.assert_not_called()
+        assert not test_obj_core.outputs
+
+        # The whole body is read once the reply is finished
+        test_obj_reply.readAll.return_value = QByteArray(body)
+        test_obj_reply.finished.connect.call_args[0][0]()
+        assert test_obj_core.outputs == [('Hello', 1, 2, EnumMessageType.RESPONSE, EnumMessageStyle.DEFAULT)]
+        assert test_obj_core.usages[-1] == ('test-model', 7, 3, 10, False)
+        assert len(test_obj_core.finished) == 1
+
+    def test_stream_error(self, test_obj_core, test_obj_reply):
+        asyncio.run(test_obj_core.run_generator([{'role': 'user', 'content': 'Hi'}], 1, 2))
+
+        self.receive(test_obj_reply, b'data: {"error": {"message": "Rate limit"}}\n\ndata: {broken\n\n')
+        self.finish(test_obj_reply)
+
+        assert test_obj_core.outputs == [('Rate limit', None, None, EnumMessageType.DEFAULT, EnumMessageStyle.ERROR)]
+        assert len(test_obj_core.finished) == 1
+
+    def test_stop(self, test_obj_core, test_obj_reply):
+        asyncio.run(test_obj_core.run_generator([{'role': 'user', 'content': 'Hi'}], 1, 2))
+        self.receive(test_obj_reply, get_chunk('Hello').encode('utf-8'))
+
+        # Stopping aborts the request in progress
+        asyncio.run(test_obj_core.stop_generator())
+        test_obj_reply.abort.assert_called_once()
+
+        # Aborted without an error message
+        test_obj_reply.error.return_value = QNetworkReply.NetworkError.OperationCanceledError
+        test_obj_reply.errorOccurred.connect.call_args[0][0](QNetworkReply.NetworkError.OperationCanceledError)
+        assert [output[0] for output in test_obj_core.outputs] == ['Hello']
+        assert len(test_obj_core.finished) == 1
+        assert test_obj_core.reply is None
@@ -0,0 +1,138 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import os
+import sys
+import json
+import time
+import pytest
+import threading
+import subprocess
+
+# The client is run within a new process, as the event loop of the request needs a Qt application, and the one
+# created here would be left for the following tests
+CLIENT = """
+import sys, json, asyncio
+from PySide6.QtCore import QCoreApplication, QEventLoop, QTimer
+from notolog.app_config import AppConfig
+
+app = QCoreApplication([])
+AppConfig().set_test_mode(True)
+
+from notolog.modules.openai_api.module_core import ModuleCore
+
+core = ModuleCore()
+core.openai_api_url = sys.argv[1]
+core.openai_api_key = 'test-key'
+core.openai_api_model = 'default-model'
+core.response_stream = True
+
+outputs, usages = [], []
+loop = QEventLoop()
+core.update_signal.connect(lambda text, *args: outputs.append(text))
+core.update_usage_signal.connect(lambda *args: usages.append(list(args)))
+core.init_callback = lambda: None
+core.finished_callback = lambda **kwargs: loop.quit()
+
+asyncio.run(core.run_generator([{'role': 'user', 'content': 'Hi'}], 1, 2))
+QTimer.singleShot(20000, loop.quit)
+loop.exec()
+print(json.dumps({'outputs': outputs, 'usages': usages}))
+"""
+
+USAGE = {'prompt_tokens': 7, 'completion_tokens': 3, 'total_tokens': 10}
+
+
+def get_event(content=None, usage=None):
+    chunk = {'id': 'chatcmpl-1', 'object': 'chat.completion.chunk', 'model': 'test-model',
+             'choices': [{'index': 0, 'delta': {'content': content}, 'finish_reason': None}] if content else []}
+    if usage is not None:
+        chunk['usage'] = usage
+    return ('data: %s\n\n' % json.dumps(chunk, ensure_ascii=False)).encode('utf-8')
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self.server.requests.append(json.loads(self.rfile.read(int(self.headers['Content-Length']))))
+        if self.path == '/json':
+            # Not streamed, even though it is requested
+            body = json.dumps({'model': 'test-model', 'usage': USAGE,
+                               'choices': [{'message': {'role': 'assistant', 'content': 'Hello, wörld!'}}]})
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body.encode('utf-8'))))
+            self.end_headers()
+            self.wfile.write(body.encode('utf-8'))
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        events = (b': keep-alive\n\n' + get_event('Hello') + get_event(', wörld') + get_event('!')
+                  + get_event(usage=USAGE) + b'data: [DONE]\n\n')
+        # An event and a multibyte character split across the chunks, sent apart to be read apart
+        split_at = events.index('ö'.encode('utf-8')) + 1
+        for chunk in (events[:split_at], events[split_at:]):
+            self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+            self.wfile.flush()
+            time.sleep(0.2)
+        self.wfile.write(b'0\r\n\r\n')
+        self.wfile.flush()
+
+
+class TestResponseStreamLive:
+
+    @pytest.fixture(scope="function")
+    def test_obj_server(self):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), ApiHandler)
+        server.requests = []
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @staticmethod
+    def run_client(url):
+        env = dict(os.environ, QT_QPA_PLATFORM='offscreen', no_proxy='*', NO_PROXY='*')
+        output = subprocess.run([sys.executable, '-c', CLIENT, url], capture_output=True, text=True, env=env,
+                                timeout=60, check=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+                                    os.path.abspath(__file__))))))
+        return json.loads(output.stdout.strip().splitlines()[-1])
+
+    def test_stream(self, test_obj_server):
+        result = self.run_client('http://127.0.0.1:%d/v1/chat/completions' % test_obj_server.server_port)
+        assert test_obj_server.requests[0]['stream'] is True
+        # Output as the events arrive, the event split across the reads is completed by the next one
+        assert result['outputs'] == ['Hello', ', wörld', '!']
+        assert result['usages'][-1] == ['test-model', 7, 3, 10, False]
+
+    def test_json_response(self, test_obj_server):
+        result = self.run_client('http://127.0.0.1:%d/json' % test_obj_server.server_port)
+        assert test_obj_server.requests[0]['stream'] is True
+        assert result['outputs'] == ['Hello, wörld!']
+        assert result['usages'][-1] == ['test-model', 7, 3, 10, False]
@@ -0,0 +1,111 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from notolog.modules.token_budget import TokenBudget
+
+import pytest
+
+from unittest.mock import MagicMock
+
+
+def count_words(text):
+    return len(text.split())
+
+
+class TestTokenBudget:
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ('', 0),
+            ('word', 1),
+            ('A longer sentence, with punctuation!', 11),
+            ('1234567', 3),
+            ('Привет', 3),
+            ('上下文', 3),
+        ]
+    )
+    def test_estimate_tokens(self, text, expected):
+        assert TokenBudget.estimate_tokens(text) == expected
+
+    @pytest.mark.parametrize(
+        "context_size, response_tokens, expected",
+        [
+            (0, 0, 0),
+            (2048, 0, 1536),
+            (2048, 512, 1536),
+            (2048, 1000, 1048),
+            # The response limit beyond the context window
+            (2048, 4096, 1536),
+            (100, 90, 64),
+        ]
+    )
+    def test_get_prompt_budget(self, context_size, response_tokens, expected):
+        assert TokenBudget.get_prompt_budget(context_size, response_tokens) == expected
+
+    def test_count_cached(self):
+        count_tokens = MagicMock(side_effect=count_words)
+        budget = TokenBudget(count_tokens=count_tokens)
+
+        assert budget.count('one two three') == 3
+        assert budget.count('one two three') == 3
+        assert count_tokens.call_count == 1
+
+        # Estimated until the tokenizer is available, the estimate is not cached
+        count_tokens.side_effect = None
+        count_tokens.return_value = None
+        assert budget.count('four five') == TokenBudget.estimate_tokens('four five')
+        assert 'four five' not in budget.cache
+
+    def test_pack(self):
+        budget = TokenBudget(count_tokens=count_words, max_tokens=30, shorten_oversized=False)
+        items = ['one ' * 10, 'two ' * 5, 'three ' * 8, 'four ' * 4]
+
+        # Newest first: 4 + 4, 8 + 4, 5 + 4 tokens, the oldest item does not fit
+        assert budget.pack(items, get_text=str) == items[1:]
+        assert budget.pack(items, get_text=str, reserved=10) == items[2:]
+        # The newest item is kept regardless
+        assert budget.pack(items, get_text=str, reserved=100) == items[3:]
+        # Not limited
+        assert TokenBudget().pack(items, get_text=str) == items
+
+    def test_pack_shortened(self):
+        budget = TokenBudget(count_tokens=count_words, max_tokens=120)
+        items = ['old ' * 200, 'new ' * 40]
+
+        def shorten(item, max_tokens):
+            return budget.shorten_text(item, max_tokens) or None
+
+        packed = budget.pack(items, get_text=str, shorten=shorten)
+        assert len(packed) == 2 and packed[1] == items[1]
+        assert packed[0].startswith('old old') and packed[0].endswith(TokenBudget.SHORTENED_MARKER)
+        assert count_words(packed[0]) + TokenBudget.MESSAGE_OVERHEAD <= 120 - 44
+
+        # Not enough budget left to shorten the item
+        budget.max_tokens = 44 + TokenBudget.MIN_SHORTENED_TOKENS - 1
+        assert budget.pack(items, get_text=str, shorten=shorten) == items[1:]
+
+    def test_shorten_text(self):
+        budget = TokenBudget()
+        text = 'The quick brown fox jumps over the lazy dog. ' * 50
+
+        assert budget.shorten_text(text, 1000) == text
+        shortened = budget.shorten_text(text, 50)
+        assert text.startswith(shortened[:-len(TokenBudget.SHORTENED_MARKER)])
+        assert budget.count(shortened) <= 50
+        assert budget.shorten_text(text, 0) == ''
@@ -0,0 +1,203 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from notolog.app import main, CRYPT_OPERATIONS
+from notolog.encrypt.batch_crypt import BatchCrypt
+from notolog.encrypt.enc_helper import EncHelper
+from notolog.encrypt.enc_password import EncPassword
+from notolog.file_header import FileHeader
+
+from cryptography.fernet import InvalidToken
+
+from threading import Event
+
+import os
+import sys
+import pytest
+
+ITERATIONS = 1000
+
+
+class TestBatchCrypt:
+
+    @pytest.fixture(scope="function")
+    def notes_dir(self, tmp_path):
+        (tmp_path / 'sub').mkdir()
+        (tmp_path / '.hidden').mkdir()
+        (tmp_path / 'first.md').write_text('First note', encoding='utf-8')
+        (tmp_path / 'sub' / 'second.txt').write_text('Second note ' * 1000, encoding='utf-8')
+        (tmp_path / '.hidden' / 'third.md').write_text('Hidden note', encoding='utf-8')
+        (tmp_path / 'image.png').write_bytes(b'\x89PNG')
+        yield tmp_path
+
+    @staticmethod
+    def encrypt(paths, password='password', **kwargs):
+        batch_crypt = BatchCrypt(BatchCrypt.ENCRYPT, new_password=password, iterations=ITERATIONS, processes=1,
+                                 **kwargs)
+        return batch_crypt.run(batch_crypt.collect(paths, recursive=True))
+
+    @staticmethod
+    def read_encrypted(file_path, password):
+        file_header = FileHeader().probe(str(file_path))
+        enc_password = EncPassword()
+        enc_password.password = password
+        enc_helper = EncHelper(enc_password=enc_password, salt=file_header.get_enc_param('slt'),
+                               iterations=int(file_header.get_enc_param('itr')))
+        return file_header, file_header.load_encrypted(str(file_path), enc_helper)
+
+    def test_unknown_operation(self):
+        with pytest.raises(ValueError):
+            BatchCrypt('compress')
+
+    def test_cli_operations(self):
+        # The command line ones are set apart, not to import the batch encryption upon the arguments are parsed
+        assert CRYPT_OPERATIONS == BatchCrypt.OPERATIONS
+
+    def test_collect(self, notes_dir):
+        files = BatchCrypt(BatchCrypt.ENCRYPT).collect([str(notes_dir)], recursive=True)
+        assert files == [(str(notes_dir / 'first.md'), str(notes_dir / 'first.md.enc')),
+                         (str(notes_dir / 'sub' / 'second.txt'), str(notes_dir / 'sub' / 'second.txt.enc'))]
+        # Not recursive
+        assert len(BatchCrypt(BatchCrypt.ENCRYPT).collect([str(notes_dir)])) == 1
+        # Nothing to decrypt or to re-key yet
+        assert BatchCrypt(BatchCrypt.DECRYPT).collect([str(notes_dir)], recursive=True) == []
+        assert BatchCrypt(BatchCrypt.REKEY).collect([str(notes_dir)], recursive=True) == []
+
+        self.encrypt([str(notes_dir)])
+        assert (BatchCrypt(BatchCrypt.DECRYPT).collect([str(notes_dir / 'first.md.enc')])
+                == [(str(notes_dir / 'first.md.enc'), str(notes_dir / 'first.md'))])
+        assert (BatchCrypt(BatchCrypt.REKEY).collect([str(notes_dir / 'first.md.enc')])
+                == [(str(notes_dir / 'first.md.enc'), str(notes_dir / 'first.md.enc'))])
+        # The notes encrypted are not encrypted again
+        assert len(BatchCrypt(BatchCrypt.ENCRYPT).collect([str(notes_dir)], recursive=True)) == 2
+
+    def test_roundtrip(self, notes_dir):
+        result = self.encrypt([str(notes_dir)], hint='Hint')
+        assert len(result['processed']) == 2
+        assert not result['failed'] and not result['cancelled']
+
+        first_header, first_content = self.read_encrypted(notes_dir / 'first.md.enc', 'password')
+        second_header, second_content = self.read_encrypted(notes_dir / 'sub' / 'second.txt.enc', 'password')
+        assert first_content == 'First note'
+        assert second_content == 'Second note ' * 1000
+        assert first_header.get_enc_version() == EncHelper.FORMAT_CHUNKED
+        assert first_header.get_enc_param('hint') == 'Hint'
+        # A single salt per batch
+        assert first_header.get_enc_param('slt') == second_header.get_enc_param('slt')
+        # The notes sharing the key have their own streams
+        assert first_header.get_enc_param('sid') != second_header.get_enc_param('sid')
+        first_body = list(first_header.read_body_lines(str(notes_dir / 'first.md.enc')))
+        (notes_dir / 'first.md.enc').write_text(
+            ''.join(second_header.pack_lines(first_body)), encoding='utf-8')
+        # Not the header probed already
+        os.utime(notes_dir / 'first.md.enc', ns=(1, 1))
+        with pytest.raises(InvalidToken):
+            self.read_encrypted(notes_dir / 'first.md.enc', 'password')
+        (notes_dir / 'first.md.enc').write_text(''.join(first_header.pack_lines(first_body)), encoding='utf-8')
+        os.utime(notes_dir / 'first.md.enc', ns=(2, 2))
+
+        for file_path in (notes_dir / 'first.md', notes_dir / 'sub' / 'second.txt'):
+            os.remove(file_path)
+
+        batch_crypt = BatchCrypt(BatchCrypt.REKEY, password='password', new_password='new', iterations=ITERATIONS,
+                                 processes=1)
+        result = batch_crypt.run(batch_crypt.collect([str(notes_dir)], recursive=True))
+        assert len(result['processed']) == 2
+        rekeyed_header, rekeyed_content = self.read_encrypted(notes_dir / 'first.md.enc', 'new')
+        assert rekeyed_content == 'First note'
+        # The hint is kept
+        assert rekeyed_header.get_enc_param('hint') == 'Hint'
+        assert rekeyed_header.get_enc_param('slt') != first_header.get_enc_param('slt')
+        with pytest.raises(InvalidToken):
+            self.read_encrypted(notes_dir / 'first.md.enc', 'password')
+
+        batch_crypt = BatchCrypt(BatchCrypt.DECRYPT, password='new', processes=1)
+        result = batch_crypt.run(batch_crypt.collect([str(notes_dir)], recursive=True))
+        assert len(result['processed']) == 2
+        file_header, content = FileHeader().load_file(str(notes_dir / 'sub' / 'second.txt'))
+        assert content == 'Second note ' * 1000
+        assert not file_header.is_file_encrypted()
+
+    def test_process_pool(self, notes_dir):
+        batch_crypt = BatchCrypt(BatchCrypt.ENCRYPT, new_password='password', iterations=ITERATIONS, processes=2)
+        progress = []
+        result = batch_crypt.run(batch_crypt.collect([str(notes_dir)], recursive=True),
+                                 progress_callback=lambda done, total: progress.append((done, total)))
+        assert len(result['processed']) == 2
+        assert progress == [(0, 2), (1, 2), (2, 2)]
+        assert self.read_encrypted(notes_dir / 'first.md.enc', 'password')[1] == 'First note'
+
+    def test_wrong_password(self, notes_dir):
+        self.encrypt([str(notes_dir / 'first.md')])
+        # The note existing is not overwritten on failure
+        batch_crypt = BatchCrypt(BatchCrypt.DECRYPT, password='wrong', overwrite=True, processes=1)
+        result = batch_crypt.run(batch_crypt.collect([str(notes_dir)], recursive=True))
+        assert result['processed'] == []
+        assert [file_path for file_path, _error in result['failed']] == [str(notes_dir / 'first.md.enc')]
+        assert os.path.exists(notes_dir / 'first.md.enc')
+        assert (notes_dir / 'first.md').read_text(encoding='utf-8') == 'First note'
+
+    def test_skip_existing(self, notes_dir):
+        (notes_dir / 'first.md.enc').write_text('Existing', encoding='utf-8')
+        batch_crypt = BatchCrypt(BatchCrypt.ENCRYPT, new_password='password', iterations=ITERATIONS, processes=1)
+        files = [(str(notes_dir / 'first.md'), str(notes_dir / 'first.md.enc'))]
+        result = batch_crypt.run(files)
+        assert result['skipped'] == [str(notes_dir / 'first.md')]
+        assert (notes_dir / 'first.md.enc').read_text(encoding='utf-8') == 'Existing'
+
+        batch_crypt.overwrite = True
+        result = batch_crypt.run(files)
+        assert result['processed'] == [str(notes_dir / 'first.md')]
+        assert self.read_encrypted(notes_dir / 'first.md.enc', 'password')[1] == 'First note'
+
+    def test_cancel(self, notes_dir):
+        cancel_event = Event()
+        cancel_event.set()
+        batch_crypt = BatchCrypt(BatchCrypt.ENCRYPT, new_password='password', iterations=ITERATIONS, processes=1)
+        result = batch_crypt.run(batch_crypt.collect([str(notes_dir)], recursive=True), cancel_event=cancel_event)
+        assert result['cancelled']
+        assert result['processed'] == []
+        assert not os.path.exists(notes_dir / 'first.md.enc')
+
+    def test_keys_derived_once(self, notes_dir, mocker):
+        self.encrypt([str(notes_dir / 'first.md')])
+        self.encrypt([str(notes_dir / 'sub' / 'second.txt')])
+        derive_key = mocker.spy(EncHelper, 'derive_key')
+        batch_crypt = BatchCrypt(BatchCrypt.REKEY, password='password', new_password='new', iterations=ITERATIONS,
+                                 processes=1)
+        result = batch_crypt.run(batch_crypt.collect([str(notes_dir)], recursive=True))
+        assert len(result['processed']) == 2
+        # Two old salts and a new one
+        assert derive_key.call_count == 3
+
+    def test_cli(self, notes_dir, monkeypatch, capsys):
+        monkeypatch.setenv('NOTOLOG_NEW_PASSWORD', 'password')
+        monkeypatch.setattr(sys, 'argv', ['notolog', 'crypt', 'encrypt', str(notes_dir), '-r', '-j', '1',
+                                          '--iterations', str(ITERATIONS)])
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+        assert excinfo.value.code == 0
+        assert 'Processed: 2, failed: 0, skipped: 0' in capsys.readouterr().out
+
+        monkeypatch.setenv('NOTOLOG_PASSWORD', 'wrong')
+        monkeypatch.setattr(sys, 'argv', ['notolog', 'crypt', 'decrypt', str(notes_dir / 'first.md.enc'),
+                                          '--overwrite', '-j', '1'])
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+        assert excinfo.value.code == 1
+        assert 'Processed: 0, failed: 1, skipped: 0' in capsys.readouterr().out
@@ -0,0 +1,87 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from tests.benchmarks import benchmark_suite, compare
+from tests.benchmarks.benchmark_suite import BenchmarkSuite
+
+import os
+import sys
+import json
+import subprocess
+
+
+class TestBenchmarks:
+
+    def test_sizes(self):
+        assert benchmark_suite.parse_size('1K') == 1024
+        assert benchmark_suite.parse_size('50m') == 50 * 1024 ** 2
+        assert benchmark_suite.parse_size('512') == 512
+        assert benchmark_suite.format_size(10 * 1024 ** 2) == '10M'
+        assert benchmark_suite.format_size(1500) == '1500'
+        note = benchmark_suite.make_note(100 * 1024)
+        assert len(note) == 100 * 1024
+        assert note.startswith('## Heading')
+
+    def test_budget(self, mocker):
+        suite = BenchmarkSuite([1024, 10 * 1024, 100 * 1024], repeat=2, budget=1.0, benchmarks=['crypt_roundtrip'])
+        mocker.patch.object(suite, 'bench_crypt_roundtrip', side_effect=[
+            benchmark_suite.summarize([0.01, 0.01]), benchmark_suite.summarize([0.2, 0.2])])
+        results = suite.run()['results']
+        assert results['crypt_roundtrip/1K']['median'] == 0.01
+        assert results['crypt_roundtrip/10K']['median'] == 0.2
+        # Estimated as 0.2 s x 10 x 2 runs
+        assert 'skipped' in results['crypt_roundtrip/100K']
+
+    def test_suite(self, tmp_path):
+        # The editor is run within a new process, as the benchmarks do
+        output_path = tmp_path / 'results.json'
+        env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+        subprocess.run([sys.executable, '-m', 'tests.benchmarks.benchmark_suite', '--sizes', '1K', '--repeat', '1',
+                        '-o', str(output_path)],
+                       capture_output=True, env=env, check=True, timeout=300,
+                       cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        data = json.loads(output_path.read_text(encoding='utf-8'))
+        assert data['meta']['repeat'] == 1
+        assert sorted(data['results']) == ['crypt_roundtrip/1K', 'crypt_roundtrip_chunked/1K',
+                                           'load_content_edit/1K', 'load_content_html/1K', 'rehighlight/1K',
+                                           'searched_text_count/1K', 'startup']
+        assert all(result['median'] > 0 for result in data['results'].values())
+        assert data['results']['searched_text_count/1K']['count'] > 0
+
+    def test_compare(self, tmp_path, capsys):
+        baseline = {'startup': {'median': 1.0}, 'fast': {'median': 0.001}, 'improved': {'median': 0.5},
+                    'removed': {'median': 0.1}, 'skipped': {'skipped': 'over the budget'}}
+        current = {'startup': {'median': 1.3}, 'fast': {'median': 0.002}, 'improved': {'median': 0.2},
+                   'added': {'median': 0.1}, 'skipped': {'median': 0.1}}
+        rows = {row['name']: row for row in compare.compare(baseline, current, threshold=0.2)}
+        assert rows['startup']['status'] == compare.REGRESSION
+        assert round(rows['startup']['change'], 2) == 0.3
+        # Twice as slow, but within the noise
+        assert rows['fast']['status'] == compare.UNCHANGED
+        assert rows['improved']['status'] == compare.IMPROVEMENT
+        assert rows['removed']['status'] == compare.MISSING
+        assert rows['added']['status'] == compare.NEW
+        assert rows['skipped']['status'] == compare.SKIPPED
+        assert compare.compare(baseline, current, threshold=0.5)[0]['status'] == compare.UNCHANGED
+
+        baseline_path, current_path = tmp_path / 'baseline.json', tmp_path / 'current.json'
+        baseline_path.write_text(json.dumps({'results': baseline}), encoding='utf-8')
+        current_path.write_text(json.dumps({'results': current}), encoding='utf-8')
+        assert compare.main([str(baseline_path), str(current_path)]) == 1
+        assert 'Regressions beyond 20%: startup' in capsys.readouterr().out
+        assert compare.main([str(baseline_path), str(current_path), '--threshold', '0.5']) == 0
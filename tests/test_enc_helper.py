@@ -19,10 +19,13 @@ For detailed instructions and project information, please see the repository's R
 from notolog.encrypt.enc_helper import EncHelper
 from notolog.encrypt.enc_password import EncPassword
 
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.exceptions import InvalidTag
 
 from logging import Logger
 
+import base64
 import pytest
 
 
@@ -175,3 +178,90 @@ class TestEncHelper:
         assert len(_decrypted_content) > 0
         assert type(_decrypted_content) is bytes
         assert _decrypted_content == test_content_fixture
+
+
+class TestEncHelperChunked:
+
+    @pytest.fixture(scope="function")
+    def test_obj(self):
+        enc_password = EncPassword()
+        enc_password.password = 'some>pass>here'
+        yield EncHelper(enc_password=enc_password, salt='some>salt>here', iterations=1000)
+
+    @pytest.mark.parametrize(
+        "text, chunk_size",
+        [
+            ('', 4),
+            ('Lorem ipsum', 4),
+            ('Lorem ipsum', 11),
+            # Multi-byte characters
+            ('Съешь же ещё этих мягких французских булок 🙂' * 10, 7),
+        ]
+    )
+    def test_encrypt_decrypt_text(self, test_obj, text, chunk_size):
+        segments = list(test_obj.encrypt_text(text, chunk_size=chunk_size))
+        assert len(segments) == max(1, -(-len(text) // chunk_size))
+        assert all(isinstance(segment, str) and '\n' not in segment for segment in segments)
+        assert test_obj.decrypt_text(segments) == text
+        # The segments are read from the file as lines
+        assert test_obj.decrypt_text(segment.encode('ascii') for segment in segments + ['']) == text
+
+    def test_nonces(self, test_obj):
+        # The same content is encrypted differently
+        assert list(test_obj.encrypt_text('Lorem')) != list(test_obj.encrypt_text('Lorem'))
+
+    @pytest.mark.parametrize(
+        "alter",
+        [
+            # Reordered
+            lambda segments: [segments[1], segments[0], segments[2]],
+            # Truncated
+            lambda segments: segments[:2],
+            # Appended after the last one
+            lambda segments: segments + segments[2:],
+            # Altered
+            lambda segments: [segments[0][:-2] + ('A' if segments[0][-2] != 'A' else 'B') + segments[0][-1]]
+            + segments[1:],
+            # Not a segment
+            lambda segments: ['Not a segment'],
+        ]
+    )
+    def test_altered_segments(self, test_obj, alter):
+        segments = list(test_obj.encrypt_text('Lorem ipsum', chunk_size=4))
+        with pytest.raises(InvalidToken):
+            test_obj.decrypt_text(alter(segments))
+
+    def test_segment_key(self, test_obj):
+        key = test_obj.generate_key_from_password()
+        segment_key = EncHelper.derive_segment_key(key)
+        assert len(segment_key) == 32
+        assert segment_key != key
+        # The segments are not encrypted with the password key, the one Fernet uses
+        segment = base64.urlsafe_b64decode(next(test_obj.encrypt_text('Lorem ipsum')))
+        flag, nonce, encrypted_chunk = segment[:1], segment[1:EncHelper.NONCE_SIZE + 1], segment[EncHelper.NONCE_SIZE + 1:]
+        aad = test_obj.get_segment_aad(0, flag)
+        with pytest.raises(InvalidTag):
+            AESGCM(key).decrypt(nonce, encrypted_chunk, aad)
+        assert AESGCM(segment_key).decrypt(nonce, encrypted_chunk, aad) == b'Lorem ipsum'
+
+    def test_wrong_password(self, test_obj):
+        enc_password = EncPassword()
+        enc_password.password = 'wrong>pass'
+        other = EncHelper(enc_password=enc_password, salt='some>salt>here', iterations=1000)
+        with pytest.raises(InvalidToken):
+            other.decrypt_text(test_obj.encrypt_text('Lorem ipsum'))
+
+    def test_stream_id(self, test_obj):
+        first_id, second_id = EncHelper.generate_stream_id(), EncHelper.generate_stream_id()
+        assert first_id != second_id
+        first = list(test_obj.encrypt_text('Lorem ipsum', chunk_size=4, stream_id=first_id))
+        second = list(test_obj.encrypt_text('Dolor sit amet', chunk_size=4, stream_id=second_id))
+        assert test_obj.decrypt_text(first, stream_id=first_id) == 'Lorem ipsum'
+        # Another stream with the same key
+        with pytest.raises(InvalidToken):
+            test_obj.decrypt_text(first, stream_id=second_id)
+        with pytest.raises(InvalidToken):
+            test_obj.decrypt_text(first)
+        # The segments at the same positions taken from another stream, e.g. from a previous save
+        with pytest.raises(InvalidToken):
+            test_obj.decrypt_text(first[:1] + second[1:3], stream_id=first_id)
@@ -16,12 +16,16 @@ License: MIT License
 For detailed instructions and project information, please see the repository's README.md.
 """
 
-from notolog.file_header import FileHeader
+from notolog.file_header import FileHeader, FileHeaderCache
+from notolog.encrypt.enc_helper import EncHelper
+from notolog.encrypt.enc_password import EncPassword
 
 from notolog.exceptions.file_header_empty_exception import FileHeaderEmptyException
 
+from cryptography.fernet import InvalidToken
 from logging import Logger
 
+import os
 import time
 import pytest
 
@@ -270,3 +274,163 @@ class TestFileHeader:
 
         # Is encrypted check works well
         assert _file_header.is_file_encrypted() == test_exp_fixture
+
+    @pytest.mark.parametrize(
+        "file_data",
+        [
+            '',
+            'No header\nat all\n',
+            '<!-- {} -->\nNot a valid header\n',
+            '<!-- {"notolog.app": {"created": "2024-02-08 22:10:13.277826"}} -->',
+            '<!-- {"notolog.app": {"created": "2024-02-08 22:10:13.277826"}} -->\n',
+            '<!-- {"notolog.app": {"created": "2024-02-08 22:10:13.277826"}} -->\n\n',
+            '<!-- {"notolog.app": {"created": "2024-02-08 22:10:13.277826"}} -->\nLine one\n\nLine three',
+            '<!-- {"notolog.app": {"created": "2024-02-08 22:10:13.277826"}} -->\nLine one\nLine two\n',
+            '<!-- {"notolog.app": {"created": "2024-02-08 22:10:13.277826"}} -->\r\nLine one\r\nLine two\r\n\r\n',
+            '<!-- {"notolog.app": {"created": "2024-02-08 22:10:13.277826"}} -->\nÜnïcødé 🐱\rline\r',
+            '<!-- {"notolog.app": {"created": "2024-02-08 22:10:13.277826"}} -->\n\r\n',
+            'No header\r\nÜnïcødé\r\n',
+            '<!-- {"notolog.app": {"created": "2024-02-08 22:10:13.277826"}} -->\rLine one\rLine two\r',
+            '<!-- {"notolog.app": {"created": "2024-02-08 22:10:13.277826"}} -->\r\rLine two',
+            '<!-- {"notolog.app": {"created": "2024-02-08 22:10:13.277826"}} -->\r',
+            '<!-- {"notolog.app": {"created": "2024-02-08 22:10:13.277826"}} -->\r\n',
+            '<!-- {"notolog.app": {"created": "2024-02-08 22:10:13.277826"}} -->\r\nLine one',
+            'No header\rÜnïcødé\r',
+        ]
+    )
+    def test_file_header_load_file(self, tmp_path, file_data):
+        file_path = tmp_path / 'note.md'
+        file_path.write_bytes(file_data.encode('utf-8'))
+
+        file_header, file_body = FileHeader().load_file(str(file_path))
+        # The same as the whole file content is loaded
+        with open(file_path, encoding='utf-8') as f:
+            expected_header, expected_body = FileHeader().load(f.read())
+        assert file_body == expected_body
+        assert file_header.header == expected_header.header
+        assert file_header.is_valid() == expected_header.is_valid()
+
+    @pytest.mark.parametrize("line_break", ['\n', '\r', '\r\n'])
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 67, 68, 69])
+    def test_file_header_read_first_line(self, tmp_path, mocker, line_break, chunk_size):
+        # The line break is found whatever chunks it is split across
+        mocker.patch.object(FileHeader, 'READ_CHUNK_SIZE', chunk_size)
+        header_line = '<!-- {"notolog.app": {"created": "2024-02-08 22:10:13.277826"}} -->'
+        file_path = tmp_path / 'note.md'
+        file_path.write_bytes(('%s%sLine one%sLine two' % (header_line, line_break, line_break)).encode('utf-8'))
+
+        file_header, file_body = FileHeader().load_file(str(file_path))
+        assert file_header.is_valid()
+        assert file_header.get_param('created') == '2024-02-08 22:10:13.277826'
+        assert file_body == 'Line one\nLine two'
+
+    def test_file_header_load_file_not_found(self, tmp_path):
+        file_header, file_body = FileHeader().load_file(str(tmp_path / 'absent.md'))
+        assert file_body is None
+        assert not file_header.is_valid()
+
+    def test_file_header_enc_version(self, mocker):
+        mocker.patch.object(EncHelper, 'get_default_iterations', return_value=EncHelper.DEFAULT_ITERATIONS)
+        # New encrypted files are in the chunked format
+        assert FileHeader().get_new(is_enc=True).get_enc_version() == EncHelper.FORMAT_CHUNKED
+        # The files encrypted before the format is set
+        file_header, _file_body = FileHeader().load(
+            '<!-- {"notolog.app": {"enc": {"slt": "qwerty789ABC", "itr": "123456", "hint": ""}}} -->\nData')
+        assert file_header.get_enc_version() == EncHelper.FORMAT_FERNET
+
+    def test_file_header_pack_lines(self, tmp_path):
+        file_header = FileHeader().get_new()
+        file_path = tmp_path / 'note.md'
+        file_path.write_text(''.join(file_header.pack_lines(['First', 'Second'])), encoding='utf-8')
+        assert list(file_header.read_body_lines(str(file_path))) == ['First', 'Second']
+        # The same as packed at once
+        assert file_path.read_text(encoding='utf-8') == file_header.pack('First\nSecond')
+
+    def test_file_header_pack_encrypted(self, tmp_path, mocker):
+        mocker.patch.object(EncHelper, 'get_default_iterations', return_value=1000)
+        file_header = FileHeader().get_new(is_enc=True)
+        enc_password = EncPassword()
+        enc_password.password = 'some>pass>here'
+        enc_helper = EncHelper(enc_password=enc_password, salt=file_header.get_enc_param('slt'), iterations=1000)
+        file_path = tmp_path / 'note.md'
+        file_path.write_text(''.join(file_header.pack_encrypted('Lorem ipsum', enc_helper)), encoding='utf-8')
+        stream_id = file_header.get_enc_param('sid')
+        assert stream_id
+        loaded_header, _body = FileHeader().load(file_path.read_text(encoding='utf-8'))
+        assert loaded_header.get_enc_param('sid') == stream_id
+        assert loaded_header.load_encrypted(str(file_path), enc_helper) == 'Lorem ipsum'
+
+        # The stream is new on each save
+        previous_body = list(loaded_header.read_body_lines(str(file_path)))
+        file_path.write_text(''.join(file_header.pack_encrypted('Lorem ipsum', enc_helper)), encoding='utf-8')
+        assert file_header.get_enc_param('sid') != stream_id
+        # The body of the previous save does not match the header of the current one
+        file_path.write_text(''.join(file_header.pack_lines(previous_body)), encoding='utf-8')
+        with pytest.raises(InvalidToken):
+            FileHeader().load(file_path.read_text(encoding='utf-8'))[0].load_encrypted(str(file_path), enc_helper)
+
+
+class TestFileHeaderProbe:
+
+    @pytest.fixture(scope="function", autouse=True)
+    def cache(self, mocker):
+        cache = FileHeaderCache(max_size=2)
+        mocker.patch.object(FileHeader, 'cache', cache)
+        yield cache
+
+    @pytest.fixture(scope="function")
+    def file_path(self, tmp_path):
+        file_path = str(tmp_path / 'note.md')
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(FileHeader().get_new(is_enc=True).pack('Encrypted body'))
+        yield file_path
+
+    def test_probe(self, file_path, mocker):
+        mock_read = mocker.spy(FileHeader, 'read')
+        file_header = FileHeader().probe(file_path)
+        assert file_header.is_file_encrypted()
+        assert file_header.get_enc_param('slt')
+        mock_read.assert_called_once()
+
+        # Not read again until the file is changed
+        assert FileHeader().probe(file_path).get_enc_param('slt') == file_header.get_enc_param('slt')
+        mock_read.assert_called_once()
+
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(FileHeader().get_new().pack('Plain body, changed'))
+        os.utime(file_path, ns=(1, 1))
+        assert not FileHeader().probe(file_path).is_file_encrypted()
+        assert mock_read.call_count == 2
+
+    def test_probe_after_load(self, file_path, mocker):
+        file_header, file_body = FileHeader().load_file(file_path)
+        assert file_body == 'Encrypted body'
+        mock_read = mocker.spy(FileHeader, 'read')
+        assert FileHeader().probe(file_path).is_file_encrypted()
+        mock_read.assert_not_called()
+
+    def test_probe_header_copied(self, file_path):
+        file_header = FileHeader().probe(file_path)
+        file_header.set_param('title', 'Changed')
+        # Cached header is not changed along with the one probed
+        assert FileHeader().probe(file_path).get_param('title') is None
+
+    @pytest.mark.parametrize(
+        "file_data",
+        [b'', b'No header\nat all', b'\xff\xfe\x00binary'],
+    )
+    def test_probe_no_header(self, tmp_path, file_data):
+        file_path = tmp_path / 'note.md'
+        file_path.write_bytes(file_data)
+        file_header = FileHeader().probe(str(file_path))
+        assert not file_header.is_valid()
+        assert not file_header.is_file_encrypted()
+
+    def test_probe_not_found(self, tmp_path):
+        assert not FileHeader().probe(str(tmp_path / 'absent.md')).is_valid()
+
+    def test_cache_size(self, cache, tmp_path):
+        for name in ('a.md', 'b.md', 'c.md'):
+            (tmp_path / name).write_text('Text', encoding='utf-8')
+            FileHeader().probe(str(tmp_path / name))
+        assert list(cache.items) == [str(tmp_path / 'b.md'), str(tmp_path / 'c.md')]
@@ -0,0 +1,86 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from notolog.hilite_cache_extension import HiliteCacheExtension, HiliteCache
+from notolog.etree_extension import ElementTreeExtension
+
+from markdown.extensions.codehilite import CodeHiliteExtension
+
+import logging
+import markdown
+import pytest
+
+MD_EXTENSIONS = ['markdown.extensions.extra', 'markdown.extensions.toc']
+
+
+class TestHiliteCacheExtension:
+
+    @pytest.fixture(scope="function")
+    def test_obj_md(self):
+        HiliteCache.clear()
+        yield markdown.Markdown(extensions=MD_EXTENSIONS + [ElementTreeExtension(), HiliteCacheExtension(linenums=True)])
+        HiliteCache.clear()
+
+    @pytest.mark.parametrize(
+        "md_content",
+        [
+            "```python\ndef f(x):\n    return x\n```\n",
+            "Text\n\n    indented = 'code'\n    more = 1\n\nText\n",
+            "```python hl_lines=\"2\"\nx = 1\ny = 2\n```\n",
+            "~~~{.js #code-id}\nvar a = '<b>';\n~~~\n",
+            "```\nno language & <tags>\n```\n",
+            "```python\nx = 1\n```\n\nText\n\n```python\nx = 1\n```\n\n```sql\nSELECT 1;\n```\n",
+            "> ```\n> quoted\n> ```\n",
+            "```python\nunclosed\n",
+        ]
+    )
+    def test_same_html_as_codehilite(self, test_obj_md, md_content):
+        md = markdown.Markdown(extensions=MD_EXTENSIONS + [ElementTreeExtension(), CodeHiliteExtension(linenums=True)])
+        expected = md.convert(md_content)
+
+        assert test_obj_md.convert(md_content) == expected
+        # Rendered from the cache
+        test_obj_md.reset()
+        assert test_obj_md.convert(md_content) == expected
+
+    def test_cache_hits(self, test_obj_md, caplog):
+        md_content = "```python\nx = 1\n```\n\n```python\ny = 2\n```\n\n    indented\n"
+
+        test_obj_md.convert(md_content)
+        assert (HiliteCache.hits, HiliteCache.misses) == (0, 3)
+
+        # Another object, e.g. the one of the render pipeline
+        md = markdown.Markdown(extensions=MD_EXTENSIONS + [HiliteCacheExtension(linenums=True)])
+        with caplog.at_level(logging.DEBUG, logger='hilite_cache_extension'):
+            md.convert(md_content.replace('y = 2', 'y = 3'))
+        assert (HiliteCache.hits, HiliteCache.misses) == (2, 4)
+        assert 'Code blocks cache: 2 hit(s), 4 miss(es)' in caplog.text
+
+    def test_config_is_part_of_key(self, test_obj_md):
+        md_content = "```python\nx = 1\n```\n"
+        html = test_obj_md.convert(md_content)
+
+        md = markdown.Markdown(extensions=MD_EXTENSIONS + [HiliteCacheExtension(linenums=False)])
+        assert md.convert(md_content) != html
+        assert HiliteCache.hits == 0
+
+    def test_eviction(self, test_obj_md, mocker):
+        mocker.patch.object(HiliteCache, 'MAX_ITEMS', 2)
+        for index in range(3):
+            test_obj_md.convert(f"```python\nx = {index}\n```\n")
+        assert len(HiliteCache.items) == 2
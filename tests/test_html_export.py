@@ -0,0 +1,212 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from notolog.app import main
+from notolog.app_config import AppConfig
+from notolog.file_header import FileHeader
+from notolog.html_export import HtmlExport
+from notolog import html_export
+
+import os
+import sys
+import pytest
+import logging
+
+NOTE = """# Note
+
+Some *text* :cat:
+
+<details><summary>More</summary>
+
+Hidden **text**
+
+</details>
+
+```python
+print('code')
+```
+
+Footnote[^1]
+
+[^1]: Footnote text
+"""
+
+
+class TestHtmlExport:
+
+    @pytest.fixture(scope="function")
+    def test_obj_app_config(self, mocker):
+        # Mock AppConfig's get_logger_level method to suppress logging during tests.
+        mocker.patch.object(AppConfig, 'get_logger_level', return_value=logging.NOTSET)
+
+        _app_config = AppConfig()
+        _app_config.set_test_mode(True)
+
+        yield _app_config
+
+    @pytest.fixture(scope="function")
+    def notes_dir(self, tmp_path, test_obj_app_config):
+        notes_dir = tmp_path / 'notes'
+        (notes_dir / 'sub').mkdir(parents=True)
+        (notes_dir / '.hidden').mkdir()
+        header = FileHeader().get_new()
+        header.set_param('title', 'First <title>')
+        (notes_dir / 'first.md').write_text(header.pack(NOTE), encoding='utf-8')
+        (notes_dir / 'sub' / 'second.md').write_text('Second note', encoding='utf-8')
+        (notes_dir / '.hidden' / 'third.md').write_text('Hidden note', encoding='utf-8')
+        (notes_dir / 'plain.txt').write_text('Not a note to export', encoding='utf-8')
+        yield notes_dir
+
+    @staticmethod
+    def export(notes_dir, **kwargs):
+        return HtmlExport(str(notes_dir), str(notes_dir.parent / 'out'), process_emojis=True, processes=1, **kwargs)
+
+    def test_render(self, notes_dir):
+        result = self.export(notes_dir).run()
+        assert sorted(result['rendered']) == ['first.md', os.path.join('sub', 'second.md')]
+        assert not result['failed']
+
+        html_content = (notes_dir.parent / 'out' / 'first.html').read_text(encoding='utf-8')
+        assert '<title>First &lt;title&gt;</title>' in html_content
+        # Header is not rendered
+        assert 'notolog.app' not in html_content
+        # The same stages as the VIEW mode ones
+        assert '<h1 id="note">Note</h1>' in html_content
+        assert ':cat:' not in html_content
+        assert '<details><summary>More</summary>' in html_content
+        assert 'class="codehilite"' in html_content
+        assert 'Footnote text' in html_content
+        # Theme styles
+        assert 'codehilite' in html_content.split('</style>')[0]
+        assert (notes_dir.parent / 'out' / 'sub' / 'second.html').is_file()
+        assert not (notes_dir.parent / 'out' / 'third.html').exists()
+
+    def test_footnotes_reset(self, notes_dir):
+        (notes_dir / 'sub' / 'second.md').write_text('Other[^1]\n\n[^1]: Other footnote', encoding='utf-8')
+        self.export(notes_dir).run()
+        html_content = (notes_dir.parent / 'out' / 'sub' / 'second.html').read_text(encoding='utf-8')
+        assert 'Other footnote' in html_content
+        assert 'Footnote text' not in html_content
+
+    def test_incremental(self, notes_dir, mocker):
+        self.export(notes_dir).run()
+
+        render_html = mocker.spy(html_export, 'render_html')
+        result = self.export(notes_dir).run()
+        assert result['rendered'] == []
+        assert len(result['unchanged']) == 2
+        render_html.assert_not_called()
+
+        # Touched, but the same content
+        os.utime(notes_dir / 'first.md', ns=(0, 0))
+        # Changed
+        (notes_dir / 'sub' / 'second.md').write_text('Second note changed', encoding='utf-8')
+        result = self.export(notes_dir).run()
+        assert result['rendered'] == [os.path.join('sub', 'second.md')]
+        assert result['unchanged'] == ['first.md']
+        assert render_html.call_count == 1
+        assert 'changed' in (notes_dir.parent / 'out' / 'sub' / 'second.html').read_text(encoding='utf-8')
+
+        # Removed
+        os.remove(notes_dir / 'sub' / 'second.md')
+        result = self.export(notes_dir).run()
+        assert result['removed'] == [os.path.join('sub', 'second.md')]
+        assert not (notes_dir.parent / 'out' / 'sub' / 'second.html').exists()
+
+        # Output removed
+        os.remove(notes_dir.parent / 'out' / 'first.html')
+        assert self.export(notes_dir).run()['rendered'] == ['first.md']
+
+        # Forced or the config changed
+        assert self.export(notes_dir, force=True).run()['rendered'] == ['first.md']
+        assert HtmlExport(str(notes_dir), str(notes_dir.parent / 'out'), process_emojis=False,
+                          processes=1).run()['rendered'] == ['first.md']
+
+    def test_encrypted_skipped(self, notes_dir):
+        self.export(notes_dir).run()
+        header = FileHeader().get_new()
+        header.set_param('enc', {'slt': 'salt', 'itr': 1000, 'hint': ''})
+        (notes_dir / 'first.md').write_text(header.pack('ENCRYPTED'), encoding='utf-8')
+        result = self.export(notes_dir).run()
+        assert result['skipped'] == ['first.md']
+        # The html of the note exported before it is encrypted is removed
+        assert result['removed'] == ['first.md']
+        assert not (notes_dir.parent / 'out' / 'first.html').exists()
+
+    def test_not_recursive(self, notes_dir):
+        self.export(notes_dir).run()
+        result = self.export(notes_dir, recursive=False).run()
+        assert result['unchanged'] == ['first.md']
+        # The notes within the sub-directories are out of the scope, their html is kept
+        assert result['removed'] == []
+        assert (notes_dir.parent / 'out' / 'sub' / 'second.html').is_file()
+        result = self.export(notes_dir).run()
+        assert sorted(result['unchanged']) == ['first.md', os.path.join('sub', 'second.md')]
+
+    def test_failed(self, notes_dir, mocker):
+        self.export(notes_dir).run()
+        (notes_dir / 'first.md').write_text('Changed', encoding='utf-8')
+        (notes_dir / 'sub' / 'second.md').write_text('Second note changed', encoding='utf-8')
+        mocker.patch.object(html_export, 'render_html', side_effect=[RuntimeError('Broken extension'), '<p>Ok</p>'])
+        result = self.export(notes_dir).run()
+        # The note failed does not stop the others and keeps its html
+        assert result['failed'] == [('first.md', 'Broken extension')]
+        assert result['rendered'] == [os.path.join('sub', 'second.md')]
+        assert (notes_dir.parent / 'out' / 'first.html').is_file()
+        # Rendered again on the next export
+        mocker.stopall()
+        result = self.export(notes_dir).run()
+        assert result['rendered'] == ['first.md']
+        assert 'Changed' in (notes_dir.parent / 'out' / 'first.html').read_text(encoding='utf-8')
+
+    def test_interrupted(self, notes_dir, mocker):
+        (notes_dir / 'other.md').write_text('Other note', encoding='utf-8')
+        self.export(notes_dir).run()
+        (notes_dir / 'first.md').write_text('Changed', encoding='utf-8')
+        (notes_dir / 'sub' / 'second.md').write_text('Second note changed', encoding='utf-8')
+        os.remove(notes_dir / 'other.md')
+        mocker.patch.object(html_export, 'render_html', side_effect=['<p>Changed</p>', KeyboardInterrupt])
+        with pytest.raises(KeyboardInterrupt):
+            self.export(notes_dir).run()
+        mocker.stopall()
+        # The manifest is saved with the notes exported so far, the others keep their entries
+        result = self.export(notes_dir).run()
+        assert result['unchanged'] == ['first.md']
+        assert result['rendered'] == [os.path.join('sub', 'second.md')]
+        assert result['removed'] == ['other.md']
+
+    def test_process_pool(self, notes_dir):
+        progress = []
+        result = HtmlExport(str(notes_dir), str(notes_dir.parent / 'out'), processes=2).run(
+            progress_callback=lambda done, total: progress.append((done, total)))
+        assert len(result['rendered']) == 2
+        assert progress == [(0, 2), (1, 2), (2, 2)]
+        assert '<h1 id="note">Note</h1>' in (notes_dir.parent / 'out' / 'first.html').read_text(encoding='utf-8')
+
+    def test_cli(self, notes_dir, monkeypatch, capsys):
+        monkeypatch.setattr(sys, 'argv', ['notolog', 'export', str(notes_dir), '-o', str(notes_dir.parent / 'out'),
+                                          '--no-recursive', '--theme', 'noir_dark', '-j', '1'])
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+        assert excinfo.value.code == 0
+        assert 'Rendered: 1, unchanged: 0' in capsys.readouterr().out
+
+        monkeypatch.setattr(sys, 'argv', ['notolog', 'export', str(notes_dir / 'missing'), '-o', 'out'])
+        with pytest.raises(SystemExit) as excinfo:
+            main()
+        assert excinfo.value.code == 2
@@ -0,0 +1,92 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from notolog.helpers.import_helper import LazyImport, ImportProfiler
+
+import os
+import sys
+import json
+import subprocess
+
+
+class TestImportHelper:
+
+    def test_lazy_import(self, tmp_path, monkeypatch):
+        (tmp_path / 'lazy_sample.py').write_text('VALUE = 42\nclass Sample:\n    def __init__(self, x):\n'
+                                                 '        self.x = x\n', encoding='utf-8')
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, 'lazy_sample', raising=False)
+
+        lazy_module = LazyImport('lazy_sample')
+        lazy_class = LazyImport('lazy_sample', 'Sample')
+        assert not lazy_module.is_loaded()
+        assert 'lazy_sample' not in sys.modules
+
+        # Imported upon the first use
+        assert lazy_class(7).x == 7
+        assert lazy_class.is_loaded()
+        assert 'lazy_sample' in sys.modules
+        assert lazy_module.VALUE == 42
+        assert lazy_module.load() is sys.modules['lazy_sample']
+
+    def test_import_profiler(self, tmp_path, monkeypatch):
+        (tmp_path / 'profiled_outer.py').write_text('import time\nimport profiled_inner\ntime.sleep(0.01)\n',
+                                                    encoding='utf-8')
+        (tmp_path / 'profiled_inner.py').write_text('import time\ntime.sleep(0.02)\n', encoding='utf-8')
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        import_profiler = ImportProfiler()
+        import_profiler.install()
+        try:
+            import profiled_outer  # noqa: F401
+        finally:
+            import_profiler.uninstall()
+            sys.modules.pop('profiled_outer', None)
+            sys.modules.pop('profiled_inner', None)
+
+        outer_self, outer_cumulative = import_profiler.records['profiled_outer']
+        inner_self, inner_cumulative = import_profiler.records['profiled_inner']
+        assert inner_self >= 0.02 and inner_cumulative == inner_self
+        assert outer_self >= 0.01 and outer_cumulative >= outer_self + inner_cumulative - 1e-6
+        # The original loader is set back
+        assert 'TimedLoader' not in type(profiled_outer.__loader__).__name__
+
+        report = import_profiler.report()
+        assert report.splitlines()[1].endswith('| profiled_outer')
+        assert 'Imported modules: 2' in report
+
+    def test_startup_imports(self):
+        # The heavy modules are not imported with the editor, a new process is used as the tests import them
+        code = ('import sys, json; import notolog.app; import notolog.notolog_editor; '
+                'print(json.dumps(sorted(sys.modules)))')
+        env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, check=True)
+        modules = json.loads(output.stdout.strip().splitlines()[-1])
+        for module_name in ('markdown', 'emoji', 'pygments', 'notolog.ui.settings_dialog',
+                            'notolog.ui.ai_assistant.ai_assistant', 'notolog.modules.modules', 'notolog.html_export'):
+            assert module_name not in modules
+
+    def test_parser_imports(self):
+        # Building the command line parser does not import the batch encryption, e.g. before the profiler is set
+        code = ('import sys, json; sys.argv = ["notolog", "--version"]; import notolog.app\n'
+                'try:\n    notolog.app.main()\nexcept SystemExit:\n    pass\n'
+                'print(json.dumps(sorted(sys.modules)))')
+        env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, check=True)
+        modules = json.loads(output.stdout.strip().splitlines()[-1])
+        assert 'notolog.encrypt.batch_crypt' not in modules
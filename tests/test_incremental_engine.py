@@ -0,0 +1,131 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from PySide6.QtGui import QTextDocument, QTextCursor, QFont
+from PySide6.QtWidgets import QApplication, QPlainTextDocumentLayout
+
+from notolog.highlight.md_highlighter import MdHighlighter
+from notolog.highlight.incremental_engine import IncrementalEngine
+
+import sys
+import pytest
+
+MD_TEXT = ('# Title\n\nSome *italic* text\n\n```python\ndef x(): pass\n# comment\n```\n\n'
+           '> quote\nmore\n\n- a\n- b\n\nend ~~strike\nstill~~ done\n')
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+
+class TestIncrementalEngine:
+
+    @pytest.fixture(scope="function")
+    def test_obj_doc(self, qapp):
+        doc = QTextDocument()
+        # The layout is required to emit the contentsChange signal
+        doc.setDocumentLayout(QPlainTextDocumentLayout(doc))
+        doc.setDefaultFont(QFont("Sans Serif"))
+        yield doc
+
+    @pytest.fixture(scope="function")
+    def test_obj_highlighter(self, test_obj_doc):
+        highlighter = MdHighlighter(document=test_obj_doc)
+        test_obj_doc.setPlainText(MD_TEXT * 10)
+        highlighter.rehighlight()
+        yield highlighter
+
+    @staticmethod
+    def get_formats(doc: QTextDocument) -> list:
+        formats = []
+        block = doc.begin()
+        while block.isValid():
+            formats.append([(r.start, r.length, r.format.foreground().color().name(),
+                             r.format.background().color().name()) for r in block.layout().formats()])
+            block = block.next()
+        return formats
+
+    def test_engine_created(self, test_obj_highlighter):
+        assert isinstance(test_obj_highlighter.engine, IncrementalEngine)
+        # The whole document is up-to-date after a full re-highlighting
+        assert not test_obj_highlighter.engine.is_dirty()
+
+    @pytest.mark.parametrize(
+        "ranges, exp_ranges",
+        [
+            ([(1, 2)], [[1, 2]]),
+            ([(1, 2), (3, 5)], [[1, 5]]),
+            ([(7, 9), (1, 2)], [[1, 2], [7, 9]]),
+            ([(1, 5), (2, 3)], [[1, 5]]),
+        ]
+    )
+    def test_mark_dirty(self, test_obj_highlighter, ranges, exp_ranges):
+        engine = test_obj_highlighter.engine
+        for first, last in ranges:
+            engine.mark_dirty(first, last)
+        assert engine.dirty_ranges == exp_ranges
+
+    def test_dirty_ranges_on_change(self, test_obj_doc, test_obj_highlighter):
+        engine = test_obj_highlighter.engine
+
+        cursor = QTextCursor(test_obj_doc.findBlockByNumber(40))
+        cursor.insertText('text')
+        assert engine.dirty_ranges == [[40, 40]]
+
+        # The range below the inserted blocks is shifted
+        cursor = QTextCursor(test_obj_doc.findBlockByNumber(2))
+        cursor.insertText('one\ntwo\n')
+        assert engine.dirty_ranges == [[2, 4], [42, 42]]
+
+    def test_process_scales_with_edit(self, test_obj_doc, test_obj_highlighter):
+        cursor = QTextCursor(test_obj_doc.findBlockByNumber(2))
+        cursor.insertText('more ')
+
+        processed = test_obj_highlighter.engine.process()
+
+        assert 0 < processed < 5
+        assert not test_obj_highlighter.engine.is_dirty()
+
+    @pytest.mark.parametrize(
+        "block_number, text",
+        [
+            (1, '```\n'),  # Open a code fence, the rest of the document changes
+            (4, ''),  # Remove a code fence
+            (9, '> '),  # Blockquote
+            (12, '\n\n'),  # Split a list
+            (15, '~~'),  # Strikethrough across the lines
+        ]
+    )
+    def test_process_equals_full_rehighlight(self, test_obj_doc, test_obj_highlighter, block_number, text):
+        cursor = QTextCursor(test_obj_doc.findBlockByNumber(block_number))
+        if text:
+            cursor.insertText(text)
+        else:
+            cursor.select(QTextCursor.SelectionType.BlockUnderCursor)
+            cursor.removeSelectedText()
+
+        test_obj_highlighter.engine.process()
+        formats = self.get_formats(test_obj_doc)
+
+        test_obj_highlighter.rehighlight()
+
+        assert formats == self.get_formats(test_obj_doc)
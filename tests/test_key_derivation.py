@@ -0,0 +1,144 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from PySide6.QtCore import QCoreApplication
+
+from notolog.encrypt.key_derivation import KeyDerivation
+from notolog.encrypt.enc_helper import EncHelper
+from notolog.encrypt.enc_password import EncPassword
+from notolog.file_header import FileHeader
+from notolog.notolog_editor import NotologEditor
+
+from concurrent.futures import wait
+from types import SimpleNamespace
+
+import time
+import pytest
+import threading
+
+ITERATIONS = 1000
+
+
+def process_events(condition, timeout=5.0):
+    # Deliver the signals queued by the workers
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+
+class TestKeyDerivation:
+
+    @pytest.fixture(scope="function")
+    def test_obj(self):
+        app = QCoreApplication.instance() or QCoreApplication([])  # noqa: F841
+        key_derivation = KeyDerivation(max_size=2)
+        yield key_derivation
+        key_derivation.shutdown()
+
+    def test_derive(self, test_obj):
+        future = test_obj.derive(b'password', b'salt', ITERATIONS)
+        assert future.result(timeout=5) == EncHelper.derive_key(b'password', b'salt', ITERATIONS)
+        # Derived already
+        cached = test_obj.derive(b'password', b'salt', ITERATIONS)
+        assert cached.done()
+        assert cached.result() == future.result()
+        # Other password
+        assert test_obj.derive(b'other', b'salt', ITERATIONS).result(timeout=5) != future.result()
+
+    def test_derive_in_progress(self, test_obj):
+        first = test_obj.derive(b'password', b'salt', ITERATIONS * 100)
+        second = test_obj.derive(b'password', b'salt', ITERATIONS * 100)
+        assert first is second
+        wait([first])
+
+    def test_max_size(self, test_obj):
+        test_obj.prefetch(b'password', [(b'first', ITERATIONS), (b'second', ITERATIONS), (b'third', ITERATIONS)])
+        assert process_events(lambda: not test_obj.is_busy())
+        assert len(test_obj.keys) == 2
+        # The password is not kept as is
+        assert all(params[0] != b'password' for params in test_obj.keys)
+
+    def test_clear(self, test_obj):
+        test_obj.derive(b'password', b'salt', ITERATIONS).result(timeout=5)
+        test_obj.idle_timer.setInterval(10)
+        test_obj.idle_timer.start()
+        assert process_events(lambda: not test_obj.keys)
+
+    def test_clear_signal(self, test_obj):
+        wiped = []
+        test_obj.keys_wiped.connect(lambda: wiped.append(True))
+        test_obj.clear()
+        assert wiped == [True]
+
+    def test_prefetch_bounded(self, test_obj, mocker):
+        derive = mocker.spy(test_obj, 'derive')
+        test_obj.prefetch(b'password', [(b'salt%d' % index, ITERATIONS) for index in range(test_obj.MAX_PREFETCH + 4)])
+        assert derive.call_count == test_obj.MAX_PREFETCH
+        assert all(call.kwargs.get('prefetch') for call in derive.call_args_list)
+        assert test_obj.prefetch_executor._max_workers == test_obj.PREFETCH_WORKERS
+        assert process_events(lambda: not test_obj.is_busy())
+
+    def test_prefetch_taken_over(self, test_obj):
+        # The prefetch worker is kept busy, the key needed now does not wait behind the queued ones
+        test_obj.prefetch(b'password', [(b'slow', ITERATIONS * 500), (b'queued', ITERATIONS)])
+        future = test_obj.derive(b'password', b'queued', ITERATIONS)
+        assert future.result(timeout=5) == EncHelper.derive_key(b'password', b'queued', ITERATIONS)
+        assert process_events(lambda: not test_obj.is_busy(), timeout=30)
+
+    def test_busy_changed(self, test_obj):
+        busy = []
+        derived = []
+        test_obj.busy_changed.connect(busy.append)
+        test_obj.key_derived.connect(lambda: derived.append(True))
+        test_obj.derive(b'password', b'salt', ITERATIONS)
+        assert process_events(lambda: busy == [True, False])
+        assert derived == [True]
+
+    def test_enc_helper_key(self, mocker):
+        enc_password = EncPassword()
+        enc_password.password = 'password'
+        key = EncHelper.derive_key(b'password', b'salt', ITERATIONS)
+        derive_key = mocker.spy(EncHelper, 'derive_key')
+        enc_helper = EncHelper(enc_password=enc_password, salt='salt', iterations=ITERATIONS, key=key)
+        derive_key.assert_not_called()
+        # The same as the one with the key derived by the helper itself
+        other_helper = EncHelper(enc_password=enc_password, salt='salt', iterations=ITERATIONS)
+        assert other_helper.decrypt_data(enc_helper.encrypt_data(b'Content')) == b'Content'
+
+    def test_prefetch_scan(self, test_obj):
+        threads = []
+
+        def scan():
+            threads.append(threading.current_thread().name)
+            return [(b'first', ITERATIONS), (b'second', ITERATIONS)]
+
+        # The scan is run on the prefetch worker, the keys found are prefetched then
+        test_obj.prefetch_scan(b'password', scan).result(timeout=5)
+        assert threads[0].startswith('key_prefetch')
+        assert process_events(lambda: len(test_obj.keys) == 2 and not test_obj.is_busy())
+
+    def test_prefetch_enc_keys_probes_bounded(self, test_obj, tmp_path, mocker):
+        for index in range(NotologEditor.MAX_PREFETCH_PROBES + 10):
+            (tmp_path / f'note{index}.md').write_text('Not encrypted')
+        editor = SimpleNamespace(key_derivation=test_obj, supported_file_extensions=['.md'],
+                                 MAX_PREFETCH_PROBES=NotologEditor.MAX_PREFETCH_PROBES, logger=mocker.Mock())
+        probe = mocker.spy(FileHeader, 'probe')
+        assert NotologEditor.get_enc_key_params(editor, str(tmp_path)) == set()
+        assert probe.call_count == NotologEditor.MAX_PREFETCH_PROBES
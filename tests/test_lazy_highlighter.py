@@ -0,0 +1,175 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from PySide6.QtGui import QTextDocument, QFont
+from PySide6.QtWidgets import QApplication, QPlainTextEdit, QPlainTextDocumentLayout
+
+from notolog.highlight.md_highlighter import MdHighlighter
+from notolog.highlight.lazy_highlighter import LazyHighlighter
+
+from .test_incremental_engine import MD_TEXT
+
+import sys
+import asyncio
+import pytest
+
+# Code fence longer than the viewport, with the lines looking like Markdown within it
+FENCE_TEXT = '```\n' + '# not a heading *nor italic*\n' * 300 + '```\n\n'
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+
+class TestLazyHighlighter:
+
+    @pytest.fixture(scope="function")
+    def test_obj_editor(self, qapp):
+        editor = QPlainTextEdit()
+        editor.document().setDefaultFont(QFont("Sans Serif"))
+        editor.resize(600, 400)
+        editor.show()
+        yield editor
+        editor.close()
+
+    @pytest.fixture(scope="function")
+    def test_obj_lazy(self, test_obj_editor):
+        highlighter = MdHighlighter(document=test_obj_editor.document())
+        lazy = LazyHighlighter(highlighter, test_obj_editor)
+        yield lazy
+        lazy.stop()
+
+    @staticmethod
+    def get_formats(doc: QTextDocument) -> list:
+        formats = []
+        block = doc.begin()
+        while block.isValid():
+            formats.append([(r.start, r.length, r.format.foreground().color().name(),
+                             r.format.background().color().name()) for r in block.layout().formats()])
+            block = block.next()
+        return formats
+
+    def get_expected_formats(self, text: str) -> list:
+        # Highlighted the whole document at once
+        doc = QTextDocument()
+        doc.setDocumentLayout(QPlainTextDocumentLayout(doc))
+        doc.setDefaultFont(QFont("Sans Serif"))
+        highlighter = MdHighlighter(document=doc)
+        doc.setPlainText(text)
+        highlighter.rehighlight()
+        return self.get_formats(doc)
+
+    @staticmethod
+    def load(lazy: LazyHighlighter, text: str, scroll_to: int = 0) -> None:
+        lazy.defer()
+        lazy.editor.setPlainText(text)
+        lazy.editor.verticalScrollBar().setValue(scroll_to)
+        QApplication.processEvents()
+        # The same as resume(), with the slices run by the test
+        lazy.highlighter.deferred = False
+        lazy.highlighter.engine.mark_all_dirty()
+        lazy.viewport_changed = True
+
+    def test_deferred(self, test_obj_lazy):
+        test_obj_lazy.defer()
+        test_obj_lazy.editor.setPlainText(MD_TEXT * 10)
+        assert test_obj_lazy.editor.document().begin().userData() is None
+        assert all(not formats for formats in self.get_formats(test_obj_lazy.editor.document()))
+
+    def test_visible_first(self, test_obj_lazy):
+        text = MD_TEXT * 200
+        self.load(test_obj_lazy, text, scroll_to=1000)
+        first, last = test_obj_lazy.get_visible_range()
+        assert first == 1000
+        assert last > first
+
+        # The visible blocks are highlighted within the first slice, even with no time left for the rest
+        assert test_obj_lazy.process_slice(budget=0) is True
+        engine = test_obj_lazy.highlighter.engine
+        assert not any(engine.is_block_dirty(number) for number in range(first, last + 1))
+        assert engine.is_block_dirty(first - 200) and engine.is_block_dirty(last + 200)
+        doc = test_obj_lazy.editor.document()
+        assert doc.findBlockByNumber(last + 200).userData() is None
+
+        slices = 1
+        while test_obj_lazy.process_slice(budget=0.005):
+            slices += 1
+        assert slices > 2
+        assert self.get_formats(doc) == self.get_expected_formats(text)
+
+    def test_scroll_within_fence(self, test_obj_lazy):
+        text = MD_TEXT * 5 + FENCE_TEXT + MD_TEXT * 20
+        # Within the code fence, its opening line is far above the viewport
+        self.load(test_obj_lazy, text, scroll_to=200)
+        test_obj_lazy.process_slice(budget=0)
+
+        # Scrolling brings the newly visible blocks ahead of the rest
+        test_obj_lazy.editor.verticalScrollBar().setValue(500)
+        QApplication.processEvents()
+        assert test_obj_lazy.viewport_changed is True
+        test_obj_lazy.process_slice(budget=0)
+        first, last = test_obj_lazy.get_visible_range()
+        assert not any(test_obj_lazy.highlighter.engine.is_block_dirty(number) for number in range(first, last + 1))
+
+        # The state of the blocks above is propagated to the ones highlighted ahead, e.g. they are within the code
+        while test_obj_lazy.process_slice(budget=0.005):
+            pass
+        assert self.get_formats(test_obj_lazy.editor.document()) == self.get_expected_formats(text)
+
+    def test_edit_while_pending(self, test_obj_lazy):
+        text = MD_TEXT * 50
+        self.load(test_obj_lazy, text, scroll_to=300)
+        test_obj_lazy.process_slice(budget=0)
+
+        # Open a code fence above the blocks highlighted ahead
+        cursor = test_obj_lazy.editor.textCursor()
+        cursor.setPosition(0)
+        cursor.insertText('```\n')
+        while test_obj_lazy.process_slice(budget=0.005):
+            pass
+        assert (self.get_formats(test_obj_lazy.editor.document())
+                == self.get_expected_formats(test_obj_lazy.editor.toPlainText()))
+
+    def test_slices_scheduled(self, test_obj_lazy):
+        text = MD_TEXT * 100
+
+        async def highlight():
+            test_obj_lazy.defer()
+            test_obj_lazy.editor.setPlainText(text)
+            test_obj_lazy.resume()
+            # The rest is left to the slices run within the loop
+            assert test_obj_lazy.task is not None
+            await asyncio.wait_for(test_obj_lazy.task, timeout=60)
+
+        asyncio.run(highlight())
+        assert not test_obj_lazy.highlighter.engine.is_dirty()
+        assert self.get_formats(test_obj_lazy.editor.document()) == self.get_expected_formats(text)
+
+    def test_no_loop(self, test_obj_lazy):
+        # The whole document is highlighted right away without the event loop
+        text = MD_TEXT * 20
+        test_obj_lazy.defer()
+        test_obj_lazy.editor.setPlainText(text)
+        test_obj_lazy.resume()
+        assert test_obj_lazy.task is None
+        assert not test_obj_lazy.highlighter.engine.is_dirty()
+        assert self.get_formats(test_obj_lazy.editor.document()) == self.get_expected_formats(text)
@@ -29,6 +29,7 @@ from notolog.encrypt.enc_helper import EncHelper
 from notolog.editor_state import Encryption
 from notolog.ui.message_box import MessageBox
 from notolog.ui.statusbar import StatusBar
+from notolog.save_pipeline import SavePipeline
 
 from logging import Logger
 
@@ -78,6 +79,10 @@ class TestNotologEditor:
         # Assign the mock toolbar to the editor object
         _obj.toolbar = toolbar_mock
 
+        # Set the attributes used upon saving
+        _obj.save_pipeline = SavePipeline()
+        _obj.file_watcher = None
+
         yield _obj
 
     @pytest.fixture(scope="function")
@@ -363,6 +368,12 @@ class TestNotologEditor:
         mock_edit_widget = MagicMock(spec=EditWidget)
         mock_edit_widget_to_plain_text = mocker.patch.object(mock_edit_widget, 'toPlainText', return_value=content)
         mock_edit_widget_clear = mocker.patch.object(mock_edit_widget, 'clear', return_value=None)
+        # The content saved is compared by its hash once the document is edited
+        mocker.patch.object(mock_edit_widget, 'is_changed', return_value=True)
+        mocker.patch.object(mock_edit_widget, 'get_content_hash', side_effect=lambda text: f'hash:{text}')
+        mocker.patch.object(mock_edit_widget, 'is_saved_hash',
+                            side_effect=lambda content_hash: content_hash == f'hash:{prev_content}')
+        mock_edit_widget_set_saved = mocker.patch.object(mock_edit_widget, 'set_saved', return_value=None)
         mocker.patch.object(test_obj_notolog_editor, 'get_edit_widget', return_value=mock_edit_widget)
 
         setattr(test_obj_notolog_editor, 'content', prev_content)
@@ -383,6 +394,9 @@ class TestNotologEditor:
         mock_header = MagicMock(spec=FileHeader)
         mock_header_refresh = mocker.patch.object(mock_header, 'refresh', return_value=None)
         mock_header_pack = mocker.patch.object(mock_header, 'pack', wraps=mock_header.pack)
+        # The encrypted content is packed by the header itself
+        mocker.patch.object(mock_header, 'pack_encrypted', side_effect=lambda _content, _encrypt_helper:
+                            FileHeader.pack_encrypted(mock_header, _content, _encrypt_helper))
         header_line_tpl = '<!-- %s -->'  # To simplify the emulation of header processing operations
         mocker.patch.object(mock_header, '__repr__', return_value=(header_line_tpl % file_path))
         mocker.patch.object(mock_header, 'is_valid', return_value=True)
@@ -418,7 +432,10 @@ class TestNotologEditor:
             mock_get_encryption.assert_called_once()
             mock_toggle_save_timer.assert_not_called()
             mock_message_box.assert_not_called()
-            assert test_obj_notolog_editor.content == content
+            mock_edit_widget_set_saved.assert_called_once()
+            assert mock_edit_widget_set_saved.call_args.args == (f'hash:{content}',)
+            # The content is kept if it is not in the document anymore
+            assert test_obj_notolog_editor.content == (content if clear_after else prev_content)
             assert repr(test_obj_notolog_editor.header) == header_line_tpl % file_path
             # Encrypted file
             if encryption == Encryption.ENCRYPTED:
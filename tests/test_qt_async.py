@@ -17,64 +17,77 @@ For detailed instructions and project information, please see the repository's R
 """
 
 import asyncio
+import time
 
 from notolog.async_highlighter import AsyncHighlighter
 
 import pytest
-import pytest_asyncio
 
 
 class TestQtAsync:
 
     @pytest.fixture
     def async_highlighter_obj(self):
-        # To avoid: There is no current event loop when self.loop = asyncio.get_event_loop()
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        # Fixture to create and return object instance
-        async_highlighter = AsyncHighlighter(callback=lambda check: check)
+        # Fixture to create and return object instance, the callback records the requests for the whole document
+        calls = []
+        async_highlighter = AsyncHighlighter(callback=lambda is_full: calls.append(is_full))
+        async_highlighter.calls = calls
         yield async_highlighter
+        async_highlighter.cancel()
 
-    @pytest_asyncio.fixture
-    async def cleanup_tasks(self):
-        yield
-        # Cancel and clean up all pending asyncio tasks
-        for task in asyncio.all_tasks():
-            if task is not asyncio.current_task():
-                task.cancel()
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+    @pytest.mark.asyncio
+    async def test_ui_interaction(self, async_highlighter_obj):
+        # A burst of edits is coalesced into a single run
+        for _i in range(8):
+            assert async_highlighter_obj.rehighlight_in_queue() is True
+            await asyncio.sleep(0.01)
+        assert async_highlighter_obj.is_pending()
+        assert async_highlighter_obj.calls == []
+
+        await asyncio.sleep(AsyncHighlighter.MAX_WAIT)
+        assert not async_highlighter_obj.is_pending()
+        # No escalation to the whole document re-highlighting once the queue drains
+        assert async_highlighter_obj.calls == [False]
+
+        counters = async_highlighter_obj.get_counters()
+        assert counters['scheduled'] == 8
+        assert counters['coalesced'] == 7
+        assert counters['executed'] == 1
+        assert counters['ms_spent'] >= 0
+
+    @pytest.mark.asyncio
+    async def test_full_rehighlight(self, async_highlighter_obj):
+        # The whole document is re-highlighted only if any of the requests coalesced asks for it
+        async_highlighter_obj.rehighlight_in_queue(full_rehighlight=True)
+        async_highlighter_obj.rehighlight_in_queue()
+        await asyncio.sleep(AsyncHighlighter.MAX_WAIT)
+        async_highlighter_obj.rehighlight_in_queue()
+        await asyncio.sleep(AsyncHighlighter.MAX_WAIT)
+        assert async_highlighter_obj.calls == [True, False]
 
     @pytest.mark.asyncio
-    async def test_ui_interaction(self, mocker, async_highlighter_obj, cleanup_tasks):
-        # Get callback method to check
-        mock_rehighlight = mocker.patch.object(async_highlighter_obj, 'rehighlight_task_callback')
-
-        # Check local task pool is empty
-        assert len(async_highlighter_obj.rehighlight_tasks) == 0
-
-        # Queue re-highlight tasks
-        task0 = await async_highlighter_obj.rehighlight_in_queue()
-        mock_rehighlight.assert_called_once_with(task0)
-        # One more
-        task1 = await async_highlighter_obj.rehighlight_in_queue()
-        mock_rehighlight.assert_called_with(task1)
-        # Another one more
-        task2 = await async_highlighter_obj.rehighlight_in_queue()
-        mock_rehighlight.assert_called_with(task2)
-        # Add more tasks
-        await async_highlighter_obj.rehighlight_in_queue()
-        await async_highlighter_obj.rehighlight_in_queue()
-        await async_highlighter_obj.rehighlight_in_queue()
-        await async_highlighter_obj.rehighlight_in_queue()
-        await async_highlighter_obj.rehighlight_in_queue()
-        # Max count in a short period of time is 3
-        assert mock_rehighlight.call_count == 3
-
-        # Checking of local task pool doesn't work properly if run from IDE, but works from CLI
-        assert len(async_highlighter_obj.rehighlight_tasks) == 3
-
-        # The cleanup_tasks fixture is used implicitly; no need to assert its presence
-        # assert cleanup_tasks
+    async def test_max_wait(self, async_highlighter_obj):
+        # Continuous typing does not postpone the run beyond the max wait
+        start_time = time.monotonic()
+        while not async_highlighter_obj.calls and time.monotonic() - start_time < 2:
+            async_highlighter_obj.rehighlight_in_queue()
+            await asyncio.sleep(0.02)
+        assert async_highlighter_obj.calls == [False]
+        assert time.monotonic() - start_time < AsyncHighlighter.MAX_WAIT + 0.25
+
+    def test_adaptive_delay(self, async_highlighter_obj, mocker):
+        assert async_highlighter_obj.get_delay() == AsyncHighlighter.MIN_DELAY
+        # The more expensive the run, the longer the delay, within the bounds
+        mocker.patch('notolog.async_highlighter.time.perf_counter', side_effect=[0.0, 0.1])
+        async_highlighter_obj.run()
+        assert async_highlighter_obj.get_delay() == pytest.approx(0.1 * AsyncHighlighter.COST_FACTOR)
+        mocker.patch('notolog.async_highlighter.time.perf_counter', side_effect=[0.0, 1.0])
+        async_highlighter_obj.run()
+        assert async_highlighter_obj.get_delay() == AsyncHighlighter.MAX_DELAY
+        assert async_highlighter_obj.get_counters()['executed'] == 2
+        assert async_highlighter_obj.get_counters()['ms_spent'] == pytest.approx(1100)
+
+    def test_no_loop(self, async_highlighter_obj):
+        # Skipped if the event loop is not running
+        assert async_highlighter_obj.rehighlight_in_queue() is False
+        assert async_highlighter_obj.get_counters()['scheduled'] == 0
@@ -0,0 +1,180 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from PySide6.QtGui import QTextDocument
+from PySide6.QtWidgets import QApplication
+
+from notolog.helpers.regex_helper import RegexRegistry, Replacer
+from notolog.highlight.rule_tokenizer import RuleTokenizer
+from notolog.highlight.md_highlighter import MdHighlighter
+from notolog.view_processor import ViewProcessor
+from notolog.file_header import FileHeader
+
+from tests.benchmarks.benchmark_suite import make_note
+
+import os
+import re
+import sys
+import timeit
+import pytest
+
+# The timing assertions depend on the machine load, they are run on demand, see also the benchmark suite
+benchmark = pytest.mark.skipif(not os.environ.get('NOTOLOG_BENCHMARKS'),
+                               reason="Timing benchmark, set NOTOLOG_BENCHMARKS=1 to run it")
+
+DETAILS = '<details class="note"><summary>Summary</summary>\n\nHidden **text**\n\n</details>\n'
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+
+def replace_one_by_one(content, replacements):
+    # The replacements as they used to be performed
+    for pattern, replacement in replacements.items():
+        content = re.sub(pattern, replacement, content)
+    return content
+
+
+def best_time(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5))
+
+
+class TestRegexHelper:
+
+    def test_compile(self):
+        pattern = RegexRegistry.compile(r'(\d+)-test', re.IGNORECASE)
+        assert pattern is RegexRegistry.compile(r'(\d+)-test', re.IGNORECASE)
+        assert pattern is not RegexRegistry.compile(r'(\d+)-test')
+        assert pattern.flags & re.IGNORECASE
+
+    def test_replacer(self):
+        replacements = {r'a(b)(c)': r'[\2\1]', r'x': 'y', r'(d)(e)?': r'\g<2>\1|\g<0>\n', r'\\(z)': r'\\\1'}
+        replacer = RegexRegistry.get_replacer(replacements)
+        assert replacer is RegexRegistry.get_replacer(dict(replacements))
+        content = 'abc x de d \\z abcx'
+        assert replacer.sub(content) == replace_one_by_one(content, replacements)
+        assert Replacer.parse_template(r'<\1 \g<2> \\1\t\g<0>', 3) == ['<', 4, ' ', 5, ' \\1\t', 0]
+
+    @pytest.mark.parametrize(
+        "replacements",
+        [
+            # Numbered backreferences, not the octal escapes and not within the sets
+            {r'(x)(y)': r'\2\1', r'(a)\1': r'<\1>', r'(b)[\1]\101': r'{\1}'},
+            # Named groups and the same name used by the various patterns
+            {r'(?P<tag>x)(?P=tag)': r'[\g<tag>]', r'(?P<tag>a)(?P<other>b)?(?(other)c|d)': r'<\g<other>\g<tag>>'},
+            # Conditionals by the group number
+            {r'(x)': 'X', r'(<)?(a)(?(1)>)': r'\2'},
+        ]
+    )
+    def test_replacer_group_refs(self, replacements):
+        content = 'xy xx aa ab\x01A b\x01A xxyy <a> <a abc abd a'
+        assert Replacer(replacements).sub(content) == replace_one_by_one(content, replacements)
+
+    def test_replacer_unknown_group(self):
+        with pytest.raises(ValueError):
+            Replacer({r'(a)': r'\g<name>'})
+
+    def test_view_replacements(self):
+        content = make_note(10 * 1024) + DETAILS * 3 + '<details>\n<summary>\n\n</summary>\n</details>'
+        forward = ViewProcessor.replace_tags(content, ViewProcessor.forward_replacements)
+        assert forward == replace_one_by_one(content, ViewProcessor.forward_replacements)
+        assert '[details class="note"][summary]Summary[/summary]' in forward
+        backward = ViewProcessor.replace_tags(forward, ViewProcessor.backward_replacements)
+        assert backward == replace_one_by_one(forward, ViewProcessor.backward_replacements)
+        assert backward == content
+
+    def test_details_tags(self):
+        matches = [(match.lastindex, match.group()) for match in ViewProcessor.details_tags_re.finditer(
+            '<p><details open> text </details> <details></details></p>')]
+        assert matches == [(1, '<details open>'), (2, '</details>'), (1, '<details>'), (2, '</details>')]
+
+    def test_file_header(self):
+        header = FileHeader().get_new()
+        header.set_param('title', 'Title')
+        for line_break in ('\n', '\r\n', '\r', ' '):
+            content = line_break.join([header.pack('').rstrip('\n'), 'Body', 'Text'])
+            file_header, body = FileHeader().load(content)
+            assert file_header.get_param('title') == 'Title'
+            assert body == 'Body\nText'
+        assert FileHeader().load('')[1] == ''
+        assert FileHeader().load('No header')[1] == 'No header'
+
+    def test_shared_tokenizer(self, qapp):
+        first_doc, second_doc = QTextDocument(), QTextDocument()
+        first, second = MdHighlighter(document=first_doc), MdHighlighter(document=second_doc)
+        assert first.tokenizer is second.tokenizer is RuleTokenizer.get_shared(MdHighlighter.re_rules)
+        assert first.rules[0][0] is RegexRegistry.compile(MdHighlighter.re_rules[0][0])
+        # Another rule set has its own tokenizer
+        assert RuleTokenizer.get_shared(list(MdHighlighter.re_rules)) is not first.tokenizer
+
+    @benchmark
+    def test_block_overhead(self):
+        """
+        Micro-benchmark of the expandable blocks tags search within each block of the document, the compiled pattern
+        with a single pass over the block against the patterns passed as strings and a pass per tag.
+        """
+        blocks = (make_note(16 * 1024) + DETAILS * 20).splitlines()
+
+        def per_block_strings():
+            for text in blocks:
+                for _match in re.finditer(r"<details.*?>", text):
+                    pass
+                for _match in re.finditer(r"</details>", text):
+                    pass
+
+        def per_block_compiled():
+            for text in blocks:
+                if '<' not in text:
+                    continue
+                for _match in ViewProcessor.details_tags_re.finditer(text):
+                    pass
+
+        assert best_time(per_block_compiled, 20) < best_time(per_block_strings, 20)
+
+    @benchmark
+    def test_replacements_overhead(self):
+        """
+        Micro-benchmark of the replacements of the expandable tokens, a single pass over the content against a pass
+        per replacement.
+        """
+        content = make_note(256 * 1024) + DETAILS * 20
+        replacements = ViewProcessor.backward_replacements
+        content = replace_one_by_one(content, ViewProcessor.forward_replacements)
+
+        assert (best_time(lambda: ViewProcessor.replace_tags(content, replacements), 10)
+                < best_time(lambda: replace_one_by_one(content, replacements), 10))
+
+    @benchmark
+    def test_header_overhead(self):
+        """
+        Micro-benchmark of the header parsing, the pattern compiled once against the template formatted per line.
+        """
+        line = FileHeader().get_new().pack('').rstrip('\n')
+
+        def parse_formatted():
+            re.search(FileHeader.HEADER_TPL % '(.*?)', line, re.IGNORECASE)
+
+        def parse_compiled():
+            FileHeader.HEADER_RE.search(line)
+
+        assert best_time(parse_compiled, 2000) < best_time(parse_formatted, 2000)
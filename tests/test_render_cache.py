@@ -0,0 +1,96 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from notolog.render_cache import RenderCache
+
+import os
+import pytest
+
+
+class TestRenderCache:
+
+    @pytest.fixture(scope="function")
+    def test_obj(self, tmp_path):
+        yield RenderCache(disk_dir=str(tmp_path / 'render_cache'), max_items=3, max_size=100, max_disk_size=50)
+
+    def test_get_key(self):
+        key = RenderCache.get_key('content', 'config', True, 'default')
+        assert key == RenderCache.get_key('content', 'config', True, 'default')
+        # Any of the params changes the key
+        assert key != RenderCache.get_key('content!', 'config', True, 'default')
+        assert key != RenderCache.get_key('content', 'config', False, 'default')
+        assert key != RenderCache.get_key('content', 'config', True, 'noir_dark')
+
+    def test_get_put(self, test_obj):
+        assert test_obj.get('key1') is None
+        test_obj.put('key1', '<p>html</p>')
+        assert test_obj.get('key1') == '<p>html</p>'
+        assert (test_obj.hits, test_obj.misses) == (1, 1)
+
+    def test_memory_eviction(self, test_obj):
+        for index in range(3):
+            test_obj.put(f'key{index}', 'x' * 10)
+        # Refresh the oldest one
+        test_obj.get('key0')
+        test_obj.put('key3', 'x' * 10)
+        assert list(test_obj.items.keys()) == ['key2', 'key0', 'key3']
+        # Size limit
+        test_obj.put('key4', 'x' * 95)
+        assert list(test_obj.items.keys()) == ['key4']
+        assert test_obj.size == 95
+
+    def test_disk_tier(self, test_obj, tmp_path):
+        test_obj.put('key1', 'html1')
+        assert os.path.isfile(tmp_path / 'render_cache' / 'key1.html')
+
+        # A new instance (e.g. after the app restart) reads the file
+        cache = RenderCache(disk_dir=str(tmp_path / 'render_cache'))
+        assert cache.disk_size == 5
+        assert cache.get('key1') == 'html1'
+        assert 'key1' in cache.items
+
+    def test_disk_eviction(self, test_obj, tmp_path):
+        for index in range(5):
+            test_obj.put(f'key{index}', 'x' * 20)
+        assert test_obj.disk_size <= 50
+        assert sorted(os.listdir(tmp_path / 'render_cache')) == ['key3.html', 'key4.html']
+
+    def test_clear(self, test_obj, tmp_path):
+        test_obj.put('key1', 'html1')
+        test_obj.clear()
+        assert test_obj.items == {}
+        assert os.listdir(tmp_path / 'render_cache') == []
+        assert test_obj.get('key1') is None
+
+    def test_disk_tier_disabled(self, test_obj, tmp_path):
+        test_obj.set_disk_dir(None)
+        test_obj.put('key1', 'html1')
+        assert os.listdir(tmp_path / 'render_cache') == []
+
+    def test_private(self, test_obj, tmp_path):
+        test_obj.put('key1', 'html1', private=True)
+        test_obj.put('key2', 'html2')
+        # In memory only
+        assert test_obj.get('key1') == 'html1'
+        assert os.listdir(tmp_path / 'render_cache') == ['key2.html']
+
+        test_obj.clear_private()
+        assert test_obj.get('key1') is None
+        assert test_obj.get('key2') == 'html2'
+        assert test_obj.size == 5
+        assert test_obj.private_keys == set()
@@ -0,0 +1,131 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from notolog.render_pipeline import RenderPipeline
+from notolog.render_cache import RenderCache
+from notolog.etree_extension import ElementTreeExtension
+
+from markdown.extensions.codehilite import CodeHiliteExtension
+
+import os
+import asyncio
+import markdown
+import pytest
+
+MD_TEXT = ('# Title\n\n<details><summary>More</summary>\n\nHidden *text* :cat:\n\n</details>\n\n'
+           '```python\nprint(1)\n```\n\nNote[^1]\n\n[^1]: Footnote\n')
+
+
+def create_md() -> markdown.Markdown:
+    return markdown.Markdown(extensions=['extra', 'toc', ElementTreeExtension(), CodeHiliteExtension(linenums=True)])
+
+
+class TestRenderPipeline:
+
+    @pytest.fixture(scope="function")
+    def test_obj(self):
+        pipeline = RenderPipeline(md_factory=create_md)
+        yield pipeline
+        pipeline.shutdown()
+
+    def test_render_sync(self, test_obj):
+        html_data = test_obj.render_sync(MD_TEXT, process_emojis=True)
+
+        assert '<details><summary>More</summary>' in html_data
+        assert '</details>' in html_data
+        assert '[details' not in html_data
+        assert ':cat:' not in html_data
+        assert 'class="codehilite"' in html_data
+
+    def test_render_sync_resets_extensions(self, test_obj):
+        # Footnotes are not kept across the various notes
+        html_data = test_obj.render_sync(MD_TEXT, process_emojis=False)
+        assert html_data == test_obj.render_sync(MD_TEXT, process_emojis=False)
+        assert ':cat:' in html_data
+
+    def test_render_cached(self, test_obj, mocker):
+        html_data = test_obj.render_sync(MD_TEXT, process_emojis=False, theme='default')
+
+        # No conversion for the unchanged content
+        mock_convert = mocker.patch.object(test_obj, 'convert_markdown_to_html', wraps=test_obj.convert_markdown_to_html)
+        results = []
+        assert test_obj.render(MD_TEXT, process_emojis=False, callback=lambda html: results.append(html), theme='default')
+        assert results == [html_data]
+        assert test_obj.render_sync(MD_TEXT, process_emojis=False, theme='default') == html_data
+        mock_convert.assert_not_called()
+
+        # Another theme is another key
+        test_obj.render_sync(MD_TEXT, process_emojis=False, theme='noir_dark')
+        mock_convert.assert_called_once()
+
+    def test_render_private(self, tmp_path):
+        cache_dir = tmp_path / 'render_cache'
+        pipeline = RenderPipeline(md_factory=create_md, cache=RenderCache(disk_dir=str(cache_dir)))
+        try:
+            # Encrypted note's html is cached in memory only
+            html_data = pipeline.render_sync(MD_TEXT, process_emojis=False, private=True)
+            assert os.listdir(cache_dir) == []
+            assert pipeline.render_sync(MD_TEXT, process_emojis=False) == html_data
+            assert os.listdir(cache_dir) == []
+            # Dropped once the keys are wiped
+            pipeline.cache.clear_private()
+            assert pipeline.cache.items == {}
+        finally:
+            pipeline.shutdown()
+
+    def test_render_without_loop(self, test_obj):
+        # The caller has to render synchronously then
+        assert test_obj.render(MD_TEXT, process_emojis=False, callback=lambda html_data: None) is False
+        assert not test_obj.is_busy()
+
+    def test_cancelled_stages_skipped(self, test_obj):
+        render_id = test_obj.render_id
+        test_obj.cancel()
+        assert test_obj.run_stages(render_id, MD_TEXT, process_emojis=False) is None
+
+    def test_render_in_background(self, test_obj):
+        results = []
+        busy = []
+        test_obj.busy_changed.connect(lambda value: busy.append(value))
+
+        async def render():
+            assert test_obj.render(MD_TEXT, process_emojis=False, callback=lambda html_data: results.append(html_data))
+            assert test_obj.is_busy()
+            while not results:
+                await asyncio.sleep(0.01)
+
+        asyncio.run(asyncio.wait_for(render(), timeout=10))
+
+        assert results == [test_obj.render_sync(MD_TEXT, process_emojis=False)]
+        assert busy == [True, False]
+
+    def test_new_render_supersedes_pending(self, test_obj):
+        results = []
+
+        async def render():
+            test_obj.render('# First', process_emojis=False, callback=lambda html_data: results.append(html_data))
+            test_obj.render('# Second', process_emojis=False, callback=lambda html_data: results.append(html_data))
+            while not results:
+                await asyncio.sleep(0.01)
+            # Let the superseded render finish, if it has been started already
+            await asyncio.sleep(0.1)
+
+        asyncio.run(asyncio.wait_for(render(), timeout=10))
+
+        assert len(results) == 1
+        assert 'Second' in results[0]
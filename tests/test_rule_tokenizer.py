@@ -0,0 +1,105 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from notolog.highlight.md_highlighter import MdHighlighter
+from notolog.highlight.view_highlighter import ViewHighlighter
+from notolog.highlight.rule_tokenizer import RuleTokenizer
+
+import os
+import re
+import pytest
+
+# Hand-crafted lines to cover the rules the README does not have
+CORPUS = [
+    '',
+    '# Title',
+    '###### Sub *title* with `code`',
+    'Some *italic*, **bold**, ***both*** and _under_ __score__ text',
+    '~~strike~~ and ==mark== with <kbd>Ctrl</kbd>',
+    '> quote with [link](https://example.com "title") and ![image](img.png)',
+    '- list item',
+    '1. ordered item',
+    '    indented code',
+    '```python',
+    '~~~',
+    '| col | col |',
+    '|:----|----:|',
+    '<!-- comment -->',
+    '<div class="x">html</div>',
+    '[^1]: footnote',
+    'Line with trailing spaces  ',
+    '***',
+    'https://example.com plain url and user@example.com',
+    '\\*escaped\\* chars',
+    'Unicode ünïcödé *тест* 日本語',
+    '*unclosed **nested',
+]
+
+
+def get_corpus() -> list:
+    corpus = list(CORPUS)
+    readme_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'README.md')
+    if os.path.isfile(readme_path):
+        with open(readme_path, 'r', encoding='utf-8') as f:
+            corpus += f.read().splitlines()
+    return corpus
+
+
+class TestRuleTokenizer:
+
+    @pytest.mark.parametrize("highlighter_class", [MdHighlighter, ViewHighlighter])
+    def test_tokens_equal_rule_by_rule(self, highlighter_class):
+        rules = highlighter_class.re_rules
+        tokenizer = RuleTokenizer(rules)
+        for line in get_corpus():
+            expected = [(rule[2], match.start(rule[1]), match.end(rule[1]))
+                        for rule in rules for match in re.finditer(rule[0], line)]
+            assert tokenizer.get_tokens(line) == expected, line
+
+    @pytest.mark.parametrize(
+        "pattern, text, exp_candidate",
+        [
+            (r'\*(.+?)\*', 'some *italic* text', True),
+            (r'\*(.+?)\*', 'some text', False),
+            (r'(?:foo|bar)x', 'a barx', True),
+            (r'(?:foo|bar)x', 'a quxx', False),
+            (r'\w+', 'any text', True),
+            (r'a?b', 'b', True),
+            (r'[^x]y', 'zy', True),
+            # Scoped inline flags
+            (r'x(?i:abc)', 'xABC', True),
+            (r'x(?i:abc)', 'ABC', False),
+            (r'(?x: a b )', 'ab', True),
+        ]
+    )
+    def test_candidates(self, pattern, text, exp_candidate):
+        tokenizer = RuleTokenizer([(pattern, 0, 'tag', None, None, None, None)])
+        assert tokenizer.get_candidates(text) == [exp_candidate]
+
+    def test_global_inline_flags_always_checked(self):
+        tokenizer = RuleTokenizer([(r'(?i)abc', 0, 'tag', None, None, None, None)])
+        assert tokenizer.requirements == [[]]
+        assert tokenizer.get_tokens('ABC') == [('tag', 0, 3)]
+
+    def test_unparsable_pattern_always_checked(self, mocker):
+        # A pattern the prefilter cannot take apart, e.g. the parse tree of a newer Python version
+        mocker.patch.object(RuleTokenizer, 'get_requirements', side_effect=ValueError('Unknown opcode'))
+        tokenizer = RuleTokenizer([(r'abc', 0, 'tag', None, None, None, None)])
+        assert tokenizer.requirements == [[]]
+        assert tokenizer.get_candidates('xyz') == [True]
+        assert tokenizer.get_tokens('xabc') == [('tag', 1, 4)]
@@ -0,0 +1,186 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from notolog.save_pipeline import SavePipeline
+from notolog.helpers import file_helper
+
+from threading import Event
+
+import os
+import stat
+import asyncio
+import pytest
+
+
+def read(file_path):
+    with open(file_path, encoding='utf-8') as f:
+        return f.read()
+
+
+class TestSavePipeline:
+
+    @pytest.fixture(scope="function")
+    def test_obj(self):
+        pipeline = SavePipeline()
+        yield pipeline
+        pipeline.shutdown()
+
+    @pytest.fixture(scope="function")
+    def file_path(self, tmp_path):
+        file_path = tmp_path / 'note.md'
+        file_path.write_text('Initial content', encoding='utf-8')
+        yield str(file_path)
+
+    def test_write(self, test_obj, file_path):
+        assert test_obj.write(file_path, 'New content', prepare=lambda content: f'<!-- header -->\n{content}')
+        assert read(file_path) == '<!-- header -->\nNew content'
+        # No temporary files left
+        assert os.listdir(os.path.dirname(file_path)) == ['note.md']
+
+    def test_save_without_loop(self, test_obj, file_path):
+        # The caller has to save synchronously then
+        assert test_obj.save(file_path, 'New content') is False
+        assert not test_obj.is_busy()
+        assert read(file_path) == 'Initial content'
+
+    def test_save_in_background(self, test_obj, file_path):
+        results = []
+        busy = []
+        test_obj.busy_changed.connect(lambda value: busy.append(value))
+
+        async def save():
+            assert test_obj.save(file_path, 'New content', prepare=str.upper, callback=results.append)
+            assert test_obj.is_busy()
+            while not results:
+                await asyncio.sleep(0.01)
+
+        asyncio.run(asyncio.wait_for(save(), timeout=10))
+
+        assert results == [True]
+        assert busy == [True, False]
+        assert read(file_path) == 'NEW CONTENT'
+
+    def test_saves_coalesced(self, test_obj, file_path):
+        results = []
+        prepared = []
+        started = Event()
+        release = Event()
+
+        def prepare_first(content):
+            started.set()
+            release.wait(timeout=5)
+            return content
+
+        async def save():
+            test_obj.save(file_path, 'First', prepare=prepare_first, callback=lambda result: results.append(1))
+            started.wait(timeout=5)
+            # Requested while the first one is in progress, only the latest is saved then
+            test_obj.save(file_path, 'Second', prepare=lambda content: prepared.append(content) or content,
+                          callback=lambda result: results.append(2))
+            test_obj.save(file_path, 'Third', prepare=lambda content: prepared.append(content) or content,
+                          callback=lambda result: results.append(3))
+            release.set()
+            while len(results) < 2:
+                await asyncio.sleep(0.01)
+
+        asyncio.run(asyncio.wait_for(save(), timeout=10))
+
+        assert results == [1, 3]
+        assert prepared == ['Third']
+        assert read(file_path) == 'Third'
+        assert not test_obj.is_busy()
+
+    def test_flush(self, test_obj, file_path):
+        results = []
+
+        async def save():
+            test_obj.save(file_path, 'Background', callback=results.append)
+            test_obj.save(file_path, 'Pending', callback=results.append)
+            test_obj.flush(file_path)
+            # The save in progress is finished, the pending one is dropped
+            assert read(file_path) == 'Background'
+            assert not test_obj.is_busy()
+            await asyncio.sleep(0.1)
+
+        asyncio.run(asyncio.wait_for(save(), timeout=10))
+
+        # The results are not passed over
+        assert results == []
+        assert read(file_path) == 'Background'
+
+
+class TestSaveFileAtomic:
+
+    @pytest.mark.skipif(os.name == 'nt', reason="POSIX permissions")
+    def test_permissions_kept(self, tmp_path):
+        file_path = str(tmp_path / 'note.md')
+        file_helper.save_file(file_path, 'Content')
+        os.chmod(file_path, 0o640)
+        assert file_helper.save_file_atomic(file_path, 'Updated')
+        assert read(file_path) == 'Updated'
+        assert stat.S_IMODE(os.stat(file_path).st_mode) == 0o640
+
+    def test_new_file(self, tmp_path):
+        file_path = str(tmp_path / 'new.md')
+        assert file_helper.save_file_atomic(file_path, 'Content')
+        assert read(file_path) == 'Content'
+
+    def test_failed_write_keeps_file(self, tmp_path, mocker):
+        file_path = str(tmp_path / 'note.md')
+        file_helper.save_file(file_path, 'Content')
+        mocker.patch('os.fsync', side_effect=OSError('No space left on device'))
+        assert file_helper.save_file_atomic(file_path, 'Updated') is False
+        assert read(file_path) == 'Content'
+        assert os.listdir(str(tmp_path)) == ['note.md']
+
+    def test_parts(self, tmp_path):
+        file_path = str(tmp_path / 'note.md')
+        file_helper.save_file(file_path, 'Content')
+        assert file_helper.save_file_atomic(file_path, (part for part in ['Up', 'dated']))
+        assert read(file_path) == 'Updated'
+
+    def test_failed_parts_keep_file(self, tmp_path):
+        file_path = str(tmp_path / 'note.md')
+        file_helper.save_file(file_path, 'Content')
+
+        def parts():
+            yield 'Up'
+            raise ValueError('Cannot encrypt')
+
+        with pytest.raises(ValueError):
+            file_helper.save_file_atomic(file_path, parts())
+        assert read(file_path) == 'Content'
+        assert os.listdir(str(tmp_path)) == ['note.md']
+
+    @pytest.mark.skipif(os.name == 'nt', reason="POSIX symlinks")
+    def test_symlink_kept(self, tmp_path):
+        target_dir = tmp_path / 'target'
+        target_dir.mkdir()
+        target_path = str(target_dir / 'note.md')
+        file_helper.save_file(target_path, 'Content')
+        link_path = str(tmp_path / 'link.md')
+        os.symlink(target_path, link_path)
+
+        assert file_helper.save_file_atomic(link_path, 'Updated')
+        # The target is updated and the link is still a link to it
+        assert os.path.islink(link_path)
+        assert read(target_path) == 'Updated'
+        assert read(link_path) == 'Updated'
+        # The temporary file was created next to the target
+        assert os.listdir(str(target_dir)) == ['note.md']
+        assert sorted(os.listdir(str(tmp_path))) == ['link.md', 'target']
@@ -0,0 +1,180 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from PySide6.QtGui import QTextDocument, QTextCursor
+from PySide6.QtWidgets import QApplication, QPlainTextDocumentLayout
+
+from notolog.search_index import SearchIndex
+
+import sys
+import random
+import pytest
+
+CASE_SENSITIVE = QTextDocument.FindFlag.FindCaseSensitively
+CASE_INSENSITIVE = QTextDocument.FindFlag(0)
+WHOLE_WORDS = QTextDocument.FindFlag.FindWholeWords
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication(sys.argv)
+    yield app
+
+
+def find_positions(document, searched_text, find_flags):
+    """
+    Positions the way QTextDocument.find() reports them, for reference.
+    """
+    positions = []
+    cursor = QTextCursor(document)
+    while not (cursor := document.find(searched_text, cursor, find_flags)).isNull():
+        positions.append(cursor.position())
+    return positions
+
+
+class TestSearchIndex:
+
+    @pytest.fixture(scope="function")
+    def test_doc(self, qapp):
+        document = QTextDocument()
+        # Layout is required for the contents change signal
+        document.setDocumentLayout(QPlainTextDocumentLayout(document))
+        yield document
+
+    @pytest.fixture(scope="function")
+    def test_obj(self):
+        search_index = SearchIndex()
+        yield search_index
+        search_index.clear()
+
+    def assert_same_as_find(self, test_obj, document, searched_text, find_flags):
+        positions = find_positions(document, searched_text, find_flags)
+        assert test_obj.search(document, searched_text, find_flags) == len(positions)
+        for index, position in enumerate(positions):
+            assert test_obj.index(position) == index + 1
+
+    @pytest.mark.parametrize(
+        "text, searched_text, find_flags",
+        [
+            ('Lorem ipsum\ndolor sit amet, LOREM', 'lorem', CASE_INSENSITIVE),
+            ('Lorem ipsum\ndolor sit amet, LOREM', 'lorem', CASE_SENSITIVE),
+            ('Lorem ipsum\ndolor sit amet, LOREM', 'Lorem', CASE_SENSITIVE),
+            ('aaaaa', 'aa', CASE_SENSITIVE),
+            ('a.b a+b (a)', 'a.b', CASE_INSENSITIVE),
+            ('(a) [b] *c*', '(a)', CASE_INSENSITIVE),
+            ('🐱 cat 🐱 cat\n🐶🐶 cat', 'cat', CASE_INSENSITIVE),
+            ('🐱🐱🐱', '🐱', CASE_INSENSITIVE),
+            ('Привет, ПРИВЕТ мир', 'привет', CASE_INSENSITIVE),
+            ('text with nbsp', 'text with', CASE_INSENSITIVE),
+            ('nothing here', 'absent', CASE_INSENSITIVE),
+            ('any text', '', CASE_INSENSITIVE),
+            # Words are bounded by the letters and numbers, the underscore is not a part of a word
+            ('x _A_ y A_ _A bA A1 A', 'A', WHOLE_WORDS | CASE_SENSITIVE),
+            ('snake_case case_snake case', 'case', WHOLE_WORDS),
+        ]
+    )
+    def test_search(self, test_obj, test_doc, text, searched_text, find_flags):
+        test_doc.setPlainText(text)
+        self.assert_same_as_find(test_obj, test_doc, searched_text, find_flags)
+
+    def test_not_an_end_position(self, test_obj, test_doc):
+        test_doc.setPlainText('abc abc')
+        assert test_obj.search(test_doc, 'abc', CASE_SENSITIVE) == 2
+        assert test_obj.index(3) == 1
+        assert test_obj.index(7) == 2
+        assert test_obj.index(0) == 0
+        assert test_obj.index(5) == 0
+
+    def test_search_params_change(self, test_obj, test_doc):
+        test_doc.setPlainText('Abc abc')
+        assert test_obj.search(test_doc, 'abc', CASE_INSENSITIVE) == 2
+        assert test_obj.search(test_doc, 'abc', CASE_SENSITIVE) == 1
+        assert test_obj.search(test_doc, 'bc', CASE_SENSITIVE) == 2
+        # Another document
+        other_doc = QTextDocument()
+        other_doc.setPlainText('abc')
+        assert test_obj.search(other_doc, 'bc', CASE_SENSITIVE) == 1
+
+    def test_search_cached(self, test_obj, test_doc, mocker):
+        test_doc.setPlainText('abc abc')
+        assert test_obj.search(test_doc, 'abc', CASE_SENSITIVE) == 2
+        rebuild = mocker.patch.object(test_obj, 'rebuild')
+        assert test_obj.search(test_doc, 'abc', CASE_SENSITIVE) == 2
+        rebuild.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "text, searched_text, position, chars_removed, insert_text",
+        [
+            ('abc abc abc', 'abc', 4, 0, 'abc '),  # Insert an occurrence
+            ('abc abc abc', 'abc', 5, 1, ''),  # Break an occurrence
+            ('abc ab abc', 'abc', 6, 0, 'c'),  # Complete an occurrence
+            ('abc abc abc', 'abc', 0, 0, 'x\n'),  # Shift all the occurrences
+            ('abc abc abc', 'abc', 0, 11, 'abc'),  # Replace all
+            ('aaaa', 'aa', 0, 0, 'a'),  # Overlapping occurrences are shifted
+            ('aaaa aaaa', 'aa', 6, 1, ''),
+            ('🐱 abc 🐱 abc', 'abc', 0, 0, '🐶'),  # Astral chars take 2 positions each
+            ('🐱 abc 🐱 abc', 'abc', 7, 2, ''),
+            ('ABC abc', 'abc', 3, 0, ' aBc'),
+        ]
+    )
+    def test_contents_change(self, mocker, test_obj, test_doc, text, searched_text, position, chars_removed,
+                             insert_text):
+        test_doc.setPlainText(text)
+        assert test_obj.search(test_doc, searched_text, CASE_INSENSITIVE) == \
+            len(find_positions(test_doc, searched_text, CASE_INSENSITIVE))
+        # Only the edited region is taken from the document
+        update_text = mocker.patch.object(test_obj, 'update_text', wraps=test_obj.update_text)
+
+        cursor = QTextCursor(test_doc)
+        cursor.setPosition(position)
+        cursor.setPosition(position + chars_removed, QTextCursor.MoveMode.KeepAnchor)
+        cursor.insertText(insert_text)
+
+        # Updated by the contents change signal, without the rebuild
+        assert test_obj.revision == test_doc.revision()
+        assert test_obj.text == test_doc.toPlainText()
+        update_text.assert_not_called()
+        positions = find_positions(test_doc, searched_text, CASE_INSENSITIVE)
+        assert len(test_obj.starts) == len(positions)
+        for index, position in enumerate(positions):
+            assert test_obj.index(position) == index + 1
+
+    def test_random_edits(self, test_obj, test_doc):
+        rnd = random.Random(42)
+        alphabet = 'ab \n🐱'
+        test_doc.setPlainText(''.join(rnd.choice(alphabet) for _ in range(200)))
+        test_obj.search(test_doc, 'ab', CASE_SENSITIVE)
+
+        for _ in range(200):
+            text = test_doc.toPlainText()
+            # Not within a surrogate pair
+            index = rnd.randint(0, len(text))
+            position = len(text[:index].encode('utf-16-le')) // 2
+            cursor = QTextCursor(test_doc)
+            cursor.setPosition(position)
+            cursor.movePosition(QTextCursor.MoveOperation.NextCharacter, QTextCursor.MoveMode.KeepAnchor,
+                                rnd.randint(0, 3))
+            cursor.insertText(''.join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 3))))
+
+            positions = find_positions(test_doc, 'ab', CASE_SENSITIVE)
+            assert test_obj.revision == test_doc.revision()
+            assert test_obj.text == test_doc.toPlainText()
+            assert len(test_obj.starts) == len(positions)
+            assert [test_obj.index(position) for position in positions] == list(range(1, len(positions) + 1))
@@ -0,0 +1,138 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from notolog.workspace_index import WorkspaceIndex
+from notolog.file_header import FileHeader
+
+import os
+import pytest
+
+
+def write_note(file_path, content):
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+class TestWorkspaceIndex:
+
+    @pytest.fixture(scope="function")
+    def notes_dir(self, tmp_path):
+        notes_dir = tmp_path / 'notes'
+        write_note(str(notes_dir / 'first.md'), '# First\n\nApples and pears\n')
+        write_note(str(notes_dir / 'sub' / 'second.md'), 'Intro\nSome oranges\nMore apples here\n')
+        write_note(str(notes_dir / 'sub' / 'image.png'), 'apples')
+        write_note(str(notes_dir / '.hidden' / 'third.md'), 'apples')
+        yield str(notes_dir)
+
+    @pytest.fixture(scope="function")
+    def test_obj(self, tmp_path, notes_dir):
+        workspace_index = WorkspaceIndex(db_path=str(tmp_path / 'index' / 'workspace_index.db'))
+        workspace_index.set_root(notes_dir)
+        yield workspace_index
+        workspace_index.close()
+
+    def test_search(self, test_obj, notes_dir):
+        results = test_obj.search_sync('apples')
+        assert sorted(results) == [
+            (os.path.join(notes_dir, 'first.md'), 2, 'Apples and pears'),
+            (os.path.join(notes_dir, 'sub', 'second.md'), 2, 'More apples here'),
+        ]
+        # The last word is a prefix, all the words are required
+        assert test_obj.search_sync('more app') == [(os.path.join(notes_dir, 'sub', 'second.md'), 2, 'More apples here')]
+        assert test_obj.search_sync('oranges pears') == []
+        assert test_obj.search_sync('"*') == []
+
+    def test_search_callback(self, test_obj):
+        results = []
+        test_obj.search('oranges', results.extend)
+        assert [result[1:] for result in results] == [(1, 'Some oranges')]
+
+    def test_dirs(self, test_obj, notes_dir):
+        assert test_obj.dirs == {notes_dir, os.path.join(notes_dir, 'sub')}
+
+    def test_encrypted_note(self, test_obj, notes_dir):
+        file_path = os.path.join(notes_dir, 'secret.md')
+        file_header = FileHeader().get_new(is_enc=True)
+        write_note(file_path, file_header.pack('apples are encrypted'))
+        test_obj.update_path(notes_dir)
+        assert file_path not in [result[0] for result in test_obj.search_sync('apples')]
+
+    def test_header_is_skipped(self, test_obj, notes_dir):
+        file_path = os.path.join(notes_dir, 'header.md')
+        write_note(file_path, FileHeader().get_new().pack('Line one\nline two with kiwi'))
+        test_obj.update_path(file_path)
+        # Line numbers are the ones of the content shown
+        assert test_obj.search_sync('kiwi') == [(file_path, 1, 'line two with kiwi')]
+        assert test_obj.search_sync('notolog') == []
+
+    def test_update_dir(self, test_obj, notes_dir):
+        sub_dir = os.path.join(notes_dir, 'sub')
+        new_dirs = []
+        # A file is added to the directory and another one is removed
+        write_note(os.path.join(sub_dir, 'added.md'), 'bananas')
+        os.remove(os.path.join(sub_dir, 'second.md'))
+        # A new sub-directory
+        write_note(os.path.join(sub_dir, 'new', 'nested.md'), 'bananas too')
+        test_obj.update_path(sub_dir, callback=new_dirs.extend)
+
+        assert sorted(result[0] for result in test_obj.search_sync('bananas')) == [
+            os.path.join(sub_dir, 'added.md'), os.path.join(sub_dir, 'new', 'nested.md')]
+        assert test_obj.search_sync('oranges') == []
+        assert new_dirs == [os.path.join(sub_dir, 'new')]
+
+    def test_removed_dir(self, test_obj, notes_dir):
+        sub_dir = os.path.join(notes_dir, 'sub')
+        for file_name in os.listdir(sub_dir):
+            os.remove(os.path.join(sub_dir, file_name))
+        os.rmdir(sub_dir)
+        test_obj.update_path(notes_dir)
+        assert [result[0] for result in test_obj.search_sync('apples')] == [os.path.join(notes_dir, 'first.md')]
+        assert test_obj.dirs == {notes_dir}
+
+    def test_update_file(self, test_obj, notes_dir, mocker):
+        file_path = os.path.join(notes_dir, 'first.md')
+        write_note(file_path, 'Cherries only')
+        os.utime(file_path, (1, 1))
+        read_note = mocker.spy(test_obj, 'read_note')
+        test_obj.update_path(file_path)
+        assert test_obj.search_sync('cherries') == [(file_path, 0, 'Cherries only')]
+        # Not changed since then
+        test_obj.update_path(file_path)
+        assert read_note.call_count == 1
+        # Removed
+        os.remove(file_path)
+        test_obj.update_path(file_path)
+        assert test_obj.search_sync('cherries') == []
+
+    def test_persistent(self, test_obj, tmp_path, notes_dir, mocker):
+        test_obj.close()
+        workspace_index = WorkspaceIndex(db_path=test_obj.db_path)
+        read_note = mocker.spy(workspace_index, 'read_note')
+        workspace_index.set_root(notes_dir)
+        # Nothing changed, nothing is read again
+        read_note.assert_not_called()
+        assert len(workspace_index.search_sync('apples')) == 2
+        workspace_index.close()
+
+    def test_root_change(self, test_obj, tmp_path, notes_dir):
+        test_obj.set_root(os.path.join(notes_dir, 'sub'))
+        assert [result[0] for result in test_obj.search_sync('apples')] == [os.path.join(notes_dir, 'sub', 'second.md')]
+        # Outside the root
+        test_obj.update_path(os.path.join(notes_dir, 'first.md'))
+        assert len(test_obj.search_sync('apples')) == 1
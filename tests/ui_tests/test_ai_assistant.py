@@ -22,7 +22,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtTest import QTest
 from PySide6.QtWidgets import QMainWindow
 
-from notolog.ui.ai_assistant.ai_assistant import AIAssistant
+from notolog.ui.ai_assistant.ai_assistant import AIAssistant, EnumMessageType
 from notolog.ui.ai_assistant.ai_message_label import AIMessageLabel
 from notolog.settings import Settings
 from notolog.enums.languages import Languages
@@ -164,3 +164,73 @@ class TestAiAssistant:
 
         mock_request.assert_called_once()
         mock_cancel_request.assert_not_called()  # Either an exception or stop button click
+
+    def test_append_to_message_buffered(self, mocker, ui_obj: AIAssistant):
+        mock_find_child = mocker.patch.object(ui_obj, 'findChild', wraps=ui_obj.findChild)
+
+        # The first chunk is shown right away
+        ui_obj.append_to_message(' Hello', 3, 6, EnumMessageType.RESPONSE)
+        messages = ui_obj.messages_area.findChildren(AIMessageLabel)
+        assert len(messages) == 1
+        assert messages[0].text() == 'Hello'
+
+        # The following ones are shown by the next flush, at once
+        for chunk in [',', ' world', '!']:
+            ui_obj.append_to_message(chunk, 3, 6, EnumMessageType.RESPONSE)
+        assert messages[0].text() == 'Hello'
+        assert ui_obj.flush_timer.isActive()
+        ui_obj.flush_messages()
+        assert messages[0].text() == 'Hello, world!'
+
+        # The label is looked up once per message
+        assert mock_find_child.call_count == 1
+        assert len(ui_obj.messages_area.findChildren(AIMessageLabel)) == 1
+
+        # Messages without an id are not buffered
+        ui_obj.append_to_message('Error', None, None)
+        assert len(ui_obj.messages_area.findChildren(AIMessageLabel)) == 2
+        assert list(ui_obj.message_buffers.keys()) == [(EnumMessageType.RESPONSE, 6)]
+
+    def test_finished_callback_flushes(self, ui_obj: AIAssistant):
+        setattr(ui_obj.settings, 'ai_config_convert_to_md', False)
+        added = []
+        ui_obj.message_added.connect(lambda text, *args: added.append(text))
+
+        ui_obj.append_to_message('Hello', 3, 6, EnumMessageType.RESPONSE)
+        ui_obj.append_to_message(' world', 3, 6, EnumMessageType.RESPONSE)
+        ui_obj.send_request_finished_callback(request_msg_id=3, response_msg_id=6)
+
+        # The rest of the chunks is shown and the message is not buffered anymore
+        assert ui_obj.messages_area.findChildren(AIMessageLabel)[0].text() == 'Hello world'
+        assert added[-1] == 'Hello world'
+        assert not ui_obj.message_buffers
+        assert not ui_obj.flush_timer.isActive()
+
+    def test_finished_callback_convert_sync(self, ui_obj: AIAssistant):
+        setattr(ui_obj.settings, 'ai_config_convert_to_md', True)
+
+        ui_obj.append_to_message('**Bold**', 3, 6, EnumMessageType.RESPONSE)
+        ui_obj.append_to_message(' text', 3, 6, EnumMessageType.RESPONSE)
+        # Converted right away without the event loop
+        ui_obj.send_request_finished_callback(request_msg_id=3, response_msg_id=6)
+        assert ui_obj.messages_area.findChildren(AIMessageLabel)[0].text() == '<p><strong>Bold</strong> text</p>'
+        assert ui_obj.md_executor is None
+
+    @pytest.mark.asyncio
+    async def test_finished_callback_convert_async(self, ui_obj: AIAssistant):
+        setattr(ui_obj.settings, 'ai_config_convert_to_md', True)
+        added = []
+        ui_obj.message_added.connect(lambda text, *args: added.append(text))
+
+        ui_obj.append_to_message('**Bold**', 3, 6, EnumMessageType.RESPONSE)
+        ui_obj.append_to_message(' text', 3, 6, EnumMessageType.RESPONSE)
+        ui_obj.send_request_finished_callback(request_msg_id=3, response_msg_id=6)
+        # The plain text is passed over right away, the html is shown once converted in background
+        assert added[-1] == '**Bold** text'
+        message = ui_obj.messages_area.findChildren(AIMessageLabel)[0]
+        for _attempt in range(100):
+            if message.text() != '**Bold** text':
+                break
+            await asyncio.sleep(0.01)
+        assert message.text() == '<p><strong>Bold</strong> text</p>'
+        ui_obj.md_executor.shutdown()
@@ -0,0 +1,94 @@
+"""
+Notolog Editor
+An open-source Markdown editor built with Python.
+
+File Details:
+- Purpose: Contains unit and integration tests for the related functionality.
+
+Repository: https://github.com/notolog/notolog-editor
+Website: https://notolog.app
+PyPI: https://pypi.org/project/notolog
+
+Author: Vadim Bakhrenkov
+Copyright: 2024-2026 Vadim Bakhrenkov
+License: MIT License
+
+For detailed instructions and project information, please see the repository's README.md.
+"""
+
+from PySide6.QtGui import QTextDocument
+
+from notolog.edit_widget import EditWidget
+
+from . import test_app  # noqa: F401
+
+import pytest
+
+
+class TestEditWidget:
+
+    @pytest.fixture
+    def test_obj(self, mocker, test_app):  # noqa: F811 redefinition of unused 'test_app'
+        mocker.patch.object(EditWidget, 'CHUNK_SIZE', 10)
+        yield EditWidget()
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '',
+            'Short text',
+            'Line one\nLine two\n\nLine four with more text\n',
+            '🐱 cats 🐱 and 🐶 dogs\n' * 5,
+            '\n' * 25,
+        ]
+    )
+    def test_set_plain_text_chunked(self, test_obj, text):
+        expected_doc = QTextDocument()
+        expected_doc.setPlainText(text)
+
+        progress = []
+        content_set = []
+        test_obj.content_set.connect(lambda: content_set.append(True))
+        test_obj.set_plain_text_chunked(text, progress_callback=progress.append)
+
+        document = test_obj.document()
+        assert document.toPlainText() == expected_doc.toPlainText()
+        assert document.blockCount() == expected_doc.blockCount()
+        assert not document.isModified()
+        assert not document.isUndoAvailable()
+        assert test_obj.textCursor().position() == 0
+        assert content_set == [True]
+        if len(text) > EditWidget.CHUNK_SIZE:
+            assert progress == sorted(progress) and progress[-1] == 100
+        else:
+            assert progress == []
+
+    def test_set_plain_text_chunked_signals(self, test_obj):
+        text_changed = []
+        test_obj.textChanged.connect(lambda: text_changed.append(True))
+        test_obj.set_plain_text_chunked('Text to set\n' * 10)
+        # Emitted once, not upon each chunk
+        assert text_changed == [True]
+
+    def test_dirty_tracking(self, test_obj):
+        test_obj.setPlainText('Saved content')
+        test_obj.set_saved(EditWidget.get_content_hash('Saved content'))
+        assert not test_obj.is_changed()
+
+        cursor = test_obj.textCursor()
+        cursor.insertText('Edited. ')
+        assert test_obj.is_changed()
+        assert not test_obj.is_saved_hash(EditWidget.get_content_hash(test_obj.toPlainText()))
+
+        # Edited back to the content saved
+        test_obj.document().undo()
+        assert test_obj.is_changed()
+        assert test_obj.is_saved_hash(EditWidget.get_content_hash(test_obj.toPlainText()))
+
+    def test_saved_revision(self, test_obj):
+        test_obj.setPlainText('Content')
+        revision = test_obj.document().revision()
+        # Edited while the content taken at the revision is saved
+        test_obj.textCursor().insertText('More ')
+        test_obj.set_saved(EditWidget.get_content_hash('Content'), revision=revision)
+        assert test_obj.is_changed()